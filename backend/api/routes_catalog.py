@@ -1,16 +1,33 @@
-from fastapi import APIRouter, Depends, HTTPException
-from urllib.parse import quote
-from typing import List, Optional, Any
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from fastapi.responses import StreamingResponse
+from decimal import Decimal
+import base64
+import csv
+import datetime
+import io
+import json
+from typing import AsyncIterator, List, Optional, Any, Union
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
 
 from backend.persistance.db_dependency import get_db
+from backend.infrastructure.http_cache import is_not_modified, make_etag, not_modified, validator_headers
+from backend.persistance.catalog_version import SCOPES, TAXONOMY_SCOPE, utcnow
+from backend.infrastructure.storage import static_url
 from backend.persistance.product import Product
-from backend.repositories.repository.product_repository import ProductRepository
+from backend.persistance.product_variant import ProductVariant
+from backend.persistance.product_variant_image import ProductVariantImage
+from backend.repositories.repository.catalog_repository import (
+    CatalogFilters,
+    CatalogRepository,
+    SORT_COLUMNS,
+    SORT_ORDERS,
+)
+from backend.repositories.repository.catalog_version_repository import CatalogVersionRepository, VersionStamp
 from backend.repositories.repository.product_image_repository import ProductImageRepository
-from backend.persistance.category import Category
-from backend.persistance.subcategory import Subcategory
+from backend.repositories.repository.product_search_repository import ProductSearchRepository
+from backend.repositories.repository.product_variant_image_repository import ProductVariantImageRepository
 from backend.repositories.repository.product_variant_repository import ProductVariantRepository
+from backend.services.taxonomy_cache import taxonomy_cache
 from backend.schemas.schemas_catalog import (
     CartValidationRequest,
     CartValidationResponse,
@@ -21,17 +38,6 @@ catalog_router = APIRouter(prefix="/api/v1/catalog", tags=["catalog"])
 public_router = APIRouter(tags=["catalog"])
 
 
-def _static_url(path: str | None) -> str | None:
-    if not path:
-        return None
-    # Normalize Windows paths to forward slashes, ensure single /static prefix, then URL-encode
-    normalized = str(path).replace("\\", "/")
-    if normalized.startswith("/static/"):
-        raw = normalized
-    else:
-        raw = f"/static/{normalized.lstrip('/')}"
-    return quote(raw, safe="/")
-
 def _serialize_product_basic(p: Product, image_url: Optional[str] = None) -> dict[str, Any]:
     return {
         "id": p.product_id,
@@ -50,277 +56,461 @@ def _serialize_product_basic(p: Product, image_url: Optional[str] = None) -> dic
         "variants": [],
     }
 
-@catalog_router.get("/products")
-async def list_products(db: AsyncSession = Depends(get_db)) -> dict[str, list[dict[str, Any]]]:
-    """Public: list active products. Minimal fields for catalog browsing."""
-    cols = (
-        Product.product_id,
-        Product.title,
-        Product.description,
-        Product.price,
-        Product.currency,
-        Product.category_id,
-        Product.subcategory_id,
-    )
-    result = await db.execute(select(*cols).filter(Product.is_active == True))
-    rows = result.all()
-    image_repo = ProductImageRepository(db)
-    items: list[dict[str, Any]] = []
-    for row in rows:
-        pid = row[0]
-        images = await image_repo.get_by_product_id(pid)
-        # Primary product image (if any), normalized
-        image_url = _static_url(images[0].image_url) if images else None
-        # Resolve category/subcategory names
-        cat_name = None
-        subcat_name = None
-        cat_img = None
-        subcat_img = None
-        if row[5] is not None:
-            c_row = (await db.execute(select(Category.name, Category.image_url).filter(Category.category_id == row[5]))).first()
-            if c_row:
-                cat_name = c_row[0]
-                cat_img = c_row[1]
-        if row[6] is not None:
-            s_row = (await db.execute(select(Subcategory.name, Subcategory.image_url).filter(Subcategory.subcategory_id == row[6]))).first()
-            if s_row:
-                subcat_name = s_row[0]
-                subcat_img = s_row[1]
-        # Fallback to subcategory image, then category image
-        if not image_url and subcat_img:
-            image_url = _static_url(subcat_img)
-        if not image_url and cat_img:
-            image_url = _static_url(cat_img)
-        item: dict[str, Any] = {
-            "id": pid,
-            "name": row[1] or "Product",
-            "description": row[2] or "",
-            "price": float(row[3] or 0.0),
-            "currency": row[4] or "USD",
-            "image_url": image_url,
-            "category_id": row[5],
-            "subcategory_id": row[6],
-            "category": cat_name,
-            "subcategory": subcat_name,
-            "subcategory_name": subcat_name,
-            "variants": [],
-        }
-        items.append(item)
-    return {"items": items}
-
-async def _get_product_detail(product_id: int, db: AsyncSession) -> dict[str, dict[str, Any]]:
-    image_repo = ProductImageRepository(db)
-    cols = (
-        Product.product_id,
-        Product.title,
-        Product.description,
-        Product.price,
-        Product.currency,
-        Product.category_id,
-        Product.subcategory_id,
-        Product.is_active,
-    )
-    result = await db.execute(select(*cols).filter(Product.product_id == product_id, Product.is_active == True))
-    row = result.first()
-    if not row:
-        raise HTTPException(status_code=404, detail="Product not found")
-    pid = row[0]
-    images = await image_repo.get_by_product_id(pid)
-    image_url = _static_url(images[0].image_url) if images and hasattr(images[0], 'image_url') else None
-    cat_name = None
-    subcat_name = None
-    cat_img = None
-    subcat_img = None
-    if row[5] is not None:
-        c_row = (await db.execute(select(Category.name, Category.image_url).filter(Category.category_id == row[5]))).first()
-        if c_row:
-            cat_name = c_row[0]
-            cat_img = c_row[1]
-    if row[6] is not None:
-        s_row = (await db.execute(select(Subcategory.name, Subcategory.image_url).filter(Subcategory.subcategory_id == row[6]))).first()
-        if s_row:
-            subcat_name = s_row[0]
-            subcat_img = s_row[1]
-    if not image_url and subcat_img:
-        image_url = _static_url(subcat_img)
-    if not image_url and cat_img:
-        image_url = _static_url(cat_img)
-    item: dict[str, Any] = {
+def _serialize_catalog_row(row: Any) -> dict[str, Any]:
+    # Cards carry the already-resolved image URL (product -> subcategory -> category) and names
+    (pid, title, description, price, currency, category_id, subcategory_id,
+     _created_at, image_url, category_name, subcat_name) = tuple(row)
+    return {
         "id": pid,
-        "name": row[1] or "Product",
-        "description": row[2] or "",
-        "price": float(row[3] or 0.0),
-        "currency": row[4] or "USD",
+        "name": title or "Product",
+        "description": description or "",
+        "price": float(price or 0.0),
+        "currency": currency or "USD",
         "image_url": image_url,
-        "category_id": row[5],
-        "subcategory_id": row[6],
-        "category": cat_name,
+        "category_id": category_id,
+        "subcategory_id": subcategory_id,
+        "category": category_name,
         "subcategory": subcat_name,
         "subcategory_name": subcat_name,
         "variants": [],
     }
-    return {"product": item}
 
-@catalog_router.get("/products/{product_id}")
-async def get_product(product_id: int, db: AsyncSession = Depends(get_db)) -> dict[str, dict[str, Any]]:
-    """Public: product detail by id for browsing."""
-    return await _get_product_detail(product_id, db)
+# Row index of each sort key's value in CatalogRepository.card_select rows
+_SORT_ROW_INDEX = {"id": 0, "price": 3, "created_at": 7, "title": 1}
+MAX_PAGE_SIZE = 200
 
-# Alias to match existing frontend path `/api/product/{id}`
-@public_router.get("/api/product/{product_id}")
-async def get_product_alias(product_id: int, db: AsyncSession = Depends(get_db)) -> dict[str, dict[str, Any]]:
-    return await _get_product_detail(product_id, db)
+def _encode_cursor(sort: str, order: str, row: Any) -> str:
+    value = row[_SORT_ROW_INDEX[sort]]
+    if isinstance(value, datetime.datetime):
+        value = value.isoformat()
+    elif isinstance(value, Decimal):
+        value = str(value)
+    raw = json.dumps({"s": sort, "o": order, "v": value, "id": row[0]}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
 
+def _decode_cursor(cursor: str, sort: str, order: str) -> tuple[Any, int]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if data["s"] != sort or data["o"] != order:
+            raise ValueError("cursor was issued for a different sort")
+        value = data["v"]
+        if value is not None and sort == "price":
+            value = Decimal(value)
+        elif value is not None and sort == "created_at":
+            value = datetime.datetime.fromisoformat(value)
+        return value, int(data["id"])
+    except (ValueError, KeyError, TypeError, ArithmeticError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
 
-@catalog_router.post("/validate-cart", response_model=CartValidationResponse)
-async def validate_cart(payload: CartValidationRequest, db: AsyncSession = Depends(get_db)):
-    """Public: validate cart items for availability and quantity.
+def _validators(stamps: dict[str, VersionStamp], *key: Any) -> tuple[str, datetime.datetime, dict[str, str]]:
+    """ETag, Last-Modified and response headers for a representation keyed by `key`.
 
-    - If `variant_id` is provided, ensure the variant exists, is active, and has sufficient `quantity`.
-      If requested exceeds stock, reduce to available stock.
-    - If no `variant_id`, ensure the product exists and is active; allow any positive quantity.
+    The ETag covers the version of every scope in `stamps`, so any committed
+    write to those tables changes it for every worker.
+    """
+    etag = make_etag(*key, *((scope, stamp.version) for scope, stamp in sorted(stamps.items())))
+    last_modified = max(stamp.updated_at for stamp in stamps.values())
+    return etag, last_modified, validator_headers(etag, last_modified)
+
+@catalog_router.get("/products", response_model=None)
+async def list_products(
+    request: Request,
+    response: Response,
+    limit: int = 50,
+    cursor: Optional[str] = None,
+    sort: str = "id",
+    order: str = "asc",
+    category_id: Optional[int] = None,
+    subcategory_id: Optional[int] = None,
+    min_price: Optional[float] = None,
+    max_price: Optional[float] = None,
+    q: Optional[str] = None,
+    in_stock: bool = False,
+    db: AsyncSession = Depends(get_db),
+) -> Union[dict[str, Any], Response]:
+    """Public: list active products, one keyset page at a time.
+
+    Pages are ordered by `(sort, id)` where `sort` is one of `id`, `price`,
+    `created_at` or `title`. Pass the returned `next_cursor` back as `cursor`
+    (with the same sort/order) to fetch the following page; it is `null` on the
+    last page. `q` keeps products matching the search keywords and `in_stock`
+    those that can be bought, across the whole catalog. Each page costs two
+    queries (version row, one catalog_card range scan) however deep the client
+    pages. Supports conditional GETs: a request whose
+    `If-None-Match`/`If-Modified-Since` is current gets a 304 after reading
+    only the catalog version row. Variant stock is not versioned, so
+    `in_stock` pages are never conditional.
+    """
+    if sort not in SORT_COLUMNS:
+        raise HTTPException(status_code=400, detail=f"sort must be one of {', '.join(SORT_COLUMNS)}")
+    if order not in SORT_ORDERS:
+        raise HTTPException(status_code=400, detail="order must be 'asc' or 'desc'")
+    if limit <= 0 or limit > MAX_PAGE_SIZE:
+        raise HTTPException(status_code=400, detail=f"limit must be between 1 and {MAX_PAGE_SIZE}")
+    after = _decode_cursor(cursor, sort, order) if cursor else None
+    filters = CatalogFilters(
+        category_id=category_id,
+        subcategory_id=subcategory_id,
+        min_price=min_price,
+        max_price=max_price,
+        in_stock=in_stock,
+    )
+    headers: dict[str, str] = {}
+    if not in_stock:
+        stamps = await CatalogVersionRepository(db).get(SCOPES)
+        etag, last_modified, headers = _validators(stamps, "products", limit, cursor, sort, order, filters, q)
+        if is_not_modified(request, etag, last_modified):
+            return not_modified(headers)
+    matching = ProductSearchRepository(db).matching_ids(q)
+    # Fetch one extra row to learn whether another page exists
+    rows = await CatalogRepository(db).list_page(
+        filters, sort=sort, order=order, limit=limit + 1, after=after, product_ids=matching
+    )
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    items: list[dict[str, Any]] = [_serialize_catalog_row(row) for row in rows]
+    next_cursor = _encode_cursor(sort, order, rows[-1]) if has_more else None
+    response.headers.update(headers)
+    return {"items": items, "next_cursor": next_cursor}
+
+# Upper edges of the default price bands: <25, 25-50, 50-100, 100-250, 250+
+DEFAULT_PRICE_EDGES = (25.0, 50.0, 100.0, 250.0)
+MAX_PRICE_EDGES = 20
+
+def _parse_price_edges(raw: Optional[str]) -> tuple[float, ...]:
+    if raw is None:
+        return DEFAULT_PRICE_EDGES
+    try:
+        edges = tuple(float(v) for v in raw.split(",") if v.strip())
+    except ValueError:
+        raise HTTPException(status_code=400, detail="price_bands must be comma-separated numbers")
+    if len(edges) > MAX_PRICE_EDGES or any(b <= a for a, b in zip(edges, edges[1:])):
+        raise HTTPException(
+            status_code=400,
+            detail=f"price_bands must be at most {MAX_PRICE_EDGES} strictly increasing numbers",
+        )
+    return edges
+
+@catalog_router.get("/facets", response_model=None)
+async def get_facets(
+    request: Request,
+    response: Response,
+    q: Optional[str] = None,
+    category_id: Optional[int] = None,
+    subcategory_id: Optional[int] = None,
+    min_price: Optional[float] = None,
+    max_price: Optional[float] = None,
+    price_bands: Optional[str] = None,
+    db: AsyncSession = Depends(get_db),
+) -> Union[dict[str, Any], Response]:
+    """Public: product counts per category, subcategory and price band.
+
+    Takes the same filters as `/products` (plus the search keywords `q`), so
+    the counts always add up to what the listing or search returns.
+    `price_bands` is a comma-separated list of band edges, e.g. `25,50,100`.
+    All counts come from one grouped aggregate query; conditional GETs are
+    answered like `/products`.
+    """
+    edges = _parse_price_edges(price_bands)
+    filters = CatalogFilters(
+        category_id=category_id,
+        subcategory_id=subcategory_id,
+        min_price=min_price,
+        max_price=max_price,
+    )
+    stamps = await CatalogVersionRepository(db).get(SCOPES)
+    etag, last_modified, headers = _validators(stamps, "facets", q, edges, filters)
+    if is_not_modified(request, etag, last_modified):
+        return not_modified(headers)
+    counts = await ProductSearchRepository(db).facet_counts(q, filters, price_edges=edges)
+    taxonomy = await taxonomy_cache.get(db, stamps[TAXONOMY_SCOPE].version)
+    bounds = (None, *edges, None)
+    response.headers.update(headers)
+    return {
+        "total": counts.total,
+        "categories": [
+            {"category_id": cid, "name": taxonomy.category_name(cid), "count": n}
+            for cid, n in sorted(counts.categories.items(), key=lambda kv: (-kv[1], kv[0] or 0))
+        ],
+        "subcategories": [
+            {"subcategory_id": sid, "category_id": cid, "name": taxonomy.subcategory_name(sid), "count": n}
+            for (cid, sid), n in sorted(counts.subcategories.items(), key=lambda kv: (-kv[1], kv[0][1] or 0))
+        ],
+        "price_bands": [
+            {"min": bounds[i], "max": bounds[i + 1], "count": n}
+            for i, n in enumerate(counts.price_bands)
+        ],
+    }
+
+# Columns of a CSV export, in order; NDJSON lines carry the full listing item
+EXPORT_CSV_COLUMNS = (
+    "id", "name", "description", "price", "currency", "image_url",
+    "category_id", "subcategory_id", "category", "subcategory",
+)
+EXPORT_MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
+def _encode_export_batch(fmt: str, rows: Any) -> str:
+    items = [_serialize_catalog_row(row) for row in rows]
+    if fmt == "ndjson":
+        return "".join(json.dumps(item, separators=(",", ":")) + "\n" for item in items)
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    writer.writerows([item[col] for col in EXPORT_CSV_COLUMNS] for item in items)
+    return buf.getvalue()
+
+async def _export_stream(
+    db: AsyncSession, fmt: str, filters: CatalogFilters,
+    since: Optional[datetime.datetime], after_id: Optional[int],
+) -> AsyncIterator[str]:
+    if fmt == "csv":
+        buf = io.StringIO()
+        csv.writer(buf).writerow(EXPORT_CSV_COLUMNS)
+        yield buf.getvalue()
+    # The request-scoped session is closed before the body is sent, so the
+    # export reads through its own session on the same engine.
+    async with AsyncSession(bind=db.bind) as session:
+        async for rows in CatalogRepository(session).stream_cards(filters, since=since, after_id=after_id):
+            yield _encode_export_batch(fmt, rows)
+
+@catalog_router.get("/export", response_model=None)
+async def export_products(
+    format: str = "ndjson",
+    since: Optional[datetime.datetime] = None,
+    after_id: Optional[int] = None,
+    category_id: Optional[int] = None,
+    subcategory_id: Optional[int] = None,
+    min_price: Optional[float] = None,
+    max_price: Optional[float] = None,
+    db: AsyncSession = Depends(get_db),
+) -> StreamingResponse:
+    """Public: stream every listed product as NDJSON or CSV, in product ID order.
+
+    Rows are read through a server-side cursor and written out batch by
+    batch, so memory use does not grow with the catalog. Takes the same
+    filters as `/products`. To resume an interrupted export pass the last
+    `id` received as `after_id`; for an incremental export pass the
+    `X-Export-Started-At` header of the previous export as `since`, which
+    returns only products changed since then. Removed products are not
+    reported by an incremental export.
+    """
+    if format not in EXPORT_MEDIA_TYPES:
+        raise HTTPException(status_code=400, detail=f"format must be one of {', '.join(EXPORT_MEDIA_TYPES)}")
+    if since is not None and since.tzinfo is not None:
+        since = since.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+    filters = CatalogFilters(
+        category_id=category_id,
+        subcategory_id=subcategory_id,
+        min_price=min_price,
+        max_price=max_price,
+    )
+    started_at = utcnow()
+    return StreamingResponse(
+        _export_stream(db, format, filters, since, after_id),
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={
+            "X-Export-Started-At": started_at.isoformat() + "Z",
+            "Content-Disposition": f'attachment; filename="catalog.{format}"',
+        },
+    )
+
+def _serialize_variant(variant: ProductVariant, images: list[ProductVariantImage]) -> dict[str, Any]:
+    urls = [static_url(image.image_url) for image in images]
+    return {
+        "id": variant.variant_id,
+        "name": variant.variant_name,
+        "price": float(variant.price) if variant.price is not None else None,
+        "quantity": int(variant.quantity or 0),
+        "in_stock": (variant.quantity or 0) > 0,
+        "image_url": urls[0] if urls else None,
+        "images": urls,
+    }
+
+async def _expand_product(db: AsyncSession, product: dict[str, Any]) -> None:
+    """Fill in a detail item's variants and images: three queries, however many variants."""
+    pid = product["id"]
+    variants = (await ProductVariantRepository(db).get_active_by_product_ids([pid]))[pid]
+    variant_images = await ProductVariantImageRepository(db).get_by_variant_ids(v.variant_id for v in variants)
+    images = (await ProductImageRepository(db).get_by_product_ids([pid]))[pid]
+    product["variants"] = [_serialize_variant(v, variant_images[v.variant_id]) for v in variants]
+    product["images"] = [static_url(image.image_url) for image in images]
+
+async def _get_product_detail(
+    product_id: int, request: Request, response: Response, db: AsyncSession, expand: bool = False
+) -> Union[dict[str, dict[str, Any]], Response]:
+    stamps = await CatalogVersionRepository(db).get(SCOPES)
+    etag, last_modified, headers = _validators(stamps, "product", product_id)
+    if not expand and is_not_modified(request, etag, last_modified):
+        return not_modified(headers)
+    row = await CatalogRepository(db).get_active(product_id)
+    if not row:
+        raise HTTPException(status_code=404, detail="Product not found")
+    product = _serialize_catalog_row(row)
+    if expand:
+        # Variant stock and images are not versioned, so the expanded
+        # representation is validated by its content instead.
+        await _expand_product(db, product)
+        etag = make_etag(etag, json.dumps(product, sort_keys=True))
+        headers = validator_headers(etag, None)
+        if is_not_modified(request, etag, None):
+            return not_modified(headers)
+    response.headers.update(headers)
+    return {"product": product}
+
+@catalog_router.get("/products/{product_id}", response_model=None)
+async def get_product(
+    product_id: int,
+    request: Request,
+    response: Response,
+    expand: bool = False,
+    db: AsyncSession = Depends(get_db),
+) -> Union[dict[str, dict[str, Any]], Response]:
+    """Public: product detail by id for browsing (supports conditional GETs).
+
+    With `expand=true` the product also carries its active `variants` (each
+    with its images) and all product `images`, so a detail page needs one
+    request. That costs three more queries; its ETag is derived from the
+    response content, since stock changes are not versioned.
     """
-    product_repo = ProductRepository(db)
-    variant_repo = ProductVariantRepository(db)
-    results: List[CartValidationItemResult] = []
-    for item in payload.items:
-        requested_qty = item.quantity
-        allowed_qty = 0
-        available = False
-        price: Optional[float] = None
-        message: Optional[str] = None
-
-        # Verify product is active
-        # Read product attributes as plain columns to avoid ORM instance detachment issues
-        prod_cols = (Product.product_id, Product.price, Product.is_active)
-        prod_row = (await db.execute(select(*prod_cols).filter(Product.product_id == item.product_id))).first()
-        product = None
-        if prod_row:
-            product = {
-                "product_id": prod_row[0],
-                "price": float(prod_row[1] or 0),
-                "is_active": bool(prod_row[2]),
-            }
-        if not product:
-            results.append(CartValidationItemResult(
+    return await _get_product_detail(product_id, request, response, db, expand)
+
+# Alias to match existing frontend path `/api/product/{id}`
+@public_router.get("/api/product/{product_id}", response_model=None)
+async def get_product_alias(
+    product_id: int,
+    request: Request,
+    response: Response,
+    expand: bool = False,
+    db: AsyncSession = Depends(get_db),
+) -> Union[dict[str, dict[str, Any]], Response]:
+    return await _get_product_detail(product_id, request, response, db, expand)
+
+
+def _validate_cart_line(
+    item: Any,
+    product: Optional[dict[str, Any]],
+    variant: Optional[dict[str, Any]],
+) -> CartValidationItemResult:
+    """Evaluate one cart line against its already-loaded product/variant row."""
+    requested_qty = item.quantity
+    allowed_qty = 0
+    available = False
+    price: Optional[float] = None
+    message: Optional[str] = None
+
+    if not product:
+        return CartValidationItemResult(
+            product_id=item.product_id,
+            requested_quantity=requested_qty,
+            allowed_quantity=0,
+            available=False,
+            variant_id=item.variant_id,
+            price=None,
+            message="Product not available",
+        )
+
+    # Variant-specific validation
+    if item.variant_id:
+        if not variant:
+            return CartValidationItemResult(
                 product_id=item.product_id,
                 requested_quantity=requested_qty,
                 allowed_quantity=0,
                 available=False,
                 variant_id=item.variant_id,
                 price=None,
-                message="Product not available",
-            ))
-            continue
-
-        # Variant-specific validation
-        if item.variant_id:
-            # Read variant attributes as plain columns
-            from backend.persistance.product_variant import ProductVariant
-            var_cols = (ProductVariant.variant_id, ProductVariant.quantity, ProductVariant.price, ProductVariant.is_active)
-            var_row = (await db.execute(select(*var_cols).filter(ProductVariant.variant_id == item.variant_id))).first()
-            variant = None
-            if var_row:
-                variant = {
-                    "variant_id": var_row[0],
-                    "quantity": int(var_row[1] or 0),
-                    "price": float(var_row[2] or 0),
-                    "is_active": bool(var_row[3]),
-                }
-            if not variant:
-                results.append(CartValidationItemResult(
-                    product_id=item.product_id,
-                    requested_quantity=requested_qty,
-                    allowed_quantity=0,
-                    available=False,
-                    variant_id=item.variant_id,
-                    price=None,
-                    message="Variant not available",
-                ))
-                continue
-            stock = int(variant["quantity"])
-            price = float(variant["price"] or product["price"])
-            if stock <= 0:
-                allowed_qty = 0
-                available = False
-                message = "Variant out of stock"
-            elif requested_qty <= stock:
-                allowed_qty = requested_qty
-                available = True
-            else:
-                allowed_qty = stock
-                available = True if stock > 0 else False
-                message = "Quantity reduced to available stock"
+                message="Variant not available",
+            )
+        stock = int(variant["quantity"])
+        price = float(variant["price"] or product["price"])
+        if stock <= 0:
+            allowed_qty = 0
+            available = False
+            message = "Variant out of stock"
+        elif requested_qty <= stock:
+            allowed_qty = requested_qty
+            available = True
         else:
-            # No variant: product-level check; product active implies available
-            price = float(product["price"])
-            if requested_qty > 0:
-                allowed_qty = requested_qty
-                available = True
-            else:
-                allowed_qty = 0
-                available = False
-                message = "Invalid quantity"
-
-        results.append(CartValidationItemResult(
-            product_id=item.product_id,
-            requested_quantity=requested_qty,
-            allowed_quantity=allowed_qty,
-            available=available,
-            variant_id=item.variant_id,
-            price=price,
-            message=message,
-        ))
+            allowed_qty = stock
+            available = True if stock > 0 else False
+            message = "Quantity reduced to available stock"
+    else:
+        # No variant: product-level check; product active implies available
+        price = float(product["price"])
+        if requested_qty > 0:
+            allowed_qty = requested_qty
+            available = True
+        else:
+            allowed_qty = 0
+            available = False
+            message = "Invalid quantity"
+
+    return CartValidationItemResult(
+        product_id=item.product_id,
+        requested_quantity=requested_qty,
+        allowed_quantity=allowed_qty,
+        available=available,
+        variant_id=item.variant_id,
+        price=price,
+        message=message,
+    )
+
+@catalog_router.post("/validate-cart", response_model=CartValidationResponse)
+async def validate_cart(payload: CartValidationRequest, db: AsyncSession = Depends(get_db)):
+    """Public: validate cart items for availability and quantity.
+
+    - If `variant_id` is provided, ensure the variant exists, is active, and has sufficient `quantity`.
+      If requested exceeds stock, reduce to available stock.
+    - If no `variant_id`, ensure the product exists and is active; allow any positive quantity.
 
+    Every referenced product and variant is loaded up front (one `IN` query
+    each), then lines are evaluated in memory in request order.
+    """
+    products = await CatalogRepository(db).get_validation_rows(
+        {item.product_id for item in payload.items}
+    )
+    variants = await ProductVariantRepository(db).get_stock_rows_by_ids(
+        {item.variant_id for item in payload.items if item.variant_id}
+    )
+    results: List[CartValidationItemResult] = [
+        _validate_cart_line(item, products.get(item.product_id), variants.get(item.variant_id))
+        for item in payload.items
+    ]
     return CartValidationResponse(items=results)
 
-from sqlalchemy.orm import selectinload
 # --------------------------------------------------
 # Category/Subcategory endpoints for frontend pages
 # --------------------------------------------------
-@public_router.get("/api/categories")
-async def list_categories(db: AsyncSession = Depends(get_db)) -> dict[str, list[dict[str, Any]]]:
-    result = await db.execute(
-        select(Category).options(selectinload(Category.subcategories))
-    )
-    categories: list[dict[str, Any]] = []
-    for category in result.scalars().unique():
-        subs: list[dict[str, Any]] = [
-            {
-                "subcategory_id": sub.subcategory_id,
-                "name": sub.name or "",
-                "image_url": _static_url(sub.image_url),
-            }
-            for sub in category.subcategories
-        ]
-        categories.append({
-            "category_id": category.category_id,
-            "name": category.name or "",
-            "image_url": _static_url(category.image_url),
-            "subcategories": subs,
-        })
-    return {"categories": categories}
-
-@public_router.get("/api/category/{category_id}")
-async def get_category(category_id: int, db: AsyncSession = Depends(get_db)) -> dict[str, Any]:
-    row = (await db.execute(select(Category.category_id, Category.name, Category.image_url).filter(Category.category_id == category_id))).first()
-    if not row:
+@public_router.get("/api/categories", response_model=None)
+async def list_categories(
+    request: Request, response: Response, db: AsyncSession = Depends(get_db)
+) -> Union[dict[str, list[dict[str, Any]]], Response]:
+    stamps = await CatalogVersionRepository(db).get([TAXONOMY_SCOPE])
+    etag, last_modified, headers = _validators(stamps, "categories")
+    if is_not_modified(request, etag, last_modified):
+        return not_modified(headers)
+    taxonomy = await taxonomy_cache.get(db, stamps[TAXONOMY_SCOPE].version)
+    response.headers.update(headers)
+    return {"categories": taxonomy.tree}
+
+@public_router.get("/api/category/{category_id}", response_model=None)
+async def get_category(
+    category_id: int, request: Request, response: Response, db: AsyncSession = Depends(get_db)
+) -> Union[dict[str, Any], Response]:
+    stamps = await CatalogVersionRepository(db).get([TAXONOMY_SCOPE])
+    etag, last_modified, headers = _validators(stamps, "category", category_id)
+    if is_not_modified(request, etag, last_modified):
+        return not_modified(headers)
+    taxonomy = await taxonomy_cache.get(db, stamps[TAXONOMY_SCOPE].version)
+    node = taxonomy.category_node(category_id)
+    if not node:
         raise HTTPException(status_code=404, detail="Category not found")
-    cid, name, img = row
-    sub_rows = (await db.execute(select(Subcategory.subcategory_id, Subcategory.name, Subcategory.image_url).filter(Subcategory.category_id == cid))).all()
-    subs: list[dict[str, Any]] = [
-        {
-            "subcategory_id": s_id,
-            "name": s_name or "",
-            "image_url": _static_url(s_img),
-        }
-        for (s_id, s_name, s_img) in sub_rows
-    ]
+    response.headers.update(headers)
     return {
         "category": {
-            "category_id": cid,
-            "name": name or "",
-            "image_url": _static_url(img),
+            "category_id": node["category_id"],
+            "name": node["name"],
+            "image_url": node["image_url"],
         },
-        "subcategories": subs,
+        "subcategories": node["subcategories"],
     }
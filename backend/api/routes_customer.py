@@ -2,7 +2,9 @@ from backend.persistance.db_dependency import get_db
 from fastapi import APIRouter, Depends, HTTPException, Request
 from typing import Any
 from backend.schemas.schemas_customer import (
-    CartItemAdd, CartItemResponse, WishlistItemAdd, WishlistItemResponse
+    CartItemAdd, CartItemResponse, CartOperationsRequest, CartOperationsResponse, CheckoutHoldResponse,
+    CheckoutJobResponse, CheckoutReleaseResponse, CheckoutRequest, GuestCartMergeRequest,
+    WishlistItemAdd, WishlistItemResponse
 )
 
 router = APIRouter(prefix="/api/v1/customer", tags=["customer"])
@@ -15,7 +17,12 @@ def require_role(role: str):
         return identity
     return dependency
 
-from backend.services.customerServices import add_item_to_cart, add_item_to_wishlist
+from backend.repositories.repository.product_variant_repository import InsufficientStockError
+from backend.services.checkout_service import CheckoutError, enqueue_checkout, get_checkout_job
+from backend.services.customerServices import (
+    add_item_to_cart, add_item_to_wishlist, apply_cart_operations, hold_cart_stock, merge_guest_cart,
+    release_cart_stock
+)
 
 @router.post("/cart/items", response_model=CartItemResponse)
 async def add_item_to_cart_route(
@@ -31,6 +38,81 @@ async def add_item_to_cart_route(
     )
     return CartItemResponse(**result)
 
+@router.patch("/cart", response_model=CartOperationsResponse)
+async def apply_cart_operations_route(
+    payload: CartOperationsRequest,
+    identity: dict[str, Any] = Depends(require_role("user")),
+    db: Any = Depends(get_db),
+) -> CartOperationsResponse:
+    """Apply a batch of add/update/remove operations to the caller's cart atomically."""
+    result = await apply_cart_operations(
+        user_id=identity["user_id"],
+        operations=payload.operations,
+        db=db
+    )
+    return CartOperationsResponse(**result)
+
+@router.post("/cart/merge", response_model=CartOperationsResponse)
+async def merge_guest_cart_route(
+    payload: GuestCartMergeRequest,
+    identity: dict[str, Any] = Depends(require_role("user")),
+    db: Any = Depends(get_db),
+) -> CartOperationsResponse:
+    """Merge the guest cart kept by the frontend into the caller's cart after sign-in."""
+    result = await merge_guest_cart(
+        user_id=identity["user_id"],
+        guest_items=payload.items,
+        db=db
+    )
+    return CartOperationsResponse(**result)
+
+@router.post("/checkout/hold", response_model=CheckoutHoldResponse)
+async def hold_checkout_stock_route(
+    identity: dict[str, Any] = Depends(require_role("user")),
+    db: Any = Depends(get_db),
+) -> CheckoutHoldResponse:
+    """Hold the stock of the caller's cart for the checkout TTL; 409 if any variant is short."""
+    try:
+        result = await hold_cart_stock(user_id=identity["user_id"], db=db)
+    except InsufficientStockError as exc:
+        raise HTTPException(
+            status_code=409, detail={"message": "Not enough stock", "variant_ids": exc.variant_ids}
+        )
+    return CheckoutHoldResponse(**result)
+
+@router.delete("/checkout/hold", response_model=CheckoutReleaseResponse)
+async def release_checkout_stock_route(
+    identity: dict[str, Any] = Depends(require_role("user")),
+    db: Any = Depends(get_db),
+) -> CheckoutReleaseResponse:
+    """Give the caller's checkout holds back to stock (checkout abandoned)."""
+    result = await release_cart_stock(user_id=identity["user_id"], db=db)
+    return CheckoutReleaseResponse(**result)
+
+@router.post("/checkout", response_model=CheckoutJobResponse, status_code=202)
+async def checkout_route(
+    payload: CheckoutRequest,
+    identity: dict[str, Any] = Depends(require_role("user")),
+    db: Any = Depends(get_db),
+) -> CheckoutJobResponse:
+    """Queue the caller's cart for checkout; poll GET /checkout/{job_id} for the order."""
+    try:
+        job = await enqueue_checkout(user_id=identity["user_id"], details=payload.model_dump(), db=db)
+    except CheckoutError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    return CheckoutJobResponse(job_id=job.job_id, status=job.status, attempts=job.attempts)
+
+@router.get("/checkout/{job_id}", response_model=CheckoutJobResponse)
+async def checkout_status_route(
+    job_id: int,
+    identity: dict[str, Any] = Depends(require_role("user")),
+    db: Any = Depends(get_db),
+) -> CheckoutJobResponse:
+    result = await get_checkout_job(job_id=job_id, user_id=identity["user_id"], db=db)
+    if result is None:
+        raise HTTPException(status_code=404, detail="Checkout not found")
+    return CheckoutJobResponse(**result)
+
 @router.post("/wishlist/items", response_model=WishlistItemResponse)
 async def add_item_to_wishlist_route(
     item: WishlistItemAdd,
@@ -1,7 +1,7 @@
 from backend.persistance.db_dependency import get_db
 from fastapi import APIRouter, Depends, HTTPException, Request
 from backend.schemas.schemas_seller import (
-    SellerProductCreate, SellerProductUpdate, SellerProductResponse
+    SellerProductCreate, SellerProductUpdate, SellerProductResponse, SellerDashboardResponse
 )
 from backend.services import sellerServices
 
@@ -15,7 +15,8 @@ def require_role(role: str):
         return identity
     return dependency
 
-from typing import Any
+import datetime
+from typing import Any, Optional
 async def dummy_seller_service() -> Any:
     class DummyService:
         async def create_product(self, product: Any) -> Any:
@@ -48,3 +49,24 @@ async def update_product(
     service = SellerService(db)
     result = await service.edit_product({'product_id': product_id, **product.model_dump(exclude_unset=True)})
     return SellerProductResponse(**result)
+
+
+@router.get("/dashboard", response_model=SellerDashboardResponse)
+async def seller_dashboard(
+    period: str = "monthly",
+    start_date: Optional[datetime.date] = None,
+    end_date: Optional[datetime.date] = None,
+    identity: dict[str, Any] = Depends(require_role("seller")),
+) -> SellerDashboardResponse:
+    from backend.repositories.repository.order_analytics_repository import PERIODS
+    from backend.services.seller_dashboard_service import build_seller_dashboard
+    seller_id = identity.get("seller_id")
+    if not seller_id:
+        raise HTTPException(status_code=403, detail="Forbidden")
+    if period not in PERIODS:
+        raise HTTPException(status_code=400, detail=f"Unknown period {period!r}")
+    # Sections open their own sessions, so no request session is needed
+    result = await build_seller_dashboard(
+        int(seller_id), period=period, start_date=start_date, end_date=end_date
+    )
+    return SellerDashboardResponse(**result)
@@ -1,6 +1,7 @@
 from starlette.middleware.base import BaseHTTPMiddleware
 from fastapi import FastAPI, Request, HTTPException
 from fastapi.responses import JSONResponse
+import asyncio
 import time
 import os
 
@@ -79,20 +80,26 @@ def add_error_handlers(app: FastAPI):
         return error_response(exc, exc.status_code, code="http_error")
 from starlette.middleware.base import BaseHTTPMiddleware
 from backend.persistance.async_base import AsyncSessionLocal
+from backend.persistance.unit_of_work import UnitOfWork
 class TransactionMiddleware(BaseHTTPMiddleware):
+    """One session and one unit of work per request.
+
+    `get_db` hands endpoints this session, so repository writes only flush
+    and the whole request commits once here (or rolls back on error).
+    """
     async def dispatch(self, request, call_next):
         async with AsyncSessionLocal() as session:
             request.state.db = session
             try:
-                response = await call_next(request)
-                await session.commit()
+                # Commits on success, rolls back if the request raised
+                async with UnitOfWork(session):
+                    response = await call_next(request)
             except Exception as e:
                 try:
                     from backend.infrastructure.structured_logging import logger
                     logger.exception("app.transaction_failed", error=str(e))
                 except Exception:
                     pass
-                await session.rollback()
                 raise
             return response
 from fastapi import FastAPI, Request, HTTPException, BackgroundTasks
@@ -123,6 +130,7 @@ load_dotenv()
 from backend.config import settings
 from backend.infrastructure.structured_logging import logger, log_request_start, log_request_end
 from backend.persistance.async_base import AsyncSessionLocal
+from backend.persistance.db_dependency import request_session
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import AsyncIterator
 from backend.models.model.domain_event import DomainEventType, DomainEvent
@@ -153,8 +161,8 @@ def require_identity(request: Request):
         return JSONResponse({'detail': 'Unauthorized'}, status_code=401)
 
 # --- Dependency Injection ---
-async def get_db() -> AsyncIterator[AsyncSession]:
-    async with AsyncSessionLocal() as session:
+async def get_db(request: Request) -> AsyncIterator[AsyncSession]:
+    async for session in request_session(request):
         yield session
 
 async def get_management_services(db=Depends(get_db)):
@@ -298,9 +306,31 @@ def create_app():
         #         logger.exception("app.alembic_check_failed", error=str(e))
         #     except Exception:
         #         pass
+        # Return expired checkout stock holds in the background (cron can run
+        # backend.scripts.sweep_stock_holds instead when this is disabled)
+        sweeper = None
+        if settings.ENV != "test" and settings.STOCK_HOLD_SWEEP_INTERVAL_SECONDS:
+            from backend.services.stock_hold_service import run_sweeper
+            sweeper = asyncio.create_task(run_sweeper(settings.STOCK_HOLD_SWEEP_INTERVAL_SECONDS))
+        # Process queued asynchronous checkouts
+        checkout_workers = None
+        if settings.ENV != "test" and settings.CHECKOUT_WORKER_CONCURRENCY > 0:
+            from backend.services.checkout_service import default_pool
+            checkout_workers = asyncio.create_task(default_pool().run_forever())
+        # Apply queued order changes to the daily sales rollup
+        rollup_worker = None
+        if settings.ENV != "test" and settings.SALES_ROLLUP_INTERVAL_SECONDS:
+            from backend.services.sales_rollup_service import run_rollup_worker
+            rollup_worker = asyncio.create_task(run_rollup_worker(settings.SALES_ROLLUP_INTERVAL_SECONDS))
         yield
         # Shutdown
         logger.info("Shutting down: flushing logs, closing DB pool, stopping workers.")
+        if sweeper is not None:
+            sweeper.cancel()
+        if checkout_workers is not None:
+            checkout_workers.cancel()
+        if rollup_worker is not None:
+            rollup_worker.cancel()
 
     app = FastAPI(middleware=middlewares, lifespan=lifespan)
 
@@ -757,6 +787,26 @@ async def ctrl_get_seller_payout(request: Request, db: AsyncSession = Depends(ge
     result = await service.get_seller_payout(seller_id, data.get('year'), data.get('month'))
     return JSONResponse({'result': result})
 
+def _search_params(data: dict) -> dict:
+    """Parse optional search filters and paging from query params."""
+    try:
+        params = {
+            'category_id': int(data['category_id']) if data.get('category_id') else None,
+            'subcategory_id': int(data['subcategory_id']) if data.get('subcategory_id') else None,
+            'min_price': float(data['min_price']) if data.get('min_price') else None,
+            'max_price': float(data['max_price']) if data.get('max_price') else None,
+            'limit': int(data.get('limit', 50)),
+            'offset': int(data.get('offset', 0)),
+        }
+    except ValueError:
+        raise HTTPException(status_code=400, detail='Invalid search parameters')
+    from backend.repositories.base_repository import BaseRepository
+    try:
+        BaseRepository.validate_pagination(params['limit'], params['offset'])
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return params
+
 @app.get('/api/search_products_for_seller')
 async def ctrl_search_products_for_seller(request: Request, db: AsyncSession = Depends(get_db)):
     identity = get_identity(request)
@@ -766,7 +816,7 @@ async def ctrl_search_products_for_seller(request: Request, db: AsyncSession = D
     seller_id = identity.get('seller_id')
     from backend.services.sellerServices import SellerService
     service = SellerService(db)
-    result = await service.search_products_for_seller(seller_id, data.get('keywords'))
+    result = await service.search_products_for_seller(seller_id, data.get('keywords'), **_search_params(data))
     return JSONResponse({'result': result})
 
 @app.get('/api/search_products_for_customer')
@@ -774,7 +824,7 @@ async def ctrl_search_products_for_customer(request: Request, db: AsyncSession =
     data = dict(request.query_params)
     from backend.services.sellerServices import SellerService
     service = SellerService(db)
-    result = await service.search_products_for_customer(data.get('keywords'))
+    result = await service.search_products_for_customer(data.get('keywords'), **_search_params(data))
     return JSONResponse({'result': result})
 
 # --- Customer Service Endpoints ---
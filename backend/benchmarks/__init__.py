@@ -0,0 +1,6 @@
+"""
+Standalone performance benchmarks.
+
+Each module is runnable with `python -m backend.benchmarks.<name>` and builds its
+own throwaway SQLite database, so it never touches the dev or test databases.
+"""
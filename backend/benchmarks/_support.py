@@ -0,0 +1,157 @@
+"""
+Shared helpers for the benchmark scripts: an isolated in-memory engine, a
+SQL statement counter and minimal catalog seeding.
+"""
+import os
+
+os.environ.setdefault("ENV", "test")
+
+import datetime as dt
+import time
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+from fastapi import Request
+from sqlalchemy import event, insert
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+import backend.persistance  # noqa: F401  (registers every table on Base.metadata)
+from backend.db.base import Base
+from backend.persistance.category import Category
+from backend.persistance.product import Product
+from backend.persistance.product_image import ProductImage
+from backend.persistance.product_variant import ProductVariant
+from backend.persistance.subcategory import Subcategory
+from backend.persistance.user import User
+from backend.repositories.repository.catalog_card_repository import CatalogCardRepository
+
+
+class QueryCounter:
+    """Counts SQL statements (and transaction commits) executed on an engine while active."""
+
+    def __init__(self, engine: AsyncEngine):
+        self.engine = engine
+        self.count = 0
+        self.commits = 0
+
+    def _on_execute(self, *args, **kwargs) -> None:
+        self.count += 1
+
+    def _on_commit(self, *args, **kwargs) -> None:
+        self.commits += 1
+
+    @contextmanager
+    def track(self) -> Iterator["QueryCounter"]:
+        self.count = 0
+        self.commits = 0
+        event.listen(self.engine.sync_engine, "before_cursor_execute", self._on_execute)
+        event.listen(self.engine.sync_engine, "commit", self._on_commit)
+        try:
+            yield self
+        finally:
+            event.remove(self.engine.sync_engine, "before_cursor_execute", self._on_execute)
+            event.remove(self.engine.sync_engine, "commit", self._on_commit)
+
+
+@contextmanager
+def timed() -> Iterator[dict[str, float]]:
+    """Measure wall-clock milliseconds into the yielded dict under `ms`."""
+    out: dict[str, float] = {}
+    start = time.perf_counter()
+    try:
+        yield out
+    finally:
+        out["ms"] = (time.perf_counter() - start) * 1000.0
+
+
+def make_request(headers: Optional[dict[str, str]] = None) -> Request:
+    """Minimal GET request for calling route handlers directly."""
+    raw = [(k.lower().encode("latin-1"), v.encode("latin-1")) for k, v in (headers or {}).items()]
+    return Request({"type": "http", "method": "GET", "path": "/", "query_string": b"", "headers": raw})
+
+
+async def make_engine(path: Optional[str] = None) -> tuple[AsyncEngine, async_sessionmaker[AsyncSession]]:
+    """Create a fresh database with the full schema.
+
+    In memory by default; pass the `path` of a new SQLite file when sessions
+    must run concurrently, each on its own connection.
+    """
+    if path:
+        engine = create_async_engine(
+            f"sqlite+aiosqlite:///{path}",
+            connect_args={"timeout": 30},
+            pool_size=20,
+            max_overflow=80,
+        )
+    else:
+        engine = create_async_engine(
+            "sqlite+aiosqlite:///:memory:",
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+        )
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    return engine, async_sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False, autoflush=False)
+
+
+async def seed_catalog(session: AsyncSession, n_products: int, *, categories: int = 4, images_per_product: int = 1) -> list[int]:
+    """Insert a seller, a small taxonomy and `n_products` active products.
+
+    Returns the product ids. Every second product gets no image so the
+    subcategory/category fallback path is exercised too.
+    """
+    now = dt.datetime.now()
+    await session.execute(insert(User).values(
+        user_id=1, full_name="Bench Seller", dob=dt.date(1980, 1, 1), password="x",
+        phone_number="0", email="bench-seller@example.com", created_at=dt.date.today(),
+        img_location="", account_status="True",
+    ))
+    await session.execute(insert(Category), [
+        {"category_id": c, "name": f"Category {c}", "image_url": f"categories/{c}.jpg"}
+        for c in range(1, categories + 1)
+    ])
+    await session.execute(insert(Subcategory), [
+        {"subcategory_id": c, "category_id": c, "name": f"Subcategory {c}", "image_url": f"subcategories/{c}.jpg"}
+        for c in range(1, categories + 1)
+    ])
+    await session.execute(insert(Product), [
+        {
+            "product_id": pid, "seller_id": 1,
+            "category_id": (pid % categories) + 1, "subcategory_id": (pid % categories) + 1,
+            "title": f"Product {pid}", "description": f"Description for product {pid}",
+            "price": 1 + (pid % 500), "currency": "USD", "is_active": True, "is_deleted": False,
+            "created_at": now - dt.timedelta(minutes=pid), "updated_at": now,
+        }
+        for pid in range(1, n_products + 1)
+    ])
+    image_rows = [
+        {"image_id": pid * images_per_product + i, "product_id": pid, "image_url": f"product_images/{pid}_{i}.jpg"}
+        for pid in range(1, n_products + 1) if pid % 2 == 0
+        for i in range(images_per_product)
+    ]
+    if image_rows:
+        await session.execute(insert(ProductImage), image_rows)
+    await CatalogCardRepository(session).rebuild()
+    await session.commit()
+    return list(range(1, n_products + 1))
+
+
+async def seed_variants(session: AsyncSession, product_ids: list[int], *, per_product: int = 2) -> list[int]:
+    """Insert `per_product` variants for each product and return their ids.
+
+    Variant `v` of product `pid` has id `pid * per_product + v`; stock cycles
+    through 0..9 so some variants are sold out and some need reducing.
+    """
+    rows = [
+        {
+            "variant_id": pid * per_product + v, "product_id": pid, "variant_name": f"Variant {v}",
+            "price": 2 + (pid % 500), "quantity": (pid + v) % 10, "is_active": True,
+        }
+        for pid in product_ids
+        for v in range(per_product)
+    ]
+    if rows:
+        await session.execute(insert(ProductVariant), rows)
+    await session.commit()
+    return [r["variant_id"] for r in rows]
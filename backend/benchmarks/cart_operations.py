@@ -0,0 +1,109 @@
+"""
+Benchmark: PATCH /api/v1/customer/cart vs. replaying the same edits one call at a time.
+
+The one-at-a-time path is what the frontend does today: one request (and one
+commit) per add, quantity edit or removal. The batched path validates every
+line with one read per table and writes the net change with at most one
+INSERT, UPDATE and DELETE, so its statement count stays flat as the batch
+grows. Run with:
+
+    python -m backend.benchmarks.cart_operations --ops 10 100 500
+"""
+import argparse
+import asyncio
+from typing import Any, Optional
+
+from backend.benchmarks._support import QueryCounter, make_engine, seed_catalog, seed_variants, timed
+
+USER_ID = 1
+
+
+def build_operations(n_ops: int, product_ids: list[int], per_product: int = 2) -> list[dict[str, Any]]:
+    """Mostly adds of variant lines, then quantity edits and removals of lines added earlier."""
+    ops = []
+    for i in range(n_ops):
+        pid = product_ids[i % len(product_ids)]
+        line = {"product_id": pid, "variant_id": pid * per_product + 1}
+        if i % 5 == 3 and i > 5:
+            earlier = product_ids[(i - 5) % len(product_ids)]
+            ops.append({"op": "update", "product_id": earlier, "variant_id": earlier * per_product + 1, "quantity": 1})
+        elif i % 5 == 4 and i > 5:
+            earlier = product_ids[(i - 4) % len(product_ids)]
+            ops.append({"op": "remove", "product_id": earlier, "variant_id": earlier * per_product + 1})
+        else:
+            ops.append({"op": "add", **line, "quantity": 1 + i % 3})
+    return ops
+
+
+async def replay_one_at_a_time(session: Any, operations: list[Any]) -> None:
+    """Apply each operation the way the single-item endpoints do: a lookup, a write and a commit."""
+    import datetime as dt
+    from backend.persistance.cart import Cart
+    from backend.persistance.cart_item import CartItem
+    from backend.repositories.repository.cart_item_repository import CartItemRepository
+    from backend.repositories.repository.cart_repository import CartRepository
+    from backend.repositories.repository.product_repository import ProductRepository
+    from backend.persistance.unit_of_work import auto_commit
+
+    now = dt.datetime.now()
+    cart = await CartRepository(session).add(Cart(user_id=USER_ID, created_at=now, updated_at=now))
+    items = CartItemRepository(session)
+    item_ids: dict[tuple, int] = {}
+    for op in operations:
+        key = (op.product_id, op.variant_id)
+        if op.op == "add":
+            await ProductRepository(session).get_by_id(op.product_id)
+            added = await items.add(CartItem(cart_id=cart.cart_id, product_id=op.product_id,
+                                             variant_id=op.variant_id, quantity=op.quantity))
+            item_ids.setdefault(key, added.cart_item_id)
+        elif key in item_ids and op.op == "update":
+            await items.update(item_ids[key], CartItem(quantity=op.quantity))
+        elif key in item_ids:
+            await session.delete(await items.get(item_ids.pop(key)))
+            await auto_commit(session)
+
+
+async def measure(n_ops: int, *, n_products: int = 200, batched: bool = True) -> dict[str, float]:
+    from backend.schemas.schemas_customer import CartOperationsRequest
+    from backend.services.customerServices import apply_cart_operations
+
+    engine, Session = await make_engine()
+    try:
+        async with Session() as session:
+            product_ids = await seed_catalog(session, n_products)
+            await seed_variants(session, product_ids)
+        operations = CartOperationsRequest(operations=build_operations(n_ops, product_ids)).operations
+        counter = QueryCounter(engine)
+        async with Session() as session:
+            with counter.track(), timed() as t:
+                if batched:
+                    await apply_cart_operations(USER_ID, operations, session)
+                else:
+                    await replay_one_at_a_time(session, operations)
+        return {"ops": n_ops, "queries": counter.count, "commits": counter.commits, "ms": t["ms"]}
+    finally:
+        await engine.dispose()
+
+
+async def run(ops: list[int], n_products: int) -> list[tuple[dict[str, float], dict[str, float]]]:
+    return [
+        (await measure(n, n_products=n_products, batched=False), await measure(n, n_products=n_products))
+        for n in ops
+    ]
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Batched cart operations benchmark")
+    parser.add_argument("--ops", type=int, nargs="+", default=[10, 100, 500])
+    parser.add_argument("--products", type=int, default=200)
+    args = parser.parse_args(argv)
+    print(f"{'ops':>6} {'1-by-1 q':>9} {'commits':>8} {'ms':>9} {'batch q':>8} {'commits':>8} {'ms':>9}")
+    for one, batch in asyncio.run(run(args.ops, args.products)):
+        print(
+            f"{one['ops']:>6} {one['queries']:>9} {one['commits']:>8} {one['ms']:>9.1f}"
+            f" {batch['queries']:>8} {batch['commits']:>8} {batch['ms']:>9.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
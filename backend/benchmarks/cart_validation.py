@@ -0,0 +1,64 @@
+"""
+Benchmark: POST /api/v1/catalog/validate-cart query count and latency vs. cart size.
+
+Validation must issue at most two SQL statements (products, variants)
+however many lines the cart has. Run with:
+
+    python -m backend.benchmarks.cart_validation --lines 1 50 500
+"""
+import argparse
+import asyncio
+from typing import Optional
+
+from backend.benchmarks._support import QueryCounter, make_engine, seed_catalog, seed_variants, timed
+
+
+def build_cart(n_lines: int, product_ids: list[int], per_product: int = 2) -> list[dict]:
+    """A mixed cart: variant lines, product-only lines and unknown products."""
+    lines = []
+    for i in range(n_lines):
+        pid = product_ids[i % len(product_ids)]
+        if i % 10 == 9:
+            lines.append({"product_id": 10_000_000 + i, "quantity": 1})
+        elif i % 3 == 0:
+            lines.append({"product_id": pid, "quantity": 1 + i % 4})
+        else:
+            lines.append({"product_id": pid, "variant_id": pid * per_product + i % per_product, "quantity": 1 + i % 12})
+    return lines
+
+
+async def measure(n_lines: int, *, n_products: int = 1000) -> dict[str, float]:
+    from backend.api.routes_catalog import validate_cart
+    from backend.schemas.schemas_catalog import CartValidationRequest
+
+    engine, Session = await make_engine()
+    try:
+        async with Session() as session:
+            product_ids = await seed_catalog(session, n_products)
+            await seed_variants(session, product_ids)
+        payload = CartValidationRequest(items=build_cart(n_lines, product_ids))
+        counter = QueryCounter(engine)
+        async with Session() as session:
+            with counter.track(), timed() as t:
+                response = await validate_cart(payload, db=session)
+        return {"lines": n_lines, "items": len(response.items), "queries": counter.count, "ms": t["ms"]}
+    finally:
+        await engine.dispose()
+
+
+async def run(lines: list[int], n_products: int) -> list[dict[str, float]]:
+    return [await measure(n, n_products=n_products) for n in lines]
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Cart validation query-count benchmark")
+    parser.add_argument("--lines", type=int, nargs="+", default=[1, 50, 500])
+    parser.add_argument("--products", type=int, default=1000)
+    args = parser.parse_args(argv)
+    print(f"{'lines':>8} {'queries':>8} {'ms':>10}")
+    for r in asyncio.run(run(args.lines, args.products)):
+        print(f"{r['lines']:>8} {r['queries']:>8} {r['ms']:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
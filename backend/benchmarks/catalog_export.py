@@ -0,0 +1,73 @@
+"""
+Benchmark: /api/v1/catalog/export throughput and peak memory vs. catalog size.
+
+The export streams through a server-side cursor, so rows/sec should hold
+steady and peak Python memory should stay flat as the catalog grows.
+Run with:
+
+    python -m backend.benchmarks.catalog_export --sizes 1000 5000 10000
+"""
+import argparse
+import asyncio
+import tracemalloc
+from typing import Optional
+
+from backend.benchmarks._support import make_engine, seed_catalog, timed
+
+
+async def measure(n_products: int, *, fmt: str = "ndjson") -> dict[str, float]:
+    """Drain one full export, counting rows, bytes and the traced memory peak."""
+    from backend.api.routes_catalog import export_products
+
+    engine, Session = await make_engine()
+    try:
+        async with Session() as session:
+            await seed_catalog(session, n_products)
+        async with Session() as session:
+            response = await export_products(
+                format=fmt, since=None, after_id=None, category_id=None,
+                subcategory_id=None, min_price=None, max_price=None, db=session,
+            )
+            rows = size = 0
+            tracemalloc.start()
+            try:
+                with timed() as t:
+                    async for chunk in response.body_iterator:
+                        size += len(chunk)
+                        rows += chunk.count("\n")
+                _, peak = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+        if fmt == "csv":
+            rows -= 1  # header line
+        return {
+            "products": n_products,
+            "rows": rows,
+            "mb": size / 1e6,
+            "ms": t["ms"],
+            "rows_per_s": rows / (t["ms"] / 1000) if t["ms"] else 0.0,
+            "peak_kb": peak / 1024,
+        }
+    finally:
+        await engine.dispose()
+
+
+async def run(sizes: list[int], fmt: str) -> list[dict[str, float]]:
+    return [await measure(n, fmt=fmt) for n in sizes]
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Catalog export throughput benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 5000, 10000])
+    parser.add_argument("--format", choices=["ndjson", "csv"], default="ndjson")
+    args = parser.parse_args(argv)
+    print(f"{'products':>10} {'rows':>10} {'MB':>8} {'ms':>10} {'rows/s':>10} {'peak KB':>10}")
+    for r in asyncio.run(run(args.sizes, args.format)):
+        print(
+            f"{r['products']:>10} {r['rows']:>10} {r['mb']:>8.2f} {r['ms']:>10.1f}"
+            f" {r['rows_per_s']:>10.0f} {r['peak_kb']:>10.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
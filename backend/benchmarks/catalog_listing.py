@@ -0,0 +1,93 @@
+"""
+Benchmark: /api/v1/catalog/products query count and latency vs. catalog size.
+
+The listing must issue a constant number of SQL statements however many
+products are active, and a deep keyset page must cost the same as the first.
+A revalidation with a current ETag must cost one statement (the version row).
+Run with:
+
+    python -m backend.benchmarks.catalog_listing --sizes 100 1000 20000
+"""
+import argparse
+import asyncio
+from typing import Any, Optional
+
+from fastapi import Response
+
+from backend.benchmarks._support import QueryCounter, make_engine, make_request, seed_catalog, timed
+
+
+async def _page(
+    session, *, limit: int, cursor: Optional[str] = None, sort: str = "id",
+    response: Optional[Response] = None, headers: Optional[dict[str, str]] = None,
+) -> Any:
+    from backend.api.routes_catalog import list_products
+    return await list_products(
+        make_request(headers), response or Response(),
+        limit=limit, cursor=cursor, sort=sort, order="asc",
+        category_id=None, subcategory_id=None, min_price=None, max_price=None,
+        db=session,
+    )
+
+
+async def measure(n_products: int, *, limit: int = 50, sort: str = "id") -> dict[str, float]:
+    """Time the first page and a page from the middle of the catalog."""
+    from backend.api.routes_catalog import _encode_cursor
+    from backend.repositories.repository.catalog_repository import CatalogFilters, CatalogRepository
+
+    engine, Session = await make_engine()
+    try:
+        async with Session() as session:
+            await seed_catalog(session, n_products)
+        counter = QueryCounter(engine)
+        async with Session() as session:
+            # Measure steady state: the taxonomy is loaded once per process
+            await _page(session, limit=1, sort=sort)
+            response = Response()
+            with counter.track(), timed() as first:
+                payload = await _page(session, limit=limit, sort=sort, response=response)
+            first_queries = counter.count
+            with counter.track(), timed() as revalidate:
+                await _page(session, limit=limit, sort=sort, headers={"If-None-Match": response.headers["etag"]})
+            revalidate_queries = counter.count
+            # Position a cursor halfway through the catalog without paging there
+            mid_rows = await CatalogRepository(session).list_page(
+                CatalogFilters(), sort=sort, limit=max(1, n_products // 2),
+            )
+            cursor = _encode_cursor(sort, "asc", mid_rows[-1])
+            with counter.track(), timed() as deep:
+                await _page(session, limit=limit, cursor=cursor, sort=sort)
+        return {
+            "products": n_products,
+            "items": len(payload["items"]),
+            "queries": first_queries,
+            "deep_queries": counter.count,
+            "revalidate_queries": revalidate_queries,
+            "ms": first["ms"],
+            "deep_ms": deep["ms"],
+            "revalidate_ms": revalidate["ms"],
+        }
+    finally:
+        await engine.dispose()
+
+
+async def run(sizes: list[int], limit: int, sort: str) -> list[dict[str, float]]:
+    return [await measure(n, limit=limit, sort=sort) for n in sizes]
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Catalog listing query-count benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000, 10000])
+    parser.add_argument("--limit", type=int, default=50)
+    parser.add_argument("--sort", choices=["id", "price", "created_at", "title"], default="id")
+    args = parser.parse_args(argv)
+    print(f"{'products':>10} {'queries':>8} {'ms':>10} {'deep q':>8} {'deep ms':>10} {'304 q':>6} {'304 ms':>8}")
+    for r in asyncio.run(run(args.sizes, args.limit, args.sort)):
+        print(
+            f"{r['products']:>10} {r['queries']:>8} {r['ms']:>10.1f} {r['deep_queries']:>8} {r['deep_ms']:>10.1f}"
+            f" {r['revalidate_queries']:>6} {r['revalidate_ms']:>8.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
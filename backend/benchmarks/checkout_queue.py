@@ -0,0 +1,142 @@
+"""
+Benchmark: checkout request latency, inline versus queued.
+
+`n_clients` buyers check out at once, each on its own session and
+connection, against a payment gateway that takes `payment_ms` to answer.
+Inline, every request runs the whole pipeline (order, items, stock,
+payment, cart) before it returns. Queued, a request only stores the
+checkout job, and a `CheckoutWorkerPool` of `concurrency` workers drains
+the queue afterwards; its throughput is reported separately. Run with:
+
+    python -m backend.benchmarks.checkout_queue --clients 20 100 --payment-ms 50
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+from typing import Any, Optional
+
+from backend.benchmarks._support import make_engine, seed_catalog, seed_variants, timed
+
+CHECKOUT = {
+    "shipment_info": {"street_line_1": "1 Main St", "city": "Springfield", "postal_code": "12345", "country": "US"},
+    "payment_info": {"payment_method_token": "tok_bench"},
+}
+
+
+class SlowPayments:
+    """Payment gateway stand-in that answers after `delay` seconds."""
+
+    def __init__(self, delay: float):
+        self.delay = delay
+
+    async def process_payment(self, **kwargs: Any) -> dict[str, str]:
+        await asyncio.sleep(self.delay)
+        return {"status": "succeeded"}
+
+
+async def seed_carts(session: Any, n_clients: int) -> None:
+    """One cart per buyer (users 1..n), each with two variant lines."""
+    from sqlalchemy import insert, update
+    from backend.persistance.cart import Cart
+    from backend.persistance.cart_item import CartItem
+    from backend.persistance.product_variant import ProductVariant
+
+    await session.execute(update(ProductVariant).values(quantity=10 * n_clients))
+    await session.execute(insert(Cart), [{"cart_id": u, "user_id": u} for u in range(1, n_clients + 1)])
+    await session.execute(insert(CartItem), [
+        {"cart_id": u, "product_id": pid, "variant_id": pid * 2, "quantity": 1}
+        for u in range(1, n_clients + 1)
+        for pid in (1 + u % 40, 41 + u % 9)
+    ])
+    await session.commit()
+
+
+async def checkout(Session: Any, user_id: int, *, queued: bool, payments: Any) -> float:
+    """One checkout request; returns its latency in ms."""
+    from sqlalchemy import update
+    from backend.persistance.checkout_job import JOB_PROCESSING, CheckoutJob
+    from backend.services.checkout_service import enqueue_checkout, process_checkout_job
+
+    with timed() as t:
+        async with Session() as session:
+            job = await enqueue_checkout(user_id, CHECKOUT, session)
+            if not queued:
+                # Inline: the request owns the job and runs the pipeline itself
+                worker = f"request-{user_id}"
+                await session.execute(
+                    update(CheckoutJob).where(CheckoutJob.job_id == job.job_id)
+                    .values(status=JOB_PROCESSING, locked_by=worker, attempts=1)
+                )
+                await session.commit()
+                await process_checkout_job(job, worker, session, payments=payments)
+    return t["ms"]
+
+
+async def measure(
+    n_clients: int, *, queued: bool = True, concurrency: int = 8, payment_ms: float = 50.0
+) -> dict[str, float]:
+    from sqlalchemy import func, select
+    from backend.persistance.checkout_job import JOB_SUCCEEDED, CheckoutJob
+    from backend.services.checkout_service import CheckoutWorkerPool
+
+    payments = SlowPayments(payment_ms / 1000)
+    with tempfile.TemporaryDirectory() as tmp:
+        engine, Session = await make_engine(os.path.join(tmp, "bench.db"))
+        try:
+            async with Session() as session:
+                await seed_variants(session, await seed_catalog(session, 50))
+                await seed_carts(session, n_clients)
+            with timed() as t:
+                latencies = await asyncio.gather(
+                    *[checkout(Session, u, queued=queued, payments=payments) for u in range(1, n_clients + 1)]
+                )
+            pool = CheckoutWorkerPool(Session, concurrency=concurrency, payments=payments, name="bench")
+            with timed() as drain:
+                await pool.drain()
+            async with Session() as session:
+                succeeded = await session.scalar(
+                    select(func.count()).select_from(CheckoutJob).where(CheckoutJob.status == JOB_SUCCEEDED)
+                )
+            latencies = sorted(latencies)
+            return {
+                "clients": n_clients,
+                "p50_ms": statistics.median(latencies),
+                "p95_ms": latencies[max(0, int(len(latencies) * 0.95) - 1)],
+                "requests_ms": t["ms"],
+                "drain_ms": drain["ms"] if queued else 0.0,
+                "orders_per_s": n_clients / ((t["ms"] + (drain["ms"] if queued else 0.0)) / 1000),
+                "succeeded": succeeded,
+            }
+        finally:
+            await engine.dispose()
+
+
+async def run(clients: list[int], concurrency: int, payment_ms: float) -> list[tuple[dict[str, float], dict[str, float]]]:
+    return [
+        (
+            await measure(n, queued=False, concurrency=concurrency, payment_ms=payment_ms),
+            await measure(n, queued=True, concurrency=concurrency, payment_ms=payment_ms),
+        )
+        for n in clients
+    ]
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Inline versus queued checkout benchmark")
+    parser.add_argument("--clients", type=int, nargs="+", default=[20, 100])
+    parser.add_argument("--concurrency", type=int, default=8, help="Checkout workers")
+    parser.add_argument("--payment-ms", type=float, default=50.0, help="Simulated payment gateway latency")
+    args = parser.parse_args(argv)
+    print(f"{'clients':>8} {'mode':>7} {'p50 ms':>8} {'p95 ms':>8} {'requests ms':>12} {'drain ms':>9} {'orders/s':>9} {'ok':>5}")
+    for pair in asyncio.run(run(args.clients, args.concurrency, args.payment_ms)):
+        for mode, r in zip(("inline", "queued"), pair):
+            print(
+                f"{r['clients']:>8} {mode:>7} {r['p50_ms']:>8.1f} {r['p95_ms']:>8.1f} {r['requests_ms']:>12.1f}"
+                f" {r['drain_ms']:>9.1f} {r['orders_per_s']:>9.0f} {r['succeeded']:>5}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""
+Benchmark: line-item views (cart, wishlist, order detail, refund detail)
+query and commit count vs. number of lines.
+
+Every view hydrates its lines through LineItemHydrator, so it must issue a
+fixed number of SQL statements however many lines it has; the cart and
+wishlist write every removal and quantity trim in one commit. Run with:
+
+    python -m backend.benchmarks.line_hydration --lines 1 30 300 --view cart
+"""
+import argparse
+import asyncio
+import datetime as dt
+from typing import Any, Optional
+
+from sqlalchemy import insert, update
+
+from backend.benchmarks._support import QueryCounter, make_engine, seed_catalog, seed_variants, timed
+
+VIEWS = ("cart", "wishlist", "order", "refund")
+
+
+def build_lines(n_lines: int, product_ids: list[int], *, per_product: int = 2) -> list[dict[str, Any]]:
+    """Line references: every third line has no variant."""
+    lines = []
+    for i in range(n_lines):
+        pid = product_ids[i % len(product_ids)]
+        variant_id = None if i % 3 == 0 else pid * per_product + i % per_product
+        lines.append({"product_id": pid, "variant_id": variant_id, "quantity": 1 + i % 4})
+    return lines
+
+
+async def seed_lines(session: Any, n_lines: int, product_ids: list[int]) -> None:
+    """Give seller 1 a cart (id 1), a wishlist (id 1) and an order (id 1, refund request 1)
+    holding the same `n_lines` lines.
+
+    The product of every tenth line has since been deactivated.
+    """
+    from backend.persistance.cart import Cart
+    from backend.persistance.cart_item import CartItem
+    from backend.persistance.enums import OrderStatusEnum
+    from backend.persistance.order import Order
+    from backend.persistance.order_item import OrderItem
+    from backend.persistance.product import Product
+    from backend.persistance.refund_request import RefundRequest
+    from backend.persistance.wishlist import Wishlist
+    from backend.persistance.wishlist_item import WishlistItem
+
+    now = dt.datetime.now()
+    lines = build_lines(n_lines, product_ids)
+    await session.execute(insert(Cart).values(cart_id=1, user_id=1, created_at=now, updated_at=now))
+    await session.execute(insert(Wishlist).values(wishlist_id=1, user_id=1, created_at=now, updated_at=now))
+    await session.execute(insert(Order).values(
+        order_id=1, user_id=1, order_status=list(OrderStatusEnum)[0], total_amount=0,
+        created_at=now, updated_at=now, order_number=1,
+    ))
+    await session.execute(insert(RefundRequest).values(
+        refund_request_id=1, order_id=1, order_item_ids="[]", reason="bench", status="pending", date_of_request=now,
+    ))
+    if lines:
+        await session.execute(insert(CartItem), [{"cart_item_id": i + 1, "cart_id": 1, **line} for i, line in enumerate(lines)])
+        await session.execute(insert(WishlistItem), [
+            {"wishlist_item_id": i + 1, "wishlist_id": 1, "user_id": 1, **line} for i, line in enumerate(lines)
+        ])
+        await session.execute(insert(OrderItem), [
+            {"order_item_id": i + 1, "order_id": 1, "subtotal": 1.0, **line} for i, line in enumerate(lines)
+        ])
+    inactive = [line["product_id"] for i, line in enumerate(lines) if i % 10 == 9]
+    if inactive:
+        await session.execute(update(Product).where(Product.product_id.in_(inactive)).values(is_active=False))
+    await session.commit()
+
+
+async def load_view(session: Any, view: str) -> list[Any]:
+    """Run one view against the seeded data and return its lines."""
+    from backend.services import customerAssistanceServices, customerServices
+
+    if view == "cart":
+        return (await customerServices.get_cart_items(session, cart_id=1, user_id=1))["items"]
+    if view == "wishlist":
+        return (await customerServices.get_wishlist_items(session, wishlist_id=1))["items"]
+    if view == "order":
+        return (await customerServices.get_order_details(1, session))["lines"]
+    return (await customerAssistanceServices.get_specific_refund_request(1, session))["order_items"]
+
+
+async def measure(n_lines: int, *, view: str = "cart", n_products: int = 1000) -> dict[str, Any]:
+    engine, Session = await make_engine()
+    try:
+        async with Session() as session:
+            product_ids = await seed_catalog(session, n_products)
+            await seed_variants(session, product_ids)
+            await seed_lines(session, n_lines, product_ids)
+        counter = QueryCounter(engine)
+        async with Session() as session:
+            with counter.track(), timed() as t:
+                items = await load_view(session, view)
+        return {
+            "view": view,
+            "lines": n_lines,
+            "items": len(items),
+            "queries": counter.count,
+            "commits": counter.commits,
+            "ms": t["ms"],
+        }
+    finally:
+        await engine.dispose()
+
+
+async def run(lines: list[int], views: list[str], n_products: int) -> list[dict[str, Any]]:
+    return [await measure(n, view=view, n_products=n_products) for view in views for n in lines]
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Line-item hydration query-count benchmark")
+    parser.add_argument("--lines", type=int, nargs="+", default=[1, 30, 300])
+    parser.add_argument("--view", choices=VIEWS, nargs="+", default=list(VIEWS))
+    parser.add_argument("--products", type=int, default=1000)
+    args = parser.parse_args(argv)
+    print(f"{'view':>9} {'lines':>8} {'queries':>8} {'commits':>8} {'ms':>10}")
+    for r in asyncio.run(run(args.lines, args.view, args.products)):
+        print(f"{r['view']:>9} {r['lines']:>8} {r['queries']:>8} {r['commits']:>8} {r['ms']:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
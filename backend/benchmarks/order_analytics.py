@@ -0,0 +1,111 @@
+"""
+Benchmark: seller sales trends over a year of orders.
+
+Compares `SellerService.analyze_orders_for_product(source="orders")`, which
+groups units, revenue and order counts per period in the database, with the
+previous approach: load every matching Order and OrderItem through the ORM
+and run the three loops of backend/utilities/analysis.py. Run with:
+
+    python -m backend.benchmarks.order_analytics --orders 10000 50000 --period weekly
+"""
+import argparse
+import asyncio
+import datetime as dt
+from collections import defaultdict
+from types import SimpleNamespace
+from typing import Any, Optional
+
+from backend.benchmarks._support import QueryCounter, make_engine, seed_catalog, timed
+
+START = dt.datetime(2025, 1, 1)
+
+
+async def seed_orders(session: Any, n_orders: int, *, n_products: int = 50, days: int = 365) -> None:
+    """`n_orders` orders spread over `days`, each with one to three lines of the seller's products."""
+    from sqlalchemy import insert
+    from backend.persistance.order import Order
+    from backend.persistance.order_item import OrderItem
+
+    await session.execute(insert(Order), [
+        {"order_id": oid, "user_id": 1, "order_status": "confirmed", "total_amount": 0, "order_number": oid,
+         "created_at": START + dt.timedelta(days=oid % days, minutes=oid % 1440), "is_deleted": False}
+        for oid in range(1, n_orders + 1)
+    ])
+    await session.execute(insert(OrderItem), [
+        {"order_id": oid, "product_id": 1 + (oid + line) % n_products, "quantity": 1 + line,
+         "subtotal": float(5 + (oid + line) % 20), "is_deleted": False}
+        for oid in range(1, n_orders + 1)
+        for line in range(1 + oid % 3)
+    ])
+    await session.commit()
+
+
+async def legacy_analysis(session: Any, seller_id: int, period: str) -> dict[str, Any]:
+    """Load ORM orders and items, then aggregate with the in-memory helpers."""
+    from sqlalchemy import select
+    from backend.persistance.order_item import OrderItem
+    from backend.persistance.product import Product
+    from backend.repositories.repository.order_repository import OrderRepository
+    from backend.utilities import analysis
+
+    product_ids = set((await session.scalars(select(Product.product_id).where(Product.seller_id == seller_id))).all())
+    orders = await OrderRepository(session).filter_orders()
+    items = (await session.scalars(select(OrderItem).where(OrderItem.product_id.in_(product_ids)))).all()
+    by_order = defaultdict(list)
+    for item in items:
+        by_order[item.order_id].append(item)
+    views = [
+        SimpleNamespace(created_at=o.created_at, order_items=by_order[o.order_id],
+                        total_amount=sum(i.subtotal for i in by_order[o.order_id]))
+        for o in orders if by_order[o.order_id]
+    ]
+    return {
+        **analysis.analyze_units_sold_trends(views, period),
+        **analysis.analyze_revenue_profit_trends(views, period),
+        **analysis.analyze_order_count_trends(views, period),
+    }
+
+
+async def measure(n_orders: int, *, period: str = "weekly", sql: bool = True) -> dict[str, float]:
+    from backend.services.sellerServices import SellerService
+
+    engine, Session = await make_engine()
+    try:
+        async with Session() as session:
+            await seed_catalog(session, 50)
+            await seed_orders(session, n_orders)
+        counter = QueryCounter(engine)
+        async with Session() as session:
+            with counter.track(), timed() as t:
+                if sql:
+                    result = await SellerService(session).analyze_orders_for_product(
+                        seller_id=1, period=period, source="orders"
+                    )
+                    units = sum(result["units_sold"])
+                    periods = len(result["periods"])
+                else:
+                    result = await legacy_analysis(session, 1, period)
+                    units = sum(result["trends"].values())
+                    periods = len(result["trends"])
+        return {"orders": n_orders, "queries": counter.count, "ms": t["ms"], "units_sold": units, "periods": periods}
+    finally:
+        await engine.dispose()
+
+
+async def run(sizes: list[int], period: str) -> list[tuple[dict[str, float], dict[str, float]]]:
+    return [(await measure(n, period=period, sql=False), await measure(n, period=period)) for n in sizes]
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Seller order analytics benchmark")
+    parser.add_argument("--orders", type=int, nargs="+", default=[10000, 50000])
+    parser.add_argument("--period", default="weekly", choices=["daily", "weekly", "monthly"])
+    args = parser.parse_args(argv)
+    print(f"{'orders':>7} {'mode':>7} {'queries':>8} {'ms':>9} {'periods':>8} {'units':>9}")
+    for pair in asyncio.run(run(args.orders, args.period)):
+        for mode, r in zip(("python", "sql"), pair):
+            print(f"{r['orders']:>7} {mode:>7} {r['queries']:>8} {r['ms']:>9.1f} {r['periods']:>8} {r['units_sold']:>9}")
+
+
+if __name__ == "__main__":
+    main()
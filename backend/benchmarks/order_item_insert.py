@@ -0,0 +1,106 @@
+"""
+Benchmark: writing the lines of a large order, and shipping it.
+
+Compares building `OrderItem` / `ShipmentItem` objects and flushing them
+through the ORM unit of work against the repositories' `bulk_create`,
+which sends the column dicts as one multi-row INSERT ... RETURNING. Both
+write the same rows in one transaction. Run with:
+
+    python -m backend.benchmarks.order_item_insert --lines 100 1000 5000
+"""
+import argparse
+import asyncio
+import datetime as dt
+from typing import Any, Optional
+
+from backend.benchmarks._support import QueryCounter, make_engine, seed_catalog, seed_variants, timed
+
+
+def order_lines(n_lines: int, n_products: int) -> list[dict[str, Any]]:
+    return [
+        {"product_id": 1 + i % n_products, "variant_id": 2 * (1 + i % n_products), "quantity": 1 + i % 3,
+         "subtotal": float(1 + i % 50)}
+        for i in range(n_lines)
+    ]
+
+
+async def write_order(session: Any, lines: list[dict[str, Any]], *, bulk: bool) -> tuple[int, int]:
+    """Insert an order with `lines` and a shipment of all of them; returns (order_id, shipment_id)."""
+    from backend.persistance.enums import OrderStatusEnum
+    from backend.persistance.order import Order
+    from backend.persistance.order_item import OrderItem
+    from backend.persistance.shipment import Shipment
+    from backend.persistance.shipment_item import ShipmentItem
+    from backend.repositories.repository.order_item_repository import OrderItemRepository
+    from backend.repositories.repository.shipment_item_repository import ShipmentItemRepository
+
+    now = dt.datetime(2026, 1, 1)
+    order = Order(user_id=1, order_status=OrderStatusEnum.pending, total_amount=0, created_at=now,
+                  updated_at=now, order_number=1)
+    session.add(order)
+    await session.flush()
+    rows = [{"order_id": order.order_id, **line} for line in lines]
+    if bulk:
+        items = await OrderItemRepository(session).bulk_create(rows)
+    else:
+        items = [OrderItem(**row) for row in rows]
+        session.add_all(items)
+        await session.flush()
+    shipment = Shipment(order_id=order.order_id, shipment_status="created")
+    session.add(shipment)
+    await session.flush()
+    shipped = [
+        {"shipment_id": shipment.shipment_id, "product_id": item.product_id, "variant_id": item.variant_id,
+         "quantity": item.quantity}
+        for item in items
+    ]
+    if bulk:
+        await ShipmentItemRepository(session).bulk_create(shipped)
+    else:
+        session.add_all([ShipmentItem(**row) for row in shipped])
+        await session.flush()
+    await session.commit()
+    return order.order_id, shipment.shipment_id
+
+
+async def measure(n_lines: int, *, n_products: int = 200, bulk: bool = True) -> dict[str, float]:
+    from sqlalchemy import func, select
+    from backend.persistance.order_item import OrderItem
+    from backend.persistance.shipment_item import ShipmentItem
+
+    engine, Session = await make_engine()
+    try:
+        async with Session() as session:
+            await seed_variants(session, await seed_catalog(session, n_products))
+        lines = order_lines(n_lines, n_products)
+        counter = QueryCounter(engine)
+        async with Session() as session:
+            with counter.track(), timed() as t:
+                await write_order(session, lines, bulk=bulk)
+        async with Session() as session:
+            written = await session.scalar(select(func.count()).select_from(OrderItem))
+            shipped = await session.scalar(select(func.count()).select_from(ShipmentItem))
+        return {
+            "lines": n_lines, "queries": counter.count, "commits": counter.commits,
+            "ms": t["ms"], "order_items": written, "shipment_items": shipped,
+        }
+    finally:
+        await engine.dispose()
+
+
+async def run(sizes: list[int]) -> list[tuple[dict[str, float], dict[str, float]]]:
+    return [(await measure(n, bulk=False), await measure(n)) for n in sizes]
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Order and shipment item insert benchmark")
+    parser.add_argument("--lines", type=int, nargs="+", default=[100, 1000, 5000])
+    args = parser.parse_args(argv)
+    print(f"{'lines':>6} {'mode':>5} {'queries':>8} {'commits':>8} {'ms':>9}")
+    for pair in asyncio.run(run(args.lines)):
+        for mode, r in zip(("orm", "bulk"), pair):
+            print(f"{r['lines']:>6} {mode:>5} {r['queries']:>8} {r['commits']:>8} {r['ms']:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Benchmark: order number allocation from several workers at once.
+
+`n_workers` allocators (one per simulated process) share a SQLite file and
+each hand out `per_worker` order numbers concurrently. Reports how many
+statements the allocations cost, the time per number, and whether any number
+was issued twice. Run with:
+
+    python -m backend.benchmarks.order_numbers --workers 4 --per-worker 1000 5000
+"""
+import argparse
+import asyncio
+import os
+import tempfile
+from typing import Optional
+
+from backend.benchmarks._support import QueryCounter, make_engine, timed
+
+
+async def measure(n_workers: int, per_worker: int) -> dict[str, float]:
+    from backend.services.order_number_allocator import OrderNumberAllocator
+
+    async def worker(allocator: OrderNumberAllocator, engine) -> list[int]:
+        numbers = []
+        for _ in range(per_worker):
+            numbers.append(await allocator.next(engine))
+            # Let the other workers interleave, as concurrent requests would
+            await asyncio.sleep(0)
+        return numbers
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine, _ = await make_engine(os.path.join(tmp, "bench.db"))
+        try:
+            counter = QueryCounter(engine)
+            with counter.track(), timed() as t:
+                issued = await asyncio.gather(*[worker(OrderNumberAllocator(), engine) for _ in range(n_workers)])
+            numbers = [n for per in issued for n in per]
+            return {
+                "workers": n_workers,
+                "numbers": len(numbers),
+                "unique": len(set(numbers)),
+                "queries": counter.count,
+                "us_per_number": t["ms"] * 1000 / len(numbers),
+                # Each worker's own numbers only ever increase
+                "monotonic": all(per == sorted(per) for per in issued),
+            }
+        finally:
+            await engine.dispose()
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Order number allocation benchmark")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--per-worker", type=int, nargs="+", default=[1000, 5000])
+    args = parser.parse_args(argv)
+    print(f"{'workers':>8} {'numbers':>8} {'unique':>8} {'queries':>8} {'us/number':>10} {'monotonic':>10}")
+    for per_worker in args.per_worker:
+        r = asyncio.run(measure(args.workers, per_worker))
+        print(
+            f"{r['workers']:>8} {r['numbers']:>8} {r['unique']:>8} {r['queries']:>8}"
+            f" {r['us_per_number']:>10.1f} {str(r['monotonic']):>10}"
+        )
+
+
+if __name__ == "__main__":
+    main()
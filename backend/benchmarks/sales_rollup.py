@@ -0,0 +1,98 @@
+"""
+Benchmark: seller report latency as order history grows.
+
+Seeds `n` orders over `days` days, backfills the daily sales rollup, then
+times one monthly report for the seller two ways: from the rollup
+(`source="rollup"`) and from the raw orders (`source="orders"`). Also times a
+refresh that applies a day's worth of new orders through the outbox. Run with:
+
+    python -m backend.benchmarks.sales_rollup --orders 10000 100000 --period monthly
+"""
+import argparse
+import asyncio
+import datetime as dt
+from typing import Any, Optional
+
+from backend.benchmarks._support import QueryCounter, make_engine, seed_catalog, timed
+from backend.benchmarks.order_analytics import START, seed_orders
+
+
+async def report(session: Any, period: str, source: str) -> dict[str, Any]:
+    from backend.services.sellerServices import SellerService
+
+    return await SellerService(session).analyze_orders_for_product(seller_id=1, period=period, source=source)
+
+
+async def add_orders(session: Any, first_id: int, n_orders: int, day: dt.datetime) -> None:
+    """`n_orders` more orders on `day`, through the ORM bulk insert (so the outbox records them)."""
+    from sqlalchemy import insert
+    from backend.persistance.order import Order
+    from backend.repositories.repository.order_item_repository import OrderItemRepository
+
+    ids = range(first_id, first_id + n_orders)
+    await session.execute(insert(Order), [
+        {"order_id": oid, "user_id": 1, "order_status": "confirmed", "total_amount": 0, "order_number": oid,
+         "created_at": day, "is_deleted": False}
+        for oid in ids
+    ])
+    await OrderItemRepository(session).bulk_create(
+        {"order_id": oid, "product_id": 1 + oid % 50, "quantity": 1, "subtotal": 10.0} for oid in ids
+    )
+    await session.commit()
+
+
+async def measure(n_orders: int, *, period: str = "monthly", days: int = 365, new_orders: int = 200) -> dict[str, Any]:
+    from backend.services.sales_rollup_service import SalesRollupService
+
+    engine, Session = await make_engine()
+    try:
+        async with Session() as session:
+            await seed_catalog(session, 50)
+            await seed_orders(session, n_orders, days=days)
+        async with Session() as session:
+            # Also consumes the outbox events the seed queued
+            with timed() as backfill:
+                await SalesRollupService(session).backfill()
+        counter = QueryCounter(engine)
+        out: dict[str, Any] = {"orders": n_orders, "backfill_ms": backfill["ms"]}
+        for key, source in (("rollup", "rollup"), ("raw", "orders")):
+            async with Session() as session:
+                # Untimed first run: statement compilation is not what is measured
+                await report(session, period, source)
+                with counter.track(), timed() as t:
+                    result = await report(session, period, source)
+            out[key] = {
+                "ms": t["ms"], "queries": counter.count,
+                "units_sold": sum(result["units_sold"]), "revenue": round(sum(result["revenue"]), 2),
+                "order_count": sum(result["order_count"]), "periods": len(result["periods"]),
+            }
+        async with Session() as session:
+            await add_orders(session, n_orders + 1, new_orders, START + dt.timedelta(days=days // 2))
+        async with Session() as session:
+            with counter.track(), timed() as t:
+                consumed = await SalesRollupService(session).refresh()
+        out["refresh"] = {"ms": t["ms"], "queries": counter.count, "events": consumed}
+        return out
+    finally:
+        await engine.dispose()
+
+
+async def run(sizes: list[int], period: str) -> list[dict[str, Any]]:
+    return [await measure(n, period=period) for n in sizes]
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Daily sales rollup benchmark")
+    parser.add_argument("--orders", type=int, nargs="+", default=[10000, 100000])
+    parser.add_argument("--period", default="monthly", choices=["daily", "weekly", "monthly", "yearly"])
+    args = parser.parse_args(argv)
+    print(f"{'orders':>7} {'rollup ms':>10} {'orders ms':>10} {'refresh ms':>11} {'events':>7} {'backfill ms':>12}")
+    for r in asyncio.run(run(args.orders, args.period)):
+        print(
+            f"{r['orders']:>7} {r['rollup']['ms']:>10.1f} {r['raw']['ms']:>10.1f} "
+            f"{r['refresh']['ms']:>11.1f} {r['refresh']['events']:>7} {r['backfill_ms']:>12.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
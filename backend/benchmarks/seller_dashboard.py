@@ -0,0 +1,122 @@
+"""
+Benchmark: the seller dashboard, sections one at a time vs concurrently.
+
+Seeds a file-backed SQLite database (so every section gets its own
+connection) with products, variants, a year of orders, the sales rollup,
+payouts and comments, then builds the dashboard with different concurrency
+caps. A cap of 1 is what the portal's separate calls amounted to: the same
+reads, one after another. Local SQLite answers in microseconds, so
+--latency-ms adds a simulated network round trip before every statement, as
+against a remote Postgres. Run with:
+
+    python -m backend.benchmarks.seller_dashboard --orders 20000 100000 --concurrency 1 2 4 --latency-ms 0 2
+"""
+import argparse
+import asyncio
+import datetime as dt
+import os
+import tempfile
+from typing import Any, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from backend.benchmarks._support import make_engine, seed_catalog, seed_variants, timed
+from backend.benchmarks.order_analytics import START, seed_orders
+
+TODAY = (START + dt.timedelta(days=200)).date()
+
+
+class RemoteSession(AsyncSession):
+    """AsyncSession that waits `latency` seconds before each statement, like a database across a network."""
+    latency = 0.0
+
+    async def execute(self, *args: Any, **kwargs: Any) -> Any:
+        await asyncio.sleep(self.latency)
+        return await super().execute(*args, **kwargs)
+
+    async def scalar(self, *args: Any, **kwargs: Any) -> Any:
+        await asyncio.sleep(self.latency)
+        return await super().scalar(*args, **kwargs)
+
+    async def scalars(self, *args: Any, **kwargs: Any) -> Any:
+        await asyncio.sleep(self.latency)
+        return await super().scalars(*args, **kwargs)
+
+
+def remote_sessions(engine: Any, latency_ms: float) -> Any:
+    session_class = type("RemoteSession", (RemoteSession,), {"latency": latency_ms / 1000.0})
+    return async_sessionmaker(bind=engine, class_=session_class, expire_on_commit=False, autoflush=False)
+
+
+async def seed_dashboard(session: Any, n_orders: int, *, n_products: int = 50, n_comments: int = 500) -> None:
+    from sqlalchemy import insert
+    from backend.persistance.product_comment import ProductComment
+    from backend.persistance.seller_payout import SellerPayout
+    from backend.services.sales_rollup_service import SalesRollupService
+
+    await seed_variants(session, await seed_catalog(session, n_products))
+    await seed_orders(session, n_orders, n_products=n_products)
+    await session.execute(insert(ProductComment), [
+        {"comment_id": cid, "product_id": 1 + cid % n_products, "user_id": 1, "comment": f"Comment {cid}",
+         "response": "Thanks" if cid % 3 else None, "created_at": START + dt.timedelta(hours=cid), "is_deleted": False}
+        for cid in range(1, n_comments + 1)
+    ])
+    await session.execute(insert(SellerPayout).values(
+        payout_id=1, seller_id=1, amount=0, currency="USD", date_of_payment=TODAY, status="pending",
+    ))
+    await session.commit()
+    await SalesRollupService(session).backfill()
+
+
+async def measure(
+    n_orders: int, *, concurrency: int = 4, period: str = "weekly", latency_ms: float = 0.0
+) -> dict[str, Any]:
+    from backend.services.seller_dashboard_service import build_seller_dashboard
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine, Session = await make_engine(os.path.join(tmp, "bench.db"))
+        try:
+            async with Session() as session:
+                await seed_dashboard(session, n_orders)
+            Session = remote_sessions(engine, latency_ms)
+            # Untimed first build: connection setup and statement compilation are not what is measured
+            await build_seller_dashboard(1, period=period, today=TODAY, session_factory=Session)
+            with timed() as t:
+                result = await build_seller_dashboard(
+                    1, period=period, today=TODAY, session_factory=Session, concurrency=concurrency
+                )
+            timing = result["timing"]
+            return {
+                "orders": n_orders, "concurrency": concurrency, "latency_ms": latency_ms, "ms": t["ms"],
+                "section_ms": round(sum(s["ms"] for s in timing["sections"].values()), 1),
+                "ok": all(s["ok"] for s in timing["sections"].values()),
+                "sections": timing["sections"], "result": result["sections"],
+            }
+        finally:
+            await engine.dispose()
+
+
+async def run(sizes: list[int], caps: list[int], latencies: list[float]) -> list[dict[str, Any]]:
+    return [
+        await measure(n, concurrency=cap, latency_ms=latency)
+        for n in sizes for latency in latencies for cap in caps
+    ]
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Seller dashboard fan-out benchmark")
+    parser.add_argument("--orders", type=int, nargs="+", default=[20000, 100000])
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4])
+    parser.add_argument("--latency-ms", type=float, nargs="+", default=[0.0, 2.0])
+    args = parser.parse_args(argv)
+    print(f"{'orders':>7} {'rtt ms':>7} {'cap':>4} {'ms':>9} {'sum of sections':>16}  per section ms")
+    for r in asyncio.run(run(args.orders, args.concurrency, args.latency_ms)):
+        per = " ".join(f"{name}={s['ms']:.1f}" for name, s in r["sections"].items())
+        print(
+            f"{r['orders']:>7} {r['latency_ms']:>7.1f} {r['concurrency']:>4} {r['ms']:>9.1f} "
+            f"{r['section_ms']:>16.1f}  {per}"
+        )
+
+
+if __name__ == "__main__":
+    main()
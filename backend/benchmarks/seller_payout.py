@@ -0,0 +1,108 @@
+"""
+Benchmark: monthly seller payout reconciliation.
+
+Compares `SellerService.get_seller_payout`, which sums one month of the
+seller's order lines in SQL, with the previous approach: load every order in
+the system and filter by product, status and month in Python. Also times
+`reconcile_seller_payouts` (every seller, one grouped query) against calling
+`get_seller_payout` once per seller. Run with:
+
+    python -m backend.benchmarks.seller_payout --orders 10000 100000 --sellers 20
+"""
+import argparse
+import asyncio
+from typing import Any, Optional
+
+from backend.benchmarks._support import QueryCounter, make_engine, seed_catalog, timed
+from backend.benchmarks.order_analytics import START, seed_orders
+
+YEAR, MONTH = START.year, START.month + 1
+
+
+async def seed_sellers_and_payouts(session: Any, n_sellers: int) -> None:
+    """Spread the products over `n_sellers` and pay each seller exactly the month's sales."""
+    import datetime as dt
+    from sqlalchemy import insert, update
+    from backend.persistance.product import Product
+    from backend.persistance.seller_payout import SellerPayout
+    from backend.services.sellerServices import SellerService
+
+    await session.execute(update(Product).values(seller_id=1 + Product.product_id % n_sellers))
+    await session.commit()
+    sales = await SellerService(session).reconcile_seller_payouts(YEAR, MONTH)
+    await session.execute(insert(SellerPayout), [
+        {"payout_id": row["seller_id"], "seller_id": row["seller_id"], "amount": row["order_total"],
+         "currency": "USD", "date_of_payment": dt.date(YEAR, MONTH, 28), "status": "completed"}
+        for row in sales
+    ])
+    await session.commit()
+
+
+async def legacy_payout_total(session: Any, seller_id: int, year: int, month: int) -> float:
+    """The previous reconciliation sum: every order loaded, then filtered in Python."""
+    from sqlalchemy import select
+    from backend.persistance.product import Product
+    from backend.repositories.repository.order_repository import OrderRepository
+
+    products = (await session.scalars(
+        select(Product).filter(Product.seller_id == seller_id, Product.is_deleted == False)
+    )).all()
+    valid_product_ids = [p.product_id for p in products]
+    orders = await OrderRepository(session).filter_orders()
+    filtered = [
+        o for o in orders
+        if o.product_id in valid_product_ids and not o.is_deleted and o.created_at is not None
+        and o.created_at.year == year and o.created_at.month == month
+    ]
+    return float(sum(o.total_amount for o in filtered))
+
+
+async def measure(n_orders: int, *, n_sellers: int = 20, mode: str = "sql") -> dict[str, Any]:
+    """`mode`: 'legacy' or 'sql' reconcile seller 1; 'per_seller' or 'batch' reconcile every seller."""
+    from backend.services.sellerServices import SellerService
+
+    engine, Session = await make_engine()
+    try:
+        async with Session() as session:
+            await seed_catalog(session, 50)
+            await seed_orders(session, n_orders)
+            await seed_sellers_and_payouts(session, n_sellers)
+        counter = QueryCounter(engine)
+        async with Session() as session:
+            with counter.track(), timed() as t:
+                if mode == "legacy":
+                    reconciled = 1
+                    await legacy_payout_total(session, 1, YEAR, MONTH)
+                elif mode == "sql":
+                    reconciled = int(await SellerService(session).get_seller_payout(1, YEAR, MONTH) is not None)
+                elif mode == "per_seller":
+                    service = SellerService(session)
+                    payouts = [await service.get_seller_payout(s, YEAR, MONTH) for s in range(1, n_sellers + 1)]
+                    reconciled = sum(p is not None for p in payouts)
+                else:
+                    rows = await SellerService(session).reconcile_seller_payouts(YEAR, MONTH)
+                    reconciled = sum(bool(row["matches"]) for row in rows)
+        return {"orders": n_orders, "mode": mode, "queries": counter.count, "ms": t["ms"], "reconciled": reconciled}
+    finally:
+        await engine.dispose()
+
+
+async def run(sizes: list[int], n_sellers: int) -> list[dict[str, Any]]:
+    return [
+        await measure(n, n_sellers=n_sellers, mode=mode)
+        for n in sizes for mode in ("legacy", "sql", "per_seller", "batch")
+    ]
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Seller payout reconciliation benchmark")
+    parser.add_argument("--orders", type=int, nargs="+", default=[10000, 100000])
+    parser.add_argument("--sellers", type=int, default=20)
+    args = parser.parse_args(argv)
+    print(f"{'orders':>7} {'mode':>11} {'queries':>8} {'ms':>9} {'reconciled':>11}")
+    for r in asyncio.run(run(args.orders, args.sellers)):
+        print(f"{r['orders']:>7} {r['mode']:>11} {r['queries']:>8} {r['ms']:>9.1f} {r['reconciled']:>11}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""
+Benchmark: many concurrent buyers of the same SKU.
+
+Every buyer runs checkout's inventory step on its own session and
+connection: one unit of the hot variant plus one unit of a second variant.
+The conditional, batched reservation sells exactly the stock there is;
+the previous read-modify-write decrement (SELECT, `quantity -= qty`,
+commit) loses updates between the read and the write, so it reports more
+sales than the stock it actually removed. Run with:
+
+    python -m backend.benchmarks.stock_reservation --buyers 50 200 --stock 100
+"""
+import argparse
+import asyncio
+import os
+import tempfile
+from typing import Any, Optional
+
+from backend.benchmarks._support import make_engine, seed_catalog, seed_variants, timed
+
+HOT_VARIANT = 2  # product 1, variant 0
+
+
+async def legacy_decrement(session: Any, variant_id: int, qty: int) -> bool:
+    """The read-modify-write `decrement_stock` that conditional reservation replaced."""
+    from sqlalchemy import select
+    from backend.persistance.product_variant import ProductVariant
+
+    result = await session.execute(
+        select(ProductVariant).filter(ProductVariant.variant_id == variant_id, ProductVariant.quantity >= qty,
+                                      ProductVariant.is_active == True)
+    )
+    variant = result.scalars().first()
+    if not variant:
+        return False
+    variant.quantity -= qty
+    await session.commit()
+    return True
+
+
+async def buy(Session: Any, lines: dict[int, int], *, conditional: bool) -> bool:
+    from backend.repositories.repository.product_variant_repository import (
+        InsufficientStockError, ProductVariantRepository,
+    )
+
+    async with Session() as session:
+        if not conditional:
+            for vid, qty in lines.items():
+                if not await legacy_decrement(session, vid, qty):
+                    return False
+            return True
+        try:
+            await ProductVariantRepository(session).reserve_stock(lines)
+        except InsufficientStockError:
+            return False
+        return True
+
+
+async def measure(n_buyers: int, *, stock: int = 100, conditional: bool = True) -> dict[str, float]:
+    from sqlalchemy import select, update
+    from backend.persistance.product_variant import ProductVariant
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine, Session = await make_engine(os.path.join(tmp, "bench.db"))
+        try:
+            async with Session() as session:
+                product_ids = await seed_catalog(session, 50)
+                await seed_variants(session, product_ids)
+                # Plenty of the secondary SKUs, `stock` units of the hot one
+                await session.execute(update(ProductVariant).values(quantity=10 * n_buyers))
+                await session.execute(
+                    update(ProductVariant).where(ProductVariant.variant_id == HOT_VARIANT).values(quantity=stock)
+                )
+                await session.commit()
+            baskets = [{HOT_VARIANT: 1, 4 + 2 * (i % 40): 1} for i in range(n_buyers)]
+            with timed() as t:
+                outcomes = await asyncio.gather(
+                    *[buy(Session, basket, conditional=conditional) for basket in baskets], return_exceptions=True
+                )
+            async with Session() as session:
+                left = await session.scalar(
+                    select(ProductVariant.quantity).where(ProductVariant.variant_id == HOT_VARIANT)
+                )
+            sold = sum(1 for o in outcomes if o is True)
+            return {
+                "buyers": n_buyers,
+                "stock": stock,
+                "sold": sold,
+                "errors": sum(1 for o in outcomes if isinstance(o, BaseException)),
+                "removed": stock - left,
+                # Sales that never reached the stock row
+                "oversold": max(0, sold - (stock - left)),
+                "ms": t["ms"],
+                "buyers_per_s": n_buyers / (t["ms"] / 1000) if t["ms"] else 0.0,
+            }
+        finally:
+            await engine.dispose()
+
+
+async def run(buyers: list[int], stock: int) -> list[tuple[dict[str, float], dict[str, float]]]:
+    return [
+        (await measure(n, stock=stock, conditional=False), await measure(n, stock=stock))
+        for n in buyers
+    ]
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Concurrent stock reservation benchmark")
+    parser.add_argument("--buyers", type=int, nargs="+", default=[50, 200])
+    parser.add_argument("--stock", type=int, default=100)
+    args = parser.parse_args(argv)
+    print(f"{'buyers':>7} {'mode':>12} {'sold':>6} {'removed':>8} {'oversold':>9} {'errors':>7} {'ms':>9} {'buyers/s':>9}")
+    for pair in asyncio.run(run(args.buyers, args.stock)):
+        for mode, r in zip(("read-modify", "conditional"), pair):
+            print(
+                f"{r['buyers']:>7} {mode:>12} {r['sold']:>6} {r['removed']:>8} {r['oversold']:>9}"
+                f" {r['errors']:>7} {r['ms']:>9.1f} {r['buyers_per_s']:>9.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""
+Benchmark: the analysis.py trend functions at a million orders.
+
+Three ways to get units sold, revenue/profit and order counts per period:
+- loop: the previous defaultdict loops over order objects (kept here for comparison)
+- adapter: the analyze_* functions, which now pull columns out of the same
+  objects and aggregate them with NumPy
+- columnar: the *_series functions on arrays, as a caller that already holds
+  columns (e.g. rows fetched from the database) would use them
+Run with:
+
+    python -m backend.benchmarks.trend_analysis --orders 100000 1000000 --period weekly
+"""
+import argparse
+import datetime as dt
+from collections import defaultdict
+from typing import Any, Optional
+
+import numpy as np
+
+from backend.benchmarks._support import timed
+
+START = np.datetime64('2024-01-01T00:00', 'm')
+MINUTES = 2 * 365 * 24 * 60
+
+
+class Item:
+    __slots__ = ('quantity',)
+
+    def __init__(self, quantity: int):
+        self.quantity = quantity
+
+
+class OrderView:
+    __slots__ = ('created_at', 'total_amount', 'order_items')
+
+    def __init__(self, created_at: dt.datetime, total_amount: float, order_items: list):
+        self.created_at = created_at
+        self.total_amount = total_amount
+        self.order_items = order_items
+
+
+def make_columns(n_orders: int, seed: int = 7) -> dict[str, np.ndarray]:
+    """Two years of orders: timestamps, totals and units per order."""
+    rng = np.random.default_rng(seed)
+    return {
+        'timestamps': START + rng.integers(0, MINUTES, n_orders).astype('timedelta64[m]'),
+        'amounts': rng.integers(500, 20000, n_orders) / 100,
+        'quantities': rng.integers(1, 6, n_orders),
+    }
+
+
+def make_orders(columns: dict[str, np.ndarray]) -> list[OrderView]:
+    return [
+        OrderView(ts, amount, [Item(qty)])
+        for ts, amount, qty in zip(
+            columns['timestamps'].astype('datetime64[us]').tolist(), columns['amounts'].tolist(),
+            columns['quantities'].tolist(),
+        )
+    ]
+
+
+def _loop_key(date: dt.datetime, period: str) -> Any:
+    if period == 'weekly':
+        return date.isocalendar()[1]
+    if period == 'monthly':
+        return (date.year, date.month)
+    return date.date()
+
+
+def loop_trends(orders: list[Any], period: str, fee_rate: float = 0.1) -> dict[str, dict]:
+    """The three per-order loops analysis.py used before vectorizing, one pass each as before."""
+    units: 'defaultdict[Any, int]' = defaultdict(int)
+    for order in orders:
+        date = getattr(order, 'created_at', None)
+        if not date:
+            continue
+        key = _loop_key(date, period)
+        for item in getattr(order, 'order_items', []):
+            units[key] += item.quantity
+    revenue: 'defaultdict[Any, float]' = defaultdict(float)
+    profit: 'defaultdict[Any, float]' = defaultdict(float)
+    for order in orders:
+        date = getattr(order, 'created_at', None)
+        if not date:
+            continue
+        key = _loop_key(date, period)
+        amount = getattr(order, 'total_amount', 0)
+        revenue[key] += amount
+        profit[key] += amount - amount * fee_rate
+    counts: 'defaultdict[Any, int]' = defaultdict(int)
+    for order in orders:
+        date = getattr(order, 'created_at', None)
+        if not date:
+            continue
+        counts[_loop_key(date, period)] += 1
+    return {'units': dict(units), 'revenue': dict(revenue), 'profit': dict(profit), 'counts': dict(counts)}
+
+
+def measure(n_orders: int, *, period: str = 'weekly', mode: str = 'columnar') -> dict[str, float]:
+    from backend.utilities import analysis
+
+    columns = make_columns(n_orders)
+    orders = make_orders(columns) if mode != 'columnar' else None
+    with timed() as t:
+        if mode == 'loop':
+            result = loop_trends(orders, period)
+            units, periods = sum(result['units'].values()), len(result['counts'])
+        elif mode == 'adapter':
+            sold = analysis.analyze_units_sold_trends(orders, period)
+            analysis.analyze_revenue_profit_trends(orders, period)
+            counts = analysis.analyze_order_count_trends(orders, period)
+            units, periods = sum(sold['trends'].values()), len(counts['order_count_trends'])
+        else:
+            sold = analysis.units_sold_series(columns['timestamps'], columns['quantities'], period)
+            analysis.revenue_profit_series(columns['timestamps'], columns['amounts'], period)
+            counts = analysis.order_count_series(columns['timestamps'], period)
+            units, periods = int(sold['units_sold'].sum()), len(counts['periods'])
+    return {'orders': n_orders, 'mode': mode, 'ms': t['ms'], 'units_sold': units, 'periods': periods}
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Trend analysis benchmark")
+    parser.add_argument("--orders", type=int, nargs="+", default=[100000, 1000000])
+    parser.add_argument("--period", default="weekly", choices=["daily", "weekly", "monthly"])
+    args = parser.parse_args(argv)
+    print(f"{'orders':>8} {'mode':>9} {'ms':>9} {'periods':>8} {'units':>9}")
+    for n in args.orders:
+        for mode in ('loop', 'adapter', 'columnar'):
+            r = measure(n, period=args.period, mode=mode)
+            print(f"{r['orders']:>8} {r['mode']:>9} {r['ms']:>9.1f} {r['periods']:>8} {r['units_sold']:>9}")
+
+
+if __name__ == "__main__":
+    main()
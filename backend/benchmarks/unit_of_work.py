@@ -0,0 +1,101 @@
+"""
+Benchmark: commits and latency of a multi-row write with and without a unit of work.
+
+Replays the repository writes of SellerService.create_product (one product,
+its variants, each variant's images, the product images, the catalog card)
+through the auto-committing repositories. Outside a unit of work every save
+commits; inside one they only flush and the unit of work commits once.
+Run with:
+
+    python -m backend.benchmarks.unit_of_work --variants 10 --images 5
+"""
+import argparse
+import asyncio
+from typing import Any, Optional
+
+from backend.benchmarks._support import QueryCounter, make_engine, seed_catalog, timed
+
+
+async def create_product(session: Any, *, n_variants: int, n_images: int) -> int:
+    """Save a product with `n_variants` variants of `n_images` images each, plus `n_images` product images."""
+    from backend.persistance.product import Product
+    from backend.persistance.product_image import ProductImage
+    from backend.persistance.product_variant import ProductVariant
+    from backend.persistance.product_variant_image import ProductVariantImage
+    from backend.repositories.repository.catalog_card_repository import CatalogCardRepository
+    from backend.repositories.repository.product_image_repository import ProductImageRepository
+    from backend.repositories.repository.product_repository import ProductRepository
+    from backend.repositories.repository.product_variant_image_repository import ProductVariantImageRepository
+    from backend.repositories.repository.product_variant_repository import ProductVariantRepository
+    from backend.persistance.unit_of_work import auto_commit
+
+    # Explicit child ids: SQLite only assigns INTEGER primary keys
+    product = await ProductRepository(session).save(Product(
+        seller_id=1, category_id=1, subcategory_id=1, title="Bench product",
+        description="Bench product", price=10, currency="USD", is_active=True,
+    ))
+    pid = product.product_id
+    for v in range(n_variants):
+        vid = pid * 1000 + v
+        await ProductVariantRepository(session).save(ProductVariant(
+            variant_id=vid, product_id=pid, variant_name=f"Variant {v}", price=10, quantity=5,
+        ))
+        for i in range(n_images):
+            await ProductVariantImageRepository(session).save(ProductVariantImage(
+                image_id=vid * 100 + i, variant_id=vid, image_url=f"variant_images/{vid}_{i}.jpg",
+            ))
+    for i in range(n_images):
+        await ProductImageRepository(session).save(ProductImage(
+            image_id=pid * 100 + i, product_id=pid, image_url=f"product_images/{pid}_{i}.jpg",
+        ))
+    await CatalogCardRepository(session).refresh_products([pid])
+    await auto_commit(session)
+    return pid
+
+
+async def measure(*, n_variants: int = 10, n_images: int = 5, unit_of_work: bool = True) -> dict[str, Any]:
+    from backend.persistance.unit_of_work import UnitOfWork
+
+    engine, Session = await make_engine()
+    try:
+        async with Session() as session:
+            await seed_catalog(session, 1)
+        counter = QueryCounter(engine)
+        async with Session() as session:
+            with counter.track(), timed() as t:
+                if unit_of_work:
+                    async with UnitOfWork(session):
+                        await create_product(session, n_variants=n_variants, n_images=n_images)
+                else:
+                    await create_product(session, n_variants=n_variants, n_images=n_images)
+        return {
+            "unit_of_work": unit_of_work,
+            "rows": 1 + n_variants * (1 + n_images) + n_images,
+            "statements": counter.count,
+            "commits": counter.commits,
+            "ms": t["ms"],
+        }
+    finally:
+        await engine.dispose()
+
+
+async def run(n_variants: int, n_images: int) -> list[dict[str, Any]]:
+    return [
+        await measure(n_variants=n_variants, n_images=n_images, unit_of_work=uow)
+        for uow in (False, True)
+    ]
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Unit-of-work commit-count benchmark")
+    parser.add_argument("--variants", type=int, default=10)
+    parser.add_argument("--images", type=int, default=5)
+    args = parser.parse_args(argv)
+    print(f"{'mode':>14} {'rows':>6} {'statements':>11} {'commits':>8} {'ms':>10}")
+    for r in asyncio.run(run(args.variants, args.images)):
+        mode = "unit of work" if r["unit_of_work"] else "auto-commit"
+        print(f"{mode:>14} {r['rows']:>6} {r['statements']:>11} {r['commits']:>8} {r['ms']:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,6 @@
 import os
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from typing import Literal
+from typing import Literal, Optional
 
 
 
@@ -16,6 +16,24 @@ class BaseAppSettings(BaseSettings):
     LOG_LEVEL: str = 'INFO'
     SECRET_KEY: str
     EMAIL_API_KEY: str
+    # Optional expiry for the in-process taxonomy cache; set when running several workers
+    TAXONOMY_CACHE_TTL_SECONDS: Optional[float] = None
+    # How long checkout holds stock for a user before the sweeper returns it
+    STOCK_HOLD_TTL_SECONDS: float = 600
+    # Seconds between sweeps of expired stock holds; None disables the in-process sweeper
+    STOCK_HOLD_SWEEP_INTERVAL_SECONDS: Optional[float] = 30
+    # In-process checkout workers (jobs processed at once); 0 leaves the queue to
+    # backend.scripts.run_checkout_workers
+    CHECKOUT_WORKER_CONCURRENCY: int = 4
+    # Attempts before a transiently failing checkout job is marked failed
+    CHECKOUT_MAX_ATTEMPTS: int = 5
+    # How long a worker owns a claimed checkout job before another may reclaim it
+    CHECKOUT_LEASE_SECONDS: float = 60
+    # Seconds between sales rollup refreshes; None leaves it to
+    # backend.scripts.backfill_sales_rollup --refresh
+    SALES_ROLLUP_INTERVAL_SECONDS: Optional[float] = 60
+    # Seller dashboard sections run at once per request (each holds a pooled connection)
+    SELLER_DASHBOARD_CONCURRENCY: int = 4
 
     # Pydantic v2 settings configuration
     model_config = SettingsConfigDict(
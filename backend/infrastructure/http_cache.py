@@ -0,0 +1,63 @@
+"""
+HTTP conditional GET helpers (RFC 9110 ETag / Last-Modified).
+
+Handlers compute a strong ETag from whatever versions their representation
+depends on, check the request validators before doing any expensive work,
+and answer 304 without building the body when the client is current.
+"""
+import datetime
+import email.utils
+import hashlib
+from typing import Any, Optional
+
+from fastapi import Request, Response
+
+
+def make_etag(*parts: Any) -> str:
+    """Strong, quoted ETag over the given version/parameter values."""
+    digest = hashlib.sha256(repr(parts).encode()).hexdigest()[:32]
+    return f'"{digest}"'
+
+
+def http_date(value: datetime.datetime) -> str:
+    """Format a naive-UTC or aware datetime as an IMF-fixdate."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=datetime.timezone.utc)
+    return email.utils.format_datetime(value.astimezone(datetime.timezone.utc), usegmt=True)
+
+
+def validator_headers(etag: str, last_modified: Optional[datetime.datetime]) -> dict[str, str]:
+    """Response headers that let clients revalidate on every poll."""
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if last_modified is not None:
+        headers["Last-Modified"] = http_date(last_modified)
+    return headers
+
+
+def is_not_modified(request: Request, etag: str, last_modified: Optional[datetime.datetime]) -> bool:
+    """True when the request's validators show the client already has this representation.
+
+    `If-None-Match` wins when present (weak comparison, as for GET);
+    `If-Modified-Since` is only consulted without it, at one-second precision.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        tags = [tag.strip() for tag in if_none_match.split(",")]
+        return "*" in tags or etag in (tag[2:] if tag.startswith("W/") else tag for tag in tags)
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and last_modified is not None:
+        try:
+            since = email.utils.parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=datetime.timezone.utc)
+        modified = last_modified.replace(tzinfo=datetime.timezone.utc, microsecond=0) \
+            if last_modified.tzinfo is None else last_modified.replace(microsecond=0)
+        return modified <= since
+    return False
+
+
+def not_modified(headers: dict[str, str]) -> Response:
+    """Empty 304 carrying the same validators a 200 would have."""
+    return Response(status_code=304, headers=headers)
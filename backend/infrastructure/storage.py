@@ -1,6 +1,7 @@
 import os
 import shutil
 from typing import Optional, BinaryIO
+from urllib.parse import quote
 
 UPLOAD_ROOT = os.path.join("backend", "images", "uploads")
 os.makedirs(UPLOAD_ROOT, exist_ok=True)
@@ -25,3 +26,15 @@ class Storage:
         return f"/static/uploads/{filename}"
 
 storage = Storage()
+
+def static_url(path: str | None) -> str | None:
+    """Turn a stored image path into a URL-encoded `/static/...` URL."""
+    if not path:
+        return None
+    # Normalize Windows paths to forward slashes, ensure single /static prefix, then URL-encode
+    normalized = str(path).replace("\\", "/")
+    if normalized.startswith("/static/"):
+        raw = normalized
+    else:
+        raw = f"/static/{normalized.lstrip('/')}"
+    return quote(raw, safe="/")
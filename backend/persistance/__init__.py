@@ -14,6 +14,9 @@ from .category import Category
 from .subcategory import Subcategory
 from .product import Product
 from .product_variant import ProductVariant
+from . import product_search  # full-text index DDL attached to the product table
+from .catalog_version import CatalogVersion
+from .catalog_card import CatalogCard
 
 # Images / reviews (optional, extend as needed)
 from .product_image import ProductImage
@@ -27,6 +30,10 @@ from .cart import Cart
 from .cart_item import CartItem
 from .order import Order
 from .order_item import OrderItem
+from .stock_hold import StockHold
+from .checkout_job import CheckoutJob
+from .order_number_block import OrderNumberCounter
+from .sales_daily_rollup import SalesDailyRollup, SalesDailySellerOrders, SalesRollupEvent
 
 # Wishlist
 from .wishlist import Wishlist
@@ -0,0 +1,60 @@
+# ------------------------------------------------------------------------------
+# catalog_card.py
+# ------------------------------------------------------------------------------
+# SQLAlchemy ORM model for the catalog_card table.
+# A denormalized read model holding one fully resolved catalog card per listed
+# (active) product: text, price, category/subcategory names and the image URL
+# after the product -> subcategory -> category fallback. Catalog list and
+# detail endpoints read single rows from here instead of joining four tables.
+# Rows are written by CatalogCardRepository only (see
+# backend/repositories/repository/catalog_card_repository.py).
+# ------------------------------------------------------------------------------
+
+from __future__ import annotations
+
+from typing import Optional
+import datetime
+from sqlalchemy import Integer, BigInteger, String, Text, Numeric, DateTime, ForeignKey, Index
+from sqlalchemy.orm import Mapped, mapped_column
+from .base import Base
+
+
+class CatalogCard(Base):
+    """
+    ORM model for the 'catalog_card' table.
+
+    Attributes:
+        product_id (Integer): Primary key; the product this card renders.
+        seller_id (BigInteger): Seller of the product.
+        category_id / subcategory_id (BigInteger): Taxonomy ids, for filtering.
+        title, description, price, currency: Copied from the product; price may be NULL, as on product.
+        image_url (String): Resolved `/static/...` URL, or NULL if no image anywhere.
+        category_name / subcategory_name (String): Resolved taxonomy names.
+        created_at (DateTime): Product creation time, for sorting.
+        refreshed_at (DateTime): When this card was last rebuilt.
+    """
+    __tablename__ = 'catalog_card'
+    # Same keyset indexes the listing used on product; every row is listed,
+    # so no is_active prefix is needed.
+    __table_args__ = (
+        Index('ix_catalog_card_price', 'price', 'product_id'),
+        Index('ix_catalog_card_created_at', 'created_at', 'product_id'),
+        Index('ix_catalog_card_title', 'title', 'product_id'),
+        Index('ix_catalog_card_category_id', 'category_id'),
+        Index('ix_catalog_card_subcategory_id', 'subcategory_id'),
+    )
+    product_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey('product.product_id', ondelete='CASCADE'), primary_key=True
+    )
+    seller_id: Mapped[Optional[int]] = mapped_column(BigInteger, nullable=True)
+    category_id: Mapped[Optional[int]] = mapped_column(BigInteger, nullable=True)
+    subcategory_id: Mapped[Optional[int]] = mapped_column(BigInteger, nullable=True)
+    title: Mapped[str] = mapped_column(String(255), nullable=False)
+    description: Mapped[str] = mapped_column(Text, nullable=False)
+    price: Mapped[Optional[float]] = mapped_column(Numeric(10,2), nullable=True)
+    currency: Mapped[Optional[str]] = mapped_column(String(10), nullable=True)
+    image_url: Mapped[Optional[str]] = mapped_column(String(512), nullable=True)
+    category_name: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
+    subcategory_name: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
+    created_at: Mapped[Optional[datetime.datetime]] = mapped_column(DateTime, nullable=True)
+    refreshed_at: Mapped[datetime.datetime] = mapped_column(DateTime, nullable=False)
@@ -0,0 +1,110 @@
+# ------------------------------------------------------------------------------
+# catalog_version.py
+# ------------------------------------------------------------------------------
+# SQLAlchemy ORM model for the catalog_version table, plus the session hooks
+# that maintain it.
+# One row per scope ("catalog", "taxonomy") holds a counter that is bumped in
+# the same transaction as any write to the tables in that scope. Public
+# catalog endpoints derive their ETag/Last-Modified from these rows, so a
+# conditional GET can be answered without touching the product table, and
+# every worker sees the same version once the write commits.
+# ------------------------------------------------------------------------------
+
+from __future__ import annotations
+
+import datetime
+from typing import Any, Iterable
+
+from sqlalchemy import BigInteger, DateTime, String, event, insert, update
+from sqlalchemy.orm import Mapped, Session, mapped_column
+from .base import Base
+
+CATALOG_SCOPE = "catalog"
+TAXONOMY_SCOPE = "taxonomy"
+SCOPES = (CATALOG_SCOPE, TAXONOMY_SCOPE)
+
+# Table name -> version scope. Variant stock is not part of any cached
+# response, so checkout writes do not contend on these rows.
+WATCHED_TABLES = {
+    "product": CATALOG_SCOPE,
+    "product_image": CATALOG_SCOPE,
+    "catalog_card": CATALOG_SCOPE,
+    "category": TAXONOMY_SCOPE,
+    "subcategory": TAXONOMY_SCOPE,
+}
+_PENDING_KEY = "catalog_version_pending"
+
+
+class CatalogVersion(Base):
+    """
+    ORM model for the 'catalog_version' table.
+    A monotonically increasing version per catalog scope.
+
+    Attributes:
+        scope (String): Primary key, one of SCOPES.
+        version (BigInteger): Incremented on every flush that writes the scope.
+        updated_at (DateTime): UTC time of the last increment.
+    """
+    __tablename__ = 'catalog_version'
+    scope: Mapped[str] = mapped_column(String(32), primary_key=True)
+    version: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    updated_at: Mapped[datetime.datetime] = mapped_column(DateTime, nullable=False)
+
+
+def utcnow() -> datetime.datetime:
+    """Naive UTC timestamp, matching how DateTime columns are stored."""
+    return datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None)
+
+
+def seed_rows() -> list[dict[str, Any]]:
+    return [{"scope": scope, "version": 0, "updated_at": utcnow()} for scope in SCOPES]
+
+
+@event.listens_for(CatalogVersion.__table__, "after_create")
+def _seed_scopes(target: Any, connection: Any, **kw: Any) -> None:
+    connection.execute(insert(target), seed_rows())
+
+
+def bump(connection: Any, scopes: Iterable[str]) -> None:
+    """Increment the version of each scope on `connection` (caller's transaction)."""
+    connection.execute(
+        update(CatalogVersion.__table__)
+        .where(CatalogVersion.__table__.c.scope.in_(sorted(set(scopes))))
+        .values(version=CatalogVersion.__table__.c.version + 1, updated_at=utcnow())
+    )
+
+
+# ------------------------------------------------------------------------------
+# Write tracking: ORM flushes and bulk statements touching a watched table bump
+# the matching scope before the transaction commits.
+# ------------------------------------------------------------------------------
+@event.listens_for(Session, "before_flush")
+def _collect_flush_scopes(session: Session, flush_context: Any, instances: Any) -> None:
+    scopes = set()
+    for obj in (*session.new, *session.deleted):
+        scope = WATCHED_TABLES.get(getattr(obj, "__tablename__", None))
+        if scope:
+            scopes.add(scope)
+    for obj in session.dirty:
+        scope = WATCHED_TABLES.get(getattr(obj, "__tablename__", None))
+        if scope and session.is_modified(obj, include_collections=False):
+            scopes.add(scope)
+    if scopes:
+        session.info.setdefault(_PENDING_KEY, set()).update(scopes)
+
+
+@event.listens_for(Session, "after_flush")
+def _bump_flush_scopes(session: Session, flush_context: Any) -> None:
+    scopes = session.info.pop(_PENDING_KEY, None)
+    if scopes:
+        bump(session.connection(), scopes)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _bump_bulk_scopes(orm_execute_state: Any) -> None:
+    if not (orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete):
+        return
+    table = getattr(orm_execute_state.statement, "table", None)
+    scope = WATCHED_TABLES.get(getattr(table, "name", None))
+    if scope:
+        bump(orm_execute_state.session.connection(), [scope])
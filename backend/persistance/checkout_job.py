@@ -0,0 +1,74 @@
+# ------------------------------------------------------------------------------
+# checkout_job.py
+# ------------------------------------------------------------------------------
+# SQLAlchemy ORM model for the checkout_job table: the durable queue behind
+# asynchronous checkout. A request stores a `pending` job (the order intent)
+# and returns; background workers claim jobs with a time-limited lease, run
+# the order, inventory, payment and cart steps in one transaction, and record
+# the outcome for the client to poll. A job whose worker dies is reclaimed
+# once its lease runs out.
+# ------------------------------------------------------------------------------
+
+from __future__ import annotations
+
+import datetime
+import json
+from typing import Any, Dict, Optional
+
+from sqlalchemy import BigInteger, DateTime, ForeignKey, Index, Integer, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import Base
+
+JOB_PENDING = "pending"
+JOB_PROCESSING = "processing"
+JOB_SUCCEEDED = "succeeded"
+JOB_FAILED = "failed"
+
+
+class CheckoutJob(Base):
+    """
+    ORM model for the 'checkout_job' table.
+
+    Attributes:
+        job_id (Integer): Primary key, also the queue order.
+        user_id (BigInteger): The buyer.
+        cart_id (Integer): The cart being checked out.
+        status (String): pending, processing, succeeded or failed.
+        payload (Text): JSON of the checkout details (shipment, tokenized payment).
+        attempts (Integer): Claims so far; retries stop at the worker's max attempts.
+        available_at (DateTime): Earliest time a pending job may be claimed (retry backoff).
+        locked_until (DateTime): Lease end of the worker processing the job.
+        locked_by (String): Name of the worker holding the lease.
+        order_id (BigInteger): The order created, once succeeded.
+        last_error (Text): Why the last attempt failed.
+        created_at / updated_at (DateTime): Naive UTC timestamps.
+    """
+    __tablename__ = 'checkout_job'
+    job_id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    user_id: Mapped[int] = mapped_column(BigInteger, ForeignKey('users.user_id'), nullable=False)
+    cart_id: Mapped[int] = mapped_column(Integer, ForeignKey('cart.cart_id'), nullable=False)
+    status: Mapped[str] = mapped_column(String(16), nullable=False, default=JOB_PENDING)
+    payload: Mapped[str] = mapped_column(Text, nullable=False, default='{}')
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    available_at: Mapped[datetime.datetime] = mapped_column(DateTime, nullable=False)
+    locked_until: Mapped[Optional[datetime.datetime]] = mapped_column(DateTime, nullable=True)
+    locked_by: Mapped[Optional[str]] = mapped_column(String(64), nullable=True)
+    order_id: Mapped[Optional[int]] = mapped_column(BigInteger, ForeignKey('order.order_id'), nullable=True)
+    last_error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    created_at: Mapped[datetime.datetime] = mapped_column(DateTime, nullable=False)
+    updated_at: Mapped[datetime.datetime] = mapped_column(DateTime, nullable=False)
+
+    __table_args__ = (
+        # Claim scan: due pending jobs and expired leases, oldest first
+        Index('ix_checkout_job_status_available_at', 'status', 'available_at'),
+        Index('ix_checkout_job_user_id', 'user_id'),
+    )
+
+    def set_payload(self, payload: Dict[str, Any]) -> None:
+        """Set the payload field as a JSON string from a dict."""
+        self.payload = json.dumps(payload)
+
+    def get_payload(self) -> Dict[str, Any]:
+        """Get the payload field as a dict from its JSON string."""
+        return json.loads(self.payload) if self.payload else {}
@@ -3,9 +3,30 @@
 Re-export the centralized async session dependency from
 `backend.persistance.async_base` so the rest of the codebase can
 import `get_db` and receive a properly-typed `AsyncSession`.
+
+When `TransactionMiddleware` is installed, `get_db` yields the session it
+opened for the request, so every write in the request joins its unit of
+work and commits once (see `backend.persistance.unit_of_work`). Without
+the middleware each request gets its own auto-committing session.
 """
 
+from typing import AsyncIterator
+
+from fastapi import Request
+from sqlalchemy.ext.asyncio import AsyncSession
+
 from .async_base import get_async_session
 
+
+async def request_session(request: Request) -> AsyncIterator[AsyncSession]:
+    """Yield the middleware's request session if there is one, else a new session."""
+    session = getattr(request.state, "db", None)
+    if session is not None:
+        yield session
+        return
+    async for session in get_async_session():
+        yield session
+
+
 # Backwards compatible name expected by other modules
-get_db = get_async_session
+get_db = request_session
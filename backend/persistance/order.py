@@ -12,7 +12,7 @@ from __future__ import annotations
 
 from typing import Optional
 import datetime
-from sqlalchemy import BigInteger, Numeric, DateTime, Enum, ForeignKey, Boolean
+from sqlalchemy import BigInteger, Integer, Numeric, DateTime, Enum, ForeignKey, Boolean, Index
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.orm import relationship
 from .base import Base
@@ -35,7 +35,8 @@ class Order(Base):
         # Relationships to order items and related models are defined elsewhere.
     """
     __tablename__ = 'order'
-    order_id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
+    # SQLite only auto-assigns INTEGER primary keys
+    order_id: Mapped[int] = mapped_column(BigInteger().with_variant(Integer, 'sqlite'), primary_key=True)
     user_id: Mapped[int] = mapped_column(BigInteger, ForeignKey('users.user_id'))
     cart_id: Mapped[Optional[int]] = mapped_column(BigInteger, ForeignKey('cart.cart_id'), nullable=True)
     product_id: Mapped[Optional[int]] = mapped_column(BigInteger, ForeignKey('product.product_id'), nullable=True)
@@ -45,4 +46,9 @@ class Order(Base):
     updated_at: Mapped[Optional[datetime.datetime]] = mapped_column(DateTime, nullable=True)
     order_number: Mapped[int] = mapped_column(BigInteger)
     is_deleted: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+
+    __table_args__ = (
+        # Date-range scans: sales rollup recompute and seller reports
+        Index('ix_order_created_at', 'created_at'),
+    )
     # Relationships (to be completed in related models)
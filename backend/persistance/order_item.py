@@ -6,7 +6,7 @@ Represents an item within an order, including product and variant details.
 """
 
 from typing import Optional
-from sqlalchemy import BigInteger, Integer, Float, ForeignKey, Boolean
+from sqlalchemy import BigInteger, Integer, Float, ForeignKey, Boolean, Index
 from sqlalchemy.orm import Mapped, mapped_column
 from .base import Base
 
@@ -20,4 +20,9 @@ class OrderItem(Base):
 	subtotal: Mapped[float] = mapped_column(Float, nullable=False)
 	is_deleted: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
 
+	__table_args__ = (
+		# Lines of an order: order joins and sales rollup keys
+		Index('ix_order_item_order_id', 'order_id'),
+	)
+
 __all__ = ["OrderItem"]
@@ -0,0 +1,63 @@
+# ------------------------------------------------------------------------------
+# order_number_block.py
+# ------------------------------------------------------------------------------
+# Storage behind the order number allocator: blocks of ORDER_NUMBER_BLOCK_SIZE
+# numbers are reserved from the order_number_seq sequence on Postgres (whose
+# INCREMENT BY is the block size) or from a counter row on SQLite, which has
+# no sequences. Each worker hands numbers out of its block from memory, so
+# only one order in ORDER_NUMBER_BLOCK_SIZE touches the database for it.
+# The block size is part of the sequence DDL; changing it needs a migration.
+# ------------------------------------------------------------------------------
+
+from __future__ import annotations
+
+from typing import Any
+
+from sqlalchemy import BigInteger, Sequence, String, event, insert, select, update
+from sqlalchemy.orm import Mapped, mapped_column
+from .base import Base
+
+ORDER_NUMBER_BLOCK_SIZE = 100
+ORDER_NUMBER_COUNTER = "order_number"
+
+order_number_seq = Sequence(
+    'order_number_seq', start=1, increment=ORDER_NUMBER_BLOCK_SIZE, metadata=Base.metadata
+)
+
+
+class OrderNumberCounter(Base):
+    """
+    ORM model for the 'order_number_counter' table (SQLite stand-in for order_number_seq).
+
+    Attributes:
+        name (String): Primary key; one row, ORDER_NUMBER_COUNTER.
+        next_value (BigInteger): First number of the next unreserved block.
+    """
+    __tablename__ = 'order_number_counter'
+    name: Mapped[str] = mapped_column(String(32), primary_key=True)
+    next_value: Mapped[int] = mapped_column(BigInteger, nullable=False, default=1)
+
+
+@event.listens_for(OrderNumberCounter.__table__, "after_create")
+def _seed_counter(target: Any, connection: Any, **kw: Any) -> None:
+    connection.execute(insert(target).values(name=ORDER_NUMBER_COUNTER, next_value=1))
+
+
+async def reserve_block(connection: Any) -> int:
+    """
+    Reserve the next block on `connection` (an AsyncConnection) and return its first number.
+
+    The block is `[first, first + ORDER_NUMBER_BLOCK_SIZE)`. On SQLite the
+    counter update must commit on its own, before the caller's transaction,
+    so a rolled-back order never returns a block that was handed out.
+    """
+    if connection.dialect.name == "postgresql":
+        return await connection.scalar(select(order_number_seq.next_value()))
+    counter = OrderNumberCounter.__table__
+    end = await connection.scalar(
+        update(counter)
+        .where(counter.c.name == ORDER_NUMBER_COUNTER)
+        .values(next_value=counter.c.next_value + ORDER_NUMBER_BLOCK_SIZE)
+        .returning(counter.c.next_value)
+    )
+    return end - ORDER_NUMBER_BLOCK_SIZE
@@ -11,7 +11,7 @@ from __future__ import annotations
 
 from typing import Optional
 import datetime
-from sqlalchemy import Integer, BigInteger, String, Text, Numeric, Boolean, DateTime, ForeignKey
+from sqlalchemy import Integer, BigInteger, String, Text, Numeric, Boolean, DateTime, ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column
 from .base import Base
 
@@ -28,7 +28,7 @@ class Product(Base):
         subcategory_id (BigInteger): Foreign key referencing the product subcategory.
         title (String): Title of the product.
         description (Text): Description of the product.
-        price (Numeric): Price of the product.
+        price (Numeric): Price of the product; may be NULL.
         currency (String): Currency of the price.
         is_active (Boolean): Whether the product is currently active/listed.
         created_at (DateTime): Timestamp when the product was created.
@@ -36,6 +36,15 @@ class Product(Base):
         # Relationships to related models are defined elsewhere.
     """
     __tablename__ = 'product'
+    # Composite indexes backing keyset pagination of the public catalog:
+    # each (is_active, sort_key, product_id) index serves one sort order.
+    __table_args__ = (
+        Index('ix_product_active_price', 'is_active', 'price', 'product_id'),
+        Index('ix_product_active_created_at', 'is_active', 'created_at', 'product_id'),
+        Index('ix_product_active_title', 'is_active', 'title', 'product_id'),
+        Index('ix_product_category_id', 'category_id'),
+        Index('ix_product_subcategory_id', 'subcategory_id'),
+    )
     # Use Integer for SQLite autoincrement primary key behavior
     product_id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     seller_id: Mapped[int] = mapped_column(BigInteger, ForeignKey('users.user_id'))
@@ -43,7 +52,7 @@ class Product(Base):
     subcategory_id: Mapped[Optional[int]] = mapped_column(BigInteger, ForeignKey('subcategory.subcategory_id'), nullable=True)
     title: Mapped[str] = mapped_column(String(255), nullable=False)
     description: Mapped[str] = mapped_column(Text, nullable=False)
-    price: Mapped[float] = mapped_column(Numeric(10,2))
+    price: Mapped[Optional[float]] = mapped_column(Numeric(10,2), nullable=True)
     currency: Mapped[str] = mapped_column(String(10))
     is_active: Mapped[bool] = mapped_column(Boolean, default=True)
     created_at: Mapped[Optional[datetime.datetime]] = mapped_column(DateTime, nullable=True)
@@ -11,12 +11,14 @@
 from __future__ import annotations
 
 from typing import Optional
-from sqlalchemy import BigInteger, String, ForeignKey
+from sqlalchemy import BigInteger, String, ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column
 from .base import Base
 
 class ProductImage(Base):
     __tablename__ = 'product_image'
+    # Images are always read by product, primary (lowest image_id) first
+    __table_args__ = (Index('ix_product_image_product_id', 'product_id', 'image_id'),)
     image_id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
     product_id: Mapped[int] = mapped_column(BigInteger, ForeignKey('product.product_id'))
     image_url: Mapped[str] = mapped_column(String(255))
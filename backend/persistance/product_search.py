@@ -0,0 +1,78 @@
+# ------------------------------------------------------------------------------
+# product_search.py
+# ------------------------------------------------------------------------------
+# Full-text search index over product title/description.
+# This module is not an ORM model: it attaches dialect-specific DDL to the
+# product table so the index is created with it and kept in sync by the
+# database on every insert, update and delete.
+#   - PostgreSQL: a generated, weighted `search_vector` tsvector column + GIN index
+#   - SQLite: an external-content FTS5 table `product_search` + sync triggers
+# ------------------------------------------------------------------------------
+
+from sqlalchemy import DDL, event
+
+from .product import Product
+
+SQLITE_FTS_TABLE = "product_search"
+PG_SEARCH_COLUMN = "search_vector"
+PG_TEXT_CONFIG = "english"
+
+PG_CREATE = [
+    f"""
+    ALTER TABLE product ADD COLUMN IF NOT EXISTS {PG_SEARCH_COLUMN} tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('{PG_TEXT_CONFIG}', coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('{PG_TEXT_CONFIG}', coalesce(description, '')), 'B')
+    ) STORED
+    """,
+    f"CREATE INDEX IF NOT EXISTS ix_product_search_vector ON product USING GIN ({PG_SEARCH_COLUMN})",
+]
+
+PG_DROP = [
+    "DROP INDEX IF EXISTS ix_product_search_vector",
+    f"ALTER TABLE product DROP COLUMN IF EXISTS {PG_SEARCH_COLUMN}",
+]
+
+SQLITE_CREATE = [
+    f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {SQLITE_FTS_TABLE} USING fts5(
+        title, description,
+        content='product', content_rowid='product_id',
+        tokenize='porter unicode61'
+    )
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS product_search_ai AFTER INSERT ON product BEGIN
+        INSERT INTO {SQLITE_FTS_TABLE}(rowid, title, description)
+        VALUES (new.product_id, new.title, new.description);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS product_search_ad AFTER DELETE ON product BEGIN
+        INSERT INTO {SQLITE_FTS_TABLE}({SQLITE_FTS_TABLE}, rowid, title, description)
+        VALUES ('delete', old.product_id, old.title, old.description);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS product_search_au AFTER UPDATE OF title, description ON product BEGIN
+        INSERT INTO {SQLITE_FTS_TABLE}({SQLITE_FTS_TABLE}, rowid, title, description)
+        VALUES ('delete', old.product_id, old.title, old.description);
+        INSERT INTO {SQLITE_FTS_TABLE}(rowid, title, description)
+        VALUES (new.product_id, new.title, new.description);
+    END
+    """,
+]
+
+SQLITE_DROP = [
+    "DROP TRIGGER IF EXISTS product_search_au",
+    "DROP TRIGGER IF EXISTS product_search_ad",
+    "DROP TRIGGER IF EXISTS product_search_ai",
+    f"DROP TABLE IF EXISTS {SQLITE_FTS_TABLE}",
+]
+
+for _stmt in PG_CREATE:
+    event.listen(Product.__table__, "after_create", DDL(_stmt).execute_if(dialect="postgresql"))
+for _stmt in SQLITE_CREATE:
+    event.listen(Product.__table__, "after_create", DDL(_stmt).execute_if(dialect="sqlite"))
+for _stmt in SQLITE_DROP:
+    event.listen(Product.__table__, "before_drop", DDL(_stmt).execute_if(dialect="sqlite"))
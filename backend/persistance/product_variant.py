@@ -10,7 +10,7 @@
 from __future__ import annotations
 
 from typing import Optional
-from sqlalchemy import BigInteger, String, Numeric, Integer, Boolean, ForeignKey
+from sqlalchemy import BigInteger, String, Numeric, Integer, Boolean, ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column
 from .base import Base
 
@@ -29,6 +29,7 @@ class ProductVariant(Base):
         # Relationships to related models are defined elsewhere.
     """
     __tablename__ = 'product_variant'
+    __table_args__ = (Index('ix_product_variant_product_id', 'product_id'),)
     variant_id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
     product_id: Mapped[int] = mapped_column(BigInteger, ForeignKey('product.product_id'))
     variant_name: Mapped[str] = mapped_column(String(100))
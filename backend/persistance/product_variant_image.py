@@ -10,7 +10,7 @@
 from __future__ import annotations
 
 from typing import Optional
-from sqlalchemy import BigInteger, String, ForeignKey, Boolean
+from sqlalchemy import BigInteger, String, ForeignKey, Boolean, Index
 from sqlalchemy.orm import Mapped, mapped_column
 from .base import Base
 
@@ -26,6 +26,7 @@ class ProductVariantImage(Base):
         # Relationship to product_variant is defined elsewhere.
     """
     __tablename__ = 'product_variant_image'
+    __table_args__ = (Index('ix_product_variant_image_variant_id', 'variant_id', 'image_id'),)
     image_id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
     variant_id: Mapped[int] = mapped_column(BigInteger, ForeignKey('product_variant.variant_id'))
     image_url: Mapped[str] = mapped_column(String(255))
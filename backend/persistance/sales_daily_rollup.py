@@ -0,0 +1,134 @@
+# ------------------------------------------------------------------------------
+# sales_daily_rollup.py
+# ------------------------------------------------------------------------------
+# SQLAlchemy ORM models for the daily sales rollup, plus the session hooks that
+# feed it.
+# sales_daily_rollup holds one row per (seller, product, day): units sold,
+# revenue and the number of orders that included the product.
+# sales_daily_seller_orders holds one row per (seller, day) with the number of
+# distinct orders that included any of the seller's products; summing the
+# per-product counts instead would count a two-product order twice. Seller
+# reports read week, month or year ranges from both instead of scanning raw
+# orders.
+# Any write to an order or its lines records the order id in the
+# sales_rollup_event outbox, in the same transaction as the write; a
+# background job (SalesRollupService.refresh) consumes the outbox and
+# recomputes the affected (product, day) rows from the raw tables, so
+# creation, cancellation, refund and soft deletion all converge. Bulk
+# UPDATE/DELETE statements on order tables carry no row ids and are not
+# recorded; run the backfill after those.
+# ------------------------------------------------------------------------------
+
+from __future__ import annotations
+
+import datetime
+from typing import Any, Iterable, Set
+
+from sqlalchemy import BigInteger, Date, DateTime, Float, Index, Integer, event, insert
+from sqlalchemy.orm import Mapped, Session, mapped_column
+from .base import Base
+
+ROLLUP_TRACKED_TABLES = ("order", "order_item")
+
+
+class SalesDailyRollup(Base):
+    """
+    ORM model for the 'sales_daily_rollup' table.
+
+    Attributes:
+        seller_id (BigInteger): Seller of the product (part of the primary key).
+        day (Date): UTC day the orders were placed (part of the primary key).
+        product_id (BigInteger): Product sold (part of the primary key).
+        units (Integer): Units sold.
+        revenue (Float): Sum of the line subtotals.
+        orders (Integer): Orders that included the product.
+    """
+    __tablename__ = 'sales_daily_rollup'
+    seller_id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
+    day: Mapped[datetime.date] = mapped_column(Date, primary_key=True)
+    product_id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
+    units: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    revenue: Mapped[float] = mapped_column(Float, nullable=False, default=0)
+    orders: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        # Recompute deletes one day's rows for a set of products
+        Index('ix_sales_daily_rollup_day_product_id', 'day', 'product_id'),
+    )
+
+
+class SalesDailySellerOrders(Base):
+    """
+    ORM model for the 'sales_daily_seller_orders' table.
+
+    Attributes:
+        seller_id (BigInteger): Seller (part of the primary key).
+        day (Date): UTC day the orders were placed (part of the primary key).
+        orders (Integer): Distinct orders that included any of the seller's products.
+    """
+    __tablename__ = 'sales_daily_seller_orders'
+    seller_id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
+    day: Mapped[datetime.date] = mapped_column(Date, primary_key=True)
+    orders: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+
+class SalesRollupEvent(Base):
+    """
+    ORM model for the 'sales_rollup_event' outbox.
+
+    Attributes:
+        event_id (Integer): Primary key, in write order.
+        order_id (BigInteger): Order whose rollup rows need recomputing.
+        created_at (DateTime): When the write happened.
+    """
+    __tablename__ = 'sales_rollup_event'
+    event_id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    order_id: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    created_at: Mapped[datetime.datetime] = mapped_column(DateTime, nullable=False)
+
+
+def record(connection: Any, order_ids: Iterable[int]) -> None:
+    """Queue `order_ids` for the rollup on `connection` (caller's transaction)."""
+    from .catalog_version import utcnow
+
+    now = utcnow()
+    rows = [{"order_id": oid, "created_at": now} for oid in sorted(set(order_ids)) if oid is not None]
+    if rows:
+        connection.execute(insert(SalesRollupEvent.__table__), rows)
+
+
+# ------------------------------------------------------------------------------
+# Write tracking: ORM flushes and bulk INSERTs touching an order or its lines
+# queue the order id before the transaction commits.
+# ------------------------------------------------------------------------------
+def _order_id(obj: Any) -> Any:
+    table = getattr(obj, "__tablename__", None)
+    if table in ROLLUP_TRACKED_TABLES:
+        return getattr(obj, "order_id", None)
+    return None
+
+
+@event.listens_for(Session, "after_flush")
+def _record_flushed_orders(session: Session, flush_context: Any) -> None:
+    order_ids: Set[int] = set()
+    for obj in (*session.new, *session.deleted):
+        order_ids.add(_order_id(obj))
+    for obj in session.dirty:
+        if _order_id(obj) is not None and session.is_modified(obj, include_collections=False):
+            order_ids.add(_order_id(obj))
+    order_ids.discard(None)
+    if order_ids:
+        record(session.connection(), order_ids)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _record_bulk_inserts(orm_execute_state: Any) -> None:
+    if not orm_execute_state.is_insert:
+        return
+    table = getattr(orm_execute_state.statement, "table", None)
+    if getattr(table, "name", None) not in ROLLUP_TRACKED_TABLES:
+        return
+    params = orm_execute_state.parameters
+    rows = params if isinstance(params, (list, tuple)) else [params or {}]
+    order_ids = [row.get("order_id") for row in rows if isinstance(row, dict)]
+    record(orm_execute_state.session.connection(), order_ids)
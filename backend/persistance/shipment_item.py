@@ -13,7 +13,8 @@ from .base import Base
 
 class ShipmentItem(Base):
     __tablename__ = 'shipment_item'
-    shipment_item_id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
+    # SQLite only auto-assigns INTEGER primary keys
+    shipment_item_id: Mapped[int] = mapped_column(BigInteger().with_variant(Integer, 'sqlite'), primary_key=True)
     shipment_id: Mapped[int] = mapped_column(BigInteger, ForeignKey('shipment.shipment_id'))
     product_id: Mapped[int] = mapped_column(BigInteger, ForeignKey('product.product_id'))
     variant_id: Mapped[Optional[int]] = mapped_column(BigInteger, ForeignKey('product_variant.variant_id'), nullable=True)
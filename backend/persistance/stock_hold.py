@@ -0,0 +1,53 @@
+# ------------------------------------------------------------------------------
+# stock_hold.py
+# ------------------------------------------------------------------------------
+# SQLAlchemy ORM model for the stock_hold table.
+# A hold is stock taken out of a product variant for one user while they are
+# in checkout. Granting a hold decrements the variant once; completing the
+# order converts the hold without touching the variant row again, and the
+# sweeper returns holds that expired unconverted to stock in bulk.
+# ------------------------------------------------------------------------------
+
+from __future__ import annotations
+
+import datetime
+
+from sqlalchemy import BigInteger, DateTime, ForeignKey, Index, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import Base
+
+HOLD_ACTIVE = "held"
+HOLD_CONVERTED = "converted"
+HOLD_RELEASED = "released"
+HOLD_EXPIRED = "expired"
+
+
+class StockHold(Base):
+    """
+    ORM model for the 'stock_hold' table.
+
+    Attributes:
+        hold_id (Integer): Primary key.
+        user_id (BigInteger): The user holding the stock.
+        variant_id (BigInteger): The variant the stock was taken from.
+        quantity (Integer): Units held.
+        status (String): One of held, converted, released or expired; only
+            `held` rows still own their stock.
+        expires_at (DateTime): Naive UTC time after which the sweeper may return the stock.
+        created_at (DateTime): Naive UTC time the hold was granted.
+    """
+    __tablename__ = 'stock_hold'
+    hold_id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    user_id: Mapped[int] = mapped_column(BigInteger, ForeignKey('users.user_id'), nullable=False)
+    variant_id: Mapped[int] = mapped_column(BigInteger, ForeignKey('product_variant.variant_id'), nullable=False)
+    quantity: Mapped[int] = mapped_column(Integer, nullable=False)
+    status: Mapped[str] = mapped_column(String(16), nullable=False, default=HOLD_ACTIVE)
+    expires_at: Mapped[datetime.datetime] = mapped_column(DateTime, nullable=False)
+    created_at: Mapped[datetime.datetime] = mapped_column(DateTime, nullable=False)
+
+    __table_args__ = (
+        # Sweeper scan and per-user lookups of live holds
+        Index('ix_stock_hold_status_expires_at', 'status', 'expires_at'),
+        Index('ix_stock_hold_user_id_status', 'user_id', 'status'),
+    )
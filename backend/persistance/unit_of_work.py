@@ -0,0 +1,88 @@
+"""Unit of work over a request's `AsyncSession`.
+
+Repositories and services end each write with `auto_commit(session)`.
+Outside a unit of work that commits, as it always has. Inside one it only
+flushes (so generated ids and constraint errors still surface immediately)
+and the unit of work commits everything once when it exits, or rolls it all
+back if the block raises:
+
+    async with UnitOfWork(db):
+        await SellerService(db).create_product(...)   # flushes only
+    # one COMMIT here
+
+`TransactionMiddleware` opens a unit of work around every request, so
+endpoints get one commit per request without any changes of their own.
+Units of work nest; only the outermost one commits. A nested unit runs in a
+SAVEPOINT: if its block raises, its own writes are rolled back even when the
+caller handles the error and the outer unit goes on to commit. On SQLite the
+unit emits BEGIN first if the driver has not: pysqlite starts transactions
+lazily, and a SAVEPOINT opened outside one would commit when released.
+"""
+
+from typing import Any, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+_DEPTH_KEY = "unit_of_work_depth"
+
+
+def in_unit_of_work(session: AsyncSession) -> bool:
+    """True while a unit of work is open on `session`."""
+    # Session stand-ins without `info` never join a unit of work
+    info = getattr(session, "info", None) or {}
+    return bool(info.get(_DEPTH_KEY))
+
+
+async def auto_commit(session: AsyncSession) -> None:
+    """Commit `session`, or only flush it while a unit of work is open on it."""
+    if in_unit_of_work(session):
+        await session.flush()
+    else:
+        await session.commit()
+
+
+class UnitOfWork:
+    """Async context manager that commits `session` once, on successful exit."""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+        self._savepoint: Optional[Any] = None
+
+    async def __aenter__(self) -> "UnitOfWork":
+        if in_unit_of_work(self.session):
+            self._savepoint = await self._begin_nested()
+        self.session.info[_DEPTH_KEY] = self.session.info.get(_DEPTH_KEY, 0) + 1
+        return self
+
+    async def _begin_nested(self) -> Any:
+        connection = await self.session.connection()
+        if connection.dialect.name == "sqlite":
+            raw = await connection.get_raw_connection()
+            if not raw.driver_connection.in_transaction:
+                await connection.exec_driver_sql("BEGIN")
+        return await self.session.begin_nested()
+
+    async def __aexit__(self, exc_type: Optional[type], exc: Optional[BaseException], tb: Any) -> None:
+        depth = self.session.info.get(_DEPTH_KEY, 1) - 1
+        if depth > 0:
+            self.session.info[_DEPTH_KEY] = depth
+            savepoint, self._savepoint = self._savepoint, None
+            if savepoint is not None and savepoint.is_active:
+                if exc_type is None:
+                    await savepoint.commit()
+                else:
+                    await savepoint.rollback()
+            return
+        self.session.info.pop(_DEPTH_KEY, None)
+        if exc_type is None:
+            await self.session.commit()
+        else:
+            await self.session.rollback()
+
+    async def commit(self) -> None:
+        """Commit the work so far and keep the unit of work open."""
+        await self.session.commit()
+
+    async def rollback(self) -> None:
+        """Discard the work so far and keep the unit of work open."""
+        await self.session.rollback()
@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
 from typing import Generic, TypeVar, Optional, List
 from sqlalchemy.ext.asyncio import AsyncSession
+from backend.persistance.unit_of_work import auto_commit
 
 T = TypeVar('T')
 ID = TypeVar('ID')
@@ -13,15 +14,15 @@ class BaseRepository(ABC, Generic[T, ID]):
         """Perform a soft-delete if the model has `is_deleted`, otherwise hard-delete."""
         if hasattr(obj, "is_deleted"):
             setattr(obj, "is_deleted", True)
-            await self.session.commit()
+            await auto_commit(self.session)
             return
         if hasattr(obj, "deleted"):
             setattr(obj, "deleted", True)
-            await self.session.commit()
+            await auto_commit(self.session)
             return
         # Fallback to hard delete when model doesn't have a soft-delete column
         await self.session.delete(obj)
-        await self.session.commit()
+        await auto_commit(self.session)
 
     def apply_whitelist_update(self, target: T, source: T, whitelist: set[str]) -> None:
         """Copy only whitelisted attributes from source to target."""
@@ -6,12 +6,15 @@
 # Provides async CRUD methods for cart items.
 # ------------------------------------------------------------------------------
 
-from typing import List, Optional
+from typing import Any, Iterable, List, Mapping, Optional
 from backend.persistance.cart_item import CartItem
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.orm.util import identity_key
+from sqlalchemy.orm.attributes import set_committed_value
 
 from backend.repositories.base_repository import BaseRepository
+from backend.persistance.unit_of_work import auto_commit
 
 
 class CartItemRepository(BaseRepository[CartItem, int]):
@@ -27,6 +30,49 @@ class CartItemRepository(BaseRepository[CartItem, int]):
         )
         return result.scalars().first()
 
+    async def get_live_by_cart_id(self, cart_id: int) -> List[CartItem]:
+        """Every item of a cart that is not soft-deleted, oldest first."""
+        result = await self.session.execute(
+            select(CartItem)
+            .filter(CartItem.cart_id == cart_id, CartItem.is_deleted == False)
+            .order_by(CartItem.cart_item_id)
+        )
+        return list(result.scalars().all())
+
+    # Bulk writes issue one statement each and leave committing to the caller,
+    # so a whole batch of cart edits lands in a single transaction.
+
+    async def bulk_insert(self, rows: Iterable[Mapping[str, Any]]) -> List[CartItem]:
+        """Insert many items with one multi-row INSERT; returns them with their new ids."""
+        values = [dict(row) for row in rows]
+        if not values:
+            return []
+        result = await self.session.scalars(insert(CartItem).returning(CartItem), values)
+        return list(result.all())
+
+    async def bulk_update_quantities(self, quantities: Mapping[int, int]) -> None:
+        """Set the quantity of many items (keyed by cart_item_id) with one UPDATE."""
+        if not quantities:
+            return
+        await self.session.execute(
+            update(CartItem),
+            [{"cart_item_id": item_id, "quantity": qty} for item_id, qty in quantities.items()],
+        )
+        # Update-by-primary-key does not touch loaded instances; keep them in step
+        for item_id, qty in quantities.items():
+            loaded = self.session.identity_map.get(identity_key(CartItem, item_id))
+            if loaded is not None:
+                set_committed_value(loaded, "quantity", qty)
+
+    async def bulk_delete(self, item_ids: Iterable[int]) -> None:
+        """Hard-delete many items with one DELETE."""
+        ids = list(item_ids)
+        if not ids:
+            return
+        await self.session.execute(
+            delete(CartItem).where(CartItem.cart_item_id.in_(ids))
+        )
+
     async def list(self, *, limit: int = 100, offset: int = 0) -> List[CartItem]:
         BaseRepository.validate_pagination(limit, offset)
         result = await self.session.execute(
@@ -37,7 +83,7 @@ class CartItemRepository(BaseRepository[CartItem, int]):
 
     async def add(self, obj: CartItem) -> CartItem:
         self.session.add(obj)
-        await self.session.commit()
+        await auto_commit(self.session)
         await self.session.refresh(obj)
         return obj
 
@@ -46,7 +92,7 @@ class CartItemRepository(BaseRepository[CartItem, int]):
         if not existing:
             raise ValueError(f"CartItem with id {id} not found")
         self.apply_whitelist_update(existing, obj, self.UPDATABLE_FIELDS)
-        await self.session.commit()
+        await auto_commit(self.session)
         await self.session.refresh(existing)
         return existing
 
@@ -12,6 +12,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
 from backend.repositories.base_repository import BaseRepository
+from backend.persistance.unit_of_work import auto_commit
 
 
 class CartRepository(BaseRepository[Cart, int]):
@@ -27,6 +28,16 @@ class CartRepository(BaseRepository[Cart, int]):
         )
         return result.scalars().first()
 
+    async def get_by_user_id(self, user_id: int) -> Optional[Cart]:
+        """The user's oldest live cart, or None."""
+        result = await self.session.execute(
+            select(Cart)
+            .filter(Cart.user_id == user_id, Cart.is_deleted == False)
+            .order_by(Cart.cart_id)
+            .limit(1)
+        )
+        return result.scalars().first()
+
     async def list(self, *, limit: int = 100, offset: int = 0) -> List[Cart]:
         BaseRepository.validate_pagination(limit, offset)
         result = await self.session.execute(
@@ -37,7 +48,7 @@ class CartRepository(BaseRepository[Cart, int]):
 
     async def add(self, obj: Cart) -> Cart:
         self.session.add(obj)
-        await self.session.commit()
+        await auto_commit(self.session)
         await self.session.refresh(obj)
         return obj
 
@@ -46,7 +57,7 @@ class CartRepository(BaseRepository[Cart, int]):
         if not existing:
             raise ValueError(f"Cart with id {id} not found")
         self.apply_whitelist_update(existing, obj, self.UPDATABLE_FIELDS)
-        await self.session.commit()
+        await auto_commit(self.session)
         await self.session.refresh(existing)
         return existing
 
@@ -0,0 +1,143 @@
+# ------------------------------------------------------------------------------
+# catalog_card_repository.py
+# ------------------------------------------------------------------------------
+# Repository that maintains the denormalized catalog_card read model.
+# Cards are rebuilt from product, product_image, category and subcategory:
+# incrementally for the products a write touched, or in full (rebuild CLI:
+# `python -m backend.scripts.rebuild_catalog_cards`).
+# Callers own the transaction; nothing here commits.
+# ------------------------------------------------------------------------------
+
+from typing import Any, Iterable, Optional
+
+from sqlalchemy import Select, delete, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.infrastructure.storage import static_url
+from backend.persistance.catalog_card import CatalogCard
+from backend.persistance.catalog_version import utcnow
+from backend.persistance.category import Category
+from backend.persistance.product import Product
+from backend.persistance.product_image import ProductImage
+from backend.persistance.subcategory import Subcategory
+
+REBUILD_BATCH_SIZE = 1000
+
+
+def card_source_select() -> Select:
+    """Every input of a card, one row per active product (primary image = lowest image_id)."""
+    primary_image = (
+        select(ProductImage.image_url)
+        .where(ProductImage.product_id == Product.product_id)
+        .order_by(ProductImage.image_id)
+        .limit(1)
+        .scalar_subquery()
+    )
+    return (
+        select(
+            Product.product_id,
+            Product.seller_id,
+            Product.category_id,
+            Product.subcategory_id,
+            Product.title,
+            Product.description,
+            Product.price,
+            Product.currency,
+            Product.created_at,
+            primary_image.label("product_image"),
+            Category.name.label("category_name"),
+            Category.image_url.label("category_image"),
+            Subcategory.name.label("subcategory_name"),
+            Subcategory.image_url.label("subcategory_image"),
+        )
+        .outerjoin(Category, Category.category_id == Product.category_id)
+        .outerjoin(Subcategory, Subcategory.subcategory_id == Product.subcategory_id)
+        .filter(Product.is_active == True)
+    )
+
+
+def build_card(row: Any, refreshed_at: Any = None) -> dict[str, Any]:
+    """Resolve one `card_source_select` row into catalog_card column values."""
+    return {
+        "product_id": row.product_id,
+        "seller_id": row.seller_id,
+        "category_id": row.category_id,
+        "subcategory_id": row.subcategory_id,
+        "title": row.title,
+        "description": row.description,
+        "price": row.price,
+        "currency": row.currency,
+        # Product image, else subcategory image, else category image
+        "image_url": (
+            static_url(row.product_image)
+            or static_url(row.subcategory_image)
+            or static_url(row.category_image)
+        ),
+        "category_name": row.category_name,
+        "subcategory_name": row.subcategory_name,
+        "created_at": row.created_at,
+        "refreshed_at": refreshed_at or utcnow(),
+    }
+
+
+class CatalogCardRepository:
+    """
+    Repository for the CatalogCard read model.
+    Cards exist only for active products; refreshing a product that is no
+    longer active (or no longer exists) removes its card.
+    """
+    def __init__(self, db: AsyncSession):
+        """Initialize repository with async DB session."""
+        self.db = db
+
+    async def _write(self, condition: Any, stale: Any) -> int:
+        # Cards are built with SQL, so pending ORM changes must reach the database first
+        await self.db.flush()
+        rows = (await self.db.execute(card_source_select().filter(condition))).all()
+        await self.db.execute(delete(CatalogCard).filter(stale))
+        if rows:
+            now = utcnow()
+            await self.db.execute(insert(CatalogCard), [build_card(row, now) for row in rows])
+        return len(rows)
+
+    async def refresh_products(self, product_ids: Iterable[int]) -> int:
+        """Rebuild the cards of the given products; returns how many are listed."""
+        ids = list({pid for pid in product_ids if pid is not None})
+        if not ids:
+            return 0
+        return await self._write(Product.product_id.in_(ids), CatalogCard.product_id.in_(ids))
+
+    async def refresh_taxonomy(
+        self,
+        category_ids: Optional[Iterable[int]] = None,
+        subcategory_ids: Optional[Iterable[int]] = None,
+    ) -> int:
+        """Rebuild the cards of every product under the given categories/subcategories.
+
+        Call after renaming a category/subcategory or changing its image.
+        """
+        cats = list(category_ids or [])
+        subs = list(subcategory_ids or [])
+        total = 0
+        if cats:
+            total += await self._write(Product.category_id.in_(cats), CatalogCard.category_id.in_(cats))
+        if subs:
+            total += await self._write(Product.subcategory_id.in_(subs), CatalogCard.subcategory_id.in_(subs))
+        return total
+
+    async def rebuild(self, batch_size: int = REBUILD_BATCH_SIZE) -> int:
+        """Replace every card, reading products in primary-key batches."""
+        await self.db.flush()
+        await self.db.execute(delete(CatalogCard))
+        now = utcnow()
+        total, last_id = 0, None
+        while True:
+            stmt = card_source_select().order_by(Product.product_id).limit(batch_size)
+            if last_id is not None:
+                stmt = stmt.filter(Product.product_id > last_id)
+            rows = (await self.db.execute(stmt)).all()
+            if not rows:
+                return total
+            await self.db.execute(insert(CatalogCard), [build_card(row, now) for row in rows])
+            total += len(rows)
+            last_id = rows[-1].product_id
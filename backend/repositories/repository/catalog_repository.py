@@ -0,0 +1,208 @@
+# ------------------------------------------------------------------------------
+# catalog_repository.py
+# ------------------------------------------------------------------------------
+# Read-side repository for the public catalog.
+# Reads the denormalized catalog_card table (one row per listed product) and
+# provides keyset (cursor) pagination keyed on (sort_key, product_id).
+# ------------------------------------------------------------------------------
+
+import datetime
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Iterable, List, Optional, Sequence
+
+from sqlalchemy import Select, and_, exists, or_, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.persistance.catalog_card import CatalogCard
+from backend.persistance.product import Product
+from backend.persistance.product_variant import ProductVariant
+
+EXPORT_BATCH_SIZE = 2000
+
+# Public sort names -> CatalogCard column. `id` keeps the historical listing order.
+SORT_COLUMNS = {
+    "id": CatalogCard.product_id,
+    "price": CatalogCard.price,
+    "created_at": CatalogCard.created_at,
+    "title": CatalogCard.title,
+}
+SORT_ORDERS = ("asc", "desc")
+
+
+@dataclass(frozen=True)
+class CatalogFilters:
+    """Server-side filters shared by every catalog read (listing, facets, search, export)."""
+    category_id: Optional[int] = None
+    subcategory_id: Optional[int] = None
+    min_price: Optional[float] = None
+    max_price: Optional[float] = None
+    # Products with stock on an active variant, or without variants (which carry no stock)
+    in_stock: bool = False
+    # Internal: seller-scoped reads include the seller's inactive products
+    seller_id: Optional[int] = None
+    active_only: bool = True
+
+    def _conditions(self, source: Any) -> list[Any]:
+        conditions = []
+        if self.seller_id is not None:
+            conditions.append(source.seller_id == self.seller_id)
+        if self.category_id is not None:
+            conditions.append(source.category_id == self.category_id)
+        if self.subcategory_id is not None:
+            conditions.append(source.subcategory_id == self.subcategory_id)
+        if self.min_price is not None:
+            conditions.append(source.price >= self.min_price)
+        if self.max_price is not None:
+            conditions.append(source.price <= self.max_price)
+        if self.in_stock:
+            variants = and_(ProductVariant.product_id == source.product_id, ProductVariant.is_active == True)
+            conditions.append(or_(
+                ~exists().where(variants),
+                exists().where(variants, ProductVariant.quantity > 0),
+            ))
+        return conditions
+
+    def apply(self, stmt: Select) -> Select:
+        """Filter a statement that selects from `product`."""
+        if self.active_only:
+            stmt = stmt.filter(Product.is_active == True)
+        return stmt.filter(*self._conditions(Product))
+
+    def apply_cards(self, stmt: Select) -> Select:
+        """Filter a statement that selects from `catalog_card`.
+
+        Cards exist only for active products, so `active_only` is implied.
+        """
+        return stmt.filter(*self._conditions(CatalogCard))
+
+
+class CatalogRepository:
+    """
+    Repository for public catalog reads.
+    Card reads return plain rows (no ORM instances) shaped by `card_select`.
+    """
+    def __init__(self, db: AsyncSession):
+        """Initialize repository with async DB session."""
+        self.db = db
+
+    @staticmethod
+    def card_select() -> Select:
+        """Columns needed to render a catalog card, one fully resolved row per product.
+
+        Row layout: (product_id, title, description, price, currency,
+        category_id, subcategory_id, created_at, image_url, category_name,
+        subcategory_name).
+        """
+        return select(
+            CatalogCard.product_id,
+            CatalogCard.title,
+            CatalogCard.description,
+            CatalogCard.price,
+            CatalogCard.currency,
+            CatalogCard.category_id,
+            CatalogCard.subcategory_id,
+            CatalogCard.created_at,
+            CatalogCard.image_url,
+            CatalogCard.category_name,
+            CatalogCard.subcategory_name,
+        )
+
+    async def get_active(self, product_id: int) -> Optional[Any]:
+        """Retrieve the card of a single active product by its ID."""
+        result = await self.db.execute(self.card_select().filter(CatalogCard.product_id == product_id))
+        return result.first()
+
+    async def get_validation_rows(self, product_ids: Iterable[int]) -> dict[int, dict[str, Any]]:
+        """Retrieve id/price/is_active for many products in one query, keyed by product ID.
+
+        Inactive products are included; callers decide how to treat them.
+        """
+        ids = list(product_ids)
+        if not ids:
+            return {}
+        result = await self.db.execute(
+            select(Product.product_id, Product.price, Product.is_active).filter(Product.product_id.in_(ids))
+        )
+        return {
+            pid: {"product_id": pid, "price": float(price or 0), "is_active": bool(is_active)}
+            for pid, price, is_active in result.all()
+        }
+
+    async def list_active(self, filters: Optional[CatalogFilters] = None) -> List[Any]:
+        """Retrieve every active product card matching `filters`, ordered by ID."""
+        stmt = (filters or CatalogFilters()).apply_cards(self.card_select()).order_by(CatalogCard.product_id)
+        result = await self.db.execute(stmt)
+        return list(result.all())
+
+    async def list_page(
+        self,
+        filters: CatalogFilters,
+        *,
+        sort: str = "id",
+        order: str = "asc",
+        limit: int = 50,
+        after: Optional[Sequence[Any]] = None,
+        product_ids: Optional[Any] = None,
+    ) -> List[Any]:
+        """Retrieve one page of active product cards using keyset pagination.
+
+        `after` is the `(sort_value, product_id)` of the last row of the previous
+        page. The predicate is a row-value comparison on the same columns as the
+        ORDER BY, so each page is a single index range scan whose cost does not
+        depend on how deep the client has paged. NULL sort values (price and
+        created_at are nullable) always sort last. `product_ids` (ids or an id
+        subquery, such as a keyword match) restricts the cards further.
+        """
+        if sort not in SORT_COLUMNS:
+            raise ValueError(f"sort must be one of {', '.join(SORT_COLUMNS)}")
+        if order not in SORT_ORDERS:
+            raise ValueError("order must be 'asc' or 'desc'")
+        col = SORT_COLUMNS[sort]
+        pk = CatalogCard.product_id
+        desc = order == "desc"
+        stmt = filters.apply_cards(self.card_select())
+        if product_ids is not None:
+            stmt = stmt.filter(pk.in_(product_ids))
+        if after is not None:
+            value, last_id = after
+            if sort == "id":
+                stmt = stmt.filter(pk < last_id if desc else pk > last_id)
+            elif value is None:
+                stmt = stmt.filter(and_(col.is_(None), pk < last_id if desc else pk > last_id))
+            else:
+                keyset = tuple_(col, pk) < (value, last_id) if desc else tuple_(col, pk) > (value, last_id)
+                # NULLs sort last, so they still follow any non-NULL cursor value
+                stmt = stmt.filter(or_(keyset, col.is_(None)) if CatalogCard.__table__.c[col.key].nullable else keyset)
+        if sort == "id":
+            stmt = stmt.order_by(pk.desc() if desc else pk.asc())
+        elif desc:
+            stmt = stmt.order_by(col.desc().nulls_last(), pk.desc())
+        else:
+            stmt = stmt.order_by(col.asc().nulls_last(), pk.asc())
+        result = await self.db.execute(stmt.limit(limit))
+        return list(result.all())
+
+    async def stream_cards(
+        self,
+        filters: CatalogFilters,
+        *,
+        since: Optional[datetime.datetime] = None,
+        after_id: Optional[int] = None,
+        batch_size: int = EXPORT_BATCH_SIZE,
+    ) -> AsyncIterator[Sequence[Any]]:
+        """Yield every matching card in product ID order, `batch_size` rows at a time.
+
+        Uses a server-side cursor (`AsyncSession.stream` + `yield_per`), so
+        memory stays flat however large the catalog is. `since` keeps only
+        cards refreshed at or after that time; `after_id` resumes after the
+        last product ID a previous export delivered.
+        """
+        stmt = filters.apply_cards(self.card_select())
+        if since is not None:
+            stmt = stmt.filter(CatalogCard.refreshed_at >= since)
+        if after_id is not None:
+            stmt = stmt.filter(CatalogCard.product_id > after_id)
+        stmt = stmt.order_by(CatalogCard.product_id).execution_options(yield_per=batch_size)
+        result = await self.db.stream(stmt)
+        async for partition in result.partitions():
+            yield partition
@@ -0,0 +1,46 @@
+# ------------------------------------------------------------------------------
+# catalog_version_repository.py
+# ------------------------------------------------------------------------------
+# Repository for reading CatalogVersion records.
+# Versions are bumped by session hooks in backend/persistance/catalog_version.py;
+# this repository only reads them.
+# ------------------------------------------------------------------------------
+
+import datetime
+from dataclasses import dataclass
+from typing import Iterable
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.persistance.catalog_version import CatalogVersion
+
+
+@dataclass(frozen=True)
+class VersionStamp:
+    """Version and last-change time of one catalog scope."""
+    version: int
+    updated_at: datetime.datetime
+
+
+_EPOCH = VersionStamp(version=0, updated_at=datetime.datetime(1970, 1, 1))
+
+
+class CatalogVersionRepository:
+    """
+    Repository for CatalogVersion model.
+    Provides a single-query read of one or more scope versions.
+    """
+    def __init__(self, db: AsyncSession):
+        """Initialize repository with async DB session."""
+        self.db = db
+
+    async def get(self, scopes: Iterable[str]) -> dict[str, VersionStamp]:
+        """Retrieve the current stamp of each scope; unknown scopes read as version 0."""
+        wanted = list(scopes)
+        result = await self.db.execute(
+            select(CatalogVersion.scope, CatalogVersion.version, CatalogVersion.updated_at)
+            .filter(CatalogVersion.scope.in_(wanted))
+        )
+        found = {scope: VersionStamp(version, updated_at) for scope, version, updated_at in result.all()}
+        return {scope: found.get(scope, _EPOCH) for scope in wanted}
@@ -0,0 +1,126 @@
+# ------------------------------------------------------------------------------
+# checkout_job_repository.py
+# ------------------------------------------------------------------------------
+# Repository for the checkout_job queue.
+# Workers claim due jobs with one UPDATE ... RETURNING (rows already locked by
+# another worker are skipped on Postgres) and settle them with updates guarded
+# by their lease, so a worker that lost its lease cannot overwrite the result
+# of the worker that reclaimed the job. `renew` checks and extends a lease
+# before a step that must not run twice, such as charging the payment.
+# ------------------------------------------------------------------------------
+
+import datetime
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import and_, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.persistance.checkout_job import (
+    JOB_FAILED, JOB_PENDING, JOB_PROCESSING, JOB_SUCCEEDED, CheckoutJob,
+)
+from backend.persistance.unit_of_work import auto_commit
+
+
+class CheckoutJobRepository:
+    """Repository for CheckoutJob model."""
+    def __init__(self, db: AsyncSession):
+        """Initialize repository with async DB session."""
+        self.db = db
+
+    async def enqueue(
+        self, user_id: int, cart_id: int, payload: Dict[str, Any], *, now: datetime.datetime
+    ) -> CheckoutJob:
+        """Store a pending job, claimable immediately."""
+        job = CheckoutJob(
+            user_id=user_id, cart_id=cart_id, status=JOB_PENDING, attempts=0,
+            available_at=now, created_at=now, updated_at=now,
+        )
+        job.set_payload(payload)
+        self.db.add(job)
+        await auto_commit(self.db)
+        return job
+
+    async def get_for_user(self, job_id: int, user_id: int) -> Optional[CheckoutJob]:
+        """The user's job as currently stored; workers update it from other sessions."""
+        result = await self.db.execute(
+            select(CheckoutJob)
+            .filter(CheckoutJob.job_id == job_id, CheckoutJob.user_id == user_id)
+            .execution_options(populate_existing=True)
+        )
+        return result.scalars().first()
+
+    async def claim(
+        self, worker: str, *, now: datetime.datetime, limit: int, lease: datetime.timedelta
+    ) -> List[CheckoutJob]:
+        """Lease up to `limit` due jobs (pending, or processing with an expired lease) to `worker`."""
+        due = (
+            select(CheckoutJob.job_id)
+            .filter(or_(
+                and_(CheckoutJob.status == JOB_PENDING, CheckoutJob.available_at <= now),
+                and_(CheckoutJob.status == JOB_PROCESSING, CheckoutJob.locked_until < now),
+            ))
+            .order_by(CheckoutJob.job_id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+            .scalar_subquery()
+        )
+        result = await self.db.scalars(
+            update(CheckoutJob)
+            .where(CheckoutJob.job_id.in_(due))
+            .values(
+                status=JOB_PROCESSING, attempts=CheckoutJob.attempts + 1,
+                locked_by=worker, locked_until=now + lease, updated_at=now,
+            )
+            .returning(CheckoutJob)
+            .execution_options(populate_existing=True)
+        )
+        jobs = sorted(result.all(), key=lambda job: job.job_id)
+        await auto_commit(self.db)
+        return jobs
+
+    async def renew(
+        self, job_id: int, worker: str, *, now: datetime.datetime, lease: datetime.timedelta
+    ) -> bool:
+        """Extend `worker`'s unexpired lease on the job; False if it was lost. The caller commits."""
+        result = await self.db.execute(
+            update(CheckoutJob)
+            .where(
+                CheckoutJob.job_id == job_id,
+                CheckoutJob.status == JOB_PROCESSING,
+                CheckoutJob.locked_by == worker,
+                # The same test `claim` uses, negated: an expired lease may already be reclaimed
+                or_(CheckoutJob.locked_until.is_(None), CheckoutJob.locked_until >= now),
+            )
+            .values(locked_until=now + lease, updated_at=now)
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount == 1
+
+    async def _settle(self, job_id: int, worker: str, now: datetime.datetime, **values: Any) -> bool:
+        result = await self.db.execute(
+            update(CheckoutJob)
+            .where(
+                CheckoutJob.job_id == job_id,
+                CheckoutJob.status == JOB_PROCESSING,
+                CheckoutJob.locked_by == worker,
+            )
+            .values(locked_until=None, updated_at=now, **values)
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount == 1
+
+    async def complete(self, job_id: int, worker: str, order_id: int, *, now: datetime.datetime) -> bool:
+        """Mark the job succeeded; False if `worker` no longer holds it. The caller commits."""
+        return await self._settle(job_id, worker, now, status=JOB_SUCCEEDED, order_id=order_id, last_error=None)
+
+    async def fail(self, job_id: int, worker: str, error: str, *, now: datetime.datetime) -> bool:
+        """Mark the job failed for good; False if `worker` no longer holds it. The caller commits."""
+        return await self._settle(job_id, worker, now, status=JOB_FAILED, last_error=error)
+
+    async def retry(
+        self, job_id: int, worker: str, error: str, *, now: datetime.datetime, available_at: datetime.datetime
+    ) -> bool:
+        """Put the job back in the queue from `available_at`; False if `worker` no longer holds it."""
+        return await self._settle(
+            job_id, worker, now, status=JOB_PENDING, last_error=error, available_at=available_at
+        )
@@ -12,6 +12,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
 from backend.repositories.base_repository import BaseRepository
+from backend.persistance.unit_of_work import auto_commit
 
 
 class SellerComponentRepository(BaseRepository[SellerComponent, int]):
@@ -32,7 +33,7 @@ class SellerComponentRepository(BaseRepository[SellerComponent, int]):
 
     async def add(self, obj: SellerComponent) -> SellerComponent:
         self.session.add(obj)
-        await self.session.commit()
+        await auto_commit(self.session)
         await self.session.refresh(obj)
         return obj
 
@@ -41,7 +42,7 @@ class SellerComponentRepository(BaseRepository[SellerComponent, int]):
         if not existing:
             raise ValueError(f"SellerComponent with id {id} not found")
         self.apply_whitelist_update(existing, obj, self.UPDATABLE_FIELDS)
-        await self.session.commit()
+        await auto_commit(self.session)
         await self.session.refresh(existing)
         return existing
 
@@ -54,7 +55,7 @@ class SellerComponentRepository(BaseRepository[SellerComponent, int]):
     async def create(self, img_url: str, description: str) -> SellerComponent:
         component = SellerComponent(img_url=img_url, description=description)
         self.session.add(component)
-        await self.session.commit()
+        await auto_commit(self.session)
         await self.session.refresh(component)
         return component
 
@@ -11,6 +11,7 @@ from typing import Any, Optional
 from backend.persistance.customer_shipment import CustomerShipment
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
+from backend.persistance.unit_of_work import auto_commit
 
 
 class CustomerShipmentRepository:
@@ -33,7 +34,7 @@ class CustomerShipmentRepository:
         """Create a new customer shipment."""
         shipment = CustomerShipment(**kwargs)
         self.db.add(shipment)
-        await self.db.commit()
+        await auto_commit(self.db)
         await self.db.refresh(shipment)
         return shipment
 
@@ -45,7 +46,7 @@ class CustomerShipmentRepository:
         for k, v in kwargs.items():
             if hasattr(shipment, k):
                 setattr(shipment, k, v)
-        await self.db.commit()
+        await auto_commit(self.db)
         return shipment
 
     async def delete(self, cs_id: int) -> bool:
@@ -54,6 +55,6 @@ class CustomerShipmentRepository:
         if shipment:
             # `delete()` on AsyncSession is a synchronous method (not awaitable)
             await self.db.delete(shipment)
-            await self.db.commit()
+            await auto_commit(self.db)
             return True
         return False
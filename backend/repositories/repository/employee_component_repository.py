@@ -12,6 +12,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
 from backend.repositories.base_repository import BaseRepository
+from backend.persistance.unit_of_work import auto_commit
 
 
 class EmployeeComponentRepository(BaseRepository[EmployeeComponent, int]):
@@ -32,7 +33,7 @@ class EmployeeComponentRepository(BaseRepository[EmployeeComponent, int]):
 
     async def add(self, obj: EmployeeComponent) -> EmployeeComponent:
         self.session.add(obj)
-        await self.session.commit()
+        await auto_commit(self.session)
         await self.session.refresh(obj)
         return obj
 
@@ -41,7 +42,7 @@ class EmployeeComponentRepository(BaseRepository[EmployeeComponent, int]):
         if not existing:
             raise ValueError(f"EmployeeComponent with id {id} not found")
         self.apply_whitelist_update(existing, obj, self.UPDATABLE_FIELDS)
-        await self.session.commit()
+        await auto_commit(self.session)
         await self.session.refresh(existing)
         return existing
 
@@ -54,7 +55,7 @@ class EmployeeComponentRepository(BaseRepository[EmployeeComponent, int]):
     async def create(self, img_url: str, description: str, department_id: int) -> EmployeeComponent:
         component = EmployeeComponent(img_url=img_url, description=description, department_id=department_id)
         self.session.add(component)
-        await self.session.commit()
+        await auto_commit(self.session)
         await self.session.refresh(component)
         return component
 
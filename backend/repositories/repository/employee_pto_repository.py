@@ -11,6 +11,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.persistance.employee_pto import EmployeePTO
 from sqlalchemy import select
+from backend.persistance.unit_of_work import auto_commit
 
 class EmployeePTORepository:
     """
@@ -41,7 +42,7 @@ class EmployeePTORepository:
     async def save(self, pto: EmployeePTO) -> EmployeePTO:
         """Save a PTO record."""
         self.db.add(pto)
-        await self.db.commit()
+        await auto_commit(self.db)
         await self.db.refresh(pto)
         return pto
 
@@ -53,7 +54,7 @@ class EmployeePTORepository:
         for key, value in kwargs.items():
             if hasattr(pto, key):
                 setattr(pto, key, value)
-        await self.db.commit()
+        await auto_commit(self.db)
         await self.db.refresh(pto)
         return pto
 
@@ -63,5 +64,5 @@ class EmployeePTORepository:
         if not pto:
             return False
         await self.db.delete(pto)
-        await self.db.commit()
+        await auto_commit(self.db)
         return True
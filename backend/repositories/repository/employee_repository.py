@@ -12,6 +12,7 @@ from sqlalchemy import select, update as sql_update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.repositories.base_repository import BaseRepository
+from backend.persistance.unit_of_work import auto_commit
 
 
 class EmployeeRepository(BaseRepository[Employee, int]):
@@ -32,7 +33,7 @@ class EmployeeRepository(BaseRepository[Employee, int]):
 
     async def add(self, obj: Employee) -> Employee:
         self.session.add(obj)
-        await self.session.commit()
+        await auto_commit(self.session)
         await self.session.refresh(obj)
         return obj
 
@@ -42,7 +43,7 @@ class EmployeeRepository(BaseRepository[Employee, int]):
         if not existing:
             raise ValueError(f"Employee with id {id} not found")
         self.apply_whitelist_update(existing, obj, self.UPDATABLE_FIELDS)
-        await self.session.commit()
+        await auto_commit(self.session)
         await self.session.refresh(existing)
         return existing
 
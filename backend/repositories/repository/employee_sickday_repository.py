@@ -10,6 +10,7 @@ from typing import Optional, List
 from backend.persistance.employee_sickday import EmployeeSickDay
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
+from backend.persistance.unit_of_work import auto_commit
 
 class EmployeeSickDayRepository:
     """
@@ -40,7 +41,7 @@ class EmployeeSickDayRepository:
     async def save(self, sickday: EmployeeSickDay) -> EmployeeSickDay:
         """Save a sick day record."""
         self.db.add(sickday)
-        await self.db.commit()
+        await auto_commit(self.db)
         await self.db.refresh(sickday)
         return sickday
 
@@ -52,7 +53,7 @@ class EmployeeSickDayRepository:
         for key, value in kwargs.items():
             if hasattr(sickday, key):
                 setattr(sickday, key, value)
-        await self.db.commit()
+        await auto_commit(self.db)
         await self.db.refresh(sickday)
         return sickday
 
@@ -62,5 +63,5 @@ class EmployeeSickDayRepository:
         if not sickday:
             return False
         await self.db.delete(sickday)
-        await self.db.commit()
+        await auto_commit(self.db)
         return True
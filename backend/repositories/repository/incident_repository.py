@@ -12,6 +12,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.repositories.base_repository import BaseRepository
+from backend.persistance.unit_of_work import auto_commit
 
 
 class IncidentRepository(BaseRepository[Incident, int]):
@@ -34,7 +35,7 @@ class IncidentRepository(BaseRepository[Incident, int]):
     async def add(self, obj: Incident) -> Incident:
         self.session.add(obj)
         await self.session.flush()
-        await self.session.commit()
+        await auto_commit(self.session)
         await self.session.refresh(obj)
         return obj
 
@@ -43,7 +44,7 @@ class IncidentRepository(BaseRepository[Incident, int]):
         if not existing:
             raise ValueError(f"Incident with id {id} not found")
         self.apply_whitelist_update(existing, obj, self.UPDATABLE_FIELDS)
-        await self.session.commit()
+        await auto_commit(self.session)
         await self.session.refresh(existing)
         return existing
 
@@ -51,7 +52,7 @@ class IncidentRepository(BaseRepository[Incident, int]):
         existing = await self.get(id)
         if existing:
             existing.is_deleted = True
-            await self.session.commit()
+            await auto_commit(self.session)
         return None
 
     async def get_all(self) -> List[Incident]:
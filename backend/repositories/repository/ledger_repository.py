@@ -9,6 +9,7 @@
 from typing import Any
 from backend.persistance.ledger import LedgerEntry
 from sqlalchemy.ext.asyncio import AsyncSession
+from backend.persistance.unit_of_work import auto_commit
 
 class LedgerRepository:
     """
@@ -22,6 +23,6 @@ class LedgerRepository:
     async def save(self, ledger_entry: LedgerEntry) -> LedgerEntry:
         """Save a new ledger entry to the database."""
         self.db.add(ledger_entry)
-        await self.db.commit()
+        await auto_commit(self.db)
         await self.db.refresh(ledger_entry)
         return ledger_entry
@@ -0,0 +1,178 @@
+# ------------------------------------------------------------------------------
+# order_analytics_repository.py
+# ------------------------------------------------------------------------------
+# Read-only aggregate queries over order/order_item for seller analytics.
+# Units sold, revenue and order counts are grouped per day, week or month in
+# the database (date_trunc on Postgres, date()/strftime() on SQLite), so a
+# report transfers one row per period instead of every order and item. Payout
+# reconciliation sums a month of sales per seller the same way.
+# ------------------------------------------------------------------------------
+
+import datetime
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import distinct, func, literal_column, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.persistance.enums import OrderStatusEnum
+from backend.persistance.order import Order
+from backend.persistance.order_item import OrderItem
+from backend.persistance.product import Product
+from backend.persistance.user import User
+
+# Accepted period names -> date_trunc field
+PERIODS = {
+    'daily': 'day', 'day': 'day',
+    'weekly': 'week', 'week': 'week',
+    'monthly': 'month', 'month': 'month',
+    'yearly': 'year', 'year': 'year',
+}
+# Orders that never turned into a sale
+EXCLUDED_STATUSES = (OrderStatusEnum.cancelled, OrderStatusEnum.returned)
+
+
+@dataclass
+class OrderFilters:
+    """Which order lines a report covers; None means no restriction."""
+    seller_id: Optional[int]
+    product_id: Optional[int] = None
+    age_range: Optional[Tuple[int, int]] = None
+    sex: Optional[str] = None
+    start_date: Optional[datetime.date] = None
+    end_date: Optional[datetime.date] = None
+
+
+@dataclass
+class PeriodTotals:
+    """Aggregates of one period, starting at `start`."""
+    start: datetime.date
+    units_sold: int
+    revenue: float
+    order_count: int
+
+
+def period_start(column: Any, field: str, dialect: str) -> Any:
+    """SQL expression for the first day of the `field` period containing `column` (a date or timestamp).
+
+    Arguments are inlined literals (from PERIODS only) rather than bound
+    parameters, so SELECT and GROUP BY render the identical expression.
+    """
+    if dialect == 'postgresql':
+        return func.date_trunc(literal_column(f"'{field}'"), column)
+    if field == 'day':
+        return func.date(column)
+    if field == 'month':
+        return func.strftime(literal_column("'%Y-%m-01'"), column)
+    if field == 'year':
+        return func.strftime(literal_column("'%Y-01-01'"), column)
+    # Monday of the ISO week: forward to its Sunday (same day if Sunday), then back six days
+    return func.date(column, literal_column("'weekday 0'"), literal_column("'-6 days'"))
+
+
+def as_date(value: Any) -> datetime.date:
+    if isinstance(value, datetime.datetime):
+        return value.date()
+    if isinstance(value, datetime.date):
+        return value
+    return datetime.date.fromisoformat(str(value)[:10])
+
+
+class OrderAnalyticsRepository:
+    """Aggregate order statistics, computed by the database."""
+    def __init__(self, db: AsyncSession):
+        """Initialize repository with async DB session."""
+        self.db = db
+
+    def _bucket(self, field: str) -> Any:
+        return period_start(Order.created_at, field, self.db.get_bind().dialect.name)
+
+    def line_filter(self, stmt: Any, filters: OrderFilters) -> Any:
+        """Restrict a statement over order_item joined to order to the report's lines."""
+        stmt = (
+            stmt.join(Product, Product.product_id == OrderItem.product_id)
+            .filter(
+                Product.is_deleted == False,
+                Order.is_deleted == False,
+                OrderItem.is_deleted == False,
+                Order.order_status.notin_(EXCLUDED_STATUSES),
+            )
+        )
+        if filters.seller_id is not None:
+            stmt = stmt.filter(Product.seller_id == filters.seller_id)
+        if filters.product_id:
+            stmt = stmt.filter(OrderItem.product_id == filters.product_id)
+        if filters.start_date:
+            stmt = stmt.filter(Order.created_at >= filters.start_date)
+        if filters.end_date:
+            # Through the whole end day
+            stmt = stmt.filter(Order.created_at < filters.end_date + datetime.timedelta(days=1))
+        if filters.age_range or filters.sex:
+            stmt = stmt.join(User, Order.user_id == User.user_id)
+            if filters.age_range:
+                today = datetime.date.today()
+                min_age, max_age = filters.age_range
+                stmt = stmt.filter(
+                    User.dob >= today.replace(year=today.year - max_age),
+                    User.dob <= today.replace(year=today.year - min_age),
+                )
+            if filters.sex and hasattr(User, 'sex'):
+                stmt = stmt.filter(getattr(User, 'sex') == filters.sex)
+        return stmt
+
+    async def totals_by_period(self, filters: OrderFilters, period: str = 'daily') -> List[PeriodTotals]:
+        """
+        Units sold, revenue (sum of the seller's line subtotals) and distinct
+        orders per period, oldest first, in one GROUP BY query.
+        """
+        field = PERIODS.get(period)
+        if field is None:
+            raise ValueError(f"Unknown period {period!r}; expected one of {sorted(PERIODS)}")
+        bucket = self._bucket(field).label('bucket')
+        stmt = self.line_filter(
+            select(
+                bucket,
+                func.coalesce(func.sum(OrderItem.quantity), 0),
+                func.coalesce(func.sum(OrderItem.subtotal), 0),
+                func.count(distinct(Order.order_id)),
+            )
+            .select_from(OrderItem)
+            .join(Order, Order.order_id == OrderItem.order_id)
+            .filter(Order.created_at.is_not(None)),
+            filters,
+        ).group_by(bucket).order_by(bucket)
+        rows = (await self.db.execute(stmt)).all()
+        return [
+            PeriodTotals(start=as_date(start), units_sold=int(units), revenue=float(revenue), order_count=int(orders))
+            for start, units, revenue, orders in rows
+        ]
+
+    async def sales_total(self, filters: OrderFilters) -> float:
+        """Sum of the line subtotals in the report, as one SUM query."""
+        stmt = self.line_filter(
+            select(func.coalesce(func.sum(OrderItem.subtotal), 0))
+            .select_from(OrderItem)
+            .join(Order, Order.order_id == OrderItem.order_id),
+            filters,
+        )
+        return float(await self.db.scalar(stmt))
+
+    async def sales_totals_by_seller(self, filters: OrderFilters) -> Dict[int, float]:
+        """Sum of the line subtotals per seller (seller_id -> total), in one GROUP BY query; sellers without sales are absent."""
+        stmt = self.line_filter(
+            select(Product.seller_id, func.coalesce(func.sum(OrderItem.subtotal), 0))
+            .select_from(OrderItem)
+            .join(Order, Order.order_id == OrderItem.order_id),
+            filters,
+        ).group_by(Product.seller_id)
+        return {seller_id: float(total) for seller_id, total in (await self.db.execute(stmt)).all()}
+
+    async def lines(self, filters: OrderFilters) -> List[Tuple[int, datetime.datetime, int, float]]:
+        """(order_id, created_at, quantity, subtotal) of every line in the report, for in-memory analysis."""
+        stmt = self.line_filter(
+            select(Order.order_id, Order.created_at, OrderItem.quantity, OrderItem.subtotal)
+            .select_from(OrderItem)
+            .join(Order, Order.order_id == OrderItem.order_id),
+            filters,
+        ).order_by(Order.order_id)
+        return [tuple(row) for row in (await self.db.execute(stmt)).all()]
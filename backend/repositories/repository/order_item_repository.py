@@ -3,15 +3,17 @@
 # order_item_repository.py
 # ------------------------------------------------------------------------------
 # Repository for accessing OrderItem records from the database.
-# Provides async CRUD methods for order items.
+# Provides async CRUD methods for order items, plus a bulk insert for the
+# checkout write path.
 # ------------------------------------------------------------------------------
 
-from typing import Optional, List
+from typing import Any, Iterable, Mapping, Optional, List
 from backend.persistance.order_item import OrderItem
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import insert, select
 
 from backend.repositories.base_repository import BaseRepository
+from backend.persistance.unit_of_work import auto_commit
 
 
 class OrderItemRepository(BaseRepository[OrderItem, int]):
@@ -32,7 +34,7 @@ class OrderItemRepository(BaseRepository[OrderItem, int]):
 
     async def add(self, obj: OrderItem) -> OrderItem:
         self.session.add(obj)
-        await self.session.commit()
+        await auto_commit(self.session)
         await self.session.refresh(obj)
         return obj
 
@@ -41,7 +43,7 @@ class OrderItemRepository(BaseRepository[OrderItem, int]):
         if not existing:
             raise ValueError(f"OrderItem with id {id} not found")
         self.apply_whitelist_update(existing, obj, self.UPDATABLE_FIELDS)
-        await self.session.commit()
+        await auto_commit(self.session)
         await self.session.refresh(existing)
         return existing
 
@@ -54,3 +56,17 @@ class OrderItemRepository(BaseRepository[OrderItem, int]):
     async def get_by_order_id(self, order_id: int) -> List[OrderItem]:
         result = await self.session.execute(select(OrderItem).filter(OrderItem.order_id == order_id))
         return list(result.scalars().all())
+
+    async def bulk_create(self, rows: Iterable[Mapping[str, Any]]) -> List[OrderItem]:
+        """
+        Insert order items from column dicts with one multi-row INSERT ... RETURNING.
+
+        Skips per-object unit-of-work bookkeeping; the returned items carry
+        their new ids but not necessarily in input order. Committing is left
+        to the caller.
+        """
+        values = [dict(row) for row in rows]
+        if not values:
+            return []
+        result = await self.session.scalars(insert(OrderItem).returning(OrderItem), values)
+        return list(result.all())
@@ -13,6 +13,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
 from backend.repositories.base_repository import BaseRepository
+from backend.persistance.unit_of_work import auto_commit
 
 
 class OrderRepository(BaseRepository[Order, int]):
@@ -85,7 +86,7 @@ class OrderRepository(BaseRepository[Order, int]):
 
     async def add(self, obj: Order) -> Order:
         self.session.add(obj)
-        await self.session.commit()
+        await auto_commit(self.session)
         await self.session.refresh(obj)
         return obj
 
@@ -98,7 +99,7 @@ class OrderRepository(BaseRepository[Order, int]):
         for field in self.UPDATABLE_FIELDS:
             if hasattr(obj, field):
                 setattr(existing, field, getattr(obj, field))
-        await self.session.commit()
+        await auto_commit(self.session)
         await self.session.refresh(existing)
         return existing
 
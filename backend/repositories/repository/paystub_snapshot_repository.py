@@ -11,6 +11,7 @@ from typing import Optional
 from backend.persistance.paystub_snapshot import PaystubSnapshot
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
+from backend.persistance.unit_of_work import auto_commit
 
 class PaystubSnapshotRepository:
     """
@@ -31,7 +32,7 @@ class PaystubSnapshotRepository:
     async def save(self, snapshot: PaystubSnapshot) -> PaystubSnapshot:
         """Save a new paystub snapshot to the database."""
         self.db.add(snapshot)
-        await self.db.commit()
+        await auto_commit(self.db)
         await self.db.refresh(snapshot)
         return snapshot
 
@@ -40,6 +41,6 @@ class PaystubSnapshotRepository:
         snapshot = await self.get_by_employee_name(employee_name)
         if snapshot:
             await self.db.delete(snapshot)
-            await self.db.commit()
+            await auto_commit(self.db)
             return True
         return False
@@ -3,15 +3,18 @@
 # product_comment_repository.py
 # ------------------------------------------------------------------------------
 # Repository for accessing ProductComment records from the database.
-# Provides async CRUD methods for product comments and product-specific queries.
+# Provides async CRUD methods for product comments and product-specific queries,
+# plus the per-seller views of the seller dashboard.
 # ------------------------------------------------------------------------------
 
 from typing import Optional, List
+from backend.persistance.product import Product
 from backend.persistance.product_comment import ProductComment
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import func, select
 
 from backend.repositories.base_repository import BaseRepository
+from backend.persistance.unit_of_work import auto_commit
 
 
 class ProductCommentRepository(BaseRepository[ProductComment, int]):
@@ -37,7 +40,7 @@ class ProductCommentRepository(BaseRepository[ProductComment, int]):
 
     async def add(self, obj: ProductComment) -> ProductComment:
         self.session.add(obj)
-        await self.session.commit()
+        await auto_commit(self.session)
         await self.session.refresh(obj)
         return obj
 
@@ -46,7 +49,7 @@ class ProductCommentRepository(BaseRepository[ProductComment, int]):
         if not existing:
             raise ValueError(f"ProductComment with id {id} not found")
         self.apply_whitelist_update(existing, obj, self.UPDATABLE_FIELDS)
-        await self.session.commit()
+        await auto_commit(self.session)
         await self.session.refresh(existing)
         return existing
 
@@ -68,3 +71,27 @@ class ProductCommentRepository(BaseRepository[ProductComment, int]):
         )
         items: List[ProductComment] = list(result.scalars().all())
         return items
+
+    async def get_recent_for_seller(self, seller_id: int, *, limit: int = 20) -> List[ProductComment]:
+        """Newest comments on the seller's live products."""
+        BaseRepository.validate_pagination(limit, 0)
+        result = await self.session.execute(
+            select(ProductComment)
+            .join(Product, Product.product_id == ProductComment.product_id)
+            .filter(Product.seller_id == seller_id, Product.is_deleted == False, ProductComment.is_deleted == False)
+            .order_by(ProductComment.created_at.desc(), ProductComment.comment_id.desc())
+            .limit(limit)
+        )
+        return list(result.scalars().all())
+
+    async def count_unanswered_for_seller(self, seller_id: int) -> int:
+        """Comments on the seller's live products that have no response yet."""
+        result = await self.session.execute(
+            select(func.count(ProductComment.comment_id))
+            .join(Product, Product.product_id == ProductComment.product_id)
+            .filter(
+                Product.seller_id == seller_id, Product.is_deleted == False,
+                ProductComment.is_deleted == False, ProductComment.response.is_(None),
+            )
+        )
+        return int(result.scalar() or 0)
@@ -6,10 +6,11 @@
 # Provides async CRUD methods for product images and product-specific queries.
 # ------------------------------------------------------------------------------
 
-from typing import Optional, List
+from typing import Optional, List, Iterable, Any
 from backend.persistance.product_image import ProductImage
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
+from backend.persistance.unit_of_work import auto_commit
 
 class ProductImageRepository:
     """
@@ -34,10 +35,44 @@ class ProductImageRepository:
         )
         return list(result.scalars().all())
 
+    async def get_by_product_ids(self, product_ids: Iterable[int]) -> dict[int, List[ProductImage]]:
+        """Retrieve all images for many products in one query, grouped by product ID."""
+        ids = list(product_ids)
+        if not ids:
+            return {}
+        result = await self.db.execute(
+            select(ProductImage)
+            .filter(ProductImage.product_id.in_(ids))
+            .order_by(ProductImage.product_id, ProductImage.image_id)
+        )
+        grouped: dict[int, List[ProductImage]] = {pid: [] for pid in ids}
+        for image in result.scalars().all():
+            grouped[image.product_id].append(image)
+        return grouped
+
+    async def get_primary_urls_by_product_ids(self, product_ids: Iterable[int] | Any) -> dict[int, str]:
+        """Retrieve the primary (lowest image_id) image URL for many products in one query.
+
+        `product_ids` may be a list of ids or a scalar SELECT of product ids, so
+        callers can push the product filter into the database instead of
+        binding thousands of parameters.
+        """
+        if isinstance(product_ids, (list, tuple, set, frozenset)) and not product_ids:
+            return {}
+        result = await self.db.execute(
+            select(ProductImage.product_id, ProductImage.image_url)
+            .filter(ProductImage.product_id.in_(product_ids))
+            .order_by(ProductImage.product_id, ProductImage.image_id)
+        )
+        primary: dict[int, str] = {}
+        for pid, url in result.all():
+            primary.setdefault(pid, url)
+        return primary
+
     async def save(self, image: ProductImage) -> ProductImage:
         """Save a new product image to the database."""
         self.db.add(image)
-        await self.db.commit()
+        await auto_commit(self.db)
         await self.db.refresh(image)
         return image
 
@@ -49,7 +84,7 @@ class ProductImageRepository:
         for k, v in kwargs.items():
             if hasattr(image, k):
                 setattr(image, k, v)
-        await self.db.commit()
+        await auto_commit(self.db)
         return image
 
     async def delete(self, image_id: int) -> bool:
@@ -57,6 +92,6 @@ class ProductImageRepository:
         image = await self.get_by_id(image_id)
         if image:
             await self.db.delete(image)
-            await self.db.commit()
+            await auto_commit(self.db)
             return True
         return False
@@ -6,10 +6,12 @@
 # Provides async CRUD methods and stock management for products.
 # ------------------------------------------------------------------------------
 
-from typing import Optional
+from typing import Any, Iterable, Optional
 from backend.persistance.product import Product
+from backend.persistance.product_variant import ProductVariant
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import func, select
+from backend.persistance.unit_of_work import auto_commit
 
 class ProductRepository:
     """
@@ -30,7 +32,7 @@ class ProductRepository:
         product = result.scalars().first()
         if product:
             # No stock field on Product; assume purchase allowed when active.
-            await self.db.commit()
+            await auto_commit(self.db)
             return True
         return False
 
@@ -41,10 +43,38 @@ class ProductRepository:
         )
         return result.scalars().first()
 
+    async def get_by_ids(self, product_ids: Iterable[int]) -> dict[int, Product]:
+        """Retrieve many active products in one query, keyed by product ID (missing IDs are absent)."""
+        ids = list({pid for pid in product_ids if pid is not None})
+        if not ids:
+            return {}
+        result = await self.db.execute(
+            select(Product).filter(Product.product_id.in_(ids), Product.is_active == True)
+        )
+        return {p.product_id: p for p in result.scalars().all()}
+
+    async def seller_summaries(self, seller_id: int) -> list[dict[str, Any]]:
+        """The seller's live products with their variant count and total variant stock, in one grouped query."""
+        result = await self.db.execute(
+            select(
+                Product.product_id, Product.title, Product.price, Product.is_active,
+                func.count(ProductVariant.variant_id), func.coalesce(func.sum(ProductVariant.quantity), 0),
+            )
+            .outerjoin(ProductVariant, ProductVariant.product_id == Product.product_id)
+            .filter(Product.seller_id == seller_id, Product.is_deleted == False)
+            .group_by(Product.product_id, Product.title, Product.price, Product.is_active)
+            .order_by(Product.product_id)
+        )
+        return [
+            {'product_id': pid, 'title': title, 'price': float(price or 0), 'is_active': bool(active),
+             'variants': int(variants), 'stock': int(stock)}
+            for pid, title, price, active, variants, stock in result.all()
+        ]
+
     async def save(self, product: Product) -> Product:
         """Save a new product to the database."""
         self.db.add(product)
-        await self.db.commit()
+        await auto_commit(self.db)
         await self.db.refresh(product)
         return product
 
@@ -56,7 +86,7 @@ class ProductRepository:
         for k, v in kwargs.items():
             if hasattr(product, k):
                 setattr(product, k, v)
-        await self.db.commit()
+        await auto_commit(self.db)
         return product
 
     async def delete(self, product_id: int) -> bool:
@@ -64,6 +94,6 @@ class ProductRepository:
         product = await self.get_by_id(product_id)
         if product:
             product.is_active = False
-            await self.db.commit()
+            await auto_commit(self.db)
             return True
         return False
@@ -0,0 +1,141 @@
+# ------------------------------------------------------------------------------
+# product_search_repository.py
+# ------------------------------------------------------------------------------
+# Repository for ranked full-text product search.
+# Queries the index defined in backend/persistance/product_search.py: tsvector
+# + GIN on PostgreSQL, FTS5 on SQLite. Matching, ranking, filtering and
+# limit/offset all happen in the database.
+# ------------------------------------------------------------------------------
+
+import re
+from dataclasses import dataclass, field
+from typing import Any, List, Optional, Sequence
+
+from sqlalchemy import Select, case, column, func, literal_column, null, select, table
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.persistance.product import Product
+from backend.persistance.product_search import PG_SEARCH_COLUMN, PG_TEXT_CONFIG, SQLITE_FTS_TABLE
+from backend.repositories.base_repository import BaseRepository
+from backend.repositories.repository.catalog_repository import CatalogFilters
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+_fts = table(SQLITE_FTS_TABLE, column("rowid"))
+
+
+def search_terms(keywords: Optional[str]) -> list[str]:
+    """Split free text into distinct lowercase word tokens (no query syntax)."""
+    if not keywords:
+        return []
+    return list(dict.fromkeys(t.lower() for t in _TOKEN_RE.findall(keywords)))
+
+
+@dataclass
+class FacetCounts:
+    """Product counts per facet value for one query/filter set.
+
+    `price_bands[i]` counts products priced in `[edges[i-1], edges[i])`, with
+    the first band open below and the last open above. Products without a
+    price are in no band.
+    """
+    total: int = 0
+    categories: dict[int, int] = field(default_factory=dict)
+    subcategories: dict[tuple[int, int], int] = field(default_factory=dict)
+    price_bands: list[int] = field(default_factory=list)
+
+
+class ProductSearchRepository:
+    """
+    Repository for full-text product search.
+    A product matches when any keyword prefixes a word in its title or
+    description; title hits rank above description hits.
+    """
+    def __init__(self, db: AsyncSession):
+        """Initialize repository with async DB session."""
+        self.db = db
+
+    def _dialect(self) -> str:
+        bind = self.db.get_bind()
+        return bind.dialect.name
+
+    def apply_match(self, stmt: Select, terms: list[str]) -> tuple[Select, Any]:
+        """Restrict `stmt` (which selects from product) to rows matching `terms`.
+
+        Returns the filtered statement and a rank expression ordered best-first
+        when used with `order_by`, or `(stmt, None)` when there are no terms.
+        """
+        if not terms:
+            return stmt, None
+        if self._dialect() == "postgresql":
+            tsquery = func.to_tsquery(PG_TEXT_CONFIG, " | ".join(f"{t}:*" for t in terms))
+            vector = literal_column(f"product.{PG_SEARCH_COLUMN}")
+            stmt = stmt.filter(vector.op("@@")(tsquery))
+            return stmt, func.ts_rank_cd(vector, tsquery).desc()
+        match = " OR ".join(f'"{t}"*' for t in terms)
+        stmt = stmt.join(_fts, _fts.c.rowid == Product.product_id).filter(
+            literal_column(SQLITE_FTS_TABLE).op("MATCH")(match)
+        )
+        # bm25 is lower-is-better; weight title hits 10x over description hits
+        return stmt, func.bm25(literal_column(SQLITE_FTS_TABLE), 10.0, 1.0).asc()
+
+    def matching_ids(self, keywords: Optional[str]) -> Optional[Select]:
+        """Subquery of the ids of products matching `keywords`, or None without keywords."""
+        stmt, rank = self.apply_match(select(Product.product_id), search_terms(keywords))
+        return stmt if rank is not None else None
+
+    async def search(
+        self,
+        keywords: Optional[str],
+        filters: Optional[CatalogFilters] = None,
+        *,
+        limit: int = 50,
+        offset: int = 0,
+    ) -> List[Product]:
+        """Retrieve products matching `keywords` and `filters`, best match first.
+
+        Without keywords this is a filtered listing ordered by product ID.
+        """
+        BaseRepository.validate_pagination(limit, offset)
+        stmt = (filters or CatalogFilters()).apply(select(Product))
+        stmt, rank = self.apply_match(stmt, search_terms(keywords))
+        if rank is not None:
+            stmt = stmt.order_by(rank, Product.product_id)
+        else:
+            stmt = stmt.order_by(Product.product_id)
+        result = await self.db.execute(stmt.limit(limit).offset(offset))
+        return list(result.scalars().all())
+
+    async def facet_counts(
+        self,
+        keywords: Optional[str],
+        filters: Optional[CatalogFilters] = None,
+        *,
+        price_edges: Sequence[float] = (),
+    ) -> FacetCounts:
+        """Count matching products per category, subcategory and price band.
+
+        Applies exactly the same filters and keyword match as `search`, in a
+        single GROUP BY over (category, subcategory, price band); the handful
+        of resulting groups are rolled up per facet here.
+        """
+        # Products without a price have no band: they count towards the
+        # category facets only
+        band = case(
+            (Product.price.is_(None), null()),
+            *[(Product.price < edge, i) for i, edge in enumerate(price_edges)],
+            else_=len(price_edges),
+        )
+        stmt = (filters or CatalogFilters()).apply(
+            select(Product.category_id, Product.subcategory_id, band.label("band"), func.count().label("n"))
+        )
+        stmt, _ = self.apply_match(stmt, search_terms(keywords))
+        stmt = stmt.group_by(Product.category_id, Product.subcategory_id, band)
+        counts = FacetCounts(price_bands=[0] * (len(price_edges) + 1))
+        for category_id, subcategory_id, band_index, n in (await self.db.execute(stmt)).all():
+            counts.total += n
+            counts.categories[category_id] = counts.categories.get(category_id, 0) + n
+            key = (category_id, subcategory_id)
+            counts.subcategories[key] = counts.subcategories.get(key, 0) + n
+            if band_index is not None:
+                counts.price_bands[int(band_index)] += n
+        return counts
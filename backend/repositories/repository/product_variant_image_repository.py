@@ -6,12 +6,13 @@
 # Provides async CRUD methods for product variant images and variant-specific queries.
 # ------------------------------------------------------------------------------
 
-from typing import Optional, List
+from typing import Iterable, Optional, List
 from backend.persistance.product_variant_image import ProductVariantImage
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
 from backend.repositories.base_repository import BaseRepository
+from backend.persistance.unit_of_work import auto_commit
 
 
 class ProductVariantImageRepository(BaseRepository[ProductVariantImage, int]):
@@ -35,7 +36,7 @@ class ProductVariantImageRepository(BaseRepository[ProductVariantImage, int]):
 
     async def add(self, obj: ProductVariantImage) -> ProductVariantImage:
         self.session.add(obj)
-        await self.session.commit()
+        await auto_commit(self.session)
         await self.session.refresh(obj)
         return obj
 
@@ -44,7 +45,7 @@ class ProductVariantImageRepository(BaseRepository[ProductVariantImage, int]):
         if not existing:
             raise ValueError(f"ProductVariantImage with id {id} not found")
         self.apply_whitelist_update(existing, obj, self.UPDATABLE_FIELDS)
-        await self.session.commit()
+        await auto_commit(self.session)
         await self.session.refresh(existing)
         return existing
 
@@ -60,6 +61,24 @@ class ProductVariantImageRepository(BaseRepository[ProductVariantImage, int]):
         )
         return list(result.scalars().all())
 
+    async def get_by_variant_ids(
+        self, variant_ids: Iterable[int], *, include_deleted: bool = False
+    ) -> dict[int, List[ProductVariantImage]]:
+        """Retrieve the images of many variants in one query, grouped by variant ID."""
+        ids = list(variant_ids)
+        if not ids:
+            return {}
+        stmt = select(ProductVariantImage).filter(ProductVariantImage.variant_id.in_(ids))
+        if not include_deleted:
+            stmt = stmt.filter(ProductVariantImage.is_deleted == False)
+        result = await self.session.execute(
+            stmt.order_by(ProductVariantImage.variant_id, ProductVariantImage.image_id)
+        )
+        grouped: dict[int, List[ProductVariantImage]] = {vid: [] for vid in ids}
+        for image in result.scalars().all():
+            grouped[image.variant_id].append(image)
+        return grouped
+
     # Service layer compatibility
     async def save(self, obj: ProductVariantImage) -> ProductVariantImage:
         """Alias for add() to match service layer expectations."""
@@ -6,10 +6,33 @@
 # Provides async CRUD methods and stock management for product variants.
 # ------------------------------------------------------------------------------
 
-from typing import Optional
+from typing import Any, Iterable, Mapping, Optional, Sequence
+from backend.persistance.product import Product
 from backend.persistance.product_variant import ProductVariant
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import (
+    BigInteger, Integer, and_, case, column, func, literal, or_, select, union_all, update, values,
+)
+from sqlalchemy.sql.type_api import TypeEngine
+from backend.persistance.unit_of_work import auto_commit
+
+
+class InsufficientStockError(Exception):
+    """Raised when a reservation cannot take every requested quantity; nothing was reserved."""
+    def __init__(self, variant_ids: Sequence[int]):
+        self.variant_ids = list(variant_ids)
+        super().__init__(f"Not enough stock for variants {self.variant_ids}")
+
+
+def _derived_rows(dialect: str, name: str, columns: Sequence[tuple[str, TypeEngine]], rows: Sequence[tuple]) -> Any:
+    """`rows` as a named derived table: a VALUES list on Postgres, UNION ALL of literal selects elsewhere."""
+    if dialect == "postgresql":
+        return values(*[column(col, type_) for col, type_ in columns], name=name).data(list(rows))
+    return union_all(*[
+        select(*[literal(value, type_).label(col) for (col, type_), value in zip(columns, row)])
+        for row in rows
+    ]).subquery(name)
+
 
 class ProductVariantRepository:
     """
@@ -20,17 +43,67 @@ class ProductVariantRepository:
         """Initialize repository with async DB session."""
         self.db = db
 
+    def _dialect(self) -> str:
+        return self.db.get_bind().dialect.name
+
     async def decrement_stock(self, variant_id: int, qty: int) -> bool:
         """Decrement the quantity of a product variant by a given amount if sufficient quantity exists."""
+        try:
+            await self.reserve_stock({variant_id: qty})
+        except InsufficientStockError:
+            return False
+        return True
+
+    async def _adjust_stock(self, quantities: Mapping[int, int], *, take: bool) -> dict[int, int]:
+        """Take (or give back) `quantities` with one UPDATE; returns the new quantity of each row changed."""
+        requested = _derived_rows(
+            self._dialect(), "requested",
+            [("variant_id", BigInteger()), ("quantity", Integer())],
+            list(quantities.items()),
+        )
+        stmt = update(ProductVariant).where(ProductVariant.variant_id == requested.c.variant_id)
+        if take:
+            stmt = stmt.where(
+                ProductVariant.quantity >= requested.c.quantity, ProductVariant.is_active == True
+            ).values(quantity=ProductVariant.quantity - requested.c.quantity)
+        else:
+            stmt = stmt.values(quantity=ProductVariant.quantity + requested.c.quantity)
         result = await self.db.execute(
-            select(ProductVariant).filter(ProductVariant.variant_id == variant_id, ProductVariant.quantity >= qty, ProductVariant.is_active == True)
+            stmt.returning(ProductVariant.variant_id, ProductVariant.quantity)
+            .execution_options(synchronize_session=False)
         )
-        variant = result.scalars().first()
-        if variant:
-            variant.quantity -= qty
-            await self.db.commit()
-            return True
-        return False
+        return {vid: qty for vid, qty in result.all()}
+
+    async def reserve_stock(self, quantities: Mapping[int, int]) -> dict[int, int]:
+        """Take `quantities` (variant_id -> qty) out of stock, all or nothing.
+
+        One conditional `UPDATE ... FROM` decrements every active variant that
+        still holds enough stock, so concurrent buyers never oversell and never
+        wait on a read-modify-write round trip. If any variant falls short, the
+        rows that were decremented are given back and `InsufficientStockError`
+        lists the short variants. Returns the remaining quantity per variant.
+        """
+        wanted = {vid: qty for vid, qty in quantities.items() if qty > 0}
+        if not wanted:
+            return {}
+        remaining = await self._adjust_stock(wanted, take=True)
+        short = sorted(set(wanted) - set(remaining))
+        if short:
+            if remaining:
+                await self._adjust_stock({vid: wanted[vid] for vid in remaining}, take=False)
+            await auto_commit(self.db)
+            raise InsufficientStockError(short)
+        await auto_commit(self.db)
+        return remaining
+
+    async def release_stock(self, quantities: Mapping[int, int]) -> dict[int, int]:
+        """Return `quantities` (variant_id -> qty) to stock with one UPDATE; returns the new quantities."""
+        given = {vid: qty for vid, qty in quantities.items() if qty > 0}
+        if not given:
+            return {}
+        restored = await self._adjust_stock(given, take=False)
+        await auto_commit(self.db)
+        return restored
 
     async def get_by_id(self, variant_id: int) -> Optional[ProductVariant]:
         """Retrieve a product variant by its ID, restricted to active variants."""
@@ -39,10 +112,99 @@ class ProductVariantRepository:
         )
         return result.scalars().first()
 
+    async def get_by_ids(self, variant_ids: Iterable[int]) -> dict[int, ProductVariant]:
+        """Retrieve many active variants in one query, keyed by variant ID (missing IDs are absent)."""
+        ids = list({vid for vid in variant_ids if vid is not None})
+        if not ids:
+            return {}
+        result = await self.db.execute(
+            select(ProductVariant).filter(ProductVariant.variant_id.in_(ids), ProductVariant.is_active == True)
+        )
+        return {v.variant_id: v for v in result.scalars().all()}
+
+    async def get_stock_rows_by_ids(self, variant_ids: Iterable[int]) -> dict[int, dict[str, Any]]:
+        """Retrieve id/quantity/price/is_active for many variants in one query, keyed by variant ID.
+
+        Inactive variants are included; callers decide how to treat them.
+        """
+        ids = list(variant_ids)
+        if not ids:
+            return {}
+        result = await self.db.execute(
+            select(
+                ProductVariant.variant_id,
+                ProductVariant.quantity,
+                ProductVariant.price,
+                ProductVariant.is_active,
+            ).filter(ProductVariant.variant_id.in_(ids))
+        )
+        return {
+            vid: {
+                "variant_id": vid,
+                "quantity": int(quantity or 0),
+                "price": float(price or 0),
+                "is_active": bool(is_active),
+            }
+            for vid, quantity, price, is_active in result.all()
+        }
+
+    async def clamp_to_stock(
+        self, lines: Iterable[tuple[int, Optional[int], int]]
+    ) -> dict[tuple[int, Optional[int]], int]:
+        """Clamp requested `(product_id, variant_id, quantity)` lines to variant stock in one query.
+
+        The lines are joined against product and variant as one derived table.
+        Lines whose product is missing or inactive, or whose variant is missing,
+        inactive or belongs to another product, are absent from the result;
+        lines without a variant keep the requested quantity.
+        """
+        rows = list(lines)
+        if not rows:
+            return {}
+        requested = _derived_rows(
+            self._dialect(), "requested",
+            [("product_id", BigInteger()), ("variant_id", BigInteger()), ("quantity", Integer())],
+            rows,
+        )
+        stock = func.coalesce(ProductVariant.quantity, 0)
+        allowed = case(
+            (requested.c.variant_id.is_(None), requested.c.quantity),
+            (stock < 0, 0),
+            (stock < requested.c.quantity, stock),
+            else_=requested.c.quantity,
+        )
+        result = await self.db.execute(
+            select(requested.c.product_id, requested.c.variant_id, allowed)
+            .select_from(requested)
+            .join(Product, and_(Product.product_id == requested.c.product_id, Product.is_active == True))
+            .outerjoin(ProductVariant, and_(
+                ProductVariant.variant_id == requested.c.variant_id,
+                ProductVariant.product_id == requested.c.product_id,
+                ProductVariant.is_active == True,
+            ))
+            .filter(or_(requested.c.variant_id.is_(None), ProductVariant.variant_id.is_not(None)))
+        )
+        return {(pid, vid): int(qty) for pid, vid, qty in result.all()}
+
+    async def get_active_by_product_ids(self, product_ids: Iterable[int]) -> dict[int, list[ProductVariant]]:
+        """Retrieve the active variants of many products in one query, grouped by product ID."""
+        ids = list(product_ids)
+        if not ids:
+            return {}
+        result = await self.db.execute(
+            select(ProductVariant)
+            .filter(ProductVariant.product_id.in_(ids), ProductVariant.is_active == True)
+            .order_by(ProductVariant.product_id, ProductVariant.variant_id)
+        )
+        grouped: dict[int, list[ProductVariant]] = {pid: [] for pid in ids}
+        for variant in result.scalars().all():
+            grouped[variant.product_id].append(variant)
+        return grouped
+
     async def save(self, variant: ProductVariant) -> ProductVariant:
         """Save a new product variant to the database."""
         self.db.add(variant)
-        await self.db.commit()
+        await auto_commit(self.db)
         await self.db.refresh(variant)
         return variant
 
@@ -54,7 +216,7 @@ class ProductVariantRepository:
         for k, v in kwargs.items():
             if hasattr(variant, k):
                 setattr(variant, k, v)
-        await self.db.commit()
+        await auto_commit(self.db)
         return variant
 
     async def delete(self, variant_id: int) -> bool:
@@ -62,6 +224,6 @@ class ProductVariantRepository:
         variant = await self.get_by_id(variant_id)
         if variant:
             variant.is_active = False
-            await self.db.commit()
+            await auto_commit(self.db)
             return True
         return False
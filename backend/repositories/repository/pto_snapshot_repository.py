@@ -11,6 +11,7 @@ from typing import Optional
 from backend.persistance.pto_snapshot import PTOSnapshot
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
+from backend.persistance.unit_of_work import auto_commit
 
 class PTOSnapshotRepository:
     """
@@ -31,7 +32,7 @@ class PTOSnapshotRepository:
     async def save(self, snapshot: PTOSnapshot) -> PTOSnapshot:
         """Save a new PTO snapshot to the database."""
         self.db.add(snapshot)
-        await self.db.commit()
+        await auto_commit(self.db)
         await self.db.refresh(snapshot)
         return snapshot
 
@@ -40,6 +41,6 @@ class PTOSnapshotRepository:
         snapshot = await self.get_by_employee_name(employee_name)
         if snapshot:
             await self.db.delete(snapshot)
-            await self.db.commit()
+            await auto_commit(self.db)
             return True
         return False
@@ -8,6 +8,7 @@ Provides async methods for saving refund ledger entries.
 from typing import Optional
 from backend.persistance.refund_ledger import RefundLedger
 from sqlalchemy.ext.asyncio import AsyncSession
+from backend.persistance.unit_of_work import auto_commit
 
 class RefundLedgerRepository:
     def __init__(self, db: AsyncSession):
@@ -27,6 +28,6 @@ class RefundLedgerRepository:
             RefundLedger: The saved ledger entry.
         """
         self.db.add(ledger_entry)
-        await self.db.commit()
+        await auto_commit(self.db)
         await self.db.refresh(ledger_entry)
         return ledger_entry
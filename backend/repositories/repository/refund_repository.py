@@ -9,6 +9,7 @@ from typing import Optional
 from backend.persistance.refund import Refund
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
+from backend.persistance.unit_of_work import auto_commit
 
 class RefundRepository:
     def __init__(self, db: AsyncSession):
@@ -41,6 +42,6 @@ class RefundRepository:
             Refund: The saved refund.
         """
         self.db.add(obj)
-        await self.db.commit()
+        await auto_commit(self.db)
         await self.db.refresh(obj)
         return obj
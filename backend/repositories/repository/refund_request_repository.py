@@ -8,6 +8,7 @@ from typing import Optional
 from backend.persistance.refund_request import RefundRequest
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
+from backend.persistance.unit_of_work import auto_commit
 
 class RefundRequestRepository:
     def __init__(self, db: AsyncSession):
@@ -24,7 +25,7 @@ class RefundRequestRepository:
         Save a RefundRequest instance, including the description field if present.
         """
         self.db.add(refund_request)
-        await self.db.commit()
+        await auto_commit(self.db)
         await self.db.refresh(refund_request)
         return refund_request
 
@@ -38,13 +39,13 @@ class RefundRequestRepository:
         for k, v in kwargs.items():
             if hasattr(refund_request, k):
                 setattr(refund_request, k, v)
-        await self.db.commit()
+        await auto_commit(self.db)
         return refund_request
 
     async def delete(self, refund_request_id: int) -> bool:
         refund_request = await self.get_by_id(refund_request_id)
         if refund_request:
             await self.db.delete(refund_request)
-            await self.db.commit()
+            await auto_commit(self.db)
             return True
         return False
@@ -13,6 +13,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
 from backend.repositories.base_repository import BaseRepository
+from backend.persistance.unit_of_work import auto_commit
 
 
 class ReimbursementRepository(BaseRepository[Reimbursement, int]):
@@ -32,7 +33,7 @@ class ReimbursementRepository(BaseRepository[Reimbursement, int]):
 
     async def add(self, obj: Reimbursement) -> Reimbursement:
         self.session.add(obj)
-        await self.session.commit()
+        await auto_commit(self.session)
         await self.session.refresh(obj)
         return obj
 
@@ -41,7 +42,7 @@ class ReimbursementRepository(BaseRepository[Reimbursement, int]):
         if not existing:
             raise ValueError(f"Reimbursement with id {id} not found")
         self.apply_whitelist_update(existing, obj, self.UPDATABLE_FIELDS)
-        await self.session.commit()
+        await auto_commit(self.session)
         await self.session.refresh(existing)
         return existing
 
@@ -14,6 +14,7 @@ from typing import Optional
 from backend.persistance.reimbursement_snapshot import ReimbursementSnapshot
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
+from backend.persistance.unit_of_work import auto_commit
 
 class ReimbursementSnapshotRepository:
     def __init__(self, db: AsyncSession):
@@ -46,7 +47,7 @@ class ReimbursementSnapshotRepository:
             ReimbursementSnapshot: The saved snapshot.
         """
         self.db.add(snapshot)
-        await self.db.commit()
+        await auto_commit(self.db)
         await self.db.refresh(snapshot)
         return snapshot
 
@@ -61,6 +62,6 @@ class ReimbursementSnapshotRepository:
         snapshot = await self.get_by_employee_name(employee_name)
         if snapshot:
             await self.db.delete(snapshot)
-            await self.db.commit()
+            await auto_commit(self.db)
             return True
         return False
@@ -0,0 +1,215 @@
+# ------------------------------------------------------------------------------
+# sales_rollup_repository.py
+# ------------------------------------------------------------------------------
+# Repository for sales_daily_rollup, sales_daily_seller_orders and their
+# sales_rollup_event outbox.
+# Rows are never adjusted by deltas: `recompute` deletes a day range (optionally
+# for some products, and their sellers' order counts, only) and re-inserts it
+# from order/order_item with INSERT ... SELECT ... GROUP BY, so replaying an
+# event or a backfill is idempotent. Reads group the daily rows into weeks,
+# months or years in SQL.
+# ------------------------------------------------------------------------------
+
+import datetime
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import Date, cast, delete, distinct, func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.persistance.order import Order
+from backend.persistance.order_item import OrderItem
+from backend.persistance.product import Product
+from backend.persistance.sales_daily_rollup import SalesDailyRollup, SalesDailySellerOrders, SalesRollupEvent
+from backend.persistance.unit_of_work import auto_commit
+from backend.repositories.repository.order_analytics_repository import (
+    EXCLUDED_STATUSES, PERIODS, PeriodTotals, as_date, period_start,
+)
+
+
+class SalesRollupRepository:
+    """Repository for SalesDailyRollup and SalesRollupEvent models."""
+    def __init__(self, db: AsyncSession):
+        """Initialize repository with async DB session."""
+        self.db = db
+
+    @property
+    def _dialect(self) -> str:
+        return self.db.get_bind().dialect.name
+
+    def _day(self) -> Any:
+        if self._dialect == 'postgresql':
+            return cast(Order.created_at, Date)
+        return func.date(Order.created_at)
+
+    async def pending_events(self, limit: int) -> List[Tuple[int, int]]:
+        """(event_id, order_id) of the oldest `limit` queued events; other refreshers' rows are skipped on Postgres."""
+        result = await self.db.execute(
+            select(SalesRollupEvent.event_id, SalesRollupEvent.order_id)
+            .order_by(SalesRollupEvent.event_id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        return [tuple(row) for row in result.all()]
+
+    async def queued_event_ids(self) -> List[int]:
+        """Ids of every committed event in the outbox."""
+        return list((await self.db.scalars(select(SalesRollupEvent.event_id))).all())
+
+    async def delete_events(self, event_ids: Iterable[int], *, chunk_size: int = 1000) -> None:
+        """Drop consumed events. The caller commits."""
+        ids = list(event_ids)
+        for i in range(0, len(ids), chunk_size):
+            await self.db.execute(
+                delete(SalesRollupEvent).where(SalesRollupEvent.event_id.in_(ids[i:i + chunk_size]))
+            )
+
+    async def keys_for_orders(self, order_ids: Iterable[int]) -> Dict[datetime.date, Set[int]]:
+        """The (day -> product ids) rollup rows that the given orders contribute to."""
+        ids = sorted(set(order_ids))
+        if not ids:
+            return {}
+        day = self._day().label('day')
+        result = await self.db.execute(
+            select(day, OrderItem.product_id)
+            .select_from(OrderItem)
+            .join(Order, Order.order_id == OrderItem.order_id)
+            .filter(Order.order_id.in_(ids), Order.created_at.is_not(None))
+            .distinct()
+        )
+        keys: Dict[datetime.date, Set[int]] = {}
+        for value, product_id in result.all():
+            keys.setdefault(as_date(value), set()).add(product_id)
+        return keys
+
+    async def recompute(
+        self, start_day: datetime.date, end_day: datetime.date, product_ids: Optional[Iterable[int]] = None
+    ) -> None:
+        """
+        Rebuild the rollup rows for days `start_day`..`end_day` (inclusive), for
+        `product_ids` or all products, and the daily order counts of their sellers.
+        """
+        products = sorted(set(product_ids)) if product_ids is not None else None
+        if products is not None and not products:
+            return
+        day = self._day()
+        live_lines = (
+            Order.created_at >= start_day,
+            Order.created_at < end_day + datetime.timedelta(days=1),
+            Order.is_deleted == False,
+            OrderItem.is_deleted == False,
+            Order.order_status.notin_(EXCLUDED_STATUSES),
+        )
+        clear = delete(SalesDailyRollup).where(
+            SalesDailyRollup.day >= start_day, SalesDailyRollup.day <= end_day
+        )
+        source = (
+            select(
+                Product.seller_id,
+                day,
+                OrderItem.product_id,
+                func.coalesce(func.sum(OrderItem.quantity), 0),
+                func.coalesce(func.sum(OrderItem.subtotal), 0),
+                func.count(distinct(Order.order_id)),
+            )
+            .select_from(OrderItem)
+            .join(Order, Order.order_id == OrderItem.order_id)
+            .join(Product, Product.product_id == OrderItem.product_id)
+            .filter(*live_lines)
+            .group_by(Product.seller_id, day, OrderItem.product_id)
+        )
+        clear_orders = delete(SalesDailySellerOrders).where(
+            SalesDailySellerOrders.day >= start_day, SalesDailySellerOrders.day <= end_day
+        )
+        order_source = (
+            select(Product.seller_id, day, func.count(distinct(Order.order_id)))
+            .select_from(OrderItem)
+            .join(Order, Order.order_id == OrderItem.order_id)
+            .join(Product, Product.product_id == OrderItem.product_id)
+            .filter(*live_lines)
+            .group_by(Product.seller_id, day)
+        )
+        if products is not None:
+            clear = clear.where(SalesDailyRollup.product_id.in_(products))
+            source = source.filter(OrderItem.product_id.in_(products))
+            sellers = select(Product.seller_id).filter(Product.product_id.in_(products))
+            clear_orders = clear_orders.where(SalesDailySellerOrders.seller_id.in_(sellers))
+            order_source = order_source.filter(Product.seller_id.in_(sellers))
+        await self.db.execute(clear)
+        await self.db.execute(
+            insert(SalesDailyRollup).from_select(
+                ['seller_id', 'day', 'product_id', 'units', 'revenue', 'orders'], source
+            )
+        )
+        await self.db.execute(clear_orders)
+        await self.db.execute(
+            insert(SalesDailySellerOrders).from_select(['seller_id', 'day', 'orders'], order_source)
+        )
+        await auto_commit(self.db)
+
+    async def totals_by_period(
+        self,
+        seller_id: int,
+        period: str = 'daily',
+        *,
+        product_id: Optional[int] = None,
+        start_date: Optional[datetime.date] = None,
+        end_date: Optional[datetime.date] = None,
+    ) -> List[PeriodTotals]:
+        """
+        Units, revenue and distinct orders per period of the seller's live
+        products, oldest first. For one product the order count is that
+        product's; otherwise it comes from the seller's daily order counts, so
+        an order with two of the seller's products counts once. Those include
+        orders whose only line of the seller's is a since-deleted product.
+        """
+        field = PERIODS.get(period)
+        if field is None:
+            raise ValueError(f"Unknown period {period!r}; expected one of {sorted(PERIODS)}")
+        bucket = period_start(SalesDailyRollup.day, field, self._dialect).label('bucket')
+        stmt = (
+            select(
+                bucket,
+                func.coalesce(func.sum(SalesDailyRollup.units), 0),
+                func.coalesce(func.sum(SalesDailyRollup.revenue), 0),
+                func.coalesce(func.sum(SalesDailyRollup.orders), 0),
+            )
+            .select_from(SalesDailyRollup)
+            .join(Product, Product.product_id == SalesDailyRollup.product_id)
+            .filter(SalesDailyRollup.seller_id == seller_id, Product.is_deleted == False)
+        )
+        if product_id:
+            stmt = stmt.filter(SalesDailyRollup.product_id == product_id)
+        if start_date:
+            stmt = stmt.filter(SalesDailyRollup.day >= start_date)
+        if end_date:
+            stmt = stmt.filter(SalesDailyRollup.day <= end_date)
+        rows = (await self.db.execute(stmt.group_by(bucket).order_by(bucket))).all()
+        orders = {as_date(start): int(count) for start, _, _, count in rows}
+        if not product_id and rows:
+            orders.update(await self._seller_orders_by_period(seller_id, field, start_date, end_date))
+        return [
+            PeriodTotals(
+                start=as_date(start), units_sold=int(units), revenue=float(revenue),
+                order_count=orders.get(as_date(start), 0),
+            )
+            for start, units, revenue, _ in rows
+        ]
+
+    async def _seller_orders_by_period(
+        self,
+        seller_id: int,
+        field: str,
+        start_date: Optional[datetime.date],
+        end_date: Optional[datetime.date],
+    ) -> Dict[datetime.date, int]:
+        bucket = period_start(SalesDailySellerOrders.day, field, self._dialect).label('bucket')
+        stmt = (
+            select(bucket, func.coalesce(func.sum(SalesDailySellerOrders.orders), 0))
+            .filter(SalesDailySellerOrders.seller_id == seller_id)
+        )
+        if start_date:
+            stmt = stmt.filter(SalesDailySellerOrders.day >= start_date)
+        if end_date:
+            stmt = stmt.filter(SalesDailySellerOrders.day <= end_date)
+        rows = (await self.db.execute(stmt.group_by(bucket))).all()
+        return {as_date(start): int(count) for start, count in rows}
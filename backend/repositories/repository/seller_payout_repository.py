@@ -5,15 +5,18 @@
 seller_payout_repository.py
 
 Repository class for managing SellerPayout entities in the database.
-Provides async method for retrieving seller payouts by ID.
+Provides async method for retrieving seller payouts by ID, and the payouts
+of a month for reconciliation.
 """
 
-from typing import Optional, List
+import datetime
+from typing import Dict, Optional, List
 from backend.persistance.seller_payout import SellerPayout
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import func, select
 
 from backend.repositories.base_repository import BaseRepository
+from backend.persistance.unit_of_work import auto_commit
 
 
 class SellerPayoutRepository(BaseRepository[SellerPayout, int]):
@@ -37,7 +40,7 @@ class SellerPayoutRepository(BaseRepository[SellerPayout, int]):
 
     async def add(self, obj: SellerPayout) -> SellerPayout:
         self.session.add(obj)
-        await self.session.commit()
+        await auto_commit(self.session)
         await self.session.refresh(obj)
         return obj
 
@@ -46,7 +49,7 @@ class SellerPayoutRepository(BaseRepository[SellerPayout, int]):
         if not existing:
             raise ValueError(f"SellerPayout with id {id} not found")
         self.apply_whitelist_update(existing, obj, self.UPDATABLE_FIELDS)
-        await self.session.commit()
+        await auto_commit(self.session)
         await self.session.refresh(existing)
         return existing
 
@@ -56,6 +59,30 @@ class SellerPayoutRepository(BaseRepository[SellerPayout, int]):
             await self.soft_delete(existing)
         return None
 
+    async def list_for_seller_between(
+        self, seller_id: int, start: datetime.date, end: datetime.date
+    ) -> List[SellerPayout]:
+        """The seller's payouts paid between `start` and `end` (inclusive), oldest first."""
+        result = await self.session.execute(
+            select(SellerPayout)
+            .filter(
+                SellerPayout.seller_id == seller_id,
+                SellerPayout.date_of_payment >= start,
+                SellerPayout.date_of_payment <= end,
+            )
+            .order_by(SellerPayout.date_of_payment, SellerPayout.payout_id)
+        )
+        return list(result.scalars().all())
+
+    async def totals_by_seller_between(self, start: datetime.date, end: datetime.date) -> Dict[int, float]:
+        """Amount paid per seller (seller_id -> total) between `start` and `end` (inclusive), in one GROUP BY query."""
+        result = await self.session.execute(
+            select(SellerPayout.seller_id, func.coalesce(func.sum(SellerPayout.amount), 0))
+            .filter(SellerPayout.date_of_payment >= start, SellerPayout.date_of_payment <= end)
+            .group_by(SellerPayout.seller_id)
+        )
+        return {seller_id: float(total) for seller_id, total in result.all()}
+
     # Service layer compatibility
     async def save(self, obj: SellerPayout) -> SellerPayout:
         """Alias for add() to match service layer expectations."""
@@ -9,6 +9,7 @@ from typing import Optional
 from backend.persistance.sellers_expense import SellerExpense
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
+from backend.persistance.unit_of_work import auto_commit
 
 class SellerExpenseRepository:
     def __init__(self, db: AsyncSession):
@@ -41,7 +42,7 @@ class SellerExpenseRepository:
             SellerExpense: The saved seller expense.
         """
         self.db.add(seller_expense)
-        await self.db.commit()
+        await auto_commit(self.db)
         await self.db.refresh(seller_expense)
         return seller_expense
 
@@ -60,7 +61,7 @@ class SellerExpenseRepository:
         for k, v in kwargs.items():
             if hasattr(expense, k):
                 setattr(expense, k, v)
-        await self.db.commit()
+        await auto_commit(self.db)
         return expense
 
     async def delete(self, expense_id: int) -> bool:
@@ -74,6 +75,6 @@ class SellerExpenseRepository:
         expense = await self.get_by_id(expense_id)
         if expense:
             await self.db.delete(expense)
-            await self.db.commit()
+            await auto_commit(self.db)
             return True
         return False
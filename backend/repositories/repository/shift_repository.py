@@ -15,6 +15,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
 from backend.repositories.base_repository import BaseRepository
+from backend.persistance.unit_of_work import auto_commit
 
 
 class ShiftRepository(BaseRepository[Shift, int]):
@@ -34,7 +35,7 @@ class ShiftRepository(BaseRepository[Shift, int]):
 
     async def add(self, obj: Shift) -> Shift:
         self.session.add(obj)
-        await self.session.commit()
+        await auto_commit(self.session)
         await self.session.refresh(obj)
         return obj
 
@@ -43,7 +44,7 @@ class ShiftRepository(BaseRepository[Shift, int]):
         if not existing:
             raise ValueError(f"Shift with id {id} not found")
         self.apply_whitelist_update(existing, obj, self.UPDATABLE_FIELDS)
-        await self.session.commit()
+        await auto_commit(self.session)
         await self.session.refresh(existing)
         return existing
 
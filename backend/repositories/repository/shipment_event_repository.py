@@ -15,6 +15,7 @@ from typing import Optional
 from backend.persistance.shipment_event import ShipmentEvent
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
+from backend.persistance.unit_of_work import auto_commit
 
 class ShipmentEventRepository:
     def __init__(self, db: AsyncSession):
@@ -47,7 +48,7 @@ class ShipmentEventRepository:
             ShipmentEvent: The saved shipment event.
         """
         self.db.add(shipment_event)
-        await self.db.commit()
+        await auto_commit(self.db)
         await self.db.refresh(shipment_event)
         return shipment_event
 
@@ -66,7 +67,7 @@ class ShipmentEventRepository:
         for k, v in kwargs.items():
             if hasattr(shipment_event, k):
                 setattr(shipment_event, k, v)
-        await self.db.commit()
+        await auto_commit(self.db)
         return shipment_event
 
     async def delete(self, event_id: int) -> bool:
@@ -80,6 +81,6 @@ class ShipmentEventRepository:
         shipment_event = await self.get_by_id(event_id)
         if shipment_event:
             await self.db.delete(shipment_event)
-            await self.db.commit()
+            await auto_commit(self.db)
             return True
         return False
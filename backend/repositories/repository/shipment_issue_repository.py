@@ -13,6 +13,7 @@ from typing import Optional
 from backend.persistance.shipment_issue import ShipmentIssue
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
+from backend.persistance.unit_of_work import auto_commit
 
 class ShipmentIssueRepository:
     def __init__(self, db: AsyncSession):
@@ -51,7 +52,7 @@ class ShipmentIssueRepository:
         for k, v in kwargs.items():
             if hasattr(issue, k):
                 setattr(issue, k, v)
-        await self.db.commit()
+        await auto_commit(self.db)
         return issue
 
     async def save(self, obj: ShipmentIssue) -> ShipmentIssue:
@@ -63,6 +64,6 @@ class ShipmentIssueRepository:
             ShipmentIssue: The saved shipment issue.
         """
         self.db.add(obj)
-        await self.db.commit()
+        await auto_commit(self.db)
         await self.db.refresh(obj)
         return obj
@@ -8,13 +8,15 @@
 shipment_item_repository.py
 
 Repository class for managing ShipmentItem entities in the database.
-Provides async CRUD operations for shipment items.
+Provides async CRUD operations for shipment items, plus a bulk insert used
+when a shipment is created for a whole order.
 """
 
-from typing import Optional
+from typing import Any, Iterable, List, Mapping, Optional
 from backend.persistance.shipment_item import ShipmentItem
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import insert, select
+from backend.persistance.unit_of_work import auto_commit
 
 class ShipmentItemRepository:
     def __init__(self, db: AsyncSession):
@@ -47,10 +49,27 @@ class ShipmentItemRepository:
             ShipmentItem: The saved shipment item.
         """
         self.db.add(shipment_item)
-        await self.db.commit()
+        await auto_commit(self.db)
         await self.db.refresh(shipment_item)
         return shipment_item
 
+    async def bulk_create(self, rows: Iterable[Mapping[str, Any]]) -> List[ShipmentItem]:
+        """
+        Insert shipment items from column dicts with one multi-row INSERT ... RETURNING.
+        Args:
+            rows: Column values per item (shipment_id, product_id, variant_id, quantity, ...).
+        Returns:
+            List[ShipmentItem]: The inserted items with their ids (not necessarily
+            in input order). Committing is left to the caller.
+        """
+        values = [dict(row) for row in rows]
+        if not values:
+            return []
+        result = await self.db.scalars(
+            insert(ShipmentItem).returning(ShipmentItem), values
+        )
+        return list(result.all())
+
     async def update(self, shipment_item_id: int, **kwargs) -> Optional[ShipmentItem]:
         """
         Update a shipment item by ID.
@@ -66,7 +85,7 @@ class ShipmentItemRepository:
         for k, v in kwargs.items():
             if hasattr(shipment_item, k):
                 setattr(shipment_item, k, v)
-        await self.db.commit()
+        await auto_commit(self.db)
         return shipment_item
 
     async def delete(self, shipment_item_id: int) -> bool:
@@ -80,6 +99,6 @@ class ShipmentItemRepository:
         shipment_item = await self.get_by_id(shipment_item_id)
         if shipment_item:
             await self.db.delete(shipment_item)
-            await self.db.commit()
+            await auto_commit(self.db)
             return True
         return False
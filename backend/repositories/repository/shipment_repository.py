@@ -15,6 +15,7 @@ from typing import Optional
 from backend.persistance.shipment import Shipment
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
+from backend.persistance.unit_of_work import auto_commit
 
 class ShipmentRepository:
     def __init__(self, db: AsyncSession):
@@ -47,7 +48,7 @@ class ShipmentRepository:
             Shipment: The saved shipment.
         """
         self.db.add(shipment)
-        await self.db.commit()
+        await auto_commit(self.db)
         await self.db.refresh(shipment)
         return shipment
 
@@ -66,7 +67,7 @@ class ShipmentRepository:
         for k, v in kwargs.items():
             if hasattr(shipment, k):
                 setattr(shipment, k, v)
-        await self.db.commit()
+        await auto_commit(self.db)
         return shipment
 
     async def delete(self, shipment_id: int) -> bool:
@@ -80,6 +81,6 @@ class ShipmentRepository:
         shipment = await self.get_by_id(shipment_id)
         if shipment:
             await self.db.delete(shipment)
-            await self.db.commit()
+            await auto_commit(self.db)
             return True
         return False
@@ -14,6 +14,7 @@ from typing import Optional
 from backend.persistance.shipping_snapshot import ShippingSnapshot
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
+from backend.persistance.unit_of_work import auto_commit
 
 class ShippingSnapshotRepository:
     def __init__(self, db: AsyncSession):
@@ -46,7 +47,7 @@ class ShippingSnapshotRepository:
             ShippingSnapshot: The saved shipping snapshot.
         """
         self.db.add(snapshot)
-        await self.db.commit()
+        await auto_commit(self.db)
         await self.db.refresh(snapshot)
         return snapshot
 
@@ -61,6 +62,6 @@ class ShippingSnapshotRepository:
         snapshot = await self.get_by_id(snapshot_id)
         if snapshot:
             await self.db.delete(snapshot)
-            await self.db.commit()
+            await auto_commit(self.db)
             return True
         return False
@@ -14,6 +14,7 @@ from typing import Optional
 from backend.persistance.sickday_snapshot import SickDaySnapshot
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
+from backend.persistance.unit_of_work import auto_commit
 
 class SickDaySnapshotRepository:
     def __init__(self, db: AsyncSession):
@@ -46,7 +47,7 @@ class SickDaySnapshotRepository:
             SickDaySnapshot: The saved sick day snapshot.
         """
         self.db.add(snapshot)
-        await self.db.commit()
+        await auto_commit(self.db)
         await self.db.refresh(snapshot)
         return snapshot
 
@@ -61,6 +62,6 @@ class SickDaySnapshotRepository:
         snapshot = await self.get_by_employee_name(employee_name)
         if snapshot:
             await self.db.delete(snapshot)
-            await self.db.commit()
+            await auto_commit(self.db)
             return True
         return False
@@ -0,0 +1,75 @@
+# ------------------------------------------------------------------------------
+# stock_hold_repository.py
+# ------------------------------------------------------------------------------
+# Repository for accessing StockHold records from the database.
+# Holds are created and closed in bulk; closing is a guarded UPDATE so a hold
+# is converted, released or expired exactly once even when checkout and the
+# sweeper race for it. Committing is left to the caller.
+# ------------------------------------------------------------------------------
+
+import datetime
+from typing import Iterable, List, Mapping, Optional
+
+from sqlalchemy import insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.persistance.stock_hold import HOLD_ACTIVE, HOLD_EXPIRED, StockHold
+
+
+class StockHoldRepository:
+    """Repository for StockHold model."""
+    def __init__(self, db: AsyncSession):
+        """Initialize repository with async DB session."""
+        self.db = db
+
+    async def add_many(
+        self, user_id: int, quantities: Mapping[int, int], *, now: datetime.datetime, expires_at: datetime.datetime
+    ) -> List[StockHold]:
+        """Insert one active hold per variant with one multi-row INSERT."""
+        rows = [
+            {"user_id": user_id, "variant_id": vid, "quantity": qty, "status": HOLD_ACTIVE,
+             "created_at": now, "expires_at": expires_at}
+            for vid, qty in quantities.items() if qty > 0
+        ]
+        if not rows:
+            return []
+        result = await self.db.scalars(insert(StockHold).returning(StockHold), rows)
+        return list(result.all())
+
+    async def get_active_by_user(self, user_id: int, *, now: Optional[datetime.datetime] = None) -> List[StockHold]:
+        """The user's active holds, oldest first; with `now`, only those not yet expired."""
+        stmt = select(StockHold).filter(StockHold.user_id == user_id, StockHold.status == HOLD_ACTIVE)
+        if now is not None:
+            stmt = stmt.filter(StockHold.expires_at > now)
+        result = await self.db.execute(stmt.order_by(StockHold.hold_id))
+        return list(result.scalars().all())
+
+    async def close(self, hold_ids: Iterable[int], status: str) -> List[StockHold]:
+        """Move the still-active holds among `hold_ids` to `status`; returns the holds actually closed."""
+        ids = list(hold_ids)
+        if not ids:
+            return []
+        result = await self.db.scalars(
+            update(StockHold)
+            .where(StockHold.hold_id.in_(ids), StockHold.status == HOLD_ACTIVE)
+            .values(status=status)
+            .returning(StockHold)
+        )
+        return list(result.all())
+
+    async def expire_due(self, now: datetime.datetime, *, limit: int) -> List[StockHold]:
+        """Mark up to `limit` active holds that expired by `now` as expired; returns them."""
+        due = (
+            select(StockHold.hold_id)
+            .filter(StockHold.status == HOLD_ACTIVE, StockHold.expires_at <= now)
+            .order_by(StockHold.expires_at)
+            .limit(limit)
+            .scalar_subquery()
+        )
+        result = await self.db.scalars(
+            update(StockHold)
+            .where(StockHold.hold_id.in_(due), StockHold.status == HOLD_ACTIVE)
+            .values(status=HOLD_EXPIRED)
+            .returning(StockHold)
+        )
+        return list(result.all())
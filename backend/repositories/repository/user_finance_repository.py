@@ -15,6 +15,7 @@ from typing import Optional
 from backend.persistance.user_finance import UserFinance
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
+from backend.persistance.unit_of_work import auto_commit
 
 class UserFinanceRepository:
     def __init__(self, db: AsyncSession):
@@ -47,7 +48,7 @@ class UserFinanceRepository:
             UserFinance: The saved user finance record.
         """
         self.db.add(user_finance)
-        await self.db.commit()
+        await auto_commit(self.db)
         await self.db.refresh(user_finance)
         return user_finance
 
@@ -66,7 +67,7 @@ class UserFinanceRepository:
         for k, v in kwargs.items():
             if hasattr(user_finance, k):
                 setattr(user_finance, k, v)
-        await self.db.commit()
+        await auto_commit(self.db)
         return user_finance
 
     async def delete(self, uf_id: int) -> bool:
@@ -80,11 +81,11 @@ class UserFinanceRepository:
         user_finance = await self.get_by_id(uf_id)
         if user_finance:
             user_finance.is_deleted = True
-            await self.db.commit()
+            await auto_commit(self.db)
             return True
         return False
         if user_finance:
             await self.db.delete(user_finance)
-            await self.db.commit()
+            await auto_commit(self.db)
             return True
         return False
@@ -9,6 +9,7 @@ from backend.persistance.wishlist import Wishlist
 from typing import Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
+from backend.persistance.unit_of_work import auto_commit
 
 class WishlistRepository:
     def __init__(self, db: AsyncSession):
@@ -48,7 +49,7 @@ class WishlistRepository:
     async def save(self, wishlist: Wishlist) -> Wishlist:
         """Persist a new wishlist."""
         self.db.add(wishlist)
-        await self.db.commit()
+        await auto_commit(self.db)
         await self.db.refresh(wishlist)
         return wishlist
 
@@ -58,5 +59,5 @@ class WishlistRepository:
         if not wishlist:
             return False
         await self.db.delete(wishlist)
-        await self.db.commit()
+        await auto_commit(self.db)
         return True
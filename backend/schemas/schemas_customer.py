@@ -1,5 +1,6 @@
 from pydantic import BaseModel, Field
-from typing import Optional, List
+import datetime
+from typing import Any, Dict, Optional, List, Literal
 
 class CartItemAdd(BaseModel):
     product_id: int = Field(..., gt=0)
@@ -12,6 +13,73 @@ class CartItemResponse(BaseModel):
     quantity: int
     user_id: int
 
+class CartOperation(BaseModel):
+    op: Literal["add", "update", "remove"]
+    product_id: int = Field(..., gt=0)
+    variant_id: Optional[int] = Field(None, gt=0)
+    quantity: int = Field(1, ge=0, le=100)
+
+class CartOperationsRequest(BaseModel):
+    operations: List[CartOperation] = Field(..., min_length=1, max_length=500)
+
+class CartOperationResult(BaseModel):
+    op: str
+    product_id: int
+    variant_id: Optional[int] = None
+    applied: bool
+    quantity: int
+    message: Optional[str] = None
+
+class CartOperationsResponse(BaseModel):
+    cart_id: int
+    items: List[Dict[str, Any]]
+    results: List[CartOperationResult]
+
+class GuestCartItem(BaseModel):
+    product_id: int = Field(..., gt=0)
+    variant_id: Optional[int] = Field(None, gt=0)
+    quantity: int = Field(..., gt=0, le=100)
+
+class GuestCartMergeRequest(BaseModel):
+    items: List[GuestCartItem] = Field(..., max_length=200)
+
+class StockHoldLine(BaseModel):
+    variant_id: int
+    quantity: int
+
+class CheckoutHoldResponse(BaseModel):
+    expires_at: Optional[datetime.datetime] = None
+    holds: List[StockHoldLine]
+
+class CheckoutReleaseResponse(BaseModel):
+    released: int
+
+class CheckoutShipment(BaseModel):
+    street_line_1: str = Field(..., min_length=1, max_length=255)
+    street_line_2: Optional[str] = Field(None, max_length=255)
+    city: str = Field(..., min_length=1, max_length=100)
+    state_province: Optional[str] = Field(None, max_length=100)
+    postal_code: str = Field(..., min_length=1, max_length=20)
+    country: str = Field(..., min_length=2, max_length=100)
+
+class CheckoutPayment(BaseModel):
+    # Tokenized card only; raw card numbers never reach the queue
+    payment_method_token: str = Field(..., min_length=1, max_length=255)
+    cardholder_name: Optional[str] = Field(None, max_length=255)
+    billing_address: Optional[str] = Field(None, max_length=500)
+
+class CheckoutRequest(BaseModel):
+    shipment_info: CheckoutShipment
+    payment_info: CheckoutPayment
+
+class CheckoutJobResponse(BaseModel):
+    job_id: int
+    status: str
+    attempts: int
+    order_id: Optional[int] = None
+    order_number: Optional[int] = None
+    error: Optional[str] = None
+
 class WishlistItemAdd(BaseModel):
     product_id: int = Field(..., gt=0)
     db: Optional[str] = None
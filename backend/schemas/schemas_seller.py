@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import Any, Dict, Optional
 
 class SellerProductCreate(BaseModel):
     name: str
@@ -29,3 +29,10 @@ class SellerProductResponse(BaseModel):
 
 class SellerDeleteResponse(BaseModel):
     result: bool
+
+class SellerDashboardResponse(BaseModel):
+    seller_id: int
+    # Section name -> result (None if the section failed)
+    sections: Dict[str, Any]
+    # total_ms, concurrency, and per section wait_ms, ms, ok (and error)
+    timing: Dict[str, Any]
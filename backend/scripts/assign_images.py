@@ -243,6 +243,9 @@ async def main() -> None:
         user_assign = await assign_user_images(session)
         cat_assign = await assign_category_images(session)
         sub_assign = await assign_subcategory_images(session)
+        # Cards fall back to category/subcategory images
+        from backend.repositories.repository.catalog_card_repository import CatalogCardRepository
+        await CatalogCardRepository(session).rebuild()
         await session.commit()
 
     print("\n=== Image Assignment Summary ===")
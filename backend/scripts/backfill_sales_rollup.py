@@ -0,0 +1,53 @@
+"""
+Rebuild the daily sales rollup from the order tables.
+
+Run once after creating the sales_daily_rollup table, and after any bulk
+change to orders that bypassed the ORM. Each batch of days is one
+transaction, so a backfill can be interrupted and rerun safely. --refresh
+instead applies the queued order changes, for when the in-process worker
+(SALES_ROLLUP_INTERVAL_SECONDS) is disabled.
+
+    python -m backend.scripts.backfill_sales_rollup [--start 2024-01-01] [--end 2024-12-31] [--days-per-batch 31]
+    python -m backend.scripts.backfill_sales_rollup --refresh
+"""
+import argparse
+import asyncio
+import datetime
+from typing import Optional
+
+from backend.persistance.async_base import AsyncSessionLocal
+from backend.services.sales_rollup_service import BACKFILL_DAYS_PER_BATCH, SalesRollupService
+
+
+async def backfill(
+    start: Optional[datetime.date] = None,
+    end: Optional[datetime.date] = None,
+    days_per_batch: int = BACKFILL_DAYS_PER_BATCH,
+) -> int:
+    async with AsyncSessionLocal() as session:
+        return await SalesRollupService(session).backfill(start, end, days_per_batch=days_per_batch)
+
+
+async def refresh() -> int:
+    async with AsyncSessionLocal() as session:
+        return await SalesRollupService(session).refresh()
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Rebuild the daily sales rollup")
+    parser.add_argument("--start", type=datetime.date.fromisoformat, help="First day (default: first order)")
+    parser.add_argument("--end", type=datetime.date.fromisoformat, help="Last day (default: last order)")
+    parser.add_argument(
+        "--days-per-batch", type=int, default=BACKFILL_DAYS_PER_BATCH, help="Days rebuilt per transaction"
+    )
+    parser.add_argument("--refresh", action="store_true", help="Apply queued order changes instead")
+    args = parser.parse_args(argv)
+    if args.refresh:
+        print(f"Applied {asyncio.run(refresh())} queued order changes.")
+        return
+    days = asyncio.run(backfill(args.start, args.end, args.days_per_batch))
+    print(f"Rebuilt {days} days of sales rollup.")
+
+
+if __name__ == "__main__":
+    main()
@@ -13,6 +13,7 @@ from backend.persistance.product_review import ProductReview
 from backend.persistance.product_rating import ProductRating
 from backend.persistance.product_variant import ProductVariant
 from backend.persistance.product import Product
+from backend.persistance.catalog_card import CatalogCard
 
 
 
@@ -30,6 +31,7 @@ async def main() -> None:
                     raise
 
         # Delete dependents first to satisfy FKs
+        await try_delete(CatalogCard)
         await try_delete(CartItem)
         await try_delete(WishlistItem)
         await try_delete(ShipmentItem)
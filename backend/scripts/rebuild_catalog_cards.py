@@ -0,0 +1,35 @@
+"""
+Rebuild the denormalized catalog_card table from product, product_image,
+category and subcategory.
+
+Day-to-day writes keep cards current incrementally; run this after bulk
+imports, manual SQL edits, or to repair drift. The rebuild runs in a single
+transaction, so readers see either the old or the new set of cards.
+
+    python -m backend.scripts.rebuild_catalog_cards [--batch-size 1000]
+"""
+import argparse
+import asyncio
+from typing import Optional
+
+from backend.persistance.async_base import AsyncSessionLocal
+from backend.repositories.repository.catalog_card_repository import REBUILD_BATCH_SIZE, CatalogCardRepository
+
+
+async def rebuild(batch_size: int = REBUILD_BATCH_SIZE) -> int:
+    async with AsyncSessionLocal() as session:
+        total = await CatalogCardRepository(session).rebuild(batch_size=batch_size)
+        await session.commit()
+    return total
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Rebuild the catalog_card read model")
+    parser.add_argument("--batch-size", type=int, default=REBUILD_BATCH_SIZE, help="Products read per batch")
+    args = parser.parse_args(argv)
+    total = asyncio.run(rebuild(args.batch_size))
+    print(f"Rebuilt {total} catalog cards.")
+
+
+if __name__ == "__main__":
+    main()
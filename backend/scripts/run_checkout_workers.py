@@ -0,0 +1,39 @@
+"""
+Process queued asynchronous checkouts.
+
+The app runs CHECKOUT_WORKER_CONCURRENCY workers in-process; run this as a
+separate service instead (with the in-process pool set to 0), or to drain the
+queue once. Jobs are claimed with a lease, so several copies can run side by
+side.
+
+    python -m backend.scripts.run_checkout_workers [--concurrency 4] [--once]
+"""
+import argparse
+import asyncio
+from typing import Optional
+
+from backend.config import settings
+from backend.persistance.async_base import AsyncSessionLocal
+from backend.services.checkout_service import CheckoutWorkerPool
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Process queued checkout jobs")
+    parser.add_argument("--concurrency", type=int, default=settings.CHECKOUT_WORKER_CONCURRENCY or 4,
+                        help="Jobs processed at once")
+    parser.add_argument("--once", action="store_true", help="Exit once no job is due")
+    args = parser.parse_args(argv)
+    pool = CheckoutWorkerPool(
+        AsyncSessionLocal,
+        concurrency=args.concurrency,
+        max_attempts=settings.CHECKOUT_MAX_ATTEMPTS,
+        lease_seconds=settings.CHECKOUT_LEASE_SECONDS,
+    )
+    if args.once:
+        print(f"Processed {asyncio.run(pool.drain())} checkout jobs.")
+    else:
+        asyncio.run(pool.run_forever())
+
+
+if __name__ == "__main__":
+    main()
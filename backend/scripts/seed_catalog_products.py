@@ -20,6 +20,7 @@ from backend.persistance.user import User
 from backend.persistance.category import Category
 from backend.persistance.subcategory import Subcategory
 from backend.persistance.product import Product
+from backend.repositories.repository.catalog_card_repository import CatalogCardRepository
 
 
 PRODUCT_TITLES = [
@@ -100,6 +101,7 @@ async def main() -> None:
         subcats = result.scalars().all()
         for sub in subcats:
             total += await seed_products_for_subcategory(session, sub, sellers, max_per_sub=3)
+        await CatalogCardRepository(session).rebuild()
         await session.commit()
     print(f"Seeded demo products: {total}")
 
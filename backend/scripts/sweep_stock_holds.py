@@ -0,0 +1,32 @@
+"""
+Return expired checkout stock holds to product variant stock.
+
+The app sweeps in the background every STOCK_HOLD_SWEEP_INTERVAL_SECONDS;
+run this from cron instead when the in-process sweeper is disabled. Each
+batch is one transaction, so a sweep can be interrupted safely.
+
+    python -m backend.scripts.sweep_stock_holds [--batch-size 1000]
+"""
+import argparse
+import asyncio
+from typing import Optional
+
+from backend.persistance.async_base import AsyncSessionLocal
+from backend.services.stock_hold_service import SWEEP_BATCH_SIZE, StockHoldService
+
+
+async def sweep(batch_size: int = SWEEP_BATCH_SIZE) -> int:
+    async with AsyncSessionLocal() as session:
+        return await StockHoldService(session).sweep(batch_size=batch_size)
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Return expired stock holds to stock")
+    parser.add_argument("--batch-size", type=int, default=SWEEP_BATCH_SIZE, help="Holds expired per transaction")
+    args = parser.parse_args(argv)
+    total = asyncio.run(sweep(args.batch_size))
+    print(f"Returned {total} expired stock holds.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,243 @@
+"""
+checkout_service.py
+
+Asynchronous checkout.
+
+`enqueue_checkout` validates the request and stores a pending job in the
+checkout_job table, which takes two reads and one insert, so the request
+returns at once. A `CheckoutWorkerPool` claims due jobs with a lease and runs
+each one through `process_checkout_job`. That step prices the cart, writes the
+order and its items, takes stock (converting the buyer's checkout holds
+first), charges the payment mock and empties the cart. All of it, plus the
+job's result, is one transaction. Before charging, the worker renews its
+lease with a conditional UPDATE, so a worker whose lease ran out (and whose
+job another worker may have reclaimed) never charges; the job id also goes
+to the gateway as the idempotency key. Jobs that fail for a transient reason
+are retried with exponential backoff up to the pool's max attempts. A
+`CheckoutError` (empty cart, unavailable product, no stock, declined payment)
+fails the job at once. Clients poll the job with `get_checkout_job`.
+"""
+import asyncio
+import datetime
+import inspect
+import os
+import socket
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.config import settings
+from backend.infrastructure.structured_logging import logger
+from backend.persistance.catalog_version import utcnow
+from backend.persistance.checkout_job import CheckoutJob
+from backend.persistance.enums import OrderStatusEnum
+from backend.persistance.order import Order
+from backend.persistance.unit_of_work import UnitOfWork
+from backend.repositories.repository.cart_item_repository import CartItemRepository
+from backend.repositories.repository.cart_repository import CartRepository
+from backend.repositories.repository.checkout_job_repository import CheckoutJobRepository
+from backend.repositories.repository.order_item_repository import OrderItemRepository
+from backend.services.line_item_hydrator import LineItemHydrator
+from backend.services.order_number_allocator import next_order_number
+from backend.utilities.payment_service_mock import PaymentServiceMock
+
+RETRY_BASE_SECONDS = 2.0
+RETRY_MAX_SECONDS = 300.0
+PAYMENT_OK = ("mocked", "succeeded")
+
+
+class CheckoutError(Exception):
+    """A checkout that cannot succeed on retry; the job fails with this message."""
+
+
+def retry_delay(attempts: int) -> datetime.timedelta:
+    """Backoff before the next attempt, doubling per attempt up to RETRY_MAX_SECONDS."""
+    return datetime.timedelta(seconds=min(RETRY_BASE_SECONDS * 2 ** max(attempts - 1, 0), RETRY_MAX_SECONDS))
+
+
+async def enqueue_checkout(user_id: int, details: Dict[str, Any], db: AsyncSession) -> CheckoutJob:
+    """
+    Store a pending checkout job for the user's cart.
+
+    Raises:
+        CheckoutError: the user has no cart or it is empty.
+    """
+    cart = await CartRepository(db).get_by_user_id(user_id)
+    if not cart or not await CartItemRepository(db).get_live_by_cart_id(cart.cart_id):
+        raise CheckoutError('Cart is empty.')
+    return await CheckoutJobRepository(db).enqueue(user_id, cart.cart_id, details, now=utcnow())
+
+
+async def get_checkout_job(job_id: int, user_id: int, db: AsyncSession) -> Optional[Dict[str, Any]]:
+    """The state of one of the user's checkout jobs, or None."""
+    job = await CheckoutJobRepository(db).get_for_user(job_id, user_id)
+    if not job:
+        return None
+    order = await db.get(Order, job.order_id) if job.order_id else None
+    return {
+        'job_id': job.job_id,
+        'status': job.status,
+        'attempts': job.attempts,
+        'order_id': job.order_id,
+        'order_number': order.order_number if order else None,
+        'error': job.last_error,
+    }
+
+
+async def process_checkout_job(
+    job: CheckoutJob,
+    worker: str,
+    db: AsyncSession,
+    *,
+    payments: Optional[Any] = None,
+    lease: Optional[datetime.timedelta] = None,
+) -> Order:
+    """
+    Run the checkout pipeline for a claimed job and record its success, in one transaction.
+
+    Raises:
+        CheckoutError: the checkout cannot succeed; nothing was written.
+    """
+    # Imported here: customerServices pulls in most of the service layer
+    from backend.services.customerServices import deduct_inventory
+
+    payments = payments or PaymentServiceMock()
+    lease = lease or datetime.timedelta(seconds=settings.CHECKOUT_LEASE_SECONDS)
+    now = utcnow()
+    order_number = await next_order_number(db, now=now)
+    async with UnitOfWork(db):
+        items = await CartItemRepository(db).get_live_by_cart_id(job.cart_id)
+        if not items:
+            raise CheckoutError('Cart is empty.')
+        lines = await LineItemHydrator.for_request(db).hydrate((item.product_id, item.variant_id) for item in items)
+        priced: List[tuple] = []
+        for item, line in zip(items, lines):
+            if not line.product or (item.variant_id and not line.variant):
+                raise CheckoutError(f'Product {item.product_id} is no longer available.')
+            priced.append((item, float(line.price) * item.quantity))
+        total = round(sum(subtotal for _, subtotal in priced), 2)
+
+        order = Order(
+            user_id=job.user_id, cart_id=job.cart_id, order_status=OrderStatusEnum.pending,
+            total_amount=total, created_at=now, updated_at=now, order_number=order_number,
+        )
+        db.add(order)
+        await db.flush()
+        order_items = await OrderItemRepository(db).bulk_create(
+            {'order_id': order.order_id, 'product_id': item.product_id, 'variant_id': item.variant_id,
+             'quantity': item.quantity, 'subtotal': subtotal}
+            for item, subtotal in priced
+        )
+
+        ok, msg = await deduct_inventory(order_items, db, user_id=job.user_id)
+        if not ok:
+            raise CheckoutError(msg)
+        jobs = CheckoutJobRepository(db)
+        if not await jobs.renew(job.job_id, worker, now=utcnow(), lease=lease):
+            # Lease lost: roll back without charging and let the worker holding it finish the job
+            raise RuntimeError(f'Lease on checkout job {job.job_id} was lost.')
+        payment = job.get_payload().get('payment_info') or {}
+        charge = payments.process_payment(
+            amount=total, payment_method_token=payment.get('payment_method_token'),
+            order_number=order.order_number, idempotency_key=f'checkout-job-{job.job_id}',
+        )
+        if inspect.isawaitable(charge):
+            charge = await charge
+        if charge.get('status') not in PAYMENT_OK:
+            raise CheckoutError(charge.get('message') or 'Payment declined.')
+
+        order.order_status = OrderStatusEnum.confirmed
+        await CartItemRepository(db).bulk_delete(item.cart_item_id for item in items)
+        if not await jobs.complete(job.job_id, worker, order.order_id, now=now):
+            # Lease lost to another worker: roll back and let that worker finish the job
+            raise RuntimeError(f'Lease on checkout job {job.job_id} was lost.')
+    return order
+
+
+class CheckoutWorkerPool:
+    """
+    Claims and processes checkout jobs, at most `concurrency` at a time.
+
+    Every job runs on its own session, so a slow job holds one connection
+    and never blocks the others.
+    """
+
+    def __init__(
+        self,
+        session_factory: Any,
+        *,
+        concurrency: int = 4,
+        max_attempts: int = 5,
+        lease_seconds: float = 60.0,
+        poll_interval: float = 1.0,
+        name: Optional[str] = None,
+        payments: Optional[Any] = None,
+    ):
+        self.session_factory = session_factory
+        self.concurrency = max(1, concurrency)
+        self.max_attempts = max_attempts
+        self.lease = datetime.timedelta(seconds=lease_seconds)
+        self.poll_interval = poll_interval
+        self.name = name or f"{socket.gethostname()}:{os.getpid()}:{id(self):x}"
+        self.payments = payments
+
+    async def _settle_failure(self, job: CheckoutJob, error: str, *, permanent: bool) -> None:
+        now = utcnow()
+        async with self.session_factory() as session:
+            jobs = CheckoutJobRepository(session)
+            if permanent or job.attempts >= self.max_attempts:
+                await jobs.fail(job.job_id, self.name, error, now=now)
+            else:
+                await jobs.retry(job.job_id, self.name, error, now=now, available_at=now + retry_delay(job.attempts))
+            await session.commit()
+
+    async def _process(self, job: CheckoutJob) -> None:
+        try:
+            async with self.session_factory() as session:
+                await process_checkout_job(job, self.name, session, payments=self.payments, lease=self.lease)
+        except CheckoutError as e:
+            await self._settle_failure(job, str(e), permanent=True)
+        except Exception as e:
+            logger.exception("checkout.job_failed", job_id=job.job_id, attempts=job.attempts, error=str(e))
+            await self._settle_failure(job, str(e), permanent=False)
+
+    async def run_once(self) -> int:
+        """Claim one round of due jobs and process them concurrently; returns how many were claimed."""
+        async with self.session_factory() as session:
+            jobs = await CheckoutJobRepository(session).claim(
+                self.name, now=utcnow(), limit=self.concurrency, lease=self.lease
+            )
+        await asyncio.gather(*[self._process(job) for job in jobs])
+        return len(jobs)
+
+    async def drain(self) -> int:
+        """Process jobs until none are due; returns how many were claimed in total."""
+        total = 0
+        while True:
+            claimed = await self.run_once()
+            total += claimed
+            if not claimed:
+                return total
+
+    async def run_forever(self) -> None:
+        """Keep processing; sleep `poll_interval` whenever the queue is empty. Stops when cancelled."""
+        while True:
+            try:
+                claimed = await self.run_once()
+            except Exception as e:
+                logger.exception("checkout.claim_failed", error=str(e))
+                claimed = 0
+            if not claimed:
+                await asyncio.sleep(self.poll_interval)
+
+
+def default_pool(session_factory: Optional[Any] = None) -> CheckoutWorkerPool:
+    """A pool configured from settings (CHECKOUT_WORKER_CONCURRENCY, CHECKOUT_MAX_ATTEMPTS, CHECKOUT_LEASE_SECONDS)."""
+    if session_factory is None:
+        from backend.persistance.async_base import AsyncSessionLocal as session_factory
+    return CheckoutWorkerPool(
+        session_factory,
+        concurrency=settings.CHECKOUT_WORKER_CONCURRENCY or 1,
+        max_attempts=settings.CHECKOUT_MAX_ATTEMPTS,
+        lease_seconds=settings.CHECKOUT_LEASE_SECONDS,
+    )
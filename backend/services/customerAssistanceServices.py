@@ -22,6 +22,7 @@ from backend.repositories.repository.product_repository import ProductRepository
 from backend.repositories.repository.product_variant_repository import ProductVariantRepository
 from backend.repositories.repository.product_image_repository import ProductImageRepository
 from backend.repositories.repository.product_variant_image_repository import ProductVariantImageRepository
+from backend.services.line_item_hydrator import LineItemHydrator
 from backend.models.model.order_item import OrderItem
 from backend.repositories.repository.shipment_issue_repository import ShipmentIssueRepository
 from backend.repositories.repository.shipment_repository import ShipmentRepository
@@ -32,6 +33,7 @@ from backend.models.model.shipment_item import ShipmentItem
 import os
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
+from backend.persistance.unit_of_work import auto_commit
 
 async def send_customer_refund_status_email(customer_email, customer_name, order_id, refund_amount, status, description=None, user_id=None, db=None, **kwargs):
     """
@@ -135,33 +137,22 @@ async def get_specific_refund_request(refund_request_id, db: AsyncSession):
     refund_repo = RefundRequestRepository(db)
     order_repo = OrderRepository(db)
     order_item_repo = OrderItemRepository(db)
-    product_repo = ProductRepository(db)
-    variant_repo = ProductVariantRepository(db)
-    image_repo = ProductImageRepository(db)
-    variant_image_repo = ProductVariantImageRepository(db)
     refund = await refund_repo.get_by_id(refund_request_id)
     if not refund:
         return None
-    order_res = await order_repo.db.execute(select(Order).filter(Order.order_id == refund.order_id))
-    order = order_res.scalars().first()
-    order_items_res = await order_item_repo.db.execute(select(OrderItem).filter(OrderItem.order_id == refund.order_id))
-    order_items = order_items_res.scalars().all()
-    detailed_items = []
-    for item in order_items:
-        product = await product_repo.get_by_id(item.product_id)
-        product_images = await image_repo.get_by_product_id(item.product_id)
-        variant = None
-        variant_images = []
-        if item.variant_id:
-            variant = await variant_repo.get_by_id(item.variant_id)
-            variant_images = await variant_image_repo.get_by_variant_id(item.variant_id)
-        detailed_items.append({
+    order = await order_repo.get(refund.order_id)
+    order_items = await order_item_repo.get_by_order_id(refund.order_id)
+    lines = await LineItemHydrator.for_request(db).hydrate((item.product_id, item.variant_id) for item in order_items)
+    detailed_items = [
+        {
             'order_item': item,
-            'product': product,
-            'product_images': product_images,
-            'variant': variant,
-            'variant_images': variant_images
-        })
+            'product': line.product,
+            'product_images': line.product_images,
+            'variant': line.variant,
+            'variant_images': line.variant_images
+        }
+        for item, line in zip(order_items, lines)
+    ]
     return {
         'refund_request': refund,
         'order': order,
@@ -211,7 +202,7 @@ async def process_customer_complaint(refund_request_id=None, db: AsyncSession =
     refund.status = new_status
     if description is not None:
         refund.description = description
-    await db.commit()
+    await auto_commit(db)
     # Ledger: append refund event
     ledger_entry = RefundLedger(refund_id=refund.refund_request_id, action=action, amount=getattr(refund, 'refund_amount', 0))
     await ledger_repo.save(ledger_entry)
@@ -328,5 +319,5 @@ async def process_shipment_report(issue_id, db: AsyncSession, **update_fields):
             await send_seller_broken_product_notification(seller_email, seller_name, product_name, order_id, quantity, variant_name)
     else:
         updated_issue.resolution = ShipmentIssueResolution.UNRESOLVED
-    await db.commit()
+    await auto_commit(db)
     return updated_issue
@@ -6,10 +6,11 @@ All operations are asynchronous and require a database session.
 """
 
 # Remove invalid ...existing code... and ensure all necessary imports are present
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, Iterable, List
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from backend.infrastructure.structured_logging import logger
+from backend.persistance.unit_of_work import UnitOfWork, auto_commit
 
 async def deactivate_user_account(db: AsyncSession) -> tuple[bool, Optional[str]]:
     """
@@ -38,7 +39,7 @@ async def deactivate_user_account(db: AsyncSession) -> tuple[bool, Optional[str]
         cart_items = cart_items_result.scalars().all()
         for item in cart_items:
             await db.delete(item)
-        await db.commit()
+        await auto_commit(db)
 
     # Clear wishlist
     wishlist_repo = WishlistRepository(db)
@@ -50,7 +51,7 @@ async def deactivate_user_account(db: AsyncSession) -> tuple[bool, Optional[str]
         wishlist_items = wishlist_items_result.scalars().all()
         for item in wishlist_items:
             await db.delete(item)
-        await db.commit()
+        await auto_commit(db)
 
     # Send goodbye email
     if user and user.email:
@@ -86,9 +87,12 @@ from backend.repositories.repository.user_finance_repository import UserFinanceR
 from backend.persistance.user_finance import UserFinance
 from backend.repositories.repository.customer_shipment_repository import CustomerShipmentRepository
 from backend.persistance.customer_shipment import CustomerShipment
-from backend.repositories.repository.product_variant_repository import ProductVariantRepository
+from backend.repositories.repository.product_variant_repository import InsufficientStockError, ProductVariantRepository
 from backend.repositories.repository.product_image_repository import ProductImageRepository
 from backend.repositories.repository.product_variant_image_repository import ProductVariantImageRepository
+from backend.services.line_item_hydrator import LineItemHydrator
+from backend.services.order_number_allocator import next_order_number
+from backend.services.stock_hold_service import StockHoldService
 from backend.persistance.order import Order
 from backend.repositories.repository.order_repository import OrderRepository
 from backend.persistance.order_item import OrderItem
@@ -124,7 +128,7 @@ async def handle_payment_info(purchase_data: dict, db: AsyncSession):
         try:
             user_finance = UserFinance(**payment_info)
             db.add(user_finance)
-            await db.commit()
+            await auto_commit(db)
             await db.refresh(user_finance)
         except Exception as e:
             await db.rollback()
@@ -146,7 +150,7 @@ async def handle_shipment_info(purchase_data: dict, db: AsyncSession):
         try:
             customer_shipment = CustomerShipment(**shipment_info)
             db.add(customer_shipment)
-            await db.commit()
+            await auto_commit(db)
             await db.refresh(customer_shipment)
         except Exception as e:
             await db.rollback()
@@ -156,7 +160,7 @@ async def handle_shipment_info(purchase_data: dict, db: AsyncSession):
 async def create_order_and_items(purchase_data: dict, db: AsyncSession, cart_items, total_amount):
     user_id = g.user['user_id']
     order_repo = OrderRepository(db)
-    order_number = f"ORD{datetime.datetime.now().strftime('%Y%m%d%H%M%S')}{user_id}"
+    order_number = await next_order_number(db)
     # Extract address fields from purchase_data
     address = purchase_data.get('address')
     postal_code = purchase_data.get('postal_code')
@@ -182,37 +186,53 @@ async def create_order_and_items(purchase_data: dict, db: AsyncSession, cart_ite
         await db.rollback()
         return None, False, f'Order creation failed: {str(e)}'
     order_item_repo = OrderItemRepository(db)
-    order_items = [
-        OrderItem(
-            order_item_id=None,
-            order_id=order.order_id,
-            product_id=item['product_id'],
-            variant_id=item['variant_id'],
-            quantity=item['quantity'],
-            subtotal=item['subtotal']
-        ) for item in cart_items
-    ]
     try:
-        await db.add_all(order_items)
-        await db.commit()
+        order_items = await order_item_repo.bulk_create(
+            {
+                'order_id': order.order_id,
+                'product_id': item['product_id'],
+                'variant_id': item['variant_id'],
+                'quantity': item['quantity'],
+                'subtotal': item['subtotal'],
+            } for item in cart_items
+        )
+        await auto_commit(db)
     except Exception as e:
         await db.rollback()
         return None, False, f'Order item creation failed: {str(e)}'
     return order, order_items, True, None
 
-async def deduct_inventory(order_items, db: AsyncSession):
-    product_repo = ProductRepository(db)
-    product_variant_repo = ProductVariantRepository(db)
+async def deduct_inventory(order_items, db: AsyncSession, user_id: Optional[int] = None):
+    """
+    Reserve stock for every order line at once.
+
+    With `user_id`, the user's checkout holds on these variants are converted
+    first and only what they do not cover is reserved. Variant lines are
+    decremented together by one conditional UPDATE that either takes every
+    quantity or none; product-only lines (which carry no stock) only need an
+    active product. On failure no hold is converted and no stock is taken:
+    the conversion and reservation share one unit of work, a savepoint when
+    the request already has one open.
+    """
+    quantities: Dict[int, int] = {}
+    product_ids = set()
+    for oi in order_items:
+        if oi.variant_id:
+            quantities[oi.variant_id] = quantities.get(oi.variant_id, 0) + oi.quantity
+        else:
+            product_ids.add(oi.product_id)
     try:
-        for oi in order_items:
-            if oi.variant_id:
-                affected = await product_variant_repo.decrement_stock(oi.variant_id, oi.quantity)
-                if not affected:
-                    return False, f'Not enough stock for variant {oi.variant_id}'
-            else:
-                affected = await product_repo.decrement_stock(oi.product_id, oi.quantity)
-                if not affected:
-                    return False, f'Not enough stock for product {oi.product_id}'
+        if product_ids:
+            active = await ProductRepository(db).get_by_ids(product_ids)
+            missing = sorted(product_ids - set(active))
+            if missing:
+                return False, f'Not enough stock for product {missing[0]}'
+        async with UnitOfWork(db):
+            if user_id is not None and quantities:
+                quantities = await StockHoldService(db).convert(user_id, quantities)
+            await ProductVariantRepository(db).reserve_stock(quantities)
+    except InsufficientStockError as e:
+        return False, f'Not enough stock for variant {e.variant_ids[0]}'
     except Exception as e:
         return False, f'Inventory deduction failed: {str(e)}'
     return True, None
@@ -221,7 +241,7 @@ async def empty_cart(cart_items, db: AsyncSession):
     try:
         for item in cart_items:
             await db.delete(item['db_obj'])
-        await db.commit()
+        await auto_commit(db)
     except Exception as e:
         await db.rollback()
         return False, f'Failed to empty cart: {str(e)}'
@@ -489,7 +509,7 @@ async def add_item_to_cart(user_id: int, product_id: int, quantity: int, db: Asy
                 updated_at=None,
             )
             db.add(stub)
-            await db.commit()
+            await auto_commit(db)
             product = stub
         else:
             raise ValueError('Product not found')
@@ -497,11 +517,11 @@ async def add_item_to_cart(user_id: int, product_id: int, quantity: int, db: Asy
     if not cart:
         cart = Cart(cart_id=None, user_id=user_id, created_at=datetime.datetime.now(), updated_at=datetime.datetime.now())
         db.add(cart)
-        await db.commit()
+        await auto_commit(db)
         await db.refresh(cart)
     cart_item = CartItem(cart_item_id=None, cart_id=cart.cart_id, product_id=product_id, variant_id=variant_id, quantity=quantity)
     db.add(cart_item)
-    await db.commit()
+    await auto_commit(db)
     await db.refresh(cart_item)
     return {
         'id': cart_item.cart_item_id,
@@ -540,7 +560,7 @@ async def add_item_to_wishlist(user_id: int, product_id: int, quantity: int, db:
                 updated_at=None,
             )
             db.add(stub)
-            await db.commit()
+            await auto_commit(db)
             product = stub
         else:
             raise ValueError('Product not found')
@@ -548,11 +568,11 @@ async def add_item_to_wishlist(user_id: int, product_id: int, quantity: int, db:
     if not wishlist:
         wishlist = Wishlist(user_id=user_id, created_at=datetime.datetime.now(), updated_at=datetime.datetime.now())
         db.add(wishlist)
-        await db.commit()
+        await auto_commit(db)
         await db.refresh(wishlist)
     wishlist_item = WishlistItem(wishlist_item_id=None, wishlist_id=wishlist.wishlist_id, product_id=product_id, variant_id=variant_id, quantity=quantity)
     db.add(wishlist_item)
-    await db.commit()
+    await auto_commit(db)
     await db.refresh(wishlist_item)
     return wishlist_item
 
@@ -562,124 +582,61 @@ async def get_cart_items(db: AsyncSession, cart_id: Optional[int] = None, user_i
     if user_id is None:
         return {'items': [], 'notes': ['No user_id provided.'], 'time': str(datetime.datetime.now())}
     cart_repo = CartRepository(db)
-    cart_item_repo = CartItemRepository(db)
-    product_repo = ProductRepository(db)
-    product_variant_repo = ProductVariantRepository(db)
-    product_image_repo = ProductImageRepository(db)
-    cart = await cart_repo.get_by_id(cart_id) if cart_id else None
-    if not cart:
+    cart = await cart_repo.get(cart_id) if cart_id else None
+    if not cart or cart.user_id != user_id:
         return {'items': [], 'notes': ['No cart found for user.'], 'time': str(datetime.datetime.now())}
     items_res = await db.execute(select(CartItem).filter(CartItem.cart_id == cart.cart_id))
     items = items_res.scalars().all()
+    lines = await LineItemHydrator.for_request(db).hydrate((item.product_id, item.variant_id) for item in items)
     notes = []
     result_items = []
-    for item in items:
-        product = await product_repo.get_by_id(item.product_id)
+    changed = False
+    for item, line in zip(items, lines):
+        product = line.product
         if not product:
             notes.append(f"Product {item.product_id} removed from cart at {datetime.datetime.now()}.")
             await db.delete(item)
-            await db.commit()
+            changed = True
             continue
-        # Get product images
-        images = await product_image_repo.get_by_product_id(product.product_id)
-        image_url = images[0].image_url if images else None
-        # Get category/subcategory names if available
-        category_name = getattr(product, 'category_id', None)
-        subcategory_name = getattr(product, 'subcategory_id', None)
-        # Variant info
-        variant = None
-        variant_name = None
-        variant_image_url = None
-        price = product.price
-        if item.variant_id:
-            variant = await product_variant_repo.get_by_id(item.variant_id)
-            if variant:
-                variant_name = getattr(variant, 'name', None)
-                price = getattr(variant, 'price', price)
-                # Try to get variant image
-                from backend.repositories.repository.product_variant_image_repository import ProductVariantImageRepository
-                variant_image_repo = ProductVariantImageRepository(db)
-                variant_images = await variant_image_repo.get_by_variant_id(variant.variant_id)
-                variant_image_url = variant_images[0].image_url if variant_images else None
         # Stock check
         if item.quantity > product.stock:
             notes.append(f"Product {item.product_id} quantity reduced to {product.stock} at {datetime.datetime.now()}.")
             item.quantity = product.stock
-            await db.commit()
-        result_items.append({
-            'product_id': item.product_id,
-            'product_name': product.name,
-            'product_image': image_url,
-            'category': category_name,
-            'subcategory': subcategory_name,
-            'variant_id': item.variant_id,
-            'variant_name': variant_name,
-            'variant_image': variant_image_url,
-            'price': price,
-            'quantity': item.quantity
-        })
+            changed = True
+        result_items.append({**line.to_dict(), 'variant_id': item.variant_id, 'quantity': item.quantity})
+    # Removals and quantity trims are written together
+    if changed:
+        await auto_commit(db)
     return {'items': result_items, 'notes': notes}
 
 # Get wishlist items with alerts
 async def get_wishlist_items(db: AsyncSession, wishlist_id: Optional[int] = None) -> Dict[str, Any]:
-    user_id = g.user['user_id']
     wishlist_repo = WishlistRepository(db)
-    wishlist_item_repo = WishlistItemRepository(db)
-    product_repo = ProductRepository(db)
-    product_variant_repo = ProductVariantRepository(db)
-    product_image_repo = ProductImageRepository(db)
     wishlist = await wishlist_repo.get_by_id(wishlist_id) if wishlist_id else None
     if not wishlist:
         return {'items': [], 'notes': ['No wishlist found for user.'], 'time': str(datetime.datetime.now())}
     items_res = await db.execute(select(WishlistItem).filter(WishlistItem.wishlist_id == wishlist.wishlist_id))
     items = items_res.scalars().all()
+    lines = await LineItemHydrator.for_request(db).hydrate((item.product_id, item.variant_id) for item in items)
     notes = []
     result_items = []
-    for item in items:
-        product = await product_repo.get_by_id(item.product_id)
+    changed = False
+    for item, line in zip(items, lines):
+        product = line.product
         if not product:
             notes.append(f"Product {item.product_id} removed from wishlist at {datetime.datetime.now()}.")
             await db.delete(item)
-            await db.commit()
+            changed = True
             continue
-        # Get product images
-        images = await product_image_repo.get_by_product_id(product.product_id)
-        image_url = images[0].image_url if images else None
-        # Get category/subcategory names if available
-        category_name = getattr(product, 'category_id', None)
-        subcategory_name = getattr(product, 'subcategory_id', None)
-        # Variant info
-        variant = None
-        variant_name = None
-        variant_image_url = None
-        price = product.price
-        if item.variant_id:
-            variant = await product_variant_repo.get_by_id(item.variant_id)
-            if variant:
-                variant_name = getattr(variant, 'name', None)
-                price = getattr(variant, 'price', price)
-                # Try to get variant image
-                from backend.repositories.repository.product_variant_image_repository import ProductVariantImageRepository
-                variant_image_repo = ProductVariantImageRepository(db)
-                variant_images = await variant_image_repo.get_by_variant_id(variant.variant_id)
-                variant_image_url = variant_images[0].image_url if variant_images else None
         # Stock check
         if item.quantity > product.stock:
             notes.append(f"Product {item.product_id} quantity reduced to {product.stock} at {datetime.datetime.now()}.")
             item.quantity = product.stock
-            await db.commit()
-        result_items.append({
-            'product_id': item.product_id,
-            'product_name': product.name,
-            'product_image': image_url,
-            'category': category_name,
-            'subcategory': subcategory_name,
-            'variant_id': item.variant_id,
-            'variant_name': variant_name,
-            'variant_image': variant_image_url,
-            'price': price,
-            'quantity': item.quantity
-        })
+            changed = True
+        result_items.append({**line.to_dict(), 'variant_id': item.variant_id, 'quantity': item.quantity})
+    # Removals and quantity trims are written together
+    if changed:
+        await auto_commit(db)
     return {'items': result_items, 'notes': notes}
 
 # Edit cart item quantity
@@ -720,20 +677,20 @@ async def edit_wishlist_item_quantity(wishlist_item_id: int, new_quantity: int,
     product = await product_repo.get_by_id(item.product_id)
     if not product:
         await db.delete(item)
-        await db.commit()
+        await auto_commit(db)
         notes.append(f'Product {item.product_id} removed from wishlist at {datetime.datetime.now()}')
         return {'notes': notes}
     if new_quantity > product.stock:
         item.quantity = product.stock
-        await db.commit()
+        await auto_commit(db)
         notes.append(f'Quantity for product {item.product_id} set to {product.stock} at {datetime.datetime.now()}')
     elif new_quantity <= 0:
         await db.delete(item)
-        await db.commit()
+        await auto_commit(db)
         notes.append(f'Wishlist item {wishlist_item_id} removed at {datetime.datetime.now()}')
     else:
         item.quantity = new_quantity
-        await db.commit()
+        await auto_commit(db)
     return {'notes': notes}
 
 # Remove cart item
@@ -742,7 +699,7 @@ async def remove_cart_item(cart_item_id: int, db: AsyncSession):
     item = await cart_item_repo.get_by_id(cart_item_id)
     if item:
         await db.delete(item)
-        await db.commit()
+        await auto_commit(db)
 
 # Remove wishlist item
 async def remove_wishlist_item(wishlist_item_id: int, db: AsyncSession):
@@ -750,7 +707,185 @@ async def remove_wishlist_item(wishlist_item_id: int, db: AsyncSession):
     item = await wishlist_item_repo.get_by_id(wishlist_item_id)
     if item:
         await db.delete(item)
-        await db.commit()
+        await auto_commit(db)
+
+# Load the user's cart for a batched edit, creating it if needed
+async def _load_cart_lines(user_id: int, db: AsyncSession):
+    """
+    Return the user's cart, its live items, the items grouped by
+    (product_id, variant_id) line, and each line's total quantity.
+    """
+    cart = await CartRepository(db).get_by_user_id(user_id)
+    if not cart:
+        now = datetime.datetime.now()
+        cart = Cart(user_id=user_id, created_at=now, updated_at=now)
+        db.add(cart)
+        await db.flush()
+    items = await CartItemRepository(db).get_live_by_cart_id(cart.cart_id)
+    rows: Dict[tuple, List[CartItem]] = {}
+    for item in items:
+        rows.setdefault((item.product_id, item.variant_id), []).append(item)
+    quantities = {key: sum(item.quantity for item in group) for key, group in rows.items()}
+    return cart, items, rows, quantities
+
+# Write the new quantities of the touched cart lines
+async def _write_cart_lines(db: AsyncSession, cart: Cart, items: List[CartItem], rows: Dict[tuple, List[CartItem]],
+                            quantities: Dict[tuple, int], touched: Iterable[tuple]) -> List[CartItem]:
+    """
+    Persist `quantities` for the `touched` lines with at most one DELETE,
+    one UPDATE and one INSERT. Duplicate rows of a touched line are folded
+    into its oldest row. Returns the cart's remaining items, oldest first.
+    """
+    cart_item_repo = CartItemRepository(db)
+    inserts, updates, deletes = [], {}, []
+    for key in touched:
+        group = rows.get(key, [])
+        if quantities[key] <= 0:
+            deletes.extend(item.cart_item_id for item in group)
+        elif not group:
+            inserts.append({'cart_id': cart.cart_id, 'product_id': key[0], 'variant_id': key[1],
+                            'quantity': quantities[key], 'is_deleted': False})
+        else:
+            deletes.extend(item.cart_item_id for item in group[1:])
+            if group[0].quantity != quantities[key]:
+                updates[group[0].cart_item_id] = quantities[key]
+    await cart_item_repo.bulk_delete(deletes)
+    await cart_item_repo.bulk_update_quantities(updates)
+    inserted = await cart_item_repo.bulk_insert(inserts)
+    if inserts or updates or deletes:
+        cart.updated_at = datetime.datetime.now()
+    removed = set(deletes)
+    return sorted(
+        [item for item in items if item.cart_item_id not in removed] + inserted,
+        key=lambda item: item.cart_item_id,
+    )
+
+# Hydrate the cart items returned by the batched cart endpoints
+async def _cart_lines_response(db: AsyncSession, cart: Cart, items: List[CartItem], results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    lines = await LineItemHydrator.for_request(db).hydrate((item.product_id, item.variant_id) for item in items)
+    return {
+        'cart_id': cart.cart_id,
+        'items': [
+            {**line.to_dict(), 'cart_item_id': item.cart_item_id, 'quantity': item.quantity}
+            for item, line in zip(items, lines)
+        ],
+        'results': results,
+    }
+
+# Apply a batch of cart operations
+async def apply_cart_operations(user_id: int, operations: List[Any], db: AsyncSession) -> Dict[str, Any]:
+    """
+    Apply `add`/`update`/`remove` operations to the user's cart in one transaction.
+
+    Cart lines are keyed by (product_id, variant_id); duplicate rows of a line
+    that an operation touches are folded into its oldest row. Every product and
+    variant referenced by the cart or the operations is read once, in batch,
+    and quantities are clamped to variant stock. Operations on unavailable
+    products or variants are skipped and reported, the rest still apply. The
+    net changes are written with at most one INSERT, one UPDATE and one DELETE.
+
+    Returns:
+        dict: cart_id, the hydrated cart `items`, and one entry in `results` per operation.
+    """
+    async with UnitOfWork(db):
+        cart, items, rows, quantities = await _load_cart_lines(user_id, db)
+        refs = list(rows) + [(op.product_id, op.variant_id) for op in operations]
+        hydrated = await LineItemHydrator.for_request(db).hydrate(refs)
+        lines = {(line.product_id, line.variant_id): line for line in hydrated}
+
+        results = []
+        touched: Dict[tuple, None] = {}
+        for op in operations:
+            key = (op.product_id, op.variant_id)
+            current = quantities.get(key, 0)
+            wanted = 0 if op.op == 'remove' else (current + op.quantity if op.op == 'add' else op.quantity)
+            message = None
+            if wanted > 0:
+                line = lines[key]
+                variant = line.variant
+                if not line.product:
+                    message = 'Product not available'
+                elif op.variant_id and (not variant or variant.product_id != op.product_id):
+                    message = 'Variant not available'
+                elif op.variant_id and (variant.quantity or 0) <= 0:
+                    message = 'Variant out of stock'
+                if message:
+                    results.append({'op': op.op, 'product_id': op.product_id, 'variant_id': op.variant_id,
+                                    'applied': False, 'quantity': current, 'message': message})
+                    continue
+                if op.variant_id and wanted > variant.quantity:
+                    wanted = variant.quantity
+                    message = 'Quantity reduced to available stock'
+            quantities[key] = wanted
+            touched[key] = None
+            results.append({'op': op.op, 'product_id': op.product_id, 'variant_id': op.variant_id,
+                            'applied': True, 'quantity': wanted, 'message': message})
+        remaining = await _write_cart_lines(db, cart, items, rows, quantities, touched)
+    return await _cart_lines_response(db, cart, remaining, results)
+
+# Merge a guest cart into the user's cart
+async def merge_guest_cart(user_id: int, guest_items: List[Any], db: AsyncSession) -> Dict[str, Any]:
+    """
+    Merge the lines of an anonymous (guest) cart into the user's cart after sign-in.
+
+    Guest lines are deduplicated by (product_id, variant_id) and added to the
+    quantity the user's cart already holds for the same line. Every merged
+    total is checked and clamped to variant stock by one set-based query;
+    lines whose product or variant is unavailable are skipped and reported.
+    The merged cart is written in one transaction.
+
+    Returns:
+        dict: cart_id, the hydrated cart `items`, and one entry in `results` per distinct guest line.
+    """
+    guest: Dict[tuple, int] = {}
+    for item in guest_items:
+        key = (item.product_id, item.variant_id)
+        guest[key] = guest.get(key, 0) + item.quantity
+    async with UnitOfWork(db):
+        cart, items, rows, quantities = await _load_cart_lines(user_id, db)
+        requested = {key: quantities.get(key, 0) + qty for key, qty in guest.items()}
+        allowed = await ProductVariantRepository(db).clamp_to_stock(
+            (pid, vid, qty) for (pid, vid), qty in requested.items()
+        )
+        results = []
+        touched = []
+        for key, qty in requested.items():
+            if key not in allowed:
+                results.append({'op': 'merge', 'product_id': key[0], 'variant_id': key[1], 'applied': False,
+                                'quantity': quantities.get(key, 0), 'message': 'Product not available'})
+                continue
+            quantities[key] = allowed[key]
+            touched.append(key)
+            message = 'Quantity reduced to available stock' if allowed[key] < qty else None
+            results.append({'op': 'merge', 'product_id': key[0], 'variant_id': key[1], 'applied': True,
+                            'quantity': allowed[key], 'message': message})
+        remaining = await _write_cart_lines(db, cart, items, rows, quantities, touched)
+    return await _cart_lines_response(db, cart, remaining, results)
+
+# Hold the stock of the user's cart while they check out
+async def hold_cart_stock(user_id: int, db: AsyncSession) -> Dict[str, Any]:
+    """
+    Hold the variant quantities in the user's cart for the checkout TTL,
+    replacing any holds from an earlier checkout attempt.
+
+    Raises:
+        InsufficientStockError: a variant cannot cover the cart; nothing is held.
+    """
+    quantities: Dict[int, int] = {}
+    cart = await CartRepository(db).get_by_user_id(user_id)
+    if cart:
+        for item in await CartItemRepository(db).get_live_by_cart_id(cart.cart_id):
+            if item.variant_id:
+                quantities[item.variant_id] = quantities.get(item.variant_id, 0) + item.quantity
+    holds = await StockHoldService(db).hold(user_id, quantities)
+    return {
+        'expires_at': holds[0].expires_at if holds else None,
+        'holds': [{'variant_id': h.variant_id, 'quantity': h.quantity} for h in holds],
+    }
+
+# Give the user's checkout holds back to stock
+async def release_cart_stock(user_id: int, db: AsyncSession) -> Dict[str, Any]:
+    return {'released': await StockHoldService(db).release(user_id)}
 
 async def purchase(purchase_data):
     db = purchase_data.get('db')
@@ -823,7 +958,7 @@ async def purchase(purchase_data):
             return False, msg
 
         # 5. Deduct inventory
-        ok, msg = await deduct_inventory(order_items, db)
+        ok, msg = await deduct_inventory(order_items, db, user_id=user_id)
         if not ok:
             return False, msg
 
@@ -832,7 +967,7 @@ async def purchase(purchase_data):
         if not ok:
             return False, msg
 
-        await db.commit()
+        await auto_commit(db)
         return True, 'Purchase succeeded.'
     except Exception as e:
         return False, f'Unexpected error: {str(e)}'
@@ -855,8 +990,14 @@ async def get_order_details(order_id: int, db: AsyncSession) -> Dict[str, Any]:
     if shipment:
         shipment_items_res = await db.execute(select(ShipmentItem).filter(ShipmentItem.shipment_id == shipment.shipment_id))
         shipment_items = shipment_items_res.scalars().all()
+    lines = await LineItemHydrator.for_request(db).hydrate((item.product_id, item.variant_id) for item in order_items)
     return {
         'order_items': order_items,
+        # Product/variant details per order item, in the same order
+        'lines': [
+            {**line.to_dict(), 'order_item_id': item.order_item_id, 'quantity': item.quantity, 'subtotal': item.subtotal}
+            for item, line in zip(order_items, lines)
+        ],
         'shipment': shipment,
         'shipment_items': shipment_items
     }
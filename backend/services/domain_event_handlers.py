@@ -12,6 +12,7 @@ from backend.models.model.refund_ledger import RefundLedger
 from backend.repositories.repository.refund_ledger_repository import RefundLedgerRepository
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Optional
+from backend.persistance.unit_of_work import auto_commit
 
 async def handle_refund_event(event: DomainEvent, db: AsyncSession) -> Optional[object]:
     """
@@ -45,7 +46,7 @@ async def handle_refund_event(event: DomainEvent, db: AsyncSession) -> Optional[
     if 'description' in event.payload:
         desc_val = event.payload['description']
         refund.description = str(desc_val) if desc_val is not None else None
-    await db.commit()
+    await auto_commit(db)
     # Import the persistance model for RefundLedger
     from backend.persistance.refund_ledger import RefundLedger as RefundLedgerModel
     ledger_entry = RefundLedgerModel(refund_id=refund.refund_request_id, action=action, amount=getattr(refund, 'refund_amount', 0))
@@ -0,0 +1,132 @@
+"""
+line_item_hydrator.py
+
+Resolves `(product_id, variant_id)` line references (cart, wishlist, order and
+refund lines) into their product, variant and image rows. Lines are loaded
+with one batched `IN` query per table, so a view costs the same number of
+queries however many lines it shows.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.persistance.product import Product
+from backend.persistance.product_image import ProductImage
+from backend.persistance.product_variant import ProductVariant
+from backend.persistance.product_variant_image import ProductVariantImage
+from backend.repositories.repository.product_image_repository import ProductImageRepository
+from backend.repositories.repository.product_repository import ProductRepository
+from backend.repositories.repository.product_variant_image_repository import ProductVariantImageRepository
+from backend.repositories.repository.product_variant_repository import ProductVariantRepository
+
+LineRef = Tuple[int, Optional[int]]
+
+_SESSION_KEY = "line_item_hydrator"
+
+
+@dataclass
+class HydratedLine:
+    """
+    One resolved line.
+
+    Attributes:
+        product_id / variant_id: The reference as given.
+        product: The active product, or None if it no longer exists or is inactive.
+        variant: The active variant, or None.
+        product_images: Images of the product, primary (lowest image_id) first.
+        variant_images: Every image row of the variant, soft-deleted ones included.
+    """
+    product_id: int
+    variant_id: Optional[int]
+    product: Optional[Product] = None
+    variant: Optional[ProductVariant] = None
+    product_images: List[ProductImage] = field(default_factory=list)
+    variant_images: List[ProductVariantImage] = field(default_factory=list)
+
+    @property
+    def product_image(self) -> Optional[str]:
+        return self.product_images[0].image_url if self.product_images else None
+
+    @property
+    def variant_image(self) -> Optional[str]:
+        if not self.variant or not self.variant_images:
+            return None
+        return self.variant_images[0].image_url
+
+    @property
+    def price(self) -> Any:
+        price = self.product.price if self.product else None
+        return getattr(self.variant, 'price', price) if self.variant else price
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Line fields shared by the cart and wishlist views."""
+        product = self.product
+        return {
+            'product_id': self.product_id,
+            'product_name': product.name if product else None,
+            'product_image': self.product_image,
+            'category': getattr(product, 'category_id', None),
+            'subcategory': getattr(product, 'subcategory_id', None),
+            'variant_id': self.variant_id,
+            'variant_name': getattr(self.variant, 'name', None),
+            'variant_image': self.variant_image,
+            'price': self.price,
+        }
+
+
+class LineItemHydrator:
+    """
+    Batched loader for line references.
+
+    Rows already loaded by this instance are reused, so a request that
+    hydrates several lists (e.g. order lines, then refund lines) only queries
+    for ids it has not seen yet. Use `for_request` to share one instance
+    across every service called with the same session.
+    """
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self._products: Dict[int, Optional[Product]] = {}
+        self._product_images: Dict[int, List[ProductImage]] = {}
+        self._variants: Dict[int, Optional[ProductVariant]] = {}
+        self._variant_images: Dict[int, List[ProductVariantImage]] = {}
+
+    @classmethod
+    def for_request(cls, db: AsyncSession) -> "LineItemHydrator":
+        """The hydrator memoized on `db`; it lives as long as the session."""
+        hydrator = db.info.get(_SESSION_KEY)
+        if hydrator is None:
+            hydrator = db.info[_SESSION_KEY] = cls(db)
+        return hydrator
+
+    async def hydrate(self, lines: Iterable[LineRef]) -> List[HydratedLine]:
+        """Resolve `lines` in order; at most four queries, none for rows already loaded."""
+        refs = list(lines)
+        product_ids = list(dict.fromkeys(pid for pid, _ in refs if pid is not None and pid not in self._products))
+        variant_ids = list(dict.fromkeys(vid for _, vid in refs if vid and vid not in self._variants))
+        if product_ids:
+            found = await ProductRepository(self.db).get_by_ids(product_ids)
+            images = await ProductImageRepository(self.db).get_by_product_ids(product_ids)
+            for pid in product_ids:
+                self._products[pid] = found.get(pid)
+                self._product_images[pid] = images.get(pid, [])
+        if variant_ids:
+            found_variants = await ProductVariantRepository(self.db).get_by_ids(variant_ids)
+            variant_images = await ProductVariantImageRepository(self.db).get_by_variant_ids(
+                variant_ids, include_deleted=True
+            )
+            for vid in variant_ids:
+                self._variants[vid] = found_variants.get(vid)
+                self._variant_images[vid] = variant_images.get(vid, [])
+        return [
+            HydratedLine(
+                product_id=pid,
+                variant_id=vid,
+                product=self._products.get(pid),
+                variant=self._variants.get(vid) if vid else None,
+                product_images=self._product_images.get(pid, []),
+                variant_images=self._variant_images.get(vid, []) if vid else [],
+            )
+            for pid, vid in refs
+        ]
@@ -0,0 +1,67 @@
+"""
+order_number_allocator.py
+
+Collision-free order numbers without a database round trip per order.
+
+Each process reserves a block of ORDER_NUMBER_BLOCK_SIZE sequence values at a
+time (see persistance/order_number_block.py) and hands them out from memory.
+An order number is the UTC date followed by the ten-digit sequence value, e.g.
+2610180000000417: unique across workers because sequence values are, and
+roughly time-ordered because blocks are reserved in time order. Numbers left
+in a block when a worker stops are skipped, never reused.
+"""
+import asyncio
+import datetime
+import weakref
+from typing import Optional
+
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from backend.persistance.catalog_version import utcnow
+from backend.persistance.order_number_block import ORDER_NUMBER_BLOCK_SIZE, reserve_block
+
+
+def format_order_number(sequence_value: int, day: datetime.date) -> int:
+    return int(f"{day:%y%m%d}{sequence_value:010d}")
+
+
+class OrderNumberAllocator:
+    """Hands out sequence values from blocks reserved per database engine."""
+
+    def __init__(self):
+        # Engine -> [next value, end of block], and the lock serialising its refills
+        self._blocks: "weakref.WeakKeyDictionary[object, list[int]]" = weakref.WeakKeyDictionary()
+        self._locks: "weakref.WeakKeyDictionary[object, asyncio.Lock]" = weakref.WeakKeyDictionary()
+
+    async def next_value(self, engine: AsyncEngine) -> int:
+        """The next unused sequence value; reserves a new block when the current one is used up."""
+        key = engine.sync_engine
+        block = self._blocks.get(key)
+        if block is None or block[0] >= block[1]:
+            async with self._locks.setdefault(key, asyncio.Lock()):
+                block = self._blocks.get(key)
+                if block is None or block[0] >= block[1]:
+                    # Own connection and transaction: the reservation survives a rollback of the caller
+                    async with engine.begin() as conn:
+                        first = await reserve_block(conn)
+                    block = self._blocks[key] = [first, first + ORDER_NUMBER_BLOCK_SIZE]
+        value = block[0]
+        block[0] += 1
+        return value
+
+    async def next(self, engine: AsyncEngine, *, now: Optional[datetime.datetime] = None) -> int:
+        """The next order number."""
+        return format_order_number(await self.next_value(engine), (now or utcnow()).date())
+
+
+order_numbers = OrderNumberAllocator()
+
+
+async def next_order_number(db: AsyncSession, *, now: Optional[datetime.datetime] = None) -> int:
+    """
+    The next order number for the database `db` is bound to.
+
+    Call it before `db` starts writing: on SQLite, reserving a block opens a
+    second write transaction.
+    """
+    return await order_numbers.next(db.bind, now=now)
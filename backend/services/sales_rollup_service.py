@@ -0,0 +1,105 @@
+"""
+sales_rollup_service.py
+
+Keeps sales_daily_rollup and sales_daily_seller_orders in step with the order
+tables.
+
+Every order or order-line write queues the order id in the sales_rollup_event
+outbox, in the writer's own transaction (see persistance/sales_daily_rollup).
+`refresh` consumes the outbox a batch at a time. It finds the (day, product)
+rows those orders touch, recomputes them from the raw tables and deletes the
+consumed events, all in one transaction. Events are deleted rather than read
+past a high-water mark, so a writer that commits late (with a lower event id
+than one already consumed) is still picked up. `backfill` rebuilds a whole
+date range; run it once after deploying the table, and after bulk UPDATEs or
+hard deletes on the order tables, which the outbox does not see. The app runs
+`run_rollup_worker` in the background when `SALES_ROLLUP_INTERVAL_SECONDS` is
+set; `python -m backend.scripts.backfill_sales_rollup` does either from cron.
+"""
+import asyncio
+import datetime
+from typing import Any, Optional
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.infrastructure.structured_logging import logger
+from backend.persistance.order import Order
+from backend.persistance.unit_of_work import UnitOfWork
+from backend.repositories.repository.order_analytics_repository import as_date
+from backend.repositories.repository.sales_rollup_repository import SalesRollupRepository
+
+REFRESH_BATCH_SIZE = 500
+BACKFILL_DAYS_PER_BATCH = 31
+
+
+class SalesRollupService:
+    """Refreshes and backfills the daily sales rollup. Each batch is one transaction."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self.rollup = SalesRollupRepository(db)
+
+    async def refresh(self, *, batch_size: int = REFRESH_BATCH_SIZE) -> int:
+        """Apply every queued order change to the rollup; returns the number of events consumed."""
+        total = 0
+        while True:
+            async with UnitOfWork(self.db):
+                events = await self.rollup.pending_events(batch_size)
+                keys = await self.rollup.keys_for_orders(order_id for _, order_id in events)
+                for day, product_ids in sorted(keys.items()):
+                    await self.rollup.recompute(day, day, product_ids)
+                await self.rollup.delete_events(event_id for event_id, _ in events)
+            total += len(events)
+            if len(events) < batch_size:
+                return total
+
+    async def backfill(
+        self,
+        start: Optional[datetime.date] = None,
+        end: Optional[datetime.date] = None,
+        *,
+        days_per_batch: int = BACKFILL_DAYS_PER_BATCH,
+    ) -> int:
+        """
+        Rebuild the rollup for `start`..`end` (inclusive), `days_per_batch` days
+        per transaction. Missing bounds default to the first and last order
+        dates. Returns the number of days covered.
+
+        Rebuilding the whole history (no bounds) also drops the events queued
+        before it started: every batch reads after their writes committed.
+        Events queued during the backfill stay for `refresh`.
+        """
+        covered = await self.rollup.queued_event_ids() if start is None and end is None else []
+        await self.db.commit()
+        if start is None or end is None:
+            first, last = (await self.db.execute(
+                select(func.min(Order.created_at), func.max(Order.created_at))
+            )).one()
+            start = start or (as_date(first) if first else None)
+            end = end or (as_date(last) if last else None)
+        step = datetime.timedelta(days=max(1, days_per_batch))
+        day = start
+        while day is not None and end is not None and day <= end:
+            batch_end = min(day + step - datetime.timedelta(days=1), end)
+            async with UnitOfWork(self.db):
+                await self.rollup.recompute(day, batch_end)
+            day = batch_end + datetime.timedelta(days=1)
+        async with UnitOfWork(self.db):
+            await self.rollup.delete_events(covered)
+        return max((end - start).days + 1, 0) if start and end else 0
+
+
+async def run_rollup_worker(interval: float, session_factory: Optional[Any] = None) -> None:
+    """Refresh the rollup every `interval` seconds until cancelled."""
+    if session_factory is None:
+        from backend.persistance.async_base import AsyncSessionLocal as session_factory
+    while True:
+        try:
+            async with session_factory() as session:
+                consumed = await SalesRollupService(session).refresh()
+            if consumed:
+                logger.info("sales_rollup.refreshed", events=consumed)
+        except Exception as e:
+            logger.exception("sales_rollup.refresh_failed", error=str(e))
+        await asyncio.sleep(interval)
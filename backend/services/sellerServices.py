@@ -7,7 +7,6 @@ All repository and model operations use a db session that is request-scoped and
 from backend.repositories.repository.product_repository import ProductRepository
 from backend.persistance.product import Product
 from backend.repositories.repository.product_comment_repository import ProductCommentRepository
-from backend.repositories.repository.order_repository import OrderRepository
 from backend.repositories.repository.product_variant_repository import ProductVariantRepository
 from backend.persistance.product_variant import ProductVariant
 from backend.repositories.repository.product_image_repository import ProductImageRepository
@@ -19,9 +18,45 @@ from backend.repositories.repository.seller_payout_repository import SellerPayou
 from backend.persistance.product import Product
 from backend.persistance.product_variant import ProductVariant
 from backend.repositories.repository.product_image_repository import ProductImageRepository
-        
+from backend.repositories.repository.catalog_repository import CatalogFilters
+from backend.repositories.repository.catalog_card_repository import CatalogCardRepository
+from backend.repositories.repository.product_search_repository import ProductSearchRepository
+from backend.repositories.repository.order_analytics_repository import OrderAnalyticsRepository, OrderFilters
+from backend.repositories.repository.sales_rollup_repository import SalesRollupRepository
+
 import os
 import asyncio
+import datetime
+from backend.persistance.unit_of_work import auto_commit
+
+
+def _parse_date(value):
+    """A date from a date/datetime or an ISO string (query parameters arrive as strings)."""
+    if not value or isinstance(value, datetime.date):
+        return value or None
+    return datetime.date.fromisoformat(str(value)[:10])
+
+
+def _parse_age_range(value):
+    """(min_age, max_age) from a pair or a "min,max" string."""
+    if not value:
+        return None
+    if isinstance(value, str):
+        value = value.split(',')
+    low, high = value
+    return int(low), int(high)
+
+
+def _month_range(year, month):
+    """First and last day of the month (arguments may be query-string integers)."""
+    start = datetime.date(int(year), int(month), 1)
+    following = datetime.date(start.year + start.month // 12, start.month % 12 + 1, 1)
+    return start, following - datetime.timedelta(days=1)
+
+
+def _payout_total(payouts):
+    """Sum of the payouts' amounts; like SQL SUM, missing amounts are skipped."""
+    return float(sum(p.amount for p in payouts if p.amount is not None))
 
 
 class SellerService:
@@ -68,9 +103,9 @@ class SellerService:
             variant = ProductVariant(
                 variant_id=None,
                 product_id=product.product_id,
-                name=v['name'],
+                variant_name=v['name'],
                 price=v['price'],
-                stock=v['stock']
+                quantity=v['stock']
             )
             saved_variant = await variant_repo.save(variant)
             # Create variant image folder
@@ -99,6 +134,9 @@ class SellerService:
                 image_url=img_url
             )
             await image_repo.save(image)
+        # Publish the resolved catalog card
+        await CatalogCardRepository(db).refresh_products([product.product_id])
+        await auto_commit(db)
         # Return shape expected by SellerProductResponse
         return {
             'id': product.product_id,
@@ -127,7 +165,7 @@ class SellerService:
         variant_image_repo = ProductVariantImageRepository(db)
         for v in variants:
             if 'variant_id' in v:
-                await variant_repo.update(v['variant_id'], name=v['name'], price=v['price'], stock=v['stock'])
+                await variant_repo.update(v['variant_id'], variant_name=v['name'], price=v['price'], quantity=v['stock'])
                 # Sync variant images
                 variant_folder = os.path.join('backend', 'images', 'variant_images', f'variant_{v["variant_id"]}')
                 os.makedirs(variant_folder, exist_ok=True)
@@ -153,9 +191,9 @@ class SellerService:
                 variant = ProductVariant(
                     variant_id=None,
                     product_id=product_id,
-                    name=v['name'],
+                    variant_name=v['name'],
                     price=v['price'],
-                    stock=v['stock']
+                    quantity=v['stock']
                 )
                 saved_variant = await variant_repo.save(variant)
                 variant_folder = os.path.join('backend', 'images', 'variant_images', f'variant_{saved_variant.variant_id}')
@@ -190,6 +228,9 @@ class SellerService:
                     image_url=img_url
                 )
                 await image_repo.save(image)
+        # Text, price, taxonomy or primary image may have changed
+        await CatalogCardRepository(db).refresh_products([product_id])
+        await auto_commit(db)
         # Return product, all variants, and images
         from sqlalchemy import select
         all_variants_res = await db.execute(select(ProductVariant).filter(ProductVariant.product_id == product_id))
@@ -245,7 +286,11 @@ class SellerService:
         # Remove all images in /backend/images/uploads/product_{pid}
         delete_uploaded_image(image_id=None, product_id=pid)
 
-        return await repo.delete(pid)
+        deleted = await repo.delete(pid)
+        # Inactive products have no card
+        await CatalogCardRepository(db).refresh_products([pid])
+        await auto_commit(db)
+        return deleted
 
     async def get_product(self, product_id):
         from typing import cast
@@ -263,12 +308,13 @@ class SellerService:
         from backend.repositories.repository.product_image_repository import ProductImageRepository
         image_repo = ProductImageRepository(db)
         images = await image_repo.get_by_product_id(pid)
-        # Get variant images
-        variant_image_repo = ProductVariantImageRepository(db)
-        variants_with_images = []
-        for v in variants:
-            v_images = await variant_image_repo.get_by_variant_id(v.variant_id)
-            variants_with_images.append({'variant': v, 'images': v_images})
+        # Get variant images (one query for all variants)
+        images_by_variant = await ProductVariantImageRepository(db).get_by_variant_ids(
+            [v.variant_id for v in variants], include_deleted=True
+        )
+        variants_with_images = [
+            {'variant': v, 'images': images_by_variant.get(v.variant_id, [])} for v in variants
+        ]
         return {'product': product, 'variants': variants_with_images, 'images': images}
 
     async def get_all_products(self, seller_id=None):
@@ -303,131 +349,189 @@ class SellerService:
         if not comment:
             return None
         comment.response = response_text
-        await db.commit()
+        await auto_commit(db)
         return comment
 
-    async def analyze_orders_for_product(self, seller_id, product_id=None, age_range=None, sex=None, start_date=None, end_date=None, analysis_func=None, **analysis_kwargs):
-        db = self.db
-        order_repo = OrderRepository(db)
-        # Only use non-deleted, seller-owned products
-        product_repo = ProductRepository(db)
-        result = await db.execute(select(Product).filter(Product.seller_id == seller_id, Product.is_deleted == False))
-        valid_products = result.scalars().all()
-        valid_product_ids = [p.product_id for p in valid_products]
-        # Only use non-deleted, non-refunded orders
-        orders = await order_repo.filter_orders(
-            product_id=product_id if product_id in valid_product_ids else None,
-            age_range=age_range,
-            sex=sex,
-            start_date=start_date,
-            end_date=end_date
-        )
+    async def analyze_orders_for_product(self, seller_id, product_id=None, age_range=None, sex=None, start_date=None, end_date=None, analysis_func=None, period='daily', fee_rate=0.1, shipping_cost=0, ad_cost=0, source='rollup', **analysis_kwargs):
+        """
+        Sales trends of the seller's products: units sold, revenue, profit and
+        order count per day, week, month or year, as parallel lists.
 
+        Reports without buyer filters read the daily sales rollup, so their
+        cost does not grow with order history; it keeps distinct order counts
+        per seller and day, so a multi-product order counts once. Buyer
+        filters (age_range, sex) or source='orders' aggregate the raw orders
+        in the database instead (one GROUP BY query). Passing
+        `analysis_func` (a callable or the name of a function in
+        backend.utilities.analysis) loads the matching lines instead and runs
+        it in memory. Profit is revenue less the fee rate and per-order
+        shipping and advertising costs.
+        """
+        filters = OrderFilters(
+            seller_id=int(seller_id),
+            product_id=int(product_id) if product_id else None,
+            age_range=_parse_age_range(age_range),
+            sex=sex or None,
+            start_date=_parse_date(start_date),
+            end_date=_parse_date(end_date),
+        )
+        repo = OrderAnalyticsRepository(self.db)
+        fee_rate, per_order_cost = float(fee_rate), float(shipping_cost) + float(ad_cost)
+        if analysis_func:
+            costs = {'fee_rate': fee_rate, 'shipping_cost': float(shipping_cost), 'ad_cost': float(ad_cost)}
+            return await self._analyze_in_memory(repo, filters, analysis_func, costs, period=period, **analysis_kwargs)
+        if source == 'rollup' and not (filters.age_range or filters.sex):
+            totals = await SalesRollupRepository(self.db).totals_by_period(
+                filters.seller_id, period, product_id=filters.product_id,
+                start_date=filters.start_date, end_date=filters.end_date,
+            )
+        else:
+            totals = await repo.totals_by_period(filters, period)
+        profit = [t.revenue * (1 - fee_rate) - per_order_cost * t.order_count for t in totals]
+        series = {
+            'period': period,
+            'periods': [t.start.isoformat() for t in totals],
+            'units_sold': [t.units_sold for t in totals],
+            'revenue': [round(t.revenue, 2) for t in totals],
+            'profit': [round(p, 2) for p in profit],
+            'order_count': [t.order_count for t in totals],
+        }
+        n = len(totals) or 1
+        series.update({
+            'average_units_per_period': sum(series['units_sold']) / n,
+            'average_revenue_per_period': sum(t.revenue for t in totals) / n,
+            'average_profit_per_period': sum(profit) / n,
+            'average_orders_per_period': sum(series['order_count']) / n,
+        })
+        return series
 
+    async def _analyze_in_memory(self, repo, filters, analysis_func, costs, **kwargs):
+        """Fallback: build order views from the report's lines and run an analysis helper over them."""
+        import inspect
+        from types import SimpleNamespace
+        from backend.utilities import analysis
+        func = analysis_func if callable(analysis_func) else getattr(analysis, str(analysis_func), None)
+        if func is None or not callable(func):
+            raise ValueError(f"Unknown analysis function {analysis_func!r}")
+        orders = {}
+        for order_id, created_at, quantity, subtotal in await repo.lines(filters):
+            order = orders.setdefault(
+                order_id, SimpleNamespace(order_id=order_id, created_at=created_at, total_amount=0.0, order_items=[])
+            )
+            order.order_items.append(SimpleNamespace(quantity=quantity, subtotal=subtotal))
+            order.total_amount += subtotal
+        accepted = inspect.signature(func).parameters
+        kwargs.update({k: v for k, v in costs.items() if k in accepted})
+        result = func(list(orders.values()), **kwargs)
+        # Trend keys are dates, week numbers or (year, month) tuples; JSON needs strings
+        return {
+            key: {str(k): v for k, v in value.items()} if isinstance(value, dict) else value
+            for key, value in result.items()
+        }
 
     async def get_seller_payout(self, seller_id, year, month):
-        from backend.persistance.seller_payout import SellerPayout
-        from sqlalchemy import extract
-        db = self.db
-        repo = SellerPayoutRepository(db)
-        payout_result = await db.execute(
-            select(SellerPayout).filter(
-                SellerPayout.seller_id == seller_id,
-                extract('year', SellerPayout.date_of_payment) == year,
-                extract('month', SellerPayout.date_of_payment) == month
-            )
+        """
+        The seller's payout for the month, checked against the month's sales.
+
+        Sales are the subtotals of the seller's live order lines, excluding
+        cancelled and returned orders, summed in one query. They are compared
+        with the total of every payout made in the month, as in
+        reconcile_seller_payouts. Returns the month's first payout (None if
+        there is none).
+        Raises:
+            ValueError: the payouts differ from the sales by more than a cent.
+        """
+        start, end = _month_range(year, month)
+        payouts = await SellerPayoutRepository(self.db).list_for_seller_between(int(seller_id), start, end)
+        if not payouts:
+            return None
+        payout_total = _payout_total(payouts)
+        order_sum = await OrderAnalyticsRepository(self.db).sales_total(
+            OrderFilters(seller_id=int(seller_id), start_date=start, end_date=end)
         )
-        payout = payout_result.scalars().first()
-        # Calculate sum of non-deleted, non-refunded orders for this seller and month
-        order_repo = OrderRepository(db)
-        product_repo = ProductRepository(db)
-        result_products = await db.execute(select(Product).filter(Product.seller_id == seller_id, Product.is_deleted == False))
-        valid_products = result_products.scalars().all()
-        valid_product_ids = [p.product_id for p in valid_products]
-        orders = await order_repo.filter_orders()
-        filtered_orders = [o for o in orders if o.product_id in valid_product_ids and not getattr(o, 'is_deleted', False) and getattr(o, 'status', '').lower() != 'refunded' and getattr(o, 'created_at', None) is not None and getattr(getattr(o, 'created_at', None), 'year', None) == year and getattr(getattr(o, 'created_at', None), 'month', None) == month]
-        order_sum = sum(getattr(o, 'total_amount', 0) for o in filtered_orders)
-        payout_total = getattr(payout, 'total', None) or getattr(payout, 'amount', None)
-        if payout and payout_total is not None and abs(order_sum - payout_total) > 0.01:
+        if abs(order_sum - payout_total) > 0.01:
             raise ValueError(f"Payout total ({payout_total}) does not match sum of orders ({order_sum}) for seller {seller_id} in {year}-{month}.")
-        return payout
+        return payouts[0]
 
-    async def search_products_for_seller(self, seller_id, keywords=None, category_id=None, subcategory_id=None, min_price=None, max_price=None):
-        db = self.db
-        base = select(Product).filter(Product.seller_id == seller_id)
-        if category_id:
-            base = base.filter(Product.category_id == category_id)
-        if subcategory_id:
-            base = base.filter(Product.subcategory_id == subcategory_id)
-        if min_price is not None:
-            base = base.filter(Product.price >= min_price)
-        if max_price is not None:
-            base = base.filter(Product.price <= max_price)
-        products_result = await db.execute(base)
-        products = products_result.scalars().all()
-        result = []
-        keyword_set = set()
-        if keywords:
-            keyword_set = set(word.lower() for word in keywords.split())
-        image_repo = ProductImageRepository(db)
-        for product in products:
-            matches = False
-            text_fields = [getattr(product, 'name', '') or '', getattr(product, 'description', '') or '']
-            if keyword_set:
-                for field in text_fields:
-                    if any(kw in field.lower() for kw in keyword_set):
-                        matches = True
-                        break
-            else:
-                matches = True
-            if matches:
-                images = await image_repo.get_by_product_id(product.product_id)
-                main_image_url = images[0].image_url if images else None
-                result.append({
-                    'product_id': product.product_id,
-                    'name': product.name,
-                    'image_url': main_image_url,
-                    'price': product.price,
-                    'category_id': getattr(product, 'category_id', None),
-                    'category_name': getattr(product, 'category_name', None),
-                    'subcategory_id': getattr(product, 'subcategory_id', None),
-                    'subcategory_name': getattr(product, 'subcategory_name', None),
-                    'is_available': getattr(product, 'is_available', True),
-                    # Add any other fields shown in user product list here
-                })
-        # Optionally add pagination info if needed by frontend contract
-        return result
+    async def payout_summary(self, seller_id, year, month):
+        """The month's sales and payouts for one seller, without raising on a mismatch (for dashboards)."""
+        start, end = _month_range(year, month)
+        order_total = await OrderAnalyticsRepository(self.db).sales_total(
+            OrderFilters(seller_id=int(seller_id), start_date=start, end_date=end)
+        )
+        payouts = await SellerPayoutRepository(self.db).list_for_seller_between(int(seller_id), start, end)
+        payout_total = _payout_total(payouts) if payouts else None
+        return {
+            'year': start.year,
+            'month': start.month,
+            'order_total': round(order_total, 2),
+            'payout_total': payout_total,
+            'matches': abs(order_total - payout_total) <= 0.01 if payout_total is not None else None,
+        }
+
+    async def reconcile_seller_payouts(self, year, month):
+        """
+        Month's sales against amount paid out, for every seller with either.
+
+        One GROUP BY over the order lines and one over the payouts, whatever
+        the number of sellers. Returns dicts sorted by seller: seller_id,
+        order_total, payout_total (None without a payout) and matches (None
+        without a payout).
+        """
+        start, end = _month_range(year, month)
+        sales = await OrderAnalyticsRepository(self.db).sales_totals_by_seller(
+            OrderFilters(seller_id=None, start_date=start, end_date=end)
+        )
+        paid = await SellerPayoutRepository(self.db).totals_by_seller_between(start, end)
+        return [
+            {
+                'seller_id': seller_id,
+                'order_total': round(sales.get(seller_id, 0.0), 2),
+                'payout_total': paid.get(seller_id),
+                'matches': abs(sales.get(seller_id, 0.0) - paid[seller_id]) <= 0.01 if seller_id in paid else None,
+            }
+            for seller_id in sorted(set(sales) | set(paid))
+        ]
 
-    async def search_products_for_customer(self, keywords=None, category_id=None, subcategory_id=None, min_price=None, max_price=None):
+    async def search_products_for_seller(self, seller_id, keywords=None, category_id=None, subcategory_id=None, min_price=None, max_price=None, limit=50, offset=0):
+        """Ranked full-text search over one seller's products (active or not)."""
         db = self.db
-        base = select(Product)
-        if category_id:
-            base = base.filter(Product.category_id == category_id)
-        if subcategory_id:
-            base = base.filter(Product.subcategory_id == subcategory_id)
-        if min_price is not None:
-            base = base.filter(Product.price >= min_price)
-        if max_price is not None:
-            base = base.filter(Product.price <= max_price)
-        products_result = await db.execute(base)
-        products = products_result.scalars().all()
+        filters = CatalogFilters(
+            category_id=category_id or None,
+            subcategory_id=subcategory_id or None,
+            min_price=min_price,
+            max_price=max_price,
+            seller_id=seller_id,
+            active_only=False,
+        )
+        products = await ProductSearchRepository(db).search(keywords, filters, limit=limit, offset=offset)
+        # Images only for the page of matches, in one query
+        main_images = await ProductImageRepository(db).get_primary_urls_by_product_ids([p.product_id for p in products])
         result = []
-        keyword_set = set()
-        if keywords:
-            keyword_set = set(word.lower() for word in keywords.split())
-        image_repo = ProductImageRepository(db)
         for product in products:
-            matches = False
-            text_fields = [getattr(product, 'name', '') or '', getattr(product, 'description', '') or '']
-            if keyword_set:
-                for field in text_fields:
-                    if any(kw in field.lower() for kw in keyword_set):
-                        matches = True
-                        break
-            else:
-                matches = True
-            images = await image_repo.get_by_product_id(product.product_id)
-            if matches:
-                result.append({'product': product, 'images': images})
+            result.append({
+                'product_id': product.product_id,
+                'name': product.name,
+                'image_url': main_images.get(product.product_id),
+                'price': product.price,
+                'category_id': getattr(product, 'category_id', None),
+                'category_name': getattr(product, 'category_name', None),
+                'subcategory_id': getattr(product, 'subcategory_id', None),
+                'subcategory_name': getattr(product, 'subcategory_name', None),
+                'is_available': getattr(product, 'is_available', True),
+                # Add any other fields shown in user product list here
+            })
         return result
 
+    async def search_products_for_customer(self, keywords=None, category_id=None, subcategory_id=None, min_price=None, max_price=None, limit=50, offset=0):
+        """Ranked full-text search over active products, best match first."""
+        db = self.db
+        filters = CatalogFilters(
+            category_id=category_id or None,
+            subcategory_id=subcategory_id or None,
+            min_price=min_price,
+            max_price=max_price,
+        )
+        products = await ProductSearchRepository(db).search(keywords, filters, limit=limit, offset=offset)
+        images = await ProductImageRepository(db).get_by_product_ids([p.product_id for p in products])
+        return [{'product': product, 'images': images.get(product.product_id, [])} for product in products]
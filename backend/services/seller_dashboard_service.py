@@ -0,0 +1,132 @@
+"""
+seller_dashboard_service.py
+
+One payload for the seller portal's landing page.
+
+The dashboard sections are independent reads: product list with stock, this
+month's payout against sales, sales trends from the daily rollup, and
+recent and unanswered comments. `build_seller_dashboard` runs them
+concurrently. Each section gets its own session from the session factory, since
+one AsyncSession cannot run two statements at once. A semaphore caps how many
+run (and hold a pooled connection) at a time, `SELLER_DASHBOARD_CONCURRENCY`
+by default. Each section reports how long it waited for a slot and how long
+it ran. A section that fails is reported with its error and does not fail
+the others.
+"""
+import asyncio
+import datetime
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.config import settings
+from backend.infrastructure.structured_logging import logger
+from backend.repositories.repository.product_comment_repository import ProductCommentRepository
+from backend.repositories.repository.product_repository import ProductRepository
+
+RECENT_COMMENTS = 10
+
+Section = Callable[[AsyncSession], Awaitable[Any]]
+
+
+def _elapsed_ms(since: float) -> float:
+    return round((time.perf_counter() - since) * 1000.0, 2)
+
+
+def seller_sections(
+    seller_id: int,
+    *,
+    today: datetime.date,
+    period: str = 'monthly',
+    start_date: Optional[datetime.date] = None,
+    end_date: Optional[datetime.date] = None,
+) -> Dict[str, Section]:
+    """The dashboard's sections, by name, each a read on the session it is given."""
+    # Imported here: sellerServices pulls in most of the repository layer
+    from backend.services.sellerServices import SellerService
+
+    async def products(db: AsyncSession) -> Any:
+        return await ProductRepository(db).seller_summaries(seller_id)
+
+    async def payout(db: AsyncSession) -> Any:
+        return await SellerService(db).payout_summary(seller_id, today.year, today.month)
+
+    async def sales(db: AsyncSession) -> Any:
+        return await SellerService(db).analyze_orders_for_product(
+            seller_id, period=period, start_date=start_date, end_date=end_date
+        )
+
+    async def comments(db: AsyncSession) -> Any:
+        repo = ProductCommentRepository(db)
+        recent = await repo.get_recent_for_seller(seller_id, limit=RECENT_COMMENTS)
+        return {
+            'unanswered': await repo.count_unanswered_for_seller(seller_id),
+            'recent': [
+                {'comment_id': c.comment_id, 'product_id': c.product_id, 'comment': c.comment,
+                 'response': c.response, 'created_at': c.created_at.isoformat() if c.created_at else None}
+                for c in recent
+            ],
+        }
+
+    return {'products': products, 'payout': payout, 'sales': sales, 'comments': comments}
+
+
+async def run_sections(
+    sections: Dict[str, Section],
+    *,
+    session_factory: Optional[Any] = None,
+    concurrency: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Run every section on its own session, at most `concurrency` at a time.
+
+    Returns {'sections': name -> result (None if it failed), 'timing':
+    {'total_ms', 'concurrency', 'sections': name -> {'wait_ms', 'ms', 'ok'
+    and 'error' on failure}}}.
+    """
+    if session_factory is None:
+        from backend.persistance.async_base import AsyncSessionLocal as session_factory
+    limit = max(1, concurrency or settings.SELLER_DASHBOARD_CONCURRENCY or 1)
+    slots = asyncio.Semaphore(limit)
+    started = time.perf_counter()
+
+    async def run(name: str, section: Section) -> tuple:
+        queued = time.perf_counter()
+        async with slots:
+            wait_ms = _elapsed_ms(queued)
+            began = time.perf_counter()
+            try:
+                async with session_factory() as session:
+                    result = await section(session)
+                return name, result, {'wait_ms': wait_ms, 'ms': _elapsed_ms(began), 'ok': True}
+            except Exception as e:
+                logger.exception("seller_dashboard.section_failed", section=name, error=str(e))
+                return name, None, {'wait_ms': wait_ms, 'ms': _elapsed_ms(began), 'ok': False, 'error': str(e)}
+
+    outcomes = await asyncio.gather(*[run(name, section) for name, section in sections.items()])
+    return {
+        'sections': {name: result for name, result, _ in outcomes},
+        'timing': {
+            'total_ms': _elapsed_ms(started),
+            'concurrency': limit,
+            'sections': {name: timing for name, _, timing in outcomes},
+        },
+    }
+
+
+async def build_seller_dashboard(
+    seller_id: int,
+    *,
+    period: str = 'monthly',
+    start_date: Optional[datetime.date] = None,
+    end_date: Optional[datetime.date] = None,
+    today: Optional[datetime.date] = None,
+    session_factory: Optional[Any] = None,
+    concurrency: Optional[int] = None,
+) -> Dict[str, Any]:
+    """The seller's dashboard: every section's result plus per-section timing."""
+    today = today or datetime.date.today()
+    sections = seller_sections(seller_id, today=today, period=period, start_date=start_date, end_date=end_date)
+    payload = await run_sections(sections, session_factory=session_factory, concurrency=concurrency)
+    return {'seller_id': seller_id, **payload}
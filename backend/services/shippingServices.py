@@ -22,6 +22,7 @@ from backend.repositories.repository.shipment_issue_repository import ShipmentIs
 import json
 from datetime import datetime
 from sqlalchemy.ext.asyncio import AsyncSession
+from backend.persistance.unit_of_work import auto_commit
 
 
 async def delete_shipment_issue(db: AsyncSession, issue_id: int):
@@ -46,7 +47,7 @@ async def delete_shipment_issue(db: AsyncSession, issue_id: int):
     if not issue:
         return False
     await db.delete(issue)
-    await db.commit()
+    await auto_commit(db)
     return True
 
 async def create_shipment_event(db: AsyncSession, shipment_id: int, status: str, description: str, location: str, occurred_at: datetime):
@@ -144,16 +145,15 @@ async def create_shipment(db: AsyncSession, order_id: int, shipment_status, ship
     # Create ShipmentItems for each OrderItem in the order
     order_item_repo = OrderItemRepository(db)
     order_items = await order_item_repo.get_by_order_id(order_id)
-    for item in order_items:
-        db.add(ShipmentItem(
-            shipment_item_id=None,
-            shipment_id=shipment.shipment_id,
-            product_id=item.product_id,
-            variant_id=item.variant_id,
-            quantity=item.quantity,
-            subtotal=item.subtotal
-        ))
-    await db.commit()
+    await ShipmentItemRepository(db).bulk_create(
+        {
+            'shipment_id': shipment.shipment_id,
+            'product_id': item.product_id,
+            'variant_id': item.variant_id,
+            'quantity': item.quantity,
+        } for item in order_items
+    )
+    await auto_commit(db)
     # Build response matching ShipmentResponse schema
     status_str = shipment.shipment_status.value if hasattr(shipment.shipment_status, 'value') else str(shipment.shipment_status)
     return {
@@ -0,0 +1,126 @@
+"""
+stock_hold_service.py
+
+Time-limited stock holds for checkout.
+
+Entering checkout takes the user's variant quantities out of stock once, as
+holds that expire after `STOCK_HOLD_TTL_SECONDS`. Completing the order
+converts the holds, which only updates the user's own stock_hold rows, so the
+hot product_variant rows are not locked again while the order is written.
+Holds that expire unconverted are returned to stock by `sweep`, a batch at a
+time with one UPDATE on stock_hold and one on product_variant. The app runs
+`run_sweeper` in the background when `STOCK_HOLD_SWEEP_INTERVAL_SECONDS` is
+set; `python -m backend.scripts.sweep_stock_holds` does one pass from cron.
+"""
+import asyncio
+import datetime
+from typing import Any, Dict, Iterable, List, Mapping, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.config import settings
+from backend.infrastructure.structured_logging import logger
+from backend.persistance.catalog_version import utcnow
+from backend.persistance.stock_hold import HOLD_CONVERTED, HOLD_RELEASED, StockHold
+from backend.persistance.unit_of_work import UnitOfWork
+from backend.repositories.repository.product_variant_repository import ProductVariantRepository
+from backend.repositories.repository.stock_hold_repository import StockHoldRepository
+
+SWEEP_BATCH_SIZE = 1000
+
+
+def _by_variant(holds: Iterable[StockHold]) -> Dict[int, int]:
+    totals: Dict[int, int] = {}
+    for hold in holds:
+        totals[hold.variant_id] = totals.get(hold.variant_id, 0) + hold.quantity
+    return totals
+
+
+class StockHoldService:
+    """Grants, converts, releases and sweeps stock holds. Each call is one transaction."""
+
+    def __init__(self, db: AsyncSession, *, ttl_seconds: Optional[float] = None):
+        self.db = db
+        self.ttl = datetime.timedelta(
+            seconds=settings.STOCK_HOLD_TTL_SECONDS if ttl_seconds is None else ttl_seconds
+        )
+        self.holds = StockHoldRepository(db)
+        self.variants = ProductVariantRepository(db)
+
+    async def hold(
+        self, user_id: int, quantities: Mapping[int, int], *, now: Optional[datetime.datetime] = None
+    ) -> List[StockHold]:
+        """Hold `quantities` (variant_id -> qty) for the user, replacing the holds they already have.
+
+        Only the difference from the previous holds touches variant stock. If
+        any variant is short, `InsufficientStockError` is raised and the
+        previous holds stay as they were.
+        """
+        now = now or utcnow()
+        wanted = {vid: qty for vid, qty in quantities.items() if qty > 0}
+        async with UnitOfWork(self.db):
+            previous = await self.holds.get_active_by_user(user_id)
+            held = _by_variant(await self.holds.close([h.hold_id for h in previous], HOLD_RELEASED))
+            await self.variants.reserve_stock(
+                {vid: qty - held.get(vid, 0) for vid, qty in wanted.items() if qty > held.get(vid, 0)}
+            )
+            await self.variants.release_stock(
+                {vid: qty - wanted.get(vid, 0) for vid, qty in held.items() if qty > wanted.get(vid, 0)}
+            )
+            return await self.holds.add_many(user_id, wanted, now=now, expires_at=now + self.ttl)
+
+    async def convert(
+        self, user_id: int, quantities: Mapping[int, int], *, now: Optional[datetime.datetime] = None
+    ) -> Dict[int, int]:
+        """Convert the user's unexpired holds on these variants into the order's stock decrement.
+
+        Held units beyond what the order needs go back to stock. Returns the
+        quantities (variant_id -> qty) the holds did not cover, which the
+        caller still has to reserve.
+        """
+        now = now or utcnow()
+        async with UnitOfWork(self.db):
+            live = await self.holds.get_active_by_user(user_id, now=now)
+            converted = await self.holds.close(
+                [h.hold_id for h in live if h.variant_id in quantities], HOLD_CONVERTED
+            )
+            held = _by_variant(converted)
+            await self.variants.release_stock(
+                {vid: qty - quantities[vid] for vid, qty in held.items() if qty > quantities[vid]}
+            )
+        return {vid: qty - held.get(vid, 0) for vid, qty in quantities.items() if qty > held.get(vid, 0)}
+
+    async def release(self, user_id: int) -> int:
+        """Give every active hold of the user back to stock; returns the number of holds released."""
+        async with UnitOfWork(self.db):
+            previous = await self.holds.get_active_by_user(user_id)
+            released = await self.holds.close([h.hold_id for h in previous], HOLD_RELEASED)
+            await self.variants.release_stock(_by_variant(released))
+        return len(released)
+
+    async def sweep(self, *, now: Optional[datetime.datetime] = None, batch_size: int = SWEEP_BATCH_SIZE) -> int:
+        """Return every hold that expired by `now` to stock; returns the number of holds swept."""
+        now = now or utcnow()
+        total = 0
+        while True:
+            async with UnitOfWork(self.db):
+                expired = await self.holds.expire_due(now, limit=batch_size)
+                await self.variants.release_stock(_by_variant(expired))
+            total += len(expired)
+            if len(expired) < batch_size:
+                return total
+
+
+async def run_sweeper(interval: float, session_factory: Optional[Any] = None) -> None:
+    """Sweep expired holds every `interval` seconds until cancelled."""
+    if session_factory is None:
+        from backend.persistance.async_base import AsyncSessionLocal as session_factory
+    while True:
+        try:
+            async with session_factory() as session:
+                swept = await StockHoldService(session).sweep()
+            if swept:
+                logger.info("stock_holds.swept", holds=swept)
+        except Exception as e:
+            logger.exception("stock_holds.sweep_failed", error=str(e))
+        await asyncio.sleep(interval)
@@ -0,0 +1,195 @@
+"""
+taxonomy_cache.py
+
+Process-wide, versioned cache of the category/subcategory taxonomy.
+
+The taxonomy only changes when `seed_categories`, `assign_images` or an admin
+writes Category/Subcategory rows, yet every catalog request used to re-read it.
+Snapshots are loaded lazily on first use (two queries), kept per database
+engine, and dropped whenever a session commits a write to either table.
+
+Commit invalidation is only visible inside the writing process. Callers that
+already know the shared taxonomy version (the `catalog_version` row read for
+conditional GETs) pass it as `db_version`, which makes every worker reload as
+soon as another one commits. Elsewhere, multi-worker deployments should set
+`TAXONOMY_CACHE_TTL_SECONDS` so other workers reload within a bounded delay.
+"""
+from __future__ import annotations
+
+import time
+import weakref
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from backend.config import settings
+from backend.infrastructure.storage import static_url as _static_url
+from backend.persistance.category import Category
+from backend.persistance.subcategory import Subcategory
+
+_TAXONOMY_TABLES = frozenset({Category.__tablename__, Subcategory.__tablename__})
+_DIRTY_KEY = "taxonomy_cache_dirty"
+
+
+@dataclass(frozen=True)
+class TaxonomySnapshot:
+    """Immutable view of the taxonomy at one cache version."""
+    version: int
+    loaded_at: float
+    # Shared catalog_version "taxonomy" counter the caller saw before loading
+    db_version: Optional[int] = None
+    # category_id -> {"name", "image_url"} (raw stored image paths)
+    categories: dict[int, dict[str, Any]] = field(default_factory=dict)
+    # subcategory_id -> {"category_id", "name", "image_url"}
+    subcategories: dict[int, dict[str, Any]] = field(default_factory=dict)
+    # Prebuilt `/api/categories` payload with static URLs resolved
+    tree: list[dict[str, Any]] = field(default_factory=list)
+
+    def category_name(self, category_id: Optional[int]) -> Optional[str]:
+        entry = self.categories.get(category_id) if category_id is not None else None
+        return entry["name"] if entry else None
+
+    def category_image(self, category_id: Optional[int]) -> Optional[str]:
+        entry = self.categories.get(category_id) if category_id is not None else None
+        return entry["image_url"] if entry else None
+
+    def subcategory_name(self, subcategory_id: Optional[int]) -> Optional[str]:
+        entry = self.subcategories.get(subcategory_id) if subcategory_id is not None else None
+        return entry["name"] if entry else None
+
+    def subcategory_image(self, subcategory_id: Optional[int]) -> Optional[str]:
+        entry = self.subcategories.get(subcategory_id) if subcategory_id is not None else None
+        return entry["image_url"] if entry else None
+
+    def category_node(self, category_id: int) -> Optional[dict[str, Any]]:
+        """Return the prebuilt tree node for one category, or None."""
+        for node in self.tree:
+            if node["category_id"] == category_id:
+                return node
+        return None
+
+
+class TaxonomyCache:
+    """Lazily loaded taxonomy snapshots keyed by database engine."""
+
+    def __init__(self, ttl_seconds: Optional[float] = None):
+        self.ttl_seconds = ttl_seconds
+        self.version = 0
+        self._snapshots: "weakref.WeakKeyDictionary[Any, TaxonomySnapshot]" = weakref.WeakKeyDictionary()
+
+    def invalidate(self) -> None:
+        """Drop every cached snapshot; the next reader reloads."""
+        self.version += 1
+        self._snapshots.clear()
+
+    def _fresh(self, snap: Optional[TaxonomySnapshot], db_version: Optional[int] = None) -> bool:
+        if snap is None or snap.version != self.version:
+            return False
+        if db_version is not None and snap.db_version != db_version:
+            return False
+        if self.ttl_seconds is not None and time.monotonic() - snap.loaded_at >= self.ttl_seconds:
+            return False
+        return True
+
+    async def get(self, db: AsyncSession, db_version: Optional[int] = None) -> TaxonomySnapshot:
+        """Return the current snapshot for the database behind `db`, loading it if needed.
+
+        A snapshot loaded under a different `db_version` is treated as stale.
+        Concurrent cold reads may each load once; that is cheaper than
+        serializing every reader behind a lock.
+        """
+        key = db.bind.sync_engine if db.bind is not None else _unbound
+        snap = self._snapshots.get(key)
+        if self._fresh(snap, db_version):
+            return snap  # type: ignore[return-value]
+        version = self.version
+        snap = await self._load(db, version, db_version)
+        # Skip installing if a write invalidated the cache while we loaded
+        if version == self.version:
+            self._snapshots[key] = snap
+        return snap
+
+    @staticmethod
+    async def _load(db: AsyncSession, version: int, db_version: Optional[int] = None) -> TaxonomySnapshot:
+        cat_rows = (await db.execute(
+            select(Category.category_id, Category.name, Category.image_url).order_by(Category.category_id)
+        )).all()
+        sub_rows = (await db.execute(
+            select(Subcategory.subcategory_id, Subcategory.category_id, Subcategory.name, Subcategory.image_url)
+            .order_by(Subcategory.subcategory_id)
+        )).all()
+        categories = {cid: {"name": name, "image_url": img} for cid, name, img in cat_rows}
+        subcategories = {
+            sid: {"category_id": cid, "name": name, "image_url": img}
+            for sid, cid, name, img in sub_rows
+        }
+        children: dict[int, list[dict[str, Any]]] = {}
+        for sid, cid, name, img in sub_rows:
+            children.setdefault(cid, []).append({
+                "subcategory_id": sid,
+                "name": name or "",
+                "image_url": _static_url(img),
+            })
+        tree = [
+            {
+                "category_id": cid,
+                "name": name or "",
+                "image_url": _static_url(img),
+                "subcategories": children.get(cid, []),
+            }
+            for cid, name, img in cat_rows
+        ]
+        return TaxonomySnapshot(
+            version=version,
+            loaded_at=time.monotonic(),
+            db_version=db_version,
+            categories=categories,
+            subcategories=subcategories,
+            tree=tree,
+        )
+
+
+class _Unbound:
+    """Weak-referenceable cache key for sessions without a bound engine."""
+
+
+_unbound = _Unbound()
+
+taxonomy_cache = TaxonomyCache(ttl_seconds=settings.TAXONOMY_CACHE_TTL_SECONDS)
+
+
+# ------------------------------------------------------------------------------
+# Write invalidation: any committed ORM flush or bulk statement touching the
+# category/subcategory tables drops the cache.
+# ------------------------------------------------------------------------------
+@event.listens_for(Session, "after_flush")
+def _mark_taxonomy_flush(session: Session, flush_context: Any) -> None:
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(obj, (Category, Subcategory)):
+            session.info[_DIRTY_KEY] = True
+            return
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _mark_taxonomy_bulk(orm_execute_state: Any) -> None:
+    if not (orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete):
+        return
+    table = getattr(orm_execute_state.statement, "table", None)
+    if getattr(table, "name", None) in _TAXONOMY_TABLES:
+        orm_execute_state.session.info[_DIRTY_KEY] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_on_commit(session: Session) -> None:
+    if session.info.pop(_DIRTY_KEY, False):
+        taxonomy_cache.invalidate()
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_on_rollback(session: Session, previous_transaction: Any) -> None:
+    # A savepoint rollback leaves the enclosing transaction's writes in place
+    if not previous_transaction.nested:
+        session.info.pop(_DIRTY_KEY, None)
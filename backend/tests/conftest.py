@@ -62,6 +62,17 @@ def override_db_dependency():
 def client():
     return TestClient(app)
 
+# ---------------------------------------------------------------
+# Keep uploaded files out of the working tree
+# ---------------------------------------------------------------
+@pytest.fixture(autouse=True)
+def upload_root(tmp_path, monkeypatch):
+    from backend.api import routes_uploads
+    root = tmp_path / "uploads"
+    root.mkdir()
+    monkeypatch.setattr(routes_uploads, "UPLOAD_ROOT", str(root))
+    return root
+
 # ---------------------------------------------------------------
 # Event loop (required on Windows)
 # ---------------------------------------------------------------
@@ -0,0 +1,156 @@
+import asyncio
+
+from backend.benchmarks import cart_operations
+
+
+def _run(fn, n_products=12):
+    from backend.benchmarks._support import make_engine, seed_catalog, seed_variants
+
+    async def run():
+        engine, Session = await make_engine()
+        try:
+            async with Session() as session:
+                await seed_variants(session, await seed_catalog(session, n_products))
+            async with Session() as session:
+                return await fn(session)
+        finally:
+            await engine.dispose()
+
+    return asyncio.run(run())
+
+
+def test_cart_operations_statement_count_is_flat():
+    small = asyncio.run(cart_operations.measure(5, n_products=50))
+    large = asyncio.run(cart_operations.measure(300, n_products=50))
+    # Cart, items, products, product images, variants, variant images,
+    # one DELETE/UPDATE/INSERT each and the cart timestamp
+    assert small["queries"] <= large["queries"] <= 10
+    assert small["commits"] == large["commits"] == 1
+    one_by_one = asyncio.run(cart_operations.measure(300, n_products=50, batched=False))
+    assert one_by_one["commits"] > 100
+
+
+def test_cart_operations_merge_clamp_and_report():
+    from sqlalchemy import insert, select, update
+    from backend.api.routes_customer import apply_cart_operations_route
+    from backend.persistance.cart import Cart
+    from backend.persistance.cart_item import CartItem
+    from backend.persistance.product import Product
+    from backend.schemas.schemas_customer import CartOperationsRequest
+
+    async def fn(session):
+        await session.execute(insert(Cart).values(cart_id=5, user_id=1))
+        await session.execute(insert(CartItem), [
+            {"cart_item_id": 1, "cart_id": 5, "product_id": 3, "variant_id": 6, "quantity": 1},
+            {"cart_item_id": 2, "cart_id": 5, "product_id": 3, "variant_id": 6, "quantity": 1},
+            {"cart_item_id": 3, "cart_id": 5, "product_id": 4, "variant_id": 8, "quantity": 2},
+            {"cart_item_id": 4, "cart_id": 5, "product_id": 2, "variant_id": None, "quantity": 1},
+        ])
+        await session.execute(update(Product).where(Product.product_id == 11).values(is_active=False))
+        await session.commit()
+        payload = CartOperationsRequest(operations=[
+            {"op": "add", "product_id": 3, "variant_id": 6, "quantity": 1},
+            {"op": "update", "product_id": 4, "variant_id": 8, "quantity": 50},
+            {"op": "remove", "product_id": 2},
+            {"op": "add", "product_id": 11, "quantity": 1},
+            {"op": "add", "product_id": 9, "variant_id": 19, "quantity": 1},
+            {"op": "add", "product_id": 5, "variant_id": 7, "quantity": 1},
+            {"op": "add", "product_id": 7, "quantity": 2},
+        ])
+        response = await apply_cart_operations_route(payload, identity={"user_id": 1}, db=session)
+        stored = (await session.execute(
+            select(CartItem.cart_item_id, CartItem.product_id, CartItem.variant_id, CartItem.quantity)
+            .order_by(CartItem.cart_item_id)
+        )).all()
+        return response, [tuple(row) for row in stored]
+
+    response, stored = _run(fn)
+    assert response.cart_id == 5
+    results = [(r.applied, r.quantity, r.message) for r in response.results]
+    assert results == [
+        (True, 3, None),                                    # duplicates folded, then added to
+        (True, 4, "Quantity reduced to available stock"),
+        (True, 0, None),
+        (False, 0, "Product not available"),
+        (False, 0, "Variant out of stock"),
+        (False, 0, "Variant not available"),                # variant 7 belongs to product 3
+        (True, 2, None),
+    ]
+    assert stored[:2] == [(1, 3, 6, 3), (3, 4, 8, 4)]
+    assert [row[1:] for row in stored[2:]] == [(7, None, 2)]
+    items = {item["product_id"]: item for item in response.items}
+    assert [(i["cart_item_id"], i["quantity"]) for i in response.items] == [(row[0], row[3]) for row in stored]
+    assert items[4]["variant_id"] == 8 and items[4]["price"] == 6.0
+    assert items[7]["product_name"] == "Product 7"
+
+
+def test_cart_operations_create_cart_and_roll_back_together():
+    import pytest
+    from sqlalchemy import func, select, text
+    from backend.persistance.cart import Cart
+    from backend.persistance.cart_item import CartItem
+    from backend.schemas.schemas_customer import CartOperationsRequest
+    from backend.services.customerServices import apply_cart_operations
+
+    async def fn(session):
+        ops = CartOperationsRequest(operations=[{"op": "add", "product_id": 1, "quantity": 1}]).operations
+        first = await apply_cart_operations(1, ops, session)
+        # An unknown user fails the cart FK; nothing of that batch is kept
+        await session.execute(text("PRAGMA foreign_keys=ON"))
+        with pytest.raises(Exception):
+            await apply_cart_operations(999, ops, session)
+        await session.rollback()
+        carts = await session.scalar(select(func.count()).select_from(Cart))
+        items = await session.scalar(select(func.count()).select_from(CartItem))
+        return first, carts, items
+
+    first, carts, items = _run(fn)
+    assert len(first["items"]) == 1 and first["items"][0]["quantity"] == 1
+    assert carts == 1 and items == 1
+
+
+def test_merge_guest_cart_dedupes_and_clamps_in_one_query():
+    from sqlalchemy import insert, select, update
+    from backend.api.routes_customer import merge_guest_cart_route
+    from backend.benchmarks._support import QueryCounter
+    from backend.persistance.cart import Cart
+    from backend.persistance.cart_item import CartItem
+    from backend.persistance.product import Product
+    from backend.repositories.repository.product_variant_repository import ProductVariantRepository
+    from backend.schemas.schemas_customer import GuestCartMergeRequest
+
+    async def fn(session):
+        await session.execute(insert(Cart).values(cart_id=5, user_id=1))
+        await session.execute(insert(CartItem).values(cart_item_id=1, cart_id=5, product_id=3, variant_id=6, quantity=2))
+        await session.execute(update(Product).where(Product.product_id == 11).values(is_active=False))
+        await session.commit()
+        counter = QueryCounter(session.bind)
+        with counter.track():
+            clamped = await ProductVariantRepository(session).clamp_to_stock([(4, 8, 9), (9, 19, 1), (2, None, 7)])
+        payload = GuestCartMergeRequest(items=[
+            {"product_id": 3, "variant_id": 6, "quantity": 1},
+            {"product_id": 3, "variant_id": 6, "quantity": 1},
+            {"product_id": 4, "variant_id": 8, "quantity": 2},
+            {"product_id": 11, "quantity": 1},
+            {"product_id": 5, "variant_id": 7, "quantity": 1},
+            {"product_id": 7, "quantity": 5},
+        ])
+        response = await merge_guest_cart_route(payload, identity={"user_id": 1}, db=session)
+        stored = (await session.execute(
+            select(CartItem.product_id, CartItem.variant_id, CartItem.quantity).order_by(CartItem.cart_item_id)
+        )).all()
+        return counter.count, clamped, response, [tuple(row) for row in stored]
+
+    queries, clamped, response, stored = _run(fn)
+    assert queries == 1
+    # Variant 19 has no stock; product-only lines keep the requested quantity
+    assert clamped == {(4, 8): 4, (9, 19): 0, (2, None): 7}
+    assert [(r.product_id, r.applied, r.quantity, r.message) for r in response.results] == [
+        (3, True, 3, "Quantity reduced to available stock"),
+        (4, True, 2, None),
+        (11, False, 0, "Product not available"),
+        (5, False, 0, "Product not available"),
+        (7, True, 5, None),
+    ]
+    assert stored == [(3, 6, 3), (4, 8, 2), (7, None, 5)]
+    assert [i["quantity"] for i in response.items] == [3, 2, 5]
@@ -0,0 +1,90 @@
+import asyncio
+
+from sqlalchemy import select, update
+
+from backend.benchmarks._support import make_engine, seed_catalog
+from backend.persistance.catalog_card import CatalogCard
+from backend.persistance.category import Category
+from backend.repositories.repository.catalog_card_repository import CatalogCardRepository
+from backend.services.sellerServices import SellerService
+
+
+async def _cards(session):
+    rows = (await session.execute(select(CatalogCard).order_by(CatalogCard.product_id))).scalars().all()
+    return {
+        c.product_id: (c.title, float(c.price), c.image_url, c.category_name, c.subcategory_name)
+        for c in rows
+    }
+
+
+def test_seller_writes_keep_cards_current(tmp_path, monkeypatch):
+    # SellerService creates image folders relative to the working directory
+    monkeypatch.chdir(tmp_path)
+
+    async def run():
+        engine, Session = await make_engine()
+        try:
+            async with Session() as session:
+                await seed_catalog(session, 6)
+                service = SellerService(session)
+                created = await service.create_product(
+                    seller_id=1, category_id=2, subcategory_id=2, name="Desk Lamp",
+                    description="Warm light", price=40,
+                )
+                pid = created['id']
+                cards = await _cards(session)
+                # No product image: falls back to the subcategory image
+                assert cards[pid] == ("Desk Lamp", 40.0, "/static/subcategories/2.jpg", "Category 2", "Subcategory 2")
+
+                await service.edit_product({'product_id': pid, 'title': "Desk Lamp XL", 'price': 55})
+                assert (await _cards(session))[pid][:2] == ("Desk Lamp XL", 55.0)
+
+                await service.delete_product(pid)
+                assert pid not in await _cards(session)
+
+                await session.execute(update(Category).where(Category.category_id == 2).values(name="Lighting"))
+                assert await CatalogCardRepository(session).refresh_taxonomy(category_ids=[2]) == 2
+                await session.commit()
+                incremental = await _cards(session)
+                assert incremental[1][3] == "Lighting"
+
+                # A full rebuild produces exactly the incrementally maintained cards
+                assert await CatalogCardRepository(session).rebuild(batch_size=4) == 6
+                await session.commit()
+                assert await _cards(session) == incremental
+        finally:
+            await engine.dispose()
+
+    asyncio.run(run())
+
+
+def test_price_less_products_get_cards_that_sort_last():
+    from backend.persistance.product import Product
+    from backend.repositories.repository.catalog_repository import CatalogFilters, CatalogRepository
+
+    async def run():
+        engine, Session = await make_engine()
+        try:
+            async with Session() as session:
+                await seed_catalog(session, 3)
+                await session.execute(update(Product).where(Product.product_id == 2).values(price=None))
+                cards = CatalogCardRepository(session)
+                assert await cards.refresh_products([2]) == 1
+                await session.commit()
+                assert (await session.get(CatalogCard, 2)).price is None
+
+                assert await cards.rebuild() == 3
+                await session.commit()
+                repo = CatalogRepository(session)
+                first = await repo.list_page(CatalogFilters(), sort="price", limit=2)
+                last_row = first[-1]
+                rest = await repo.list_page(
+                    CatalogFilters(), sort="price", limit=2, after=(last_row[3], last_row[0])
+                )
+                return [row[0] for row in first + rest], [row[3] for row in first + rest]
+        finally:
+            await engine.dispose()
+
+    ids, prices = asyncio.run(run())
+    assert ids == [1, 3, 2]
+    assert prices[-1] is None
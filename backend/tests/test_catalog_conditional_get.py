@@ -0,0 +1,98 @@
+import asyncio
+
+from fastapi import Response
+from sqlalchemy import update
+
+from backend.benchmarks._support import QueryCounter, make_engine, make_request, seed_catalog
+from backend.persistance.catalog_version import CATALOG_SCOPE, SCOPES, TAXONOMY_SCOPE, bump
+from backend.persistance.category import Category
+from backend.persistance.product import Product
+from backend.repositories.repository.catalog_card_repository import CatalogCardRepository
+from backend.repositories.repository.catalog_version_repository import CatalogVersionRepository
+
+
+def _with_catalog(fn, n_products=10):
+    async def run():
+        engine, Session = await make_engine()
+        try:
+            async with Session() as session:
+                await seed_catalog(session, n_products)
+            return await fn(Session, QueryCounter(engine))
+        finally:
+            await engine.dispose()
+
+    return asyncio.run(run())
+
+
+async def _detail(session, product_id, headers=None):
+    from backend.api.routes_catalog import get_product
+    response = Response()
+    result = await get_product(product_id, make_request(headers), response, db=session)
+    return (result if isinstance(result, Response) else response), result
+
+
+async def _categories(session):
+    from backend.api.routes_catalog import list_categories
+    return await list_categories(make_request(), Response(), db=session)
+
+
+def test_product_detail_revalidates_until_a_write_commits():
+    async def fn(Session, counter):
+        async with Session() as session:
+            first, body = await _detail(session, 4)
+            etag = first.headers["etag"]
+            assert body["product"]["id"] == 4
+            with counter.track():
+                cached, _ = await _detail(session, 4, {"If-None-Match": etag})
+            assert cached.status_code == 304 and cached.headers["etag"] == etag
+            # Answered from the version row alone
+            assert counter.count == 1
+            since, _ = await _detail(session, 4, {"If-Modified-Since": first.headers["last-modified"]})
+            assert since.status_code == 304
+
+        async with Session() as session:
+            product = await session.get(Product, 4)
+            product.title = "Renamed"
+            await session.rollback()
+            unchanged, _ = await _detail(session, 4, {"If-None-Match": etag})
+            assert unchanged.status_code == 304
+            product = await session.get(Product, 4)
+            product.title = "Renamed"
+            await CatalogCardRepository(session).refresh_products([4])
+            await session.commit()
+
+        async with Session() as session:
+            fresh, body = await _detail(session, 4, {"If-None-Match": etag})
+            assert fresh.status_code == 200 and fresh.headers["etag"] != etag
+            assert body["product"]["name"] == "Renamed"
+        return True
+
+    assert _with_catalog(fn)
+
+
+def test_bulk_writes_bump_only_their_scope():
+    async def fn(Session, counter):
+        async with Session() as session:
+            repo = CatalogVersionRepository(session)
+            before = await repo.get(SCOPES)
+            await session.execute(update(Product).values(price=Product.price + 1))
+            await session.commit()
+            mid = await repo.get(SCOPES)
+            assert mid[CATALOG_SCOPE].version == before[CATALOG_SCOPE].version + 1
+            assert mid[TAXONOMY_SCOPE].version == before[TAXONOMY_SCOPE].version
+
+            await session.execute(update(Category).where(Category.category_id == 1).values(name="Shoes"))
+            await session.commit()
+            after = await repo.get(SCOPES)
+            assert after[TAXONOMY_SCOPE].version == mid[TAXONOMY_SCOPE].version + 1
+            assert after[CATALOG_SCOPE].version == mid[CATALOG_SCOPE].version
+            assert (await _categories(session))["categories"][0]["name"] == "Shoes"
+
+        # Another worker's write: no local session events, only the shared version moves
+        async with counter.engine.begin() as conn:
+            await conn.execute(update(Category).where(Category.category_id == 1).values(name="Boots"))
+            await conn.run_sync(lambda sync_conn: bump(sync_conn, [TAXONOMY_SCOPE]))
+        async with Session() as session:
+            return (await _categories(session))["categories"][0]["name"]
+
+    assert _with_catalog(fn) == "Boots"
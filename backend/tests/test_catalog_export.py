@@ -0,0 +1,61 @@
+import asyncio
+import csv
+import datetime
+import io
+import json
+
+from sqlalchemy import update
+
+from backend.api.routes_catalog import export_products, list_products
+from backend.benchmarks._support import make_engine, make_request, seed_catalog
+from backend.persistance.catalog_card import CatalogCard
+from fastapi import Response
+
+
+async def _export(session, fmt="ndjson", **params):
+    kwargs = dict(since=None, after_id=None, category_id=None, subcategory_id=None, min_price=None, max_price=None)
+    kwargs.update(params)
+    response = await export_products(format=fmt, db=session, **kwargs)
+    body = "".join([chunk async for chunk in response.body_iterator])
+    return response, body
+
+
+def test_export_streams_every_card_and_resumes():
+    async def run():
+        engine, Session = await make_engine()
+        try:
+            async with Session() as session:
+                await seed_catalog(session, 25)
+            async with Session() as session:
+                listing = await list_products(
+                    make_request(), Response(), limit=200, cursor=None, sort="id", order="asc",
+                    category_id=None, subcategory_id=None, min_price=None, max_price=None, db=session,
+                )
+                response, body = await _export(session)
+                assert response.media_type == "application/x-ndjson"
+                started_at = response.headers["x-export-started-at"]
+                items = [json.loads(line) for line in body.splitlines()]
+                # Same items, in the same order, as the listing endpoint
+                assert items == listing["items"]
+
+                # Resume after the 10th row
+                _, body = await _export(session, after_id=items[9]["id"])
+                assert [json.loads(line)["id"] for line in body.splitlines()] == [i["id"] for i in items[10:]]
+
+                _, body = await _export(session, "csv", category_id=2)
+                rows = list(csv.DictReader(io.StringIO(body)))
+                assert [int(r["id"]) for r in rows] == [i["id"] for i in items if i["category_id"] == 2]
+                assert rows[0]["name"] == items[[i["category_id"] for i in items].index(2)]["name"]
+
+                # Incremental export: only cards refreshed after the previous export started
+                later = datetime.datetime.fromisoformat(started_at.rstrip("Z")) + datetime.timedelta(seconds=1)
+                await session.execute(
+                    update(CatalogCard).where(CatalogCard.product_id.in_([3, 7])).values(refreshed_at=later)
+                )
+                await session.commit()
+                _, body = await _export(session, since=datetime.datetime.fromisoformat(started_at.rstrip("Z")))
+                assert [json.loads(line)["id"] for line in body.splitlines()] == [3, 7]
+        finally:
+            await engine.dispose()
+
+    asyncio.run(run())
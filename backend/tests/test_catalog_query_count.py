@@ -0,0 +1,236 @@
+import asyncio
+
+from backend.benchmarks.catalog_listing import measure
+
+
+def _run_catalog(n_products, fn):
+    from backend.benchmarks._support import make_engine, seed_catalog
+
+    async def run():
+        engine, Session = await make_engine()
+        try:
+            async with Session() as session:
+                await seed_catalog(session, n_products)
+            async with Session() as session:
+                return await fn(session)
+        finally:
+            await engine.dispose()
+
+    return asyncio.run(run())
+
+
+def _list(session, **params):
+    from fastapi import Response
+    from backend.api.routes_catalog import list_products
+    from backend.benchmarks._support import make_request
+    args = dict(request=make_request(), response=Response(), limit=50, cursor=None, sort="id", order="asc", category_id=None,
+                subcategory_id=None, min_price=None, max_price=None)
+    args.update(params)
+    return list_products(db=session, **args)
+
+
+def test_catalog_listing_query_count_is_flat():
+    small = asyncio.run(measure(5))
+    large = asyncio.run(measure(400))
+    assert small["items"] == 5
+    assert large["items"] == 50
+    # Version row + one catalog_card range scan
+    assert small["queries"] == large["queries"] == 2
+    assert large["deep_queries"] == 2
+    # A poll with a current ETag only reads the version row
+    assert large["revalidate_queries"] == 1
+
+
+def test_catalog_listing_image_fallbacks():
+    async def fn(session):
+        return (await _list(session))["items"]
+
+    items = {i["id"]: i for i in _run_catalog(4, fn)}
+    # Even ids carry a product image; odd ids fall back to their subcategory image
+    assert items[2]["image_url"] == "/static/product_images/2_0.jpg"
+    assert items[1]["image_url"] == "/static/subcategories/2.jpg"
+    assert items[1]["category"] == "Category 2"
+    assert items[1]["subcategory"] == items[1]["subcategory_name"] == "Subcategory 2"
+
+
+def test_catalog_keyset_pages_cover_catalog_once():
+    async def fn(session):
+        pages = {}
+        for sort in ("price", "title", "created_at"):
+            for order in ("asc", "desc"):
+                seen, cursor = [], None
+                while True:
+                    page = await _list(session, limit=7, cursor=cursor, sort=sort, order=order)
+                    seen.extend(i["id"] for i in page["items"])
+                    cursor = page["next_cursor"]
+                    if cursor is None:
+                        break
+                pages[(sort, order)] = seen
+        return pages
+
+    pages = _run_catalog(30, fn)
+    for seen in pages.values():
+        assert sorted(seen) == list(range(1, 31))
+    # Seeded prices rise with product id, created_at falls with it
+    assert pages[("price", "asc")] == list(range(1, 31))
+    assert pages[("created_at", "desc")] == list(range(1, 31))
+
+
+def test_catalog_filters_and_bad_cursor():
+    from fastapi import HTTPException
+
+    async def fn(session):
+        filtered = await _list(session, category_id=2, min_price=5, max_price=20)
+        try:
+            await _list(session, cursor="not-a-cursor", sort="price")
+        except HTTPException as exc:
+            return filtered, exc.status_code
+        return filtered, None
+
+    filtered, status = _run_catalog(30, fn)
+    assert filtered["items"]
+    assert all(i["category_id"] == 2 and 5 <= i["price"] <= 20 for i in filtered["items"])
+    assert status == 400
+
+
+def test_catalog_keywords_and_stock_filter_the_whole_catalog():
+    from fastapi import Response
+    from backend.benchmarks._support import QueryCounter, make_request, seed_variants
+
+    async def fn(session):
+        # One variant per product with product_id % 10 units: 10, 20 and 30 are sold out
+        await seed_variants(session, list(range(1, 31)), per_product=1)
+        searched, cursor = [], None
+        while True:
+            page = await _list(session, q="7", limit=1, cursor=cursor)
+            searched += [item["id"] for item in page["items"]]
+            cursor = page["next_cursor"]
+            if not cursor:
+                break
+        counter = QueryCounter(session.bind)
+        response = Response()
+        with counter.track():
+            stocked = await _list(session, in_stock=True, limit=200, response=response)
+        return searched, [item["id"] for item in stocked["items"]], counter.count, response.headers
+
+    searched, stocked, queries, headers = _run_catalog(30, fn)
+    assert searched == [7]
+    assert stocked == [pid for pid in range(1, 31) if pid % 10]
+    # Stock is not versioned: no version row read and no validators sent
+    assert queries == 1 and "etag" not in headers
+
+
+def test_catalog_facets_agree_with_listing():
+    from fastapi import Response
+    from backend.api.routes_catalog import get_facets
+    from backend.benchmarks._support import QueryCounter, make_request
+
+    def get_facets_(**params):
+        return get_facets(make_request(), Response(), **params)
+
+    async def fn(session):
+        await get_facets_(q=None, category_id=None, subcategory_id=None, min_price=None,
+                          max_price=None, price_bands=None, db=session)
+        counter = QueryCounter(session.bind)
+        with counter.track():
+            facets = await get_facets_(q=None, category_id=None, subcategory_id=None, min_price=5,
+                                      max_price=None, price_bands="10,20", db=session)
+        listing = await _list(session, min_price=5, limit=200)
+        in_cat_2 = await _list(session, min_price=5, category_id=2, limit=200)
+        searched = await get_facets_(q="7", category_id=None, subcategory_id=None, min_price=None,
+                                    max_price=None, price_bands=None, db=session)
+        return facets, counter.count, listing["items"], in_cat_2["items"], searched
+
+    facets, queries, listing, in_cat_2, searched = _run_catalog(30, fn)
+    # Version row + one grouped aggregate
+    assert queries == 2
+    assert facets["total"] == len(listing) == 27
+    by_cat = {c["category_id"]: c["count"] for c in facets["categories"]}
+    assert by_cat[2] == len(in_cat_2)
+    assert sum(s["count"] for s in facets["subcategories"]) == facets["total"]
+    assert facets["price_bands"] == [
+        {"min": None, "max": 10.0, "count": 5},
+        {"min": 10.0, "max": 20.0, "count": 10},
+        {"min": 20.0, "max": None, "count": 12},
+    ]
+    # Keywords narrow the counts exactly like search does
+    assert searched["total"] == 1
+    assert searched["categories"] == [{"category_id": 4, "name": "Category 4", "count": 1}]
+
+
+def test_price_less_products_are_in_no_price_band():
+    from sqlalchemy import update
+    from backend.persistance.product import Product
+    from backend.repositories.repository.product_search_repository import ProductSearchRepository
+
+    async def fn(session):
+        repo = ProductSearchRepository(session)
+        before = await repo.facet_counts(None, price_edges=(10, 20))
+        await session.execute(update(Product).where(Product.product_id == 30).values(price=None))
+        await session.commit()
+        after = await repo.facet_counts(None, price_edges=(10, 20))
+        return before, after
+
+    before, after = _run_catalog(30, fn)
+    # Product 30 had the top price; it still counts, just not in any band
+    assert after.total == before.total == 30
+    assert after.price_bands == before.price_bands[:-1] + [before.price_bands[-1] - 1]
+    assert sum(after.price_bands) == 29
+
+
+def test_validate_cart_query_count_is_flat():
+    from backend.benchmarks import cart_validation
+
+    small = asyncio.run(cart_validation.measure(1, n_products=50))
+    large = asyncio.run(cart_validation.measure(500, n_products=50))
+    assert large["items"] == 500
+    assert small["queries"] <= large["queries"] == 2
+
+
+def test_expanded_product_detail_batches_variants_and_images():
+    from fastapi import Response
+    from sqlalchemy import insert, update
+    from backend.api.routes_catalog import get_product
+    from backend.benchmarks._support import QueryCounter, make_request, seed_variants
+    from backend.persistance.product_variant import ProductVariant
+    from backend.persistance.product_variant_image import ProductVariantImage
+
+    async def detail(session, pid, headers=None):
+        response = Response()
+        result = await get_product(pid, make_request(headers), response, expand=True, db=session)
+        return (result if isinstance(result, Response) else response), result
+
+    async def fn(session):
+        await seed_variants(session, [4, 5], per_product=6)
+        await session.execute(insert(ProductVariantImage), [
+            {"image_id": vid, "variant_id": vid, "image_url": f"variants/{vid}.jpg", "is_deleted": vid == 25}
+            for vid in range(24, 30)
+        ])
+        await session.execute(update(ProductVariant).where(ProductVariant.variant_id == 29).values(is_active=False))
+        await session.commit()
+        counter = QueryCounter(session.bind)
+        with counter.track():
+            first, body = await detail(session, 4)
+        queries = counter.count
+        cached, _ = await detail(session, 4, {"If-None-Match": first.headers["etag"]})
+        await session.execute(update(ProductVariant).where(ProductVariant.variant_id == 24).values(quantity=0))
+        await session.commit()
+        restocked, _ = await detail(session, 4, {"If-None-Match": first.headers["etag"]})
+        return queries, body["product"], cached.status_code, restocked.status_code
+
+    queries, product, cached, restocked = _run_catalog(6, fn)
+    # Version row, card, variants, variant images, product images
+    assert queries == 5
+    assert product["images"] == ["/static/product_images/4_0.jpg"]
+    variants = {v["id"]: v for v in product["variants"]}
+    # Inactive variant 29 is left out; soft-deleted images are skipped
+    assert sorted(variants) == [24, 25, 26, 27, 28]
+    assert variants[24]["images"] == ["/static/variants/24.jpg"]
+    assert variants[25]["images"] == [] and variants[25]["image_url"] is None
+    assert variants[26] == {
+        "id": 26, "name": "Variant 2", "price": 6.0, "quantity": 6, "in_stock": True,
+        "image_url": "/static/variants/26.jpg", "images": ["/static/variants/26.jpg"],
+    }
+    # Unversioned stock changes still produce a new ETag
+    assert cached == 304
+    assert restocked == 200
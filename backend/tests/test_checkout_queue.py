@@ -0,0 +1,254 @@
+import asyncio
+import datetime as dt
+
+import pytest
+
+from backend.benchmarks import checkout_queue
+
+CHECKOUT = checkout_queue.CHECKOUT
+
+
+def _run(fn):
+    from sqlalchemy import insert
+    from backend.benchmarks._support import make_engine, seed_catalog, seed_variants
+    from backend.persistance.cart import Cart
+    from backend.persistance.cart_item import CartItem
+
+    async def run():
+        engine, Session = await make_engine()
+        try:
+            async with Session() as session:
+                await seed_variants(session, await seed_catalog(session, 12))
+                # Variants 6 and 8 start with 3 and 4 units at 5 and 6; product 2 costs 3
+                await session.execute(insert(Cart).values(cart_id=1, user_id=1))
+                await session.execute(insert(CartItem), [
+                    {"cart_id": 1, "product_id": 3, "variant_id": 6, "quantity": 2},
+                    {"cart_id": 1, "product_id": 4, "variant_id": 8, "quantity": 1},
+                    {"cart_id": 1, "product_id": 2, "variant_id": None, "quantity": 1},
+                ])
+                await session.commit()
+            return await fn(Session)
+        finally:
+            await engine.dispose()
+
+    return asyncio.run(run())
+
+
+async def _state(Session):
+    from sqlalchemy import select
+    from backend.persistance.cart_item import CartItem
+    from backend.persistance.checkout_job import CheckoutJob
+    from backend.persistance.order import Order
+    from backend.persistance.order_item import OrderItem
+    from backend.persistance.product_variant import ProductVariant
+
+    async with Session() as session:
+        stock = dict((await session.execute(
+            select(ProductVariant.variant_id, ProductVariant.quantity).where(ProductVariant.variant_id.in_([6, 8]))
+        )).all())
+        jobs = [(j.status, j.attempts, j.last_error) for j in (await session.scalars(select(CheckoutJob))).all()]
+        orders = [(o.order_status.value, float(o.total_amount)) for o in (await session.scalars(select(Order))).all()]
+        items = [(i.variant_id, i.quantity, i.subtotal) for i in
+                 (await session.scalars(select(OrderItem).order_by(OrderItem.order_item_id))).all()]
+        cart = (await session.scalars(select(CartItem))).all()
+    return {"stock": stock, "jobs": jobs, "orders": orders, "items": items, "cart_lines": len(cart)}
+
+
+class FlakyPayments:
+    def __init__(self, failures):
+        self.failures = failures
+
+    def process_payment(self, **kwargs):
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionError("gateway timeout")
+        return {"status": "succeeded"}
+
+
+def test_queued_checkout_is_processed_by_a_worker():
+    from backend.services.checkout_service import CheckoutWorkerPool, enqueue_checkout, get_checkout_job
+
+    async def fn(Session):
+        async with Session() as session:
+            job = await enqueue_checkout(1, CHECKOUT, session)
+            queued = await _state(Session)
+            claimed = await CheckoutWorkerPool(Session, name="w1").drain()
+            polled = await get_checkout_job(job.job_id, 1, session)
+            other_user = await get_checkout_job(job.job_id, 2, session)
+        return queued, claimed, polled, other_user, await _state(Session)
+
+    queued, claimed, polled, other_user, state = _run(fn)
+    # Enqueueing writes nothing but the job
+    assert queued["jobs"] == [("pending", 0, None)] and queued["orders"] == [] and queued["stock"] == {6: 3, 8: 4}
+    assert claimed == 1
+    assert polled["status"] == "succeeded" and polled["order_id"] and polled["order_number"]
+    assert other_user is None
+    assert state["orders"] == [("confirmed", 19.0)]
+    assert state["items"] == [(6, 2, 10.0), (8, 1, 6.0), (None, 1, 3.0)]
+    assert state["stock"] == {6: 1, 8: 3}
+    assert state["cart_lines"] == 0
+
+
+def test_permanent_failure_fails_the_job_without_writing():
+    from sqlalchemy import update
+    from backend.persistance.product_variant import ProductVariant
+    from backend.services.checkout_service import CheckoutWorkerPool, enqueue_checkout
+
+    async def fn(Session):
+        async with Session() as session:
+            await enqueue_checkout(1, CHECKOUT, session)
+            await session.execute(update(ProductVariant).where(ProductVariant.variant_id == 6).values(quantity=1))
+            await session.commit()
+        await CheckoutWorkerPool(Session, name="w1").drain()
+        return await _state(Session)
+
+    state = _run(fn)
+    assert state["jobs"] == [("failed", 1, "Not enough stock for variant 6")]
+    assert state["orders"] == [] and state["items"] == []
+    assert state["stock"] == {6: 1, 8: 4}
+    assert state["cart_lines"] == 3
+
+
+def test_transient_failure_is_retried_with_backoff():
+    from backend.services import checkout_service
+    from backend.services.checkout_service import CheckoutWorkerPool, enqueue_checkout
+
+    async def fn(Session):
+        async with Session() as session:
+            await enqueue_checkout(1, CHECKOUT, session)
+        pool = CheckoutWorkerPool(Session, name="w1", max_attempts=3, payments=FlakyPayments(1))
+        first = await pool.run_once()
+        after_failure = await _state(Session)
+        # Backoff keeps the job out of the queue until it is due
+        not_due = await pool.run_once()
+        checkout_service.RETRY_BASE_SECONDS = 0
+        try:
+            async with Session() as session:
+                from sqlalchemy import update
+                from backend.persistance.checkout_job import CheckoutJob
+                await session.execute(update(CheckoutJob).values(available_at=dt.datetime(2000, 1, 1)))
+                await session.commit()
+            retried = await pool.run_once()
+        finally:
+            checkout_service.RETRY_BASE_SECONDS = 2.0
+        return first, after_failure, not_due, retried, await _state(Session)
+
+    first, after_failure, not_due, retried, state = _run(fn)
+    assert first == 1 and not_due == 0 and retried == 1
+    assert after_failure["jobs"] == [("pending", 1, "gateway timeout")]
+    assert after_failure["orders"] == [] and after_failure["stock"] == {6: 3, 8: 4}
+    assert state["jobs"] == [("succeeded", 2, None)]
+    assert state["stock"] == {6: 1, 8: 3}
+
+
+def test_retries_stop_at_max_attempts_and_expired_leases_are_reclaimed():
+    from sqlalchemy import update
+    from backend.persistance.checkout_job import CheckoutJob
+    from backend.services.checkout_service import CheckoutWorkerPool, enqueue_checkout, retry_delay
+
+    past = dt.datetime(2000, 1, 1)
+
+    async def make_due(Session):
+        async with Session() as session:
+            await session.execute(update(CheckoutJob).values(available_at=past))
+            await session.commit()
+
+    async def fn(Session):
+        async with Session() as session:
+            job = await enqueue_checkout(1, CHECKOUT, session)
+            # A worker claims the job and dies: its lease expires and another worker takes over
+            await session.execute(
+                update(CheckoutJob).values(status="processing", attempts=1, locked_by="dead", locked_until=past)
+            )
+            await session.commit()
+        pool = CheckoutWorkerPool(Session, name="w2", max_attempts=2, payments=FlakyPayments(5))
+        reclaimed = await pool.run_once()
+        await make_due(Session)
+        await pool.run_once()
+        return reclaimed, await _state(Session)
+
+    reclaimed, state = _run(fn)
+    assert reclaimed == 1
+    # The reclaim was attempt 2 of 2, so the failure is final
+    assert state["jobs"] == [("failed", 2, "gateway timeout")]
+    assert state["orders"] == [] and state["cart_lines"] == 3
+    assert [retry_delay(n).total_seconds() for n in (1, 2, 3, 20)] == [2.0, 4.0, 8.0, 300.0]
+
+
+class RecordingPayments:
+    def __init__(self):
+        self.calls = []
+
+    def process_payment(self, **kwargs):
+        self.calls.append(kwargs)
+        return {"status": "succeeded"}
+
+
+def test_worker_that_lost_its_lease_does_not_charge():
+    from sqlalchemy import update
+    from backend.persistance.catalog_version import utcnow
+    from backend.persistance.checkout_job import CheckoutJob
+    from backend.repositories.repository.checkout_job_repository import CheckoutJobRepository
+    from backend.services.checkout_service import enqueue_checkout, process_checkout_job
+
+    async def fn(Session):
+        async with Session() as session:
+            await enqueue_checkout(1, CHECKOUT, session)
+            # w1's lease runs out before it reaches the payment
+            [job] = await CheckoutJobRepository(session).claim("w1", now=utcnow(), limit=1, lease=dt.timedelta(0))
+        lost = RecordingPayments()
+        async with Session() as session:
+            with pytest.raises(RuntimeError, match="was lost"):
+                await process_checkout_job(job, "w1", session, payments=lost)
+        after_lost = await _state(Session)
+        # Another worker reclaims the job and finishes it
+        async with Session() as session:
+            await session.execute(update(CheckoutJob).values(locked_by="w2", locked_until=dt.datetime(2999, 1, 1)))
+            await session.commit()
+        held = RecordingPayments()
+        async with Session() as session:
+            await process_checkout_job(job, "w2", session, payments=held)
+        return lost.calls, after_lost, held.calls, job.job_id, await _state(Session)
+
+    lost, after_lost, held, job_id, state = _run(fn)
+    assert lost == []
+    assert after_lost["orders"] == [] and after_lost["stock"] == {6: 3, 8: 4} and after_lost["cart_lines"] == 3
+    assert [call["idempotency_key"] for call in held] == [f"checkout-job-{job_id}"]
+    assert state["jobs"] == [("succeeded", 1, None)] and state["stock"] == {6: 1, 8: 3}
+
+
+def test_checkout_routes_enqueue_and_poll():
+    from fastapi import HTTPException
+    from backend.api.routes_customer import checkout_route, checkout_status_route
+    from backend.schemas.schemas_customer import CheckoutRequest
+    from backend.services.checkout_service import CheckoutWorkerPool
+
+    async def fn(Session):
+        payload = CheckoutRequest(**{**CHECKOUT, "payment_info": {**CHECKOUT["payment_info"], "card_number": "4111"}})
+        async with Session() as session:
+            accepted = await checkout_route(payload, identity={"user_id": 1}, db=session)
+            pending = await checkout_status_route(accepted.job_id, identity={"user_id": 1}, db=session)
+            with pytest.raises(HTTPException) as empty:
+                await checkout_route(payload, identity={"user_id": 2}, db=session)
+            with pytest.raises(HTTPException) as missing:
+                await checkout_status_route(accepted.job_id, identity={"user_id": 2}, db=session)
+        await CheckoutWorkerPool(Session, name="w1").drain()
+        async with Session() as session:
+            from backend.persistance.checkout_job import CheckoutJob
+            done = await checkout_status_route(accepted.job_id, identity={"user_id": 1}, db=session)
+            stored = (await session.get(CheckoutJob, accepted.job_id)).get_payload()
+        return accepted, pending, empty.value, missing.value, done, stored
+
+    accepted, pending, empty, missing, done, stored = _run(fn)
+    assert accepted.status == pending.status == "pending"
+    assert empty.status_code == 400 and missing.status_code == 404
+    assert done.status == "succeeded" and done.order_id is not None
+    # Only the payment token is queued
+    assert "card_number" not in stored["payment_info"]
+
+
+def test_queued_requests_return_before_the_pipeline_runs():
+    inline = asyncio.run(checkout_queue.measure(8, queued=False, concurrency=4, payment_ms=30))
+    queued = asyncio.run(checkout_queue.measure(8, queued=True, concurrency=4, payment_ms=30))
+    assert inline["succeeded"] == queued["succeeded"] == 8
+    assert queued["p50_ms"] < inline["p50_ms"]
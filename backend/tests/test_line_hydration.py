@@ -0,0 +1,101 @@
+import asyncio
+
+import pytest
+
+from backend.benchmarks.line_hydration import measure
+
+
+def test_cart_hydration_query_count_is_flat():
+    small = asyncio.run(measure(3, n_products=100))
+    large = asyncio.run(measure(60, n_products=100))
+    # Every tenth line's product was deactivated and is removed; the rest are hydrated
+    assert large["items"] == 54
+    # cart, lines, products, images, variants, variant images + the batched writes
+    assert small["queries"] <= large["queries"] <= 8
+    # Removals and trims share one commit
+    assert large["commits"] == 1
+
+
+@pytest.mark.parametrize("view, items", [("wishlist", 54), ("order", 60), ("refund", 60)])
+def test_line_views_query_count_is_flat(view, items):
+    small = asyncio.run(measure(3, view=view, n_products=100))
+    large = asyncio.run(measure(60, view=view, n_products=100))
+    assert large["items"] == items
+    assert small["queries"] <= large["queries"] == asyncio.run(measure(120, view=view, n_products=100))["queries"]
+
+
+def _with_lines(fn, n_lines=12):
+    from backend.benchmarks._support import make_engine, seed_catalog, seed_variants
+    from backend.benchmarks.line_hydration import seed_lines
+
+    async def run():
+        engine, Session = await make_engine()
+        try:
+            async with Session() as session:
+                ids = await seed_catalog(session, 20)
+                await seed_variants(session, ids)
+                await seed_lines(session, n_lines, ids)
+            async with Session() as session:
+                return await fn(session)
+        finally:
+            await engine.dispose()
+
+    return asyncio.run(run())
+
+
+def test_cart_items_require_the_owners_cart():
+    from backend.services import customerServices
+
+    async def fn(session):
+        return await customerServices.get_cart_items(session, cart_id=1, user_id=2)
+
+    result = _with_lines(fn, n_lines=2)
+    assert result["items"] == [] and result["notes"] == ["No cart found for user."]
+
+
+def test_hydrator_resolves_lines_and_memoizes_per_session():
+    from backend.benchmarks._support import QueryCounter
+    from backend.services.line_item_hydrator import LineItemHydrator
+
+    async def fn(session):
+        counter = QueryCounter(session.bind)
+        hydrator = LineItemHydrator.for_request(session)
+        with counter.track():
+            first = await hydrator.hydrate([(2, 5), (3, None), (10, 20), (2, 4), (999, None)])
+        first_queries = counter.count
+        with counter.track():
+            again = await LineItemHydrator.for_request(session).hydrate([(3, None), (2, 5)])
+        return first, first_queries, again, counter.count
+
+    first, first_queries, again, again_queries = _with_lines(fn)
+    assert first_queries == 4
+    # Same session: everything already loaded
+    assert again_queries == 0
+    assert [line.product_id for line in again] == [3, 2]
+    by_ref = {(line.product_id, line.variant_id): line for line in first}
+    line = by_ref[(2, 5)]
+    assert line.product.title == "Product 2" and line.product_image == "product_images/2_0.jpg"
+    assert line.variant.variant_id == 5 and line.price == line.variant.price
+    assert by_ref[(3, None)].variant is None and by_ref[(3, None)].product_image is None
+    # Product 10 is the tenth line's product, deactivated by seed_lines
+    assert by_ref[(10, 20)].product is None
+    assert by_ref[(999, None)].product is None
+
+
+def test_refund_detail_and_order_lines():
+    from backend.services import customerAssistanceServices, customerServices
+
+    async def fn(session):
+        refund = await customerAssistanceServices.get_specific_refund_request(1, session)
+        order = await customerServices.get_order_details(1, session)
+        return refund, order
+
+    refund, order = _with_lines(fn, n_lines=4)
+    assert refund["order"].order_id == 1
+    assert [d["order_item"].order_item_id for d in refund["order_items"]] == [1, 2, 3, 4]
+    assert refund["order_items"][1]["product"].product_id == 2
+    assert refund["order_items"][1]["variant"].variant_id == 5
+    assert refund["order_items"][1]["product_images"][0].image_url == "product_images/2_0.jpg"
+    assert [(line["order_item_id"], line["product_id"], line["variant_id"]) for line in order["lines"]] == [
+        (1, 1, None), (2, 2, 5), (3, 3, 6), (4, 4, None),
+    ]
@@ -0,0 +1,105 @@
+import asyncio
+import datetime as dt
+
+from backend.benchmarks import order_analytics
+
+
+def _run(fn):
+    from backend.benchmarks._support import make_engine, seed_catalog
+
+    async def run():
+        engine, Session = await make_engine()
+        try:
+            async with Session() as session:
+                await seed_catalog(session, 12)
+            async with Session() as session:
+                return await fn(session)
+        finally:
+            await engine.dispose()
+
+    return asyncio.run(run())
+
+
+async def _order(session, order_id, created_at, lines, status="confirmed", is_deleted=False):
+    from sqlalchemy import insert
+    from backend.persistance.order import Order
+    from backend.persistance.order_item import OrderItem
+
+    await session.execute(insert(Order).values(
+        order_id=order_id, user_id=1, order_status=status, total_amount=0, order_number=order_id,
+        created_at=created_at, is_deleted=is_deleted,
+    ))
+    await session.execute(insert(OrderItem), [
+        {"order_id": order_id, "product_id": pid, "quantity": qty, "subtotal": subtotal, "is_deleted": False}
+        for pid, qty, subtotal in lines
+    ])
+
+
+def test_sql_series_per_day_week_and_month():
+    from sqlalchemy import update
+    from backend.persistance.product import Product
+    from backend.services.sellerServices import SellerService
+
+    async def fn(session):
+        # Product 12 belongs to another seller; its line is not this seller's revenue
+        await session.execute(update(Product).where(Product.product_id == 12).values(seller_id=2))
+        await _order(session, 1, dt.datetime(2026, 3, 2, 9), [(1, 2, 20.0), (12, 1, 99.0)])   # Monday
+        await _order(session, 2, dt.datetime(2026, 3, 2, 18), [(2, 1, 5.0)])
+        await _order(session, 3, dt.datetime(2026, 3, 8, 23), [(1, 1, 10.0), (2, 3, 15.0)])   # Sunday
+        await _order(session, 4, dt.datetime(2026, 4, 1), [(1, 4, 40.0)])
+        await _order(session, 5, dt.datetime(2026, 4, 1), [(1, 9, 90.0)], status="cancelled")
+        await _order(session, 6, dt.datetime(2026, 4, 1), [(1, 9, 90.0)], is_deleted=True)
+        await session.commit()
+        service = SellerService(session)
+        daily = await service.analyze_orders_for_product(
+            seller_id=1, fee_rate=0.1, shipping_cost=1, ad_cost=0.5, source="orders"
+        )
+        weekly = await service.analyze_orders_for_product(seller_id="1", period="weekly", source="orders")
+        monthly = await service.analyze_orders_for_product(
+            seller_id=1, period="monthly", product_id="1", start_date="2026-03-01", end_date="2026-03-08",
+            source="orders",
+        )
+        return daily, weekly, monthly
+
+    daily, weekly, monthly = _run(fn)
+    assert daily["periods"] == ["2026-03-02", "2026-03-08", "2026-04-01"]
+    assert daily["units_sold"] == [3, 4, 4]
+    assert daily["revenue"] == [25.0, 25.0, 40.0]
+    assert daily["order_count"] == [2, 1, 1]
+    # 10% fee, 1.5 per order
+    assert daily["profit"] == [19.5, 21.0, 34.5]
+    assert daily["average_units_per_period"] == 11 / 3
+    # Sunday 8 March is still in the week of Monday 2 March
+    assert weekly["periods"] == ["2026-03-02", "2026-03-30"]
+    assert weekly["units_sold"] == [7, 4]
+    # The end date is inclusive
+    assert monthly["periods"] == ["2026-03-01"] and monthly["units_sold"] == [3] and monthly["revenue"] == [30.0]
+
+
+def test_in_memory_fallback_matches_and_is_json_ready():
+    import json
+    from backend.services.sellerServices import SellerService
+
+    async def fn(session):
+        await _order(session, 1, dt.datetime(2026, 3, 2, 9), [(1, 2, 20.0), (2, 1, 5.0)])
+        await _order(session, 2, dt.datetime(2026, 3, 3), [(1, 1, 10.0)])
+        await session.commit()
+        service = SellerService(session)
+        units = await service.analyze_orders_for_product(seller_id=1, analysis_func="analyze_units_sold_trends")
+        revenue = await service.analyze_orders_for_product(
+            seller_id=1, analysis_func="analyze_revenue_profit_trends", fee_rate=0.5
+        )
+        return units, revenue
+
+    units, revenue = _run(fn)
+    assert units == {"trends": {"2026-03-02": 3, "2026-03-03": 1}, "average_per_period": 2.0}
+    assert revenue["revenue_trends"] == {"2026-03-02": 25.0, "2026-03-03": 10.0}
+    assert revenue["profit_trends"] == {"2026-03-02": 12.5, "2026-03-03": 5.0}
+    json.dumps(revenue)
+
+
+def test_sql_aggregation_is_one_query_and_agrees_with_the_python_loops():
+    python = asyncio.run(order_analytics.measure(2000, period="monthly", sql=False))
+    sql = asyncio.run(order_analytics.measure(2000, period="monthly"))
+    assert sql["queries"] == 1
+    assert sql["units_sold"] == python["units_sold"] and sql["periods"] == python["periods"] == 12
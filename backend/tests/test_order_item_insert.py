@@ -0,0 +1,55 @@
+import asyncio
+
+from backend.benchmarks import order_item_insert
+
+
+def test_bulk_create_writes_every_line_in_a_flat_number_of_statements():
+    small = asyncio.run(order_item_insert.measure(10))
+    large = asyncio.run(order_item_insert.measure(600))
+    orm = asyncio.run(order_item_insert.measure(600, bulk=False))
+    assert large["order_items"] == large["shipment_items"] == 600
+    assert orm["order_items"] == orm["shipment_items"] == 600
+    # Order, order items, shipment, shipment items, and a sales rollup event
+    # insert each for the order and its items
+    assert small["queries"] == large["queries"] == 6
+    assert small["commits"] == large["commits"] == 1
+    assert orm["queries"] > 1000
+
+
+def test_bulk_create_returns_items_with_ids_and_create_shipment_uses_it():
+    from sqlalchemy import select
+    from backend.benchmarks._support import make_engine, seed_catalog, seed_variants
+    from backend.persistance.enums import OrderStatusEnum
+    from backend.persistance.order import Order
+    from backend.persistance.shipment_item import ShipmentItem
+    from backend.repositories.repository.order_item_repository import OrderItemRepository
+    from backend.repositories.repository.shipment_item_repository import ShipmentItemRepository
+    from backend.services.shippingServices import create_shipment
+
+    async def run():
+        engine, Session = await make_engine()
+        try:
+            async with Session() as session:
+                await seed_variants(session, await seed_catalog(session, 12))
+                order = Order(user_id=1, order_status=OrderStatusEnum.pending, total_amount=0, order_number=1)
+                session.add(order)
+                await session.flush()
+                items = await OrderItemRepository(session).bulk_create([
+                    {"order_id": order.order_id, "product_id": 3, "variant_id": 6, "quantity": 2, "subtotal": 10.0},
+                    {"order_id": order.order_id, "product_id": 2, "variant_id": None, "quantity": 1, "subtotal": 3.0},
+                ])
+                empty = await ShipmentItemRepository(session).bulk_create([])
+                await session.commit()
+                shipment = await create_shipment(session, order.order_id, "created")
+                shipped = (await session.scalars(
+                    select(ShipmentItem).order_by(ShipmentItem.shipment_item_id)
+                )).all()
+                return items, empty, shipment, [(s.shipment_id, s.product_id, s.variant_id, s.quantity) for s in shipped]
+        finally:
+            await engine.dispose()
+
+    items, empty, shipment, shipped = asyncio.run(run())
+    assert sorted((i.product_id, i.quantity, i.is_deleted) for i in items) == [(2, 1, False), (3, 2, False)]
+    assert all(i.order_item_id for i in items)
+    assert empty == []
+    assert sorted(shipped) == [(shipment["id"], 2, None, 1), (shipment["id"], 3, 6, 2)]
@@ -0,0 +1,51 @@
+import asyncio
+import datetime as dt
+
+from backend.benchmarks import order_numbers
+
+
+def test_concurrent_workers_never_share_a_number_and_reserve_per_block():
+    result = asyncio.run(order_numbers.measure(4, 250))
+    assert result["numbers"] == result["unique"] == 1000
+    assert result["monotonic"]
+    # 250 numbers per worker is three blocks of 100 each
+    assert result["queries"] == 12
+
+
+def test_order_numbers_are_date_prefixed_and_survive_rollbacks():
+    from backend.benchmarks._support import make_engine
+    from backend.services.order_number_allocator import OrderNumberAllocator, next_order_number
+
+    async def run():
+        engine, Session = await make_engine()
+        try:
+            day = dt.datetime(2026, 10, 18, 23, 59)
+            first = OrderNumberAllocator()
+            numbers = [await first.next(engine, now=day) for _ in range(3)]
+            # A second process reserves the following block
+            other = await OrderNumberAllocator().next(engine, now=day + dt.timedelta(minutes=1))
+            async with Session() as session:
+                in_rolled_back = await next_order_number(session)
+                await session.rollback()
+            async with Session() as session:
+                after_rollback = await next_order_number(session)
+            return numbers, other, in_rolled_back, after_rollback
+        finally:
+            await engine.dispose()
+
+    numbers, other, in_rolled_back, after_rollback = asyncio.run(run())
+    assert numbers == [2610180000000001, 2610180000000002, 2610180000000003]
+    assert other == 2610190000000101
+    assert after_rollback != in_rolled_back
+
+
+def test_postgres_reserves_from_the_sequence():
+    from sqlalchemy import select
+    from sqlalchemy.dialects import postgresql
+    from backend.persistance.order_number_block import ORDER_NUMBER_BLOCK_SIZE, order_number_seq
+    from sqlalchemy.schema import CreateSequence
+
+    assert str(select(order_number_seq.next_value()).compile(dialect=postgresql.dialect())).startswith(
+        "SELECT nextval('order_number_seq')"
+    )
+    assert f"INCREMENT BY {ORDER_NUMBER_BLOCK_SIZE}" in str(CreateSequence(order_number_seq).compile(dialect=postgresql.dialect()))
@@ -0,0 +1,69 @@
+import asyncio
+
+from sqlalchemy import delete, update
+
+from backend.benchmarks._support import QueryCounter, make_engine, seed_catalog
+from backend.persistance.product import Product
+from backend.services.sellerServices import SellerService
+
+
+def _with_catalog(fn, n_products=20):
+    async def run():
+        engine, Session = await make_engine()
+        try:
+            async with Session() as session:
+                await seed_catalog(session, n_products)
+            async with Session() as session:
+                return await fn(session, QueryCounter(engine))
+        finally:
+            await engine.dispose()
+
+    return asyncio.run(run())
+
+
+def test_customer_search_ranks_and_pages_in_database():
+    async def fn(session, counter):
+        service = SellerService(session)
+        await session.execute(update(Product).where(Product.product_id == 3).values(title="Wireless Headphones"))
+        await session.execute(update(Product).where(Product.product_id == 7).values(description="Pairs with wireless chargers"))
+        await session.execute(update(Product).where(Product.product_id == 9).values(title="Wireless Mouse", is_active=False))
+        await session.commit()
+        with counter.track():
+            hits = await service.search_products_for_customer("WIRELESS")
+        # One search query plus one image query, whatever the catalog size
+        assert counter.count == 2
+        ids = [h['product'].product_id for h in hits]
+        # Title match outranks description match; inactive products are hidden
+        assert ids == [3, 7]
+        # Prefix matching and any-keyword semantics
+        assert [h['product'].product_id for h in await service.search_products_for_customer("headph charg")] == [3, 7]
+        page = await service.search_products_for_customer(None, category_id=2, limit=2, offset=1)
+        assert [h['product'].category_id for h in page] == [2, 2]
+        return True
+
+    assert _with_catalog(fn)
+
+
+def test_search_index_follows_edits_and_deletes():
+    async def fn(session, counter):
+        service = SellerService(session)
+        product = await session.get(Product, 4)
+        product.title = "Espresso Machine"
+        product.description = "Italian pump"
+        await session.commit()
+        assert [r['product_id'] for r in await service.search_products_for_seller(1, "espresso")] == [4]
+        # The old "Product 4" text is no longer indexed
+        assert 4 not in [r['product_id'] for r in await service.search_products_for_seller(1, "4")]
+
+        product.is_active = False
+        await session.commit()
+        # Sellers still find their own inactive products; customers do not
+        assert [r['product_id'] for r in await service.search_products_for_seller(1, "espresso")] == [4]
+        assert await service.search_products_for_customer("espresso") == []
+
+        await session.execute(delete(Product).where(Product.product_id == 4))
+        await session.commit()
+        assert await service.search_products_for_seller(1, "espresso") == []
+        return True
+
+    assert _with_catalog(fn)
@@ -0,0 +1,154 @@
+import asyncio
+import datetime as dt
+
+from backend.benchmarks import sales_rollup
+
+
+def _run(fn):
+    from backend.benchmarks._support import make_engine, seed_catalog
+
+    async def run():
+        engine, Session = await make_engine()
+        try:
+            async with Session() as session:
+                await seed_catalog(session, 6)
+            async with Session() as session:
+                return await fn(session)
+        finally:
+            await engine.dispose()
+
+    return asyncio.run(run())
+
+
+async def _rollup(session):
+    from sqlalchemy import select
+    from backend.persistance.sales_daily_rollup import SalesDailyRollup
+
+    rows = (await session.execute(
+        select(SalesDailyRollup.day, SalesDailyRollup.product_id, SalesDailyRollup.units,
+               SalesDailyRollup.revenue, SalesDailyRollup.orders)
+        .order_by(SalesDailyRollup.day, SalesDailyRollup.product_id)
+    )).all()
+    return [(day.isoformat(), pid, units, revenue, orders) for day, pid, units, revenue, orders in rows]
+
+
+async def _queued(session):
+    from sqlalchemy import func, select
+    from backend.persistance.sales_daily_rollup import SalesRollupEvent
+
+    return await session.scalar(select(func.count()).select_from(SalesRollupEvent))
+
+
+def test_order_writes_are_queued_and_refresh_converges():
+    from backend.persistance.enums import OrderStatusEnum
+    from backend.persistance.order import Order
+    from backend.persistance.order_item import OrderItem
+    from backend.repositories.repository.order_item_repository import OrderItemRepository
+    from backend.services.sales_rollup_service import SalesRollupService
+
+    async def fn(session):
+        seen = []
+        orders = [
+            Order(user_id=1, order_status=OrderStatusEnum.confirmed, total_amount=0, order_number=n,
+                  created_at=dt.datetime(2026, 3, 2, 9 + n))
+            for n in range(2)
+        ]
+        session.add_all(orders)
+        await session.flush()
+        # ORM objects and bulk inserts are both queued
+        session.add(OrderItem(order_id=orders[0].order_id, product_id=1, quantity=2, subtotal=20.0))
+        await OrderItemRepository(session).bulk_create([
+            {"order_id": orders[0].order_id, "product_id": 2, "quantity": 1, "subtotal": 5.0},
+            {"order_id": orders[1].order_id, "product_id": 1, "quantity": 3, "subtotal": 30.0},
+        ])
+        await session.commit()
+        seen.append(await _queued(session) > 0)
+        await SalesRollupService(session).refresh()
+        seen.append((await _queued(session), await _rollup(session)))
+
+        # A cancellation takes the order out of its day
+        orders[1].order_status = OrderStatusEnum.cancelled
+        await session.commit()
+        await SalesRollupService(session).refresh()
+        seen.append(await _rollup(session))
+        return seen
+
+    queued, (left, created), cancelled = _run(fn)
+    assert queued and left == 0
+    assert created == [("2026-03-02", 1, 5, 50.0, 2), ("2026-03-02", 2, 1, 5.0, 1)]
+    assert cancelled == [("2026-03-02", 1, 2, 20.0, 1), ("2026-03-02", 2, 1, 5.0, 1)]
+
+
+def test_backfill_rebuilds_history_and_consumes_the_outbox():
+    from sqlalchemy import delete
+    from backend.benchmarks.order_analytics import seed_orders
+    from backend.persistance.sales_daily_rollup import SalesDailyRollup
+    from backend.services.sales_rollup_service import SalesRollupService
+
+    async def fn(session):
+        await seed_orders(session, 300, n_products=6, days=60)
+        service = SalesRollupService(session)
+        # A bounded backfill leaves queued events for refresh
+        await service.backfill(dt.date(2025, 1, 1), dt.date(2025, 1, 10))
+        partial = (len(await _rollup(session)), await _queued(session) > 0)
+        days = await service.backfill()
+        full = await _rollup(session)
+        await session.execute(delete(SalesDailyRollup))
+        await session.commit()
+        await service.backfill()
+        return partial, days, full, await _rollup(session), await _queued(session)
+
+    (partial_rows, still_queued), days, full, rebuilt, left = _run(fn)
+    assert partial_rows > 0 and still_queued
+    assert days == 60 and left == 0
+    assert rebuilt == full and sum(units for _, _, units, _, _ in full) > 0
+
+
+def test_rollup_report_matches_the_raw_orders_report():
+    r = asyncio.run(sales_rollup.measure(1500, period="monthly", days=90, new_orders=20))
+    # Product totals, then the seller's order counts
+    assert r["rollup"]["queries"] == 2
+    assert r["rollup"]["periods"] == r["raw"]["periods"] == 3
+    assert r["rollup"]["units_sold"] == r["raw"]["units_sold"]
+    assert r["rollup"]["revenue"] == r["raw"]["revenue"]
+    assert r["rollup"]["order_count"] == r["raw"]["order_count"]
+    assert r["refresh"]["events"] > 0
+
+
+def test_multi_product_orders_count_once_in_either_source():
+    from sqlalchemy import insert
+    from backend.persistance.order import Order
+    from backend.persistance.order_item import OrderItem
+    from backend.services.sales_rollup_service import SalesRollupService
+    from backend.services.sellerServices import SellerService
+
+    async def fn(session):
+        # Order 1 has two of the seller's products, order 2 one
+        await session.execute(insert(Order), [
+            {"order_id": oid, "user_id": 1, "order_status": "confirmed", "total_amount": 0, "order_number": oid,
+             "created_at": dt.datetime(2026, 3, 2, 9 + oid), "is_deleted": False}
+            for oid in (1, 2)
+        ])
+        await session.execute(insert(OrderItem), [
+            {"order_id": 1, "product_id": 1, "quantity": 1, "subtotal": 10.0, "is_deleted": False},
+            {"order_id": 1, "product_id": 2, "quantity": 1, "subtotal": 10.0, "is_deleted": False},
+            {"order_id": 2, "product_id": 1, "quantity": 2, "subtotal": 20.0, "is_deleted": False},
+        ])
+        await session.commit()
+        await SalesRollupService(session).refresh()
+        service = SellerService(session)
+        return {
+            source: (
+                await service.analyze_orders_for_product(1, period="monthly", shipping_cost=5, source=source),
+                await service.analyze_orders_for_product(1, product_id=1, period="monthly", source=source),
+            )
+            for source in ("rollup", "orders")
+        }
+
+    reports = _run(fn)
+    (rollup, rollup_product), (raw, raw_product) = reports["rollup"], reports["orders"]
+    assert rollup["order_count"] == raw["order_count"] == [2]
+    # 40 revenue less the 10% fee and 5 per order
+    assert rollup["profit"] == raw["profit"] == [26.0]
+    assert rollup["average_orders_per_period"] == raw["average_orders_per_period"] == 2
+    assert rollup_product["order_count"] == raw_product["order_count"] == [2]
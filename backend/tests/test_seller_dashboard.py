@@ -0,0 +1,66 @@
+import asyncio
+import datetime as dt
+
+from backend.benchmarks import seller_dashboard
+
+
+def test_dashboard_combines_every_section_with_timing():
+    r = asyncio.run(seller_dashboard.measure(600, concurrency=4))
+    sections, result = r["sections"], r["result"]
+    assert set(result) == {"products", "payout", "sales", "comments"} == set(sections)
+    assert r["ok"] and all(s["ms"] >= 0 and s["wait_ms"] >= 0 for s in sections.values())
+    assert len(result["products"]) == 50 and result["products"][0]["variants"] == 2
+    assert result["payout"]["payout_total"] == 0.0 and result["payout"]["order_total"] > 0
+    assert result["payout"]["matches"] is False
+    assert sum(result["sales"]["units_sold"]) > 0
+    # Every third seeded comment has no response
+    assert result["comments"]["unanswered"] == 166 and len(result["comments"]["recent"]) == 10
+
+
+def test_run_sections_caps_concurrency_and_isolates_failures():
+    from contextlib import asynccontextmanager
+    from backend.services.seller_dashboard_service import run_sections
+
+    running, peak, sessions = 0, 0, []
+
+    @asynccontextmanager
+    async def session_factory():
+        session = object()
+        sessions.append(session)
+        yield session
+
+    async def slow(db):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return id(db)
+
+    async def broken(db):
+        raise RuntimeError("boom")
+
+    sections = {f"s{i}": slow for i in range(5)}
+    sections["broken"] = broken
+    out = asyncio.run(run_sections(sections, session_factory=session_factory, concurrency=2))
+    assert peak == 2 and out["timing"]["concurrency"] == 2
+    # One session per section
+    assert len({out["sections"][f"s{i}"] for i in range(5)}) == 5 and len(sessions) == 6
+    assert out["sections"]["broken"] is None
+    broken_timing = out["timing"]["sections"]["broken"]
+    assert broken_timing["ok"] is False and broken_timing["error"] == "boom"
+    assert all(out["timing"]["sections"][f"s{i}"]["ok"] for i in range(5))
+
+
+def test_dashboard_route_requires_a_seller(client):
+    headers = {"X-Auth-Role": "seller", "X-Auth-Id": "7", "X-Auth-Seller-Id": "7"}
+    ok = client.get("/api/v1/seller/dashboard", params={"period": "weekly"}, headers=headers)
+    assert ok.status_code == 200
+    body = ok.json()
+    assert body["seller_id"] == 7 and body["sections"]["products"] == []
+    assert set(body["timing"]["sections"]) == {"products", "payout", "sales", "comments"}
+    assert body["sections"]["payout"]["month"] == dt.date.today().month
+    assert client.get("/api/v1/seller/dashboard", params={"period": "hourly"}, headers=headers).status_code == 400
+    assert client.get(
+        "/api/v1/seller/dashboard", headers={"X-Auth-Role": "user", "X-Auth-Id": "7"}
+    ).status_code == 403
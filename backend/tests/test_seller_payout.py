@@ -0,0 +1,131 @@
+import asyncio
+import datetime as dt
+
+import pytest
+
+from backend.benchmarks import seller_payout
+
+
+def _run(fn):
+    from backend.benchmarks._support import make_engine, seed_catalog
+
+    async def run():
+        engine, Session = await make_engine()
+        try:
+            async with Session() as session:
+                await seed_catalog(session, 6)
+            async with Session() as session:
+                return await fn(session)
+        finally:
+            await engine.dispose()
+
+    return asyncio.run(run())
+
+
+async def _seed(session):
+    from sqlalchemy import insert, update
+    from backend.persistance.order import Order
+    from backend.persistance.order_item import OrderItem
+    from backend.persistance.product import Product
+    from backend.persistance.seller_payout import SellerPayout
+
+    # Products 5 and 6 belong to seller 2
+    await session.execute(update(Product).where(Product.product_id >= 5).values(seller_id=2))
+    orders = [
+        # order_id, created_at, status, deleted, lines
+        (1, dt.datetime(2026, 3, 1, 0, 0), "confirmed", False, [(1, 10.0), (5, 7.0)]),
+        (2, dt.datetime(2026, 3, 31, 23, 59), "delivered", False, [(2, 5.5)]),
+        (3, dt.datetime(2026, 4, 1, 0, 0), "confirmed", False, [(1, 100.0)]),
+        (4, dt.datetime(2026, 3, 15), "cancelled", False, [(1, 100.0)]),
+        (5, dt.datetime(2026, 3, 15), "returned", False, [(1, 100.0)]),
+        (6, dt.datetime(2026, 3, 15), "confirmed", True, [(1, 100.0)]),
+    ]
+    for order_id, created_at, status, deleted, lines in orders:
+        await session.execute(insert(Order).values(
+            order_id=order_id, user_id=1, order_status=status, total_amount=0, order_number=order_id,
+            created_at=created_at, is_deleted=deleted,
+        ))
+        await session.execute(insert(OrderItem), [
+            {"order_id": order_id, "product_id": pid, "quantity": 1, "subtotal": subtotal, "is_deleted": False}
+            for pid, subtotal in lines
+        ])
+    await session.execute(insert(SellerPayout), [
+        {"payout_id": 1, "seller_id": 1, "amount": 15.5, "currency": "USD",
+         "date_of_payment": dt.date(2026, 3, 31), "status": "completed"},
+        {"payout_id": 2, "seller_id": 2, "amount": 9.0, "currency": "USD",
+         "date_of_payment": dt.date(2026, 3, 31), "status": "completed"},
+        {"payout_id": 3, "seller_id": 3, "amount": 4.0, "currency": "USD",
+         "date_of_payment": dt.date(2026, 3, 31), "status": "pending"},
+    ])
+    await session.commit()
+
+
+def test_get_seller_payout_sums_the_month_of_live_sales():
+    from backend.services.sellerServices import SellerService
+
+    async def fn(session):
+        await _seed(session)
+        service = SellerService(session)
+        matched = await service.get_seller_payout(1, "2026", "3")
+        none = await service.get_seller_payout(1, 2026, 2)
+        with pytest.raises(ValueError, match="does not match"):
+            await service.get_seller_payout(2, 2026, 3)
+        return matched, none
+
+    matched, none = _run(fn)
+    assert matched.payout_id == 1 and none is None
+
+
+def test_split_payouts_are_checked_by_their_month_total():
+    from sqlalchemy import insert, update
+    from backend.persistance.seller_payout import SellerPayout
+    from backend.services.sellerServices import SellerService
+
+    async def fn(session):
+        await _seed(session)
+        # Seller 1's 15.5 is paid out in two parts
+        await session.execute(update(SellerPayout).where(SellerPayout.payout_id == 1).values(amount=10.0))
+        await session.execute(insert(SellerPayout).values(
+            payout_id=4, seller_id=1, amount=5.5, currency="USD",
+            date_of_payment=dt.date(2026, 3, 15), status="completed",
+        ))
+        await session.commit()
+        service = SellerService(session)
+        payout = await service.get_seller_payout(1, 2026, 3)
+        summary = await service.payout_summary(1, 2026, 3)
+        reconciled = await service.reconcile_seller_payouts(2026, 3)
+        return payout, summary, reconciled[0]
+
+    payout, summary, reconciled = _run(fn)
+    assert payout.payout_id == 4
+    assert summary["payout_total"] == reconciled["payout_total"] == 15.5
+    assert summary["matches"] is reconciled["matches"] is True
+
+
+def test_reconcile_seller_payouts_covers_every_seller_in_two_queries():
+    from backend.benchmarks._support import QueryCounter
+    from backend.services.sellerServices import SellerService
+
+    async def fn(session):
+        await _seed(session)
+        counter = QueryCounter(session.bind)
+        with counter.track():
+            rows = await SellerService(session).reconcile_seller_payouts(2026, 3)
+        return rows, counter.count
+
+    rows, queries = _run(fn)
+    assert queries == 2
+    assert rows == [
+        {"seller_id": 1, "order_total": 15.5, "payout_total": 15.5, "matches": True},
+        {"seller_id": 2, "order_total": 7.0, "payout_total": 9.0, "matches": False},
+        {"seller_id": 3, "order_total": 0.0, "payout_total": 4.0, "matches": False},
+    ]
+
+
+def test_payout_queries_stay_flat_as_orders_grow():
+    small = asyncio.run(seller_payout.measure(500, n_sellers=5, mode="batch"))
+    large = asyncio.run(seller_payout.measure(3000, n_sellers=5, mode="batch"))
+    single = asyncio.run(seller_payout.measure(3000, n_sellers=5, mode="sql"))
+    assert small["queries"] == large["queries"] == single["queries"] == 2
+    assert small["reconciled"] == large["reconciled"] == 5
+    assert single["reconciled"] == 1
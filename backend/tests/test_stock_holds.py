@@ -0,0 +1,192 @@
+import asyncio
+import datetime as dt
+from types import SimpleNamespace
+
+import pytest
+
+T0 = dt.datetime(2026, 1, 1, 12, 0, 0)
+
+
+def _run(fn):
+    from backend.benchmarks._support import make_engine, seed_catalog, seed_variants
+
+    async def run():
+        engine, Session = await make_engine()
+        try:
+            async with Session() as session:
+                await seed_variants(session, await seed_catalog(session, 12))
+            async with Session() as session:
+                return await fn(session)
+        finally:
+            await engine.dispose()
+
+    return asyncio.run(run())
+
+
+async def _stock(session, *variant_ids):
+    from sqlalchemy import select
+    from backend.persistance.product_variant import ProductVariant
+
+    rows = await session.execute(
+        select(ProductVariant.variant_id, ProductVariant.quantity).where(ProductVariant.variant_id.in_(variant_ids))
+    )
+    return dict(rows.all())
+
+
+async def _statuses(session):
+    from sqlalchemy import select
+    from backend.persistance.stock_hold import StockHold
+
+    rows = await session.execute(select(StockHold.variant_id, StockHold.quantity, StockHold.status).order_by(StockHold.hold_id))
+    return [tuple(row) for row in rows.all()]
+
+
+def test_hold_takes_stock_once_and_rehold_adjusts_by_difference():
+    from backend.repositories.repository.product_variant_repository import InsufficientStockError
+    from backend.services.stock_hold_service import StockHoldService
+
+    async def fn(session):
+        service = StockHoldService(session, ttl_seconds=600)
+        # Variants 6, 8 and 9 start with 3, 4 and 5 units
+        holds = [(h.variant_id, h.quantity, h.expires_at) for h in await service.hold(1, {6: 2, 8: 1}, now=T0)]
+        after_first = await _stock(session, 6, 8, 9)
+        await service.hold(1, {6: 1, 9: 5}, now=T0)
+        after_second = await _stock(session, 6, 8, 9)
+        with pytest.raises(InsufficientStockError):
+            await service.hold(1, {6: 1, 9: 6}, now=T0)
+        return holds, after_first, after_second, await _stock(session, 6, 8, 9), await _statuses(session)
+
+    holds, first, second, final, statuses = _run(fn)
+    assert holds == [
+        (6, 2, T0 + dt.timedelta(minutes=10)), (8, 1, T0 + dt.timedelta(minutes=10)),
+    ]
+    assert first == {6: 1, 8: 3, 9: 5}
+    assert second == final == {6: 2, 8: 4, 9: 0}
+    # The failed re-hold left the second set of holds active
+    assert statuses == [(6, 2, "released"), (8, 1, "released"), (6, 1, "held"), (9, 5, "held")]
+
+
+def test_convert_uses_live_holds_and_returns_the_rest():
+    from backend.services.stock_hold_service import StockHoldService
+
+    async def fn(session):
+        service = StockHoldService(session, ttl_seconds=60)
+        await service.hold(1, {6: 3, 8: 2}, now=T0)
+        await service.hold(2, {10: 1}, now=T0 - dt.timedelta(hours=1))
+        needed = await service.convert(1, {6: 1, 8: 4}, now=T0)
+        # User 2's hold has expired: nothing to convert
+        expired = await service.convert(2, {10: 1}, now=T0)
+        return needed, expired, await _stock(session, 6, 8, 10), await _statuses(session)
+
+    needed, expired, stock, statuses = _run(fn)
+    assert needed == {8: 2}
+    assert expired == {10: 1}
+    # Two surplus units of variant 6 went back to stock
+    assert stock == {6: 2, 8: 2, 10: 4}
+    assert statuses == [(6, 3, "converted"), (8, 2, "converted"), (10, 1, "held")]
+
+
+def test_sweep_returns_expired_holds_in_batches():
+    from backend.benchmarks._support import QueryCounter
+    from backend.services.stock_hold_service import StockHoldService
+
+    async def fn(session):
+        service = StockHoldService(session, ttl_seconds=60)
+        for user in (1, 2, 3):
+            await service.hold(user, {8: 1, 10: 1}, now=T0 - dt.timedelta(minutes=user))
+        await service.hold(4, {8: 1}, now=T0)
+        counter = QueryCounter(session.bind)
+        with counter.track():
+            swept = await service.sweep(now=T0, batch_size=4)
+        again = await service.sweep(now=T0)
+        return swept, counter.count, counter.commits, again, await _stock(session, 8, 10), await _statuses(session)
+
+    swept, queries, commits, again, stock, statuses = _run(fn)
+    assert swept == 6 and again == 0
+    # Per batch: expire holds, return stock; batches of 4 and 2
+    assert queries == 4 and commits == 2
+    assert stock == {8: 3, 10: 5}
+    assert [s for _, _, s in statuses] == ["expired"] * 6 + ["held"]
+
+
+def test_deduct_inventory_converts_holds_before_reserving():
+    from backend.services.customerServices import deduct_inventory
+    from backend.services.stock_hold_service import StockHoldService
+
+    def line(product_id, variant_id, quantity):
+        return SimpleNamespace(product_id=product_id, variant_id=variant_id, quantity=quantity)
+
+    async def fn(session):
+        await StockHoldService(session).hold(1, {6: 3})
+        # Stock is all held by user 1; anyone else is refused
+        other = await deduct_inventory([line(3, 6, 1)], session, user_id=2)
+        mine = await deduct_inventory([line(3, 6, 2), line(4, 8, 1)], session, user_id=1)
+        return other, mine, await _stock(session, 6, 8), await _statuses(session)
+
+    other, mine, stock, statuses = _run(fn)
+    assert other == (False, "Not enough stock for variant 6")
+    assert mine == (True, None)
+    assert stock == {6: 1, 8: 3}
+    assert statuses == [(6, 3, "converted")]
+
+
+def test_failed_hold_and_deduction_inside_a_request_unit_leave_stock_alone():
+    from backend.persistance.unit_of_work import UnitOfWork
+    from backend.repositories.repository.product_variant_repository import InsufficientStockError
+    from backend.services.customerServices import deduct_inventory
+    from backend.services.stock_hold_service import StockHoldService
+
+    def line(product_id, variant_id, quantity):
+        return SimpleNamespace(product_id=product_id, variant_id=variant_id, quantity=quantity)
+
+    async def fn(session):
+        service = StockHoldService(session, ttl_seconds=600)
+        await service.hold(1, {6: 2})
+        # As under TransactionMiddleware: the 409 is handled and the request's unit commits
+        async with UnitOfWork(session):
+            with pytest.raises(InsufficientStockError):
+                await service.hold(1, {6: 2, 9: 6})
+        after_hold = await _stock(session, 6, 9), await _statuses(session)
+        async with UnitOfWork(session):
+            deducted = await deduct_inventory([line(3, 6, 2), line(4, 9, 6)], session, user_id=1)
+        return after_hold, deducted, await _stock(session, 6, 9), await _statuses(session)
+
+    after_hold, deducted, stock, statuses = _run(fn)
+    assert after_hold == ({6: 1, 9: 5}, [(6, 2, "held")])
+    assert deducted == (False, "Not enough stock for variant 9")
+    # The hold was not converted by the failed deduction
+    assert stock == {6: 1, 9: 5}
+    assert statuses == [(6, 2, "held")]
+
+
+def test_checkout_hold_route_holds_cart_and_reports_shortage():
+    from fastapi import HTTPException
+    from sqlalchemy import insert
+    from backend.api.routes_customer import hold_checkout_stock_route, release_checkout_stock_route
+    from backend.persistance.cart import Cart
+    from backend.persistance.cart_item import CartItem
+
+    async def fn(session):
+        await session.execute(insert(Cart).values(cart_id=1, user_id=1))
+        await session.execute(insert(CartItem), [
+            {"cart_id": 1, "product_id": 4, "variant_id": 8, "quantity": 2},
+            {"cart_id": 1, "product_id": 4, "variant_id": 8, "quantity": 1},
+            {"cart_id": 1, "product_id": 2, "variant_id": None, "quantity": 1},
+        ])
+        await session.commit()
+        held = await hold_checkout_stock_route(identity={"user_id": 1}, db=session)
+        stock_held = await _stock(session, 8)
+        released = await release_checkout_stock_route(identity={"user_id": 1}, db=session)
+        await session.execute(insert(CartItem).values(cart_id=1, product_id=9, variant_id=19, quantity=1))
+        await session.commit()
+        with pytest.raises(HTTPException) as short:
+            await hold_checkout_stock_route(identity={"user_id": 1}, db=session)
+        return held, stock_held, released, short.value, await _stock(session, 8)
+
+    held, stock_held, released, short, stock = _run(fn)
+    assert [(h.variant_id, h.quantity) for h in held.holds] == [(8, 3)]
+    assert held.expires_at is not None
+    assert stock_held == {8: 1}
+    assert released.released == 1
+    assert short.status_code == 409 and short.detail["variant_ids"] == [19]
+    assert stock == {8: 4}
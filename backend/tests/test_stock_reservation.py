@@ -0,0 +1,90 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from backend.benchmarks import stock_reservation
+
+
+def _run(fn):
+    from backend.benchmarks._support import make_engine, seed_catalog, seed_variants
+
+    async def run():
+        engine, Session = await make_engine()
+        try:
+            async with Session() as session:
+                await seed_variants(session, await seed_catalog(session, 12))
+            async with Session() as session:
+                return await fn(session)
+        finally:
+            await engine.dispose()
+
+    return asyncio.run(run())
+
+
+async def _stock(session, *variant_ids):
+    from sqlalchemy import select
+    from backend.persistance.product_variant import ProductVariant
+
+    rows = await session.execute(
+        select(ProductVariant.variant_id, ProductVariant.quantity).where(ProductVariant.variant_id.in_(variant_ids))
+    )
+    return dict(rows.all())
+
+
+def test_reserve_stock_is_one_statement_and_all_or_nothing():
+    from sqlalchemy import update
+    from backend.benchmarks._support import QueryCounter
+    from backend.persistance.product_variant import ProductVariant
+    from backend.repositories.repository.product_variant_repository import (
+        InsufficientStockError, ProductVariantRepository,
+    )
+
+    async def fn(session):
+        repo = ProductVariantRepository(session)
+        counter = QueryCounter(session.bind)
+        with counter.track():
+            remaining = await repo.reserve_stock({6: 2, 8: 4, 10: 1})
+        queries = counter.count
+        # Variant 19 is sold out: the other lines are given back
+        with pytest.raises(InsufficientStockError) as short:
+            await repo.reserve_stock({6: 1, 19: 1})
+        await session.execute(update(ProductVariant).where(ProductVariant.variant_id == 7).values(is_active=False))
+        with pytest.raises(InsufficientStockError) as inactive:
+            await repo.reserve_stock({7: 1})
+        ok = await repo.decrement_stock(9, 5)
+        too_many = await repo.decrement_stock(9, 1)
+        return queries, remaining, short.value.variant_ids, inactive.value.variant_ids, ok, too_many, await _stock(session, 6, 7, 9, 19)
+
+    queries, remaining, short, inactive, ok, too_many, stock = _run(fn)
+    assert queries == 1
+    assert remaining == {6: 1, 8: 0, 10: 4}
+    assert short == [19] and inactive == [7]
+    assert ok is True and too_many is False
+    assert stock == {6: 1, 7: 4, 9: 0, 19: 0}
+
+
+def test_deduct_inventory_reports_the_short_line():
+    from backend.services.customerServices import deduct_inventory
+
+    def line(product_id, variant_id, quantity):
+        return SimpleNamespace(product_id=product_id, variant_id=variant_id, quantity=quantity)
+
+    async def fn(session):
+        ok = await deduct_inventory([line(3, 6, 1), line(3, 6, 1), line(2, None, 9)], session)
+        short = await deduct_inventory([line(3, 6, 2), line(4, 8, 1)], session)
+        missing = await deduct_inventory([line(99, None, 1), line(4, 8, 1)], session)
+        return ok, short, missing, await _stock(session, 6, 8)
+
+    ok, short, missing, stock = _run(fn)
+    assert ok == (True, None)
+    assert short == (False, "Not enough stock for variant 6")
+    assert missing == (False, "Not enough stock for product 99")
+    assert stock == {6: 1, 8: 4}
+
+
+def test_concurrent_buyers_never_oversell():
+    conditional = asyncio.run(stock_reservation.measure(30, stock=10))
+    assert conditional["errors"] == 0
+    assert conditional["sold"] == conditional["removed"] == 10
+    assert conditional["oversold"] == 0
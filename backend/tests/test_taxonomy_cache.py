@@ -0,0 +1,94 @@
+import asyncio
+
+from sqlalchemy import insert, update
+
+from backend.benchmarks._support import QueryCounter, make_engine, seed_catalog
+from backend.persistance.category import Category
+from backend.persistance.subcategory import Subcategory
+from backend.persistance.unit_of_work import UnitOfWork
+from backend.services.taxonomy_cache import TaxonomyCache, taxonomy_cache
+
+
+def test_taxonomy_cache_serves_from_memory_and_invalidates_on_write():
+    async def run():
+        engine, Session = await make_engine()
+        try:
+            async with Session() as session:
+                await seed_catalog(session, 2, categories=2)
+            counter = QueryCounter(engine)
+            async with Session() as session:
+                first = await taxonomy_cache.get(session)
+                with counter.track():
+                    again = await taxonomy_cache.get(session)
+                assert again is first
+                assert counter.count == 0
+                assert first.category_name(1) == "Category 1"
+                assert first.tree[0]["subcategories"][0]["image_url"] == "/static/subcategories/1.jpg"
+
+                # ORM write invalidates on commit
+                cat = await session.get(Category, 1)
+                cat.name = "Renamed"
+                await session.commit()
+                renamed = await taxonomy_cache.get(session)
+                assert renamed.version > first.version
+                assert renamed.category_name(1) == "Renamed"
+
+                # Bulk Core-style writes through the session invalidate too
+                await session.execute(insert(Subcategory).values(subcategory_id=9, category_id=2, name="New Sub"))
+                await session.execute(update(Category).where(Category.category_id == 2).values(image_url=None))
+                await session.commit()
+                bulk = await taxonomy_cache.get(session)
+                assert bulk.subcategory_name(9) == "New Sub"
+                assert bulk.category_image(2) is None
+
+                # Rolled-back writes leave the cache alone
+                await session.execute(update(Category).where(Category.category_id == 1).values(name="Nope"))
+                await session.rollback()
+                assert await taxonomy_cache.get(session) is bulk
+        finally:
+            await engine.dispose()
+
+    asyncio.run(run())
+
+
+def test_taxonomy_write_survives_a_failed_nested_unit():
+    async def run():
+        engine, Session = await make_engine()
+        try:
+            async with Session() as session:
+                await seed_catalog(session, 1, categories=1)
+            async with Session() as session:
+                first = await taxonomy_cache.get(session)
+                async with UnitOfWork(session):
+                    cat = await session.get(Category, 1)
+                    cat.name = "Renamed"
+                    await session.flush()
+                    try:
+                        async with UnitOfWork(session):
+                            raise RuntimeError("boom")
+                    except RuntimeError:
+                        pass
+                # The outer unit committed the rename, so the snapshot is stale
+                renamed = await taxonomy_cache.get(session)
+                assert renamed is not first
+                assert renamed.category_name(1) == "Renamed"
+        finally:
+            await engine.dispose()
+
+    asyncio.run(run())
+
+
+def test_taxonomy_cache_ttl_expires_snapshot():
+    async def run():
+        engine, Session = await make_engine()
+        try:
+            async with Session() as session:
+                await seed_catalog(session, 1, categories=1)
+            cache = TaxonomyCache(ttl_seconds=0)
+            async with Session() as session:
+                first = await cache.get(session)
+                assert await cache.get(session) is not first
+        finally:
+            await engine.dispose()
+
+    asyncio.run(run())
@@ -0,0 +1,57 @@
+import datetime as dt
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from backend.benchmarks import trend_analysis
+
+
+def test_series_bucket_by_day_iso_week_and_month():
+    from backend.utilities.analysis import order_count_series, revenue_profit_series, units_sold_series
+
+    timestamps = np.array(
+        ['2026-03-01T23:59', '2026-03-02T00:00', '2026-03-08T12:00', '2026-03-09T08:00', '2026-04-30T10:00'],
+        dtype='datetime64[m]',
+    )
+    weekly = units_sold_series(timestamps, [1, 2, 3, 4, 5], 'weekly')
+    assert weekly['periods'].astype(str).tolist() == ['2026-02-23', '2026-03-02', '2026-03-09', '2026-04-27']
+    assert weekly['units_sold'].tolist() == [1, 5, 4, 5]
+    assert weekly['average_per_period'] == 3.75
+    monthly = revenue_profit_series(timestamps, [10, 20, 30, 40, 50], 'monthly', fee_rate=0.5, shipping_cost=1)
+    assert monthly['periods'].astype(str).tolist() == ['2026-03-01', '2026-04-01']
+    assert monthly['revenue'].tolist() == [100.0, 50.0]
+    assert monthly['profit'].tolist() == [46.0, 24.0]
+    daily = order_count_series(timestamps)
+    assert daily['order_count'].tolist() == [1, 1, 1, 1, 1]
+    empty = order_count_series(np.array([], dtype='datetime64[m]'), 'weekly')
+    assert len(empty['periods']) == 0 and empty['average_orders_per_period'] == 0
+
+
+@pytest.mark.parametrize("period", ["daily", "weekly", "monthly"])
+def test_adapters_match_the_previous_loops(period):
+    from backend.utilities.analysis import (
+        analyze_order_count_trends, analyze_revenue_profit_trends, analyze_units_sold_trends,
+    )
+
+    orders = trend_analysis.make_orders(trend_analysis.make_columns(3000, seed=3))
+    orders.append(SimpleNamespace(created_at=None, total_amount=99.0, order_items=[]))
+    orders.append(SimpleNamespace(created_at=dt.datetime(2030, 1, 1), total_amount=5.0, order_items=[]))
+    expected = trend_analysis.loop_trends(orders, period)
+
+    units = analyze_units_sold_trends(orders, period)
+    revenue = analyze_revenue_profit_trends(orders, period)
+    counts = analyze_order_count_trends(orders, period)
+    assert units['trends'] == expected['units']
+    assert counts['order_count_trends'] == expected['counts']
+    assert revenue['revenue_trends'] == pytest.approx(expected['revenue'])
+    assert revenue['profit_trends'] == pytest.approx(expected['profit'])
+    # Only the series come back, not the input orders
+    assert 'orders' not in units and 'orders' not in revenue and 'orders' not in counts
+
+
+def test_columnar_matches_the_loops():
+    # Timings are left to backend/benchmarks/trend_analysis.py
+    loop = trend_analysis.measure(5000, mode='loop')
+    columnar = trend_analysis.measure(5000, mode='columnar')
+    assert columnar['units_sold'] == loop['units_sold']
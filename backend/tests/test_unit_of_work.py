@@ -0,0 +1,167 @@
+import asyncio
+
+import httpx
+import pytest
+from fastapi import Depends, FastAPI, HTTPException
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.benchmarks import unit_of_work as bench
+from backend.benchmarks._support import QueryCounter, make_engine, seed_catalog
+from backend.persistance.db_dependency import get_db
+from backend.persistance.product import Product
+from backend.persistance.unit_of_work import UnitOfWork, in_unit_of_work
+
+
+def test_unit_of_work_commits_once():
+    auto = asyncio.run(bench.measure(n_variants=3, n_images=2, unit_of_work=False))
+    uow = asyncio.run(bench.measure(n_variants=3, n_images=2, unit_of_work=True))
+    # One commit per save (+ the final one) vs. a single commit
+    assert auto["commits"] == auto["rows"] + 1
+    assert uow["commits"] == 1
+
+
+async def _products(Session):
+    async with Session() as session:
+        return (await session.execute(select(func.count()).select_from(Product))).scalar_one()
+
+
+def _with_engine(fn):
+    async def run():
+        engine, Session = await make_engine()
+        try:
+            async with Session() as session:
+                await seed_catalog(session, 1)
+            return await fn(engine, Session)
+        finally:
+            await engine.dispose()
+
+    return asyncio.run(run())
+
+
+def test_unit_of_work_rolls_back_and_nests():
+    async def fn(engine, Session):
+        counter = QueryCounter(engine)
+        async with Session() as session:
+            with pytest.raises(RuntimeError):
+                async with UnitOfWork(session):
+                    await bench.create_product(session, n_variants=1, n_images=1)
+                    raise RuntimeError("boom")
+            assert not in_unit_of_work(session)
+        failed = await _products(Session)
+        async with Session() as session:
+            with counter.track():
+                async with UnitOfWork(session):
+                    async with UnitOfWork(session):
+                        await bench.create_product(session, n_variants=1, n_images=1)
+                    assert in_unit_of_work(session)
+                    inner_commits = counter.commits
+            outer_commits = counter.commits
+        return failed, inner_commits, outer_commits, await _products(Session)
+
+    failed, inner_commits, outer_commits, kept = _with_engine(fn)
+    assert failed == 1
+    assert (inner_commits, outer_commits) == (0, 1)
+    assert kept == 2
+
+
+def test_failed_nested_unit_rolls_back_only_its_own_writes():
+    async def fn(engine, Session):
+        async with Session() as session:
+            # The inner unit opens first: its savepoint must not commit on its own
+            async with UnitOfWork(session):
+                async with UnitOfWork(session):
+                    await bench.create_product(session, n_variants=1, n_images=1)
+                try:
+                    async with UnitOfWork(session):
+                        await bench.create_product(session, n_variants=1, n_images=1)
+                        raise RuntimeError("boom")
+                except RuntimeError:
+                    pass
+                assert in_unit_of_work(session)
+        kept = await _products(Session)
+        async with Session() as session:
+            with pytest.raises(RuntimeError):
+                async with UnitOfWork(session):
+                    async with UnitOfWork(session):
+                        await bench.create_product(session, n_variants=1, n_images=1)
+                    raise RuntimeError("boom")
+        return kept, await _products(Session)
+
+    kept, after_outer_error = _with_engine(fn)
+    # Only the successful nested unit's product is committed
+    assert kept == 2
+    # A released savepoint is still undone by the outer rollback
+    assert after_outer_error == 2
+
+
+def test_edit_product_updates_existing_variants(tmp_path, monkeypatch):
+    from backend.persistance.product_variant import ProductVariant
+    from backend.services.sellerServices import SellerService
+
+    # edit_product creates image folders relative to the working directory
+    monkeypatch.chdir(tmp_path)
+
+    async def fn(engine, Session):
+        async with Session() as session:
+            pid = await bench.create_product(session, n_variants=1, n_images=0)
+            vid = (await session.execute(
+                select(ProductVariant.variant_id).where(ProductVariant.product_id == pid)
+            )).scalar_one()
+            async with UnitOfWork(session):
+                await SellerService(session).edit_product({
+                    "product_id": pid,
+                    "title": "Edited",
+                    # New variants need a generated BIGINT id, which SQLite lacks
+                    "variants": [{"variant_id": vid, "name": "Small", "price": 3, "stock": 4}],
+                })
+        async with Session() as session:
+            rows = await session.execute(
+                select(ProductVariant.variant_name, ProductVariant.price, ProductVariant.quantity)
+                .where(ProductVariant.product_id == pid).order_by(ProductVariant.variant_id)
+            )
+            return [(name, float(price), quantity) for name, price, quantity in rows.all()]
+
+    assert _with_engine(fn) == [("Small", 3.0, 4)]
+
+
+def test_transaction_middleware_commits_once_per_request(monkeypatch):
+    from backend import app as app_module
+    from backend.repositories.repository.product_repository import ProductRepository
+
+    def product(title):
+        return Product(seller_id=1, category_id=1, title=title, description="d", price=1, currency="USD")
+
+    async def fn(engine, Session):
+        monkeypatch.setattr(app_module, "AsyncSessionLocal", Session)
+        api = FastAPI()
+        api.add_middleware(app_module.TransactionMiddleware)
+
+        @api.post("/products")
+        async def create(db: AsyncSession = Depends(get_db)):
+            for n in range(3):
+                await ProductRepository(db).save(product(f"P{n}"))
+            return {"ok": True}
+
+        @api.post("/explode")
+        async def explode(db: AsyncSession = Depends(get_db)):
+            await ProductRepository(db).save(product("X"))
+            raise RuntimeError("boom")
+
+        counter = QueryCounter(engine)
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=api), base_url="http://test") as client:
+            with counter.track():
+                ok = await client.post("/products")
+            commits = counter.commits
+            created = await _products(Session)
+            # Unhandled errors propagate through the middleware, which rolls back
+            with pytest.raises(RuntimeError):
+                await client.post("/explode")
+        return ok.status_code, commits, created, await _products(Session)
+
+    status, commits, created, after_error = _with_engine(fn)
+    assert status == 200
+    # Three saves, one commit
+    assert commits == 1
+    assert created == 4
+    assert after_error == 4
@@ -4,9 +4,182 @@
 # ------------------------------------------------------------------------------
 # Utility functions for analyzing order trends, revenue, and profit in sales data.
 # Provides daily, weekly, and monthly aggregation for reporting and dashboards.
+# Seller reports aggregate in SQL (OrderAnalyticsRepository); these helpers are
+# the in-memory fallback, used when a report asks for a specific analysis_func.
+#
+# The *_series functions are columnar: they take NumPy arrays (timestamps,
+# quantities, amounts), bucket them with datetime64 truncation and sum each
+# bucket with np.bincount, and return only the series. The analyze_* functions
+# keep their original signatures and result keys as adapters over them.
 # ------------------------------------------------------------------------------
 
-from typing import List, Dict, Any
+from typing import Any, Callable, Dict, List, Tuple
+
+import numpy as np
+
+# 1970-01-01 was a Thursday: three days after the Monday that starts its ISO week
+_EPOCH_WEEKDAY = 3
+# date.toordinal() of 1970-01-01, the datetime64 epoch
+_EPOCH_ORDINAL = 719163
+
+
+def _period_codes(timestamps: Any, period: str) -> Tuple[np.ndarray, Callable[[np.ndarray], np.ndarray]]:
+    """Consecutive integer codes for each timestamp's period, and how to turn codes back into start days."""
+    days = np.asarray(timestamps, dtype='datetime64[D]')
+    if period == 'weekly':
+        return (
+            (days.view('int64') + _EPOCH_WEEKDAY) // 7,
+            lambda codes: (codes * 7 - _EPOCH_WEEKDAY).astype('datetime64[D]'),
+        )
+    if period == 'monthly':
+        return (
+            days.astype('datetime64[M]').view('int64'),
+            lambda codes: codes.astype('datetime64[M]').astype('datetime64[D]'),
+        )
+    return days.view('int64'), lambda codes: codes.astype('datetime64[D]')
+
+
+def bucket_periods(timestamps: Any, period: str = 'daily') -> np.ndarray:
+    """
+    First day of the period containing each timestamp.
+    Args:
+        timestamps (array-like): datetime64 values (or anything np.asarray turns into them).
+        period (str): 'daily', 'weekly' (ISO weeks, from Monday) or 'monthly'; anything else is daily.
+    Returns:
+        np.ndarray: datetime64[D] period starts, one per timestamp.
+    """
+    codes, to_start = _period_codes(timestamps, period)
+    return to_start(codes)
+
+
+def trend_series(timestamps: Any, period: str = 'daily', **columns: Any) -> Dict[str, np.ndarray]:
+    """
+    Per-period sums of each column, plus the number of rows per period.
+
+    Period codes are offset to start at zero and summed with np.bincount, so
+    no sort is needed; periods without rows are left out.
+    Args:
+        timestamps (array-like): datetime64 per row.
+        period (str): Aggregation period ('daily', 'weekly', 'monthly').
+        **columns: Numeric arrays aligned with `timestamps`.
+    Returns:
+        dict: 'periods' (sorted datetime64[D] starts), 'count', and one summed array per column.
+    """
+    codes, to_start = _period_codes(timestamps, period)
+    if not len(codes):
+        empty: Dict[str, np.ndarray] = {
+            'periods': np.array([], dtype='datetime64[D]'), 'count': np.array([], dtype='int64'),
+        }
+        empty.update({name: np.array([], dtype='float64') for name in columns})
+        return empty
+    low = codes.min()
+    index = codes - low
+    count = np.bincount(index)
+    present = np.flatnonzero(count)
+    series: Dict[str, np.ndarray] = {'periods': to_start(present + low), 'count': count[present]}
+    for name, values in columns.items():
+        sums = np.bincount(index, weights=np.asarray(values, dtype='float64'), minlength=len(count))
+        series[name] = sums[present]
+    return series
+
+
+def _average(values: np.ndarray) -> float:
+    return float(values.mean()) if len(values) else 0
+
+
+def units_sold_series(timestamps: Any, quantities: Any, period: str = 'daily') -> Dict[str, Any]:
+    """
+    Units sold per period.
+    Args:
+        timestamps (array-like): Order (or order line) timestamps.
+        quantities (array-like): Units per timestamp.
+        period (str): Aggregation period ('daily', 'weekly', 'monthly').
+    Returns:
+        dict: 'periods', 'units_sold' and 'average_per_period'.
+    """
+    series = trend_series(timestamps, period, units_sold=quantities)
+    units = series['units_sold'].astype('int64')
+    return {'periods': series['periods'], 'units_sold': units, 'average_per_period': _average(units)}
+
+
+def revenue_profit_series(
+    timestamps: Any,
+    amounts: Any,
+    period: str = 'daily',
+    fee_rate: float = 0.1,
+    shipping_cost: float = 0,
+    ad_cost: float = 0
+) -> Dict[str, Any]:
+    """
+    Revenue and profit per period.
+    Args:
+        timestamps (array-like): Order timestamps.
+        amounts (array-like): Order totals.
+        period (str): Aggregation period ('daily', 'weekly', 'monthly').
+        fee_rate (float): Platform fee rate as a decimal.
+        shipping_cost (float): Shipping cost per order.
+        ad_cost (float): Advertising cost per order.
+    Returns:
+        dict: 'periods', 'revenue', 'profit' and their averages per period.
+    """
+    series = trend_series(timestamps, period, revenue=amounts)
+    revenue = series['revenue']
+    profit = revenue * (1 - fee_rate) - (shipping_cost + ad_cost) * series['count']
+    return {
+        'periods': series['periods'],
+        'revenue': revenue,
+        'profit': profit,
+        'average_revenue_per_period': _average(revenue),
+        'average_profit_per_period': _average(profit),
+    }
+
+
+def order_count_series(timestamps: Any, period: str = 'daily') -> Dict[str, Any]:
+    """
+    Orders per period.
+    Args:
+        timestamps (array-like): Order timestamps.
+        period (str): Aggregation period ('daily', 'weekly', 'monthly').
+    Returns:
+        dict: 'periods', 'order_count' and 'average_orders_per_period'.
+    """
+    series = trend_series(timestamps, period)
+    return {
+        'periods': series['periods'],
+        'order_count': series['count'],
+        'average_orders_per_period': _average(series['count']),
+    }
+
+
+# ------------------------------------------------------------------------------
+# Adapters: order objects in, trend dicts keyed as before (date for daily, ISO
+# week number for weekly, (year, month) for monthly).
+# ------------------------------------------------------------------------------
+def _dated(orders: List[Any]) -> Tuple[List[Any], np.ndarray]:
+    """Orders that have a created_at, and their days as datetime64[D]."""
+    dated = [order for order in orders if getattr(order, 'created_at', None)]
+    # toordinal() is far cheaper than letting NumPy parse datetime objects
+    ordinals = np.fromiter((order.created_at.toordinal() for order in dated), dtype='int64', count=len(dated))
+    return dated, (ordinals - _EPOCH_ORDINAL).astype('datetime64[D]')
+
+
+def _legacy_key(start: np.datetime64, period: str) -> Any:
+    day = start.astype('datetime64[D]').item()
+    if period == 'weekly':
+        return day.isocalendar()[1]
+    if period == 'monthly':
+        return (day.year, day.month)
+    return day
+
+
+def _keyed(periods: np.ndarray, values: np.ndarray, period: str, cast: Any) -> Dict[Any, Any]:
+    # Weekly keys are week numbers only, so the same week of different years shares a key
+    trends: Dict[Any, Any] = {}
+    for start, value in zip(periods, values.tolist()):
+        key = _legacy_key(start, period)
+        trends[key] = trends.get(key, 0) + cast(value)
+    return trends
+
 
 def analyze_units_sold_trends(orders: List[Any], period: str = 'daily') -> Dict[str, Any]:
     """
@@ -15,28 +188,22 @@ def analyze_units_sold_trends(orders: List[Any], period: str = 'daily') -> Dict[
         orders (list): List of order objects with 'created_at' and 'order_items'.
         period (str): Aggregation period ('daily', 'weekly', 'monthly').
     Returns:
-        dict: Trends, average per period, and original orders.
-    """
-    from collections import defaultdict
-    trends: 'defaultdict[Any, int]' = defaultdict(int)
-    for order in orders:
-        date = getattr(order, 'created_at', None)
-        if not date:
-            continue
-        if period == 'daily':
-            key = date.date()
-        elif period == 'weekly':
-            key = date.isocalendar()[1]
-        elif period == 'monthly':
-            key = (date.year, date.month)
-        else:
-            key = date.date()
-        for item in getattr(order, 'order_items', []):
-            trends[key] += item.quantity
+        dict: Trends and average per period.
+    """
+    dated, timestamps = _dated(orders)
+    items = [getattr(order, 'order_items', []) for order in dated]
+    series = trend_series(
+        timestamps, period,
+        units_sold=[sum(item.quantity for item in lines) for lines in items],
+        lines=[len(lines) for lines in items],
+    )
+    # Periods whose orders had no items are not trends
+    has_lines = series['lines'] > 0
+    trends = _keyed(series['periods'][has_lines], series['units_sold'][has_lines], period, int)
     if not trends:
-        return {'trends': {}, 'average_per_period': 0, 'orders': orders}
-    avg = sum(trends.values()) / len(trends)
-    return {'trends': dict(trends), 'average_per_period': avg, 'orders': orders}
+        return {'trends': {}, 'average_per_period': 0}
+    return {'trends': trends, 'average_per_period': sum(trends.values()) / len(trends)}
+
 
 def analyze_revenue_profit_trends(
     orders: List[Any],
@@ -54,38 +221,21 @@ def analyze_revenue_profit_trends(
         shipping_cost (float): Shipping cost per order.
         ad_cost (float): Advertising cost per order.
     Returns:
-        dict: Revenue/profit trends, averages, and original orders.
-    """
-    from collections import defaultdict
-    revenue_trends: 'defaultdict[Any, float]' = defaultdict(float)
-    profit_trends: 'defaultdict[Any, float]' = defaultdict(float)
-    for order in orders:
-        date = getattr(order, 'created_at', None)
-        if not date:
-            continue
-        if period == 'daily':
-            key = date.date()
-        elif period == 'weekly':
-            key = date.isocalendar()[1]
-        elif period == 'monthly':
-            key = (date.year, date.month)
-        else:
-            key = date.date()
-        revenue = getattr(order, 'total_amount', 0)
-        fees = revenue * fee_rate
-        profit = revenue - fees - shipping_cost - ad_cost
-        revenue_trends[key] += revenue
-        profit_trends[key] += profit
-    avg_revenue = sum(revenue_trends.values()) / len(revenue_trends) if revenue_trends else 0
-    avg_profit = sum(profit_trends.values()) / len(profit_trends) if profit_trends else 0
+        dict: Revenue/profit trends and averages.
+    """
+    dated, timestamps = _dated(orders)
+    amounts = [float(getattr(order, 'total_amount', 0) or 0) for order in dated]
+    series = revenue_profit_series(timestamps, amounts, period, fee_rate, shipping_cost, ad_cost)
+    revenue_trends = _keyed(series['periods'], series['revenue'], period, float)
+    profit_trends = _keyed(series['periods'], series['profit'], period, float)
     return {
-        'revenue_trends': dict(revenue_trends),
-        'profit_trends': dict(profit_trends),
-        'average_revenue_per_period': avg_revenue,
-        'average_profit_per_period': avg_profit,
-        'orders': orders
+        'revenue_trends': revenue_trends,
+        'profit_trends': profit_trends,
+        'average_revenue_per_period': sum(revenue_trends.values()) / len(revenue_trends) if revenue_trends else 0,
+        'average_profit_per_period': sum(profit_trends.values()) / len(profit_trends) if profit_trends else 0,
     }
 
+
 def analyze_order_count_trends(orders: List[Any], period: str = 'daily') -> Dict[str, Any]:
     """
     Analyze order count trends over a given period.
@@ -93,22 +243,10 @@ def analyze_order_count_trends(orders: List[Any], period: str = 'daily') -> Dict
         orders (list): List of order objects with 'created_at'.
         period (str): Aggregation period ('daily', 'weekly', 'monthly').
     Returns:
-        dict: Order count trends, average per period, and original orders.
-    """
-    from collections import defaultdict
-    trends: 'defaultdict[Any, int]' = defaultdict(int)
-    for order in orders:
-        date = getattr(order, 'created_at', None)
-        if not date:
-            continue
-        if period == 'daily':
-            key = date.date()
-        elif period == 'weekly':
-            key = date.isocalendar()[1]
-        elif period == 'monthly':
-            key = (date.year, date.month)
-        else:
-            key = date.date()
-        trends[key] += 1
+        dict: Order count trends and average per period.
+    """
+    _, timestamps = _dated(orders)
+    series = order_count_series(timestamps, period)
+    trends = _keyed(series['periods'], series['order_count'], period, int)
     avg = sum(trends.values()) / len(trends) if trends else 0
-    return {'order_count_trends': dict(trends), 'average_orders_per_period': avg, 'orders': orders}
+    return {'order_count_trends': trends, 'average_orders_per_period': avg}
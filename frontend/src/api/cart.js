@@ -59,3 +59,24 @@ export async function addToCart(payload) {
   if (!res.ok) throw new Error('Failed to add to cart');
   return res.json();
 }
+
+/**
+ * Merges the guest cart (see cart/guestCart.js) into the signed-in user's cart
+ * in one request; the server dedupes lines and clamps quantities to stock.
+ * @param {Array} guestItems Items as stored by the guest cart
+ * @returns {Promise<object>} The merged cart ({cart_id, items, results})
+ */
+export async function mergeGuestCart(guestItems) {
+  const items = guestItems.map((it) => ({
+    product_id: it.product.id,
+    variant_id: it.variant?.id ?? null,
+    quantity: it.quantity
+  }));
+  const res = await fetch('/api/v1/customer/cart/merge', {
+    method: 'POST',
+    headers: { 'Content-Type': 'application/json' },
+    body: JSON.stringify({ items })
+  });
+  if (!res.ok) throw new Error('Failed to merge guest cart');
+  return res.json();
+}
@@ -1,5 +1,5 @@
 import fetchMock from 'jest-fetch-mock';
-import { fetchCartItems, editCartItemQuantity, removeCartItem } from './cart';
+import { fetchCartItems, editCartItemQuantity, removeCartItem, mergeGuestCart } from './cart';
 
 beforeEach(() => {
   fetchMock.resetMocks();
@@ -74,3 +74,25 @@ test('removeCartItem failure', async () => {
   );
   await expect(removeCartItem(1)).rejects.toThrow('Failed to remove cart item');
 });
+
+test('mergeGuestCart posts every guest line at once', async () => {
+  fetchMock.mockImplementationOnce(() =>
+    Promise.resolve({
+      ok: true,
+      status: 200,
+      json: () => Promise.resolve({ cart_id: 1, items: [], results: [] })
+    })
+  );
+  await mergeGuestCart([
+    { id: 5001, product: { id: 5 }, variant: { id: 5001 }, quantity: 2 },
+    { id: 7, product: { id: 7 }, variant: null, quantity: 1 }
+  ]);
+  const [url, init] = fetchMock.mock.calls[0];
+  expect(url).toBe('/api/v1/customer/cart/merge');
+  expect(JSON.parse(init.body)).toEqual({
+    items: [
+      { product_id: 5, variant_id: 5001, quantity: 2 },
+      { product_id: 7, variant_id: null, quantity: 1 }
+    ]
+  });
+});
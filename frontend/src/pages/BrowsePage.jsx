@@ -1,4 +1,4 @@
-import React, { useEffect, useMemo, useState } from 'react';
+import React, { useEffect, useMemo, useRef, useState } from 'react';
 import { useLocation } from 'react-router-dom';
 import PageHeader from '../components/PageHeader';
 import FiltersBar from '../components/FiltersBar';
@@ -9,9 +9,23 @@ function useQuery() {
   return useMemo(() => new URLSearchParams(search), [search]);
 }
 
+const PAGE_SIZE = 48;
+// Wait for typing to pause before searching
+const SEARCH_DEBOUNCE_MS = 300;
+
+// FiltersBar sort option -> catalog endpoint sort/order
+const SORT_PARAMS = {
+  relevance: { sort: 'id', order: 'asc' },
+  price_asc: { sort: 'price', order: 'asc' },
+  price_desc: { sort: 'price', order: 'desc' },
+  name_asc: { sort: 'title', order: 'asc' },
+};
+
 export default function BrowsePage({ forceSubcategoryId }) {
   const [items, setItems] = useState([]);
+  const [nextCursor, setNextCursor] = useState(null);
   const [loading, setLoading] = useState(true);
+  const [loadingMore, setLoadingMore] = useState(false);
   const [error, setError] = useState(null);
   const [filters, setFilters] = useState({
     q: '',
@@ -22,74 +36,104 @@ export default function BrowsePage({ forceSubcategoryId }) {
     in_stock: false,
     sort: 'relevance',
   });
+  // filters.q once typing pauses; this is what is sent to the server
+  const [searchTerm, setSearchTerm] = useState('');
+
+  useEffect(() => {
+    const timer = setTimeout(() => setSearchTerm(filters.q.trim()), SEARCH_DEBOUNCE_MS);
+    return () => clearTimeout(timer);
+  }, [filters.q]);
 
   const query = useQuery();
   const subcategoryParam = forceSubcategoryId || query.get('subcategory_id') || '';
   const categoryParam = query.get('category_id') || '';
 
   useEffect(() => {
+    setFilters((f) => ({
+      ...f,
+      category_id: categoryParam || '',
+      subcategory_id: subcategoryParam || '',
+    }));
+    // eslint-disable-next-line react-hooks/exhaustive-deps
+  }, [categoryParam, subcategoryParam]);
+
+  // Every filter is applied server-side, so each page is already filtered
+  // against the whole catalog; the endpoint returns keyset pages and a
+  // `next_cursor` for the following page.
+  const serverQuery = useMemo(() => {
+    const params = new URLSearchParams();
+    const sort = SORT_PARAMS[filters.sort] || SORT_PARAMS.relevance;
+    params.set('sort', sort.sort);
+    params.set('order', sort.order);
+    params.set('limit', String(PAGE_SIZE));
+    if (filters.category_id) params.set('category_id', filters.category_id);
+    if (filters.subcategory_id) params.set('subcategory_id', filters.subcategory_id);
+    if (!isNaN(parseFloat(filters.min_price))) params.set('min_price', filters.min_price);
+    if (!isNaN(parseFloat(filters.max_price))) params.set('max_price', filters.max_price);
+    if (searchTerm) params.set('q', searchTerm);
+    if (filters.in_stock) params.set('in_stock', 'true');
+    return params.toString();
+  }, [
+    filters.sort, filters.category_id, filters.subcategory_id, filters.min_price, filters.max_price,
+    filters.in_stock, searchTerm,
+  ]);
+
+  // The query the listing currently shows; a "Load more" response for an
+  // older query is dropped instead of being appended.
+  const currentQuery = useRef(serverQuery);
+  currentQuery.current = serverQuery;
+
+  const loadPage = async (cursor) => {
+    const url = `/api/v1/catalog/products?${serverQuery}${cursor ? `&cursor=${encodeURIComponent(cursor)}` : ''}`;
+    const res = await fetch(url);
+    const data = await res.json();
+    return {
+      pageItems: Array.isArray(data.items) ? data.items : [],
+      next: data.next_cursor || null,
+    };
+  };
+
+  useEffect(() => {
+    let cancelled = false;
     (async () => {
       try {
         setLoading(true);
-        const res = await fetch('/api/v1/catalog/products');
-        const data = await res.json();
-        setItems(Array.isArray(data.items) ? data.items : []);
+        const { pageItems, next } = await loadPage(null);
+        if (cancelled) return;
+        setItems(pageItems);
+        setNextCursor(next);
         setError(null);
       } catch (e) {
+        if (cancelled) return;
         setError('Failed to load products');
         setItems([]);
+        setNextCursor(null);
       } finally {
-        setLoading(false);
+        if (!cancelled) setLoading(false);
       }
     })();
-  }, []);
-
-  useEffect(() => {
-    setFilters((f) => ({
-      ...f,
-      category_id: categoryParam || '',
-      subcategory_id: subcategoryParam || '',
-    }));
+    return () => {
+      cancelled = true;
+    };
     // eslint-disable-next-line react-hooks/exhaustive-deps
-  }, [categoryParam, subcategoryParam]);
+  }, [serverQuery]);
 
-  const filtered = useMemo(() => {
-    let out = items.slice();
-    const q = filters.q.trim().toLowerCase();
-    if (q) {
-      out = out.filter((p) =>
-        (p.name || '').toLowerCase().includes(q) || (p.description || '').toLowerCase().includes(q)
-      );
-    }
-    if (filters.category_id) {
-      out = out.filter((p) => String(p.category_id) === String(filters.category_id));
-    }
-    if (filters.subcategory_id) {
-      out = out.filter((p) => String(p.subcategory_id) === String(filters.subcategory_id));
-    }
-    const min = parseFloat(filters.min_price);
-    const max = parseFloat(filters.max_price);
-    if (!isNaN(min)) out = out.filter((p) => (p.price ?? 0) >= min);
-    if (!isNaN(max)) out = out.filter((p) => (p.price ?? 0) <= max);
-    if (filters.in_stock) {
-      // Without stock info, approximate by price presence
-      out = out.filter((p) => (p.price ?? 0) > 0);
+  const loadMore = async () => {
+    if (!nextCursor) return;
+    const query = serverQuery;
+    try {
+      setLoadingMore(true);
+      const { pageItems, next } = await loadPage(nextCursor);
+      if (currentQuery.current !== query) return;
+      setItems((prev) => prev.concat(pageItems));
+      setNextCursor(next);
+    } catch (e) {
+      if (currentQuery.current !== query) return;
+      setError('Failed to load products');
+    } finally {
+      setLoadingMore(false);
     }
-    switch (filters.sort) {
-      case 'price_asc':
-        out.sort((a, b) => (a.price ?? 0) - (b.price ?? 0));
-        break;
-      case 'price_desc':
-        out.sort((a, b) => (b.price ?? 0) - (a.price ?? 0));
-        break;
-      case 'name_asc':
-        out.sort((a, b) => (a.name || '').localeCompare(b.name || ''));
-        break;
-      default:
-        break;
-    }
-    return out;
-  }, [items, filters]);
+  };
 
   const onChange = (e) => {
     const { name, value, type, checked } = e.target;
@@ -117,7 +161,7 @@ export default function BrowsePage({ forceSubcategoryId }) {
       {error && <div className="alert alert-danger">{error}</div>}
       {!loading && !error && (
         <div className="row row-cols-1 row-cols-sm-2 row-cols-lg-3 g-3">
-          {filtered.map((p) => (
+          {items.map((p) => (
             <div key={p.id} className="col">
               <div className="card h-100">
                 {p.image_url && (
@@ -139,11 +183,18 @@ export default function BrowsePage({ forceSubcategoryId }) {
               </div>
             </div>
           ))}
-          {filtered.length === 0 && (
+          {items.length === 0 && !nextCursor && (
             <div className="col-12">
               <div className="alert alert-secondary">No products match your filters.</div>
             </div>
           )}
+          {nextCursor && (
+            <div className="col-12 text-center">
+              <button type="button" className="btn btn-outline-secondary" onClick={loadMore} disabled={loadingMore}>
+                {loadingMore ? 'Loading...' : 'Load more'}
+              </button>
+            </div>
+          )}
         </div>
       )}
     </div>
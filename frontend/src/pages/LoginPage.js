@@ -1,6 +1,24 @@
 import React, { useState } from 'react';
+import { mergeGuestCart } from '../api/cart';
+import { clearGuestCart, getGuestCart } from '../cart/guestCart';
 // ...existing code...
 
+/**
+ * Moves the guest cart into the signed-in user's cart. The guest cart is only
+ * cleared once the merge succeeded, so a failed merge can be retried on the
+ * next sign-in; it never blocks the login itself.
+ */
+async function mergeGuestCartAfterLogin() {
+  const guestItems = getGuestCart();
+  if (!guestItems.length) return;
+  try {
+    await mergeGuestCart(guestItems);
+    clearGuestCart();
+  } catch (_) {
+    // Keep the guest cart for the next attempt
+  }
+}
+
 const LoginPage = () => {
   const [email, setEmail] = useState('');
   const [password, setPassword] = useState('');
@@ -14,6 +32,7 @@ const LoginPage = () => {
       body: JSON.stringify({ email, password })
     });
     if (res.ok) {
+      await mergeGuestCartAfterLogin();
       window.location.href = '/';
     } else {
       setError('Invalid credentials');
@@ -0,0 +1,53 @@
+import React from 'react';
+import { fireEvent, waitFor } from '@testing-library/react';
+import { renderWithRouter } from '../../test-utils/renderWithRouter';
+
+// Apply mocks before importing the component under test
+jest.mock('../../api/cart', () => ({
+  __esModule: true,
+  mergeGuestCart: jest.fn(async () => ({ items: [] }))
+}));
+
+jest.mock('../../cart/guestCart', () => ({
+  getGuestCart: jest.fn(() => [{ id: 5, product: { id: 5 }, variant: null, quantity: 2 }]),
+  clearGuestCart: jest.fn()
+}));
+
+import { mergeGuestCart } from '../../api/cart';
+import { clearGuestCart, getGuestCart } from '../../cart/guestCart';
+import LoginPage from '../LoginPage';
+
+function submitLogin(utils) {
+  fireEvent.change(utils.getByPlaceholderText('Email or Username'), { target: { value: 'buyer@example.com' } });
+  fireEvent.change(utils.getByPlaceholderText('Password'), { target: { value: 'secret' } });
+  fireEvent.click(utils.getByRole('button', { name: 'Login' }));
+}
+
+describe('LoginPage', () => {
+  beforeEach(() => {
+    jest.clearAllMocks();
+  });
+
+  it('merges the guest cart after signing in and then clears it', async () => {
+    global.fetch = jest.fn(() => Promise.resolve({ ok: true }));
+    submitLogin(renderWithRouter(<LoginPage />));
+    await waitFor(() => expect(clearGuestCart).toHaveBeenCalled());
+    expect(mergeGuestCart).toHaveBeenCalledWith(getGuestCart());
+  });
+
+  it('keeps the guest cart when the merge fails', async () => {
+    global.fetch = jest.fn(() => Promise.resolve({ ok: true }));
+    mergeGuestCart.mockRejectedValueOnce(new Error('Failed to merge guest cart'));
+    submitLogin(renderWithRouter(<LoginPage />));
+    await waitFor(() => expect(mergeGuestCart).toHaveBeenCalled());
+    expect(clearGuestCart).not.toHaveBeenCalled();
+  });
+
+  it('does not merge when the credentials are rejected', async () => {
+    global.fetch = jest.fn(() => Promise.resolve({ ok: false }));
+    const utils = renderWithRouter(<LoginPage />);
+    submitLogin(utils);
+    expect(await utils.findByText('Invalid credentials')).toBeInTheDocument();
+    expect(mergeGuestCart).not.toHaveBeenCalled();
+  });
+});
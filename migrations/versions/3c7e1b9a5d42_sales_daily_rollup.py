@@ -0,0 +1,48 @@
+"""sales_daily_rollup, sales_rollup_event and the order indexes recomputing it needs
+
+Revision ID: 3c7e1b9a5d42
+Revises: 9f4c6a2b8d13
+Create Date: 2026-10-18 23:48:12.000000
+
+The rollup starts empty; fill it with
+python -m backend.scripts.backfill_sales_rollup after upgrading.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3c7e1b9a5d42'
+down_revision = '9f4c6a2b8d13'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index('ix_order_created_at', 'order', ['created_at'], unique=False)
+    op.create_index('ix_order_item_order_id', 'order_item', ['order_id'], unique=False)
+    op.create_table(
+        'sales_daily_rollup',
+        sa.Column('seller_id', sa.BigInteger(), nullable=False),
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('product_id', sa.BigInteger(), nullable=False),
+        sa.Column('units', sa.Integer(), nullable=False),
+        sa.Column('revenue', sa.Float(), nullable=False),
+        sa.Column('orders', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('seller_id', 'day', 'product_id'),
+    )
+    op.create_index('ix_sales_daily_rollup_day_product_id', 'sales_daily_rollup', ['day', 'product_id'])
+    op.create_table(
+        'sales_rollup_event',
+        sa.Column('event_id', sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column('order_id', sa.BigInteger(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+    )
+
+
+def downgrade():
+    op.drop_table('sales_rollup_event')
+    op.drop_index('ix_sales_daily_rollup_day_product_id', table_name='sales_daily_rollup')
+    op.drop_table('sales_daily_rollup')
+    op.drop_index('ix_order_item_order_id', table_name='order_item')
+    op.drop_index('ix_order_created_at', table_name='order')
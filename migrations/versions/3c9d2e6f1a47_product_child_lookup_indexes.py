@@ -0,0 +1,27 @@
+"""indexes for looking up images and variants by parent
+
+Revision ID: 3c9d2e6f1a47
+Revises: 8e1f4b7c2a90
+Create Date: 2026-10-18 16:40:09.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '3c9d2e6f1a47'
+down_revision = '8e1f4b7c2a90'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index('ix_product_image_product_id', 'product_image', ['product_id', 'image_id'], unique=False)
+    op.create_index('ix_product_variant_product_id', 'product_variant', ['product_id'], unique=False)
+    op.create_index('ix_product_variant_image_variant_id', 'product_variant_image', ['variant_id', 'image_id'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_product_variant_image_variant_id', table_name='product_variant_image')
+    op.drop_index('ix_product_variant_product_id', table_name='product_variant')
+    op.drop_index('ix_product_image_product_id', table_name='product_image')
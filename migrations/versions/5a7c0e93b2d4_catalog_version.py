@@ -0,0 +1,36 @@
+"""catalog version counters for conditional GETs
+
+Revision ID: 5a7c0e93b2d4
+Revises: bce1feea1675
+Create Date: 2026-10-18 13:05:21.000000
+
+"""
+import datetime
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5a7c0e93b2d4'
+down_revision = 'bce1feea1675'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    table = op.create_table(
+        'catalog_version',
+        sa.Column('scope', sa.String(length=32), primary_key=True),
+        sa.Column('version', sa.BigInteger(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+    )
+    now = datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None)
+    op.bulk_insert(table, [
+        {'scope': 'catalog', 'version': 0, 'updated_at': now},
+        {'scope': 'taxonomy', 'version': 0, 'updated_at': now},
+    ])
+
+
+def downgrade():
+    op.drop_table('catalog_version')
@@ -0,0 +1,43 @@
+"""checkout_job table: durable queue for asynchronous checkout
+
+Revision ID: 5d8a3f1e7c26
+Revises: 7b2e9d4c1f05
+Create Date: 2026-10-18 21:40:11.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5d8a3f1e7c26'
+down_revision = '7b2e9d4c1f05'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'checkout_job',
+        sa.Column('job_id', sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column('user_id', sa.BigInteger(), sa.ForeignKey('users.user_id'), nullable=False),
+        sa.Column('cart_id', sa.Integer(), sa.ForeignKey('cart.cart_id'), nullable=False),
+        sa.Column('status', sa.String(length=16), nullable=False),
+        sa.Column('payload', sa.Text(), nullable=False),
+        sa.Column('attempts', sa.Integer(), nullable=False),
+        sa.Column('available_at', sa.DateTime(), nullable=False),
+        sa.Column('locked_until', sa.DateTime(), nullable=True),
+        sa.Column('locked_by', sa.String(length=64), nullable=True),
+        sa.Column('order_id', sa.BigInteger(), sa.ForeignKey('order.order_id'), nullable=True),
+        sa.Column('last_error', sa.Text(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+    )
+    op.create_index('ix_checkout_job_status_available_at', 'checkout_job', ['status', 'available_at'], unique=False)
+    op.create_index('ix_checkout_job_user_id', 'checkout_job', ['user_id'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_checkout_job_user_id', table_name='checkout_job')
+    op.drop_index('ix_checkout_job_status_available_at', table_name='checkout_job')
+    op.drop_table('checkout_job')
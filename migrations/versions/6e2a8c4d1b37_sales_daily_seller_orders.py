@@ -0,0 +1,31 @@
+"""sales_daily_seller_orders: distinct orders per seller and day
+
+Revision ID: 6e2a8c4d1b37
+Revises: 3c7e1b9a5d42
+Create Date: 2026-10-19 10:12:40.000000
+
+Fill it with python -m backend.scripts.backfill_sales_rollup after upgrading.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '6e2a8c4d1b37'
+down_revision = '3c7e1b9a5d42'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'sales_daily_seller_orders',
+        sa.Column('seller_id', sa.BigInteger(), nullable=False),
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('orders', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('seller_id', 'day'),
+    )
+
+
+def downgrade():
+    op.drop_table('sales_daily_seller_orders')
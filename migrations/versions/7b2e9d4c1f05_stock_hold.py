@@ -0,0 +1,37 @@
+"""stock_hold table for time-limited checkout holds
+
+Revision ID: 7b2e9d4c1f05
+Revises: 3c9d2e6f1a47
+Create Date: 2026-10-18 19:12:54.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '7b2e9d4c1f05'
+down_revision = '3c9d2e6f1a47'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'stock_hold',
+        sa.Column('hold_id', sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column('user_id', sa.BigInteger(), sa.ForeignKey('users.user_id'), nullable=False),
+        sa.Column('variant_id', sa.BigInteger(), sa.ForeignKey('product_variant.variant_id'), nullable=False),
+        sa.Column('quantity', sa.Integer(), nullable=False),
+        sa.Column('status', sa.String(length=16), nullable=False),
+        sa.Column('expires_at', sa.DateTime(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+    )
+    op.create_index('ix_stock_hold_status_expires_at', 'stock_hold', ['status', 'expires_at'], unique=False)
+    op.create_index('ix_stock_hold_user_id_status', 'stock_hold', ['user_id', 'status'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_stock_hold_user_id_status', table_name='stock_hold')
+    op.drop_index('ix_stock_hold_status_expires_at', table_name='stock_hold')
+    op.drop_table('stock_hold')
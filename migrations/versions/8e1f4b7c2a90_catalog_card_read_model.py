@@ -0,0 +1,55 @@
+"""catalog_card denormalized read model
+
+Revision ID: 8e1f4b7c2a90
+Revises: 5a7c0e93b2d4
+Create Date: 2026-10-18 14:02:37.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8e1f4b7c2a90'
+down_revision = '5a7c0e93b2d4'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    table = op.create_table(
+        'catalog_card',
+        sa.Column('product_id', sa.Integer(), sa.ForeignKey('product.product_id', ondelete='CASCADE'), primary_key=True),
+        sa.Column('seller_id', sa.BigInteger(), nullable=True),
+        sa.Column('category_id', sa.BigInteger(), nullable=True),
+        sa.Column('subcategory_id', sa.BigInteger(), nullable=True),
+        sa.Column('title', sa.String(length=255), nullable=False),
+        sa.Column('description', sa.Text(), nullable=False),
+        sa.Column('price', sa.Numeric(10, 2), nullable=False),
+        sa.Column('currency', sa.String(length=10), nullable=True),
+        sa.Column('image_url', sa.String(length=512), nullable=True),
+        sa.Column('category_name', sa.String(length=100), nullable=True),
+        sa.Column('subcategory_name', sa.String(length=100), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.Column('refreshed_at', sa.DateTime(), nullable=False),
+    )
+    op.create_index('ix_catalog_card_price', 'catalog_card', ['price', 'product_id'], unique=False)
+    op.create_index('ix_catalog_card_created_at', 'catalog_card', ['created_at', 'product_id'], unique=False)
+    op.create_index('ix_catalog_card_title', 'catalog_card', ['title', 'product_id'], unique=False)
+    op.create_index('ix_catalog_card_category_id', 'catalog_card', ['category_id'], unique=False)
+    op.create_index('ix_catalog_card_subcategory_id', 'catalog_card', ['subcategory_id'], unique=False)
+
+    # Backfill with the same resolution rules the application uses
+    from backend.repositories.repository.catalog_card_repository import build_card, card_source_select
+    rows = op.get_bind().execute(card_source_select()).all()
+    if rows:
+        op.bulk_insert(table, [build_card(row) for row in rows])
+
+
+def downgrade():
+    op.drop_index('ix_catalog_card_subcategory_id', table_name='catalog_card')
+    op.drop_index('ix_catalog_card_category_id', table_name='catalog_card')
+    op.drop_index('ix_catalog_card_title', table_name='catalog_card')
+    op.drop_index('ix_catalog_card_created_at', table_name='catalog_card')
+    op.drop_index('ix_catalog_card_price', table_name='catalog_card')
+    op.drop_table('catalog_card')
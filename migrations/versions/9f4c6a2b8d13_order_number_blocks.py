@@ -0,0 +1,36 @@
+"""order_number_seq (Postgres) and order_number_counter (SQLite) for order number blocks
+
+Revision ID: 9f4c6a2b8d13
+Revises: 5d8a3f1e7c26
+Create Date: 2026-10-18 22:31:47.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9f4c6a2b8d13'
+down_revision = '5d8a3f1e7c26'
+branch_labels = None
+depends_on = None
+
+# Must match ORDER_NUMBER_BLOCK_SIZE in backend/persistance/order_number_block.py
+BLOCK_SIZE = 100
+
+
+def upgrade():
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute(f"CREATE SEQUENCE order_number_seq START WITH 1 INCREMENT BY {BLOCK_SIZE}")
+    counter = op.create_table(
+        'order_number_counter',
+        sa.Column('name', sa.String(length=32), primary_key=True),
+        sa.Column('next_value', sa.BigInteger(), nullable=False),
+    )
+    op.bulk_insert(counter, [{'name': 'order_number', 'next_value': 1}])
+
+
+def downgrade():
+    op.drop_table('order_number_counter')
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute("DROP SEQUENCE order_number_seq")
@@ -0,0 +1,28 @@
+"""catalog_card.price nullable, as product.price is
+
+Revision ID: a4d7e2c9f615
+Revises: 6e2a8c4d1b37
+Create Date: 2026-10-19 11:05:18.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a4d7e2c9f615'
+down_revision = '6e2a8c4d1b37'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('catalog_card') as batch_op:
+        batch_op.alter_column('price', existing_type=sa.Numeric(10, 2), nullable=True)
+
+
+def downgrade():
+    # Cards of price-less products cannot be kept under NOT NULL
+    op.execute("DELETE FROM catalog_card WHERE price IS NULL")
+    with op.batch_alter_table('catalog_card') as batch_op:
+        batch_op.alter_column('price', existing_type=sa.Numeric(10, 2), nullable=False)
@@ -0,0 +1,71 @@
+"""product full-text search index
+
+Revision ID: bce1feea1675
+Revises: d33d1f647fa8
+Create Date: 2026-10-18 11:40:03.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'bce1feea1675'
+down_revision = 'd33d1f647fa8'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    dialect = op.get_bind().dialect.name
+    if dialect == 'postgresql':
+        # Generated column: Postgres keeps it current on every insert/update
+        op.execute("""
+            ALTER TABLE product ADD COLUMN IF NOT EXISTS search_vector tsvector
+            GENERATED ALWAYS AS (
+                setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+                setweight(to_tsvector('english', coalesce(description, '')), 'B')
+            ) STORED
+        """)
+        op.execute("CREATE INDEX IF NOT EXISTS ix_product_search_vector ON product USING GIN (search_vector)")
+    elif dialect == 'sqlite':
+        op.execute("""
+            CREATE VIRTUAL TABLE IF NOT EXISTS product_search USING fts5(
+                title, description,
+                content='product', content_rowid='product_id',
+                tokenize='porter unicode61'
+            )
+        """)
+        op.execute("""
+            CREATE TRIGGER IF NOT EXISTS product_search_ai AFTER INSERT ON product BEGIN
+                INSERT INTO product_search(rowid, title, description)
+                VALUES (new.product_id, new.title, new.description);
+            END
+        """)
+        op.execute("""
+            CREATE TRIGGER IF NOT EXISTS product_search_ad AFTER DELETE ON product BEGIN
+                INSERT INTO product_search(product_search, rowid, title, description)
+                VALUES ('delete', old.product_id, old.title, old.description);
+            END
+        """)
+        op.execute("""
+            CREATE TRIGGER IF NOT EXISTS product_search_au AFTER UPDATE OF title, description ON product BEGIN
+                INSERT INTO product_search(product_search, rowid, title, description)
+                VALUES ('delete', old.product_id, old.title, old.description);
+                INSERT INTO product_search(rowid, title, description)
+                VALUES (new.product_id, new.title, new.description);
+            END
+        """)
+        # Index products that existed before the FTS table
+        op.execute("INSERT INTO product_search(product_search) VALUES ('rebuild')")
+
+
+def downgrade():
+    dialect = op.get_bind().dialect.name
+    if dialect == 'postgresql':
+        op.execute("DROP INDEX IF EXISTS ix_product_search_vector")
+        op.execute("ALTER TABLE product DROP COLUMN IF EXISTS search_vector")
+    elif dialect == 'sqlite':
+        op.execute("DROP TRIGGER IF EXISTS product_search_au")
+        op.execute("DROP TRIGGER IF EXISTS product_search_ad")
+        op.execute("DROP TRIGGER IF EXISTS product_search_ai")
+        op.execute("DROP TABLE IF EXISTS product_search")
@@ -0,0 +1,31 @@
+"""catalog keyset pagination indexes
+
+Revision ID: d33d1f647fa8
+Revises: e25f01736900
+Create Date: 2026-10-18 09:12:44.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'd33d1f647fa8'
+down_revision = 'e25f01736900'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index('ix_product_active_price', 'product', ['is_active', 'price', 'product_id'], unique=False)
+    op.create_index('ix_product_active_created_at', 'product', ['is_active', 'created_at', 'product_id'], unique=False)
+    op.create_index('ix_product_active_title', 'product', ['is_active', 'title', 'product_id'], unique=False)
+    op.create_index('ix_product_category_id', 'product', ['category_id'], unique=False)
+    op.create_index('ix_product_subcategory_id', 'product', ['subcategory_id'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_product_subcategory_id', table_name='product')
+    op.drop_index('ix_product_category_id', table_name='product')
+    op.drop_index('ix_product_active_title', table_name='product')
+    op.drop_index('ix_product_active_created_at', table_name='product')
+    op.drop_index('ix_product_active_price', table_name='product')